@@ -5,6 +5,7 @@ Main entry point
 """
 import sys
 import os
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QObject, QEvent, Qt
 from PyQt6.QtGui import QIcon, QPalette, QColor
@@ -135,4 +136,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 분석 샤드 프로세스(spawn) 지원
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,93 @@
+"""분석 진행률/텔레메트리 - 일정 주기로만 보고하여 Qt 이벤트 큐 과부하 방지
+
+워커는 프레임마다 TelemetryThrottle.due()만 확인하고(시계 읽기 1회),
+보고 시점에만 AnalysisTelemetry를 만들어 시그널로 보낸다.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+# 텔레메트리 보고 주기 (초) - 10Hz
+TELEMETRY_INTERVAL_SECONDS = 0.1
+
+# 단계 이름 → 한글 표시명
+STAGE_DISPLAY_NAMES = {
+    'decode': '디코딩',
+    'inference': '추론',
+    'scoring': '집계',
+}
+
+
+@dataclass
+class AnalysisTelemetry:
+    """분석 진행 상태 스냅샷"""
+    processed_frames: int             # 처리 완료 프레임 위치 (건너뛴 프레임 포함)
+    total_frames: int
+    sampled_frames: int = 0           # 포즈 감지를 거친 샘플 프레임 수
+    skipped_frames: int = 0           # 감지 실패 프레임 수
+    elapsed_seconds: float = 0.0
+    frames_per_second: float = 0.0    # 처리 프레임 위치 기준 속도
+    eta_seconds: Optional[float] = None
+    stage_seconds: Dict[str, float] = field(default_factory=dict)  # 단계별 누적 시간
+
+    @property
+    def progress_ratio(self) -> float:
+        if self.total_frames <= 0:
+            return 0.0
+        return min(1.0, self.processed_frames / self.total_frames)
+
+    @property
+    def skipped_ratio(self) -> float:
+        if self.sampled_frames <= 0:
+            return 0.0
+        return self.skipped_frames / self.sampled_frames
+
+
+class TelemetryThrottle:
+    """고정 주기 텔레메트리 생성기"""
+
+    def __init__(self, total_frames: int, start_frame: int = 0,
+                 interval: float = TELEMETRY_INTERVAL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            total_frames: 전체 프레임 수
+            start_frame: 시작 프레임 (재개 시 이전 처리분은 속도 계산에서 제외)
+            interval: 보고 주기 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self._total_frames = total_frames
+        self._start_frame = start_frame
+        self._interval = interval
+        self._clock = clock
+        self._start_time = clock()
+        self._last_report = self._start_time
+
+    def due(self) -> bool:
+        """보고 주기가 지났는지"""
+        return self._clock() - self._last_report >= self._interval
+
+    def snapshot(self, processed_frames: int, sampled_frames: int = 0,
+                 skipped_frames: int = 0,
+                 stage_seconds: Optional[Dict[str, float]] = None) -> AnalysisTelemetry:
+        """현재 상태로 텔레메트리 생성 (다음 보고 주기 시작)"""
+        now = self._clock()
+        self._last_report = now
+        elapsed = now - self._start_time
+
+        done = processed_frames - self._start_frame
+        fps = done / elapsed if elapsed > 0 and done > 0 else 0.0
+        eta = None
+        if fps > 0 and self._total_frames > 0:
+            eta = max(0, self._total_frames - processed_frames) / fps
+
+        return AnalysisTelemetry(
+            processed_frames=processed_frames,
+            total_frames=self._total_frames,
+            sampled_frames=sampled_frames,
+            skipped_frames=skipped_frames,
+            elapsed_seconds=elapsed,
+            frames_per_second=fps,
+            eta_seconds=eta,
+            stage_seconds=dict(stage_seconds or {}),
+        )
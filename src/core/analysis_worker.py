@@ -1,4 +1,11 @@
-"""분석 워커 스레드 - 동영상 전체 프레임 순차 스캔"""
+"""분석 워커 스레드 - 동영상 전체 프레임 순차 스캔
+
+디코딩 / 포즈 추론 / 점수 집계를 크기가 제한된 큐로 연결한 파이프라인으로 처리한다.
+    디코더 스레드 ─▶ frame_queue ─▶ 추론 스레드(1개 이상) ─▶ result_queue ─▶ 집계(run)
+OpenCV 디코딩과 MediaPipe 추론은 GIL을 해제하므로 스레드만으로 단계가 겹쳐 실행된다.
+"""
+import queue
+import threading
 import time
 
 import cv2
@@ -6,30 +13,86 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 from src.utils.cv_unicode import VideoCapture as CvVideoCapture
 
-from src.core.pose_detector import PoseDetector
+from src.core.pose_detector import PoseDetector, PoseResult, TRACKING_RESET_GAP_MS
 from src.core.angle_calculator import AngleCalculator
 from src.core.ergonomic.rula_calculator import RULACalculator
 from src.core.ergonomic.reba_calculator import REBACalculator
-from src.core.movement_analyzer import MovementAnalyzer, MovementAnalysisResult
+from src.core.movement_analyzer import MovementAnalyzer, MovementAnalysisResult, DEFAULT_THRESHOLD
+from src.core.landmark_cache import LandmarkCache
+from src.core.keyframe_index import KeyframeIndex, seek_frame
+from src.core.presence_gate import PresenceGate
+from src.core.analysis_telemetry import TelemetryThrottle
 from src.core.logger import get_logger
 
+# 파이프라인 단계 사이 큐 크기 (선행 디코딩 프레임 수 = 메모리 상한)
+PIPELINE_QUEUE_SIZE = 8
+
+# 큐 대기 시 중단 여부 확인 주기 (초)
+_QUEUE_POLL_SECONDS = 0.1
+
+# 단계 종료 표시
+_END = object()
+
+# fps를 알 수 없을 때 타임스탬프 계산에 쓰는 기본값
+_DEFAULT_FPS = 30.0
+
+
+class _StageError:
+    """파이프라인 스레드에서 발생한 예외 전달용"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
 
 class AnalysisWorker(QThread):
     """동영상 전체 프레임을 순차 스캔하여 움직임 빈도를 분석하는 워커 스레드"""
 
+    # 진행 관련 시그널은 TELEMETRY_INTERVAL_SECONDS 주기 + 종료 시 1회만 발생
     progress_updated = pyqtSignal(int, int)       # (current_frame, total_frames)
     analysis_completed = pyqtSignal(object)        # MovementAnalysisResult
     analysis_cancelled = pyqtSignal(object, dict, int, int)  # (partial_result, analyzer_state, frame_index, skipped_frames)
     skipped_updated = pyqtSignal(int)              # skipped_frames_count
+    telemetry_updated = pyqtSignal(object)         # AnalysisTelemetry
     error_occurred = pyqtSignal(str)               # error message
 
+    # 샘플 간격이 이 값 이상이면 grab() 반복 대신 탐색(seek)으로 건너뜀
+    # (일반적인 GOP 길이 이상이면 키프레임 탐색이 순차 grab보다 빠름)
+    SEEK_MIN_INTERVAL = 60
+
     def __init__(self, video_path: str, sample_interval: int = 1,
                  resume_state: dict = None, resume_frame: int = 0,
                  resume_skipped: int = 0, resume_elapsed: float = 0.0,
+                 sample_seconds: float = 0.0, inference_threads: int = 1,
+                 model_type: str = 'lite', cache_dir: str = None,
+                 threshold: float = DEFAULT_THRESHOLD, inference_size: int = 0,
+                 tracking: bool = True, num_poses: int = 5, roi_tracking: bool = True,
+                 presence_gate: bool = True, index_dir: str = None,
+                 min_visibility: float = 0.0, detection_sensitivity: float = 1.0,
                  parent=None):
+        """
+        Args:
+            inference_threads: 추론 스레드 수. 프레임은 먼저 꺼내는 스레드가 가져가므로
+                스레드마다 프레임 간격과 순서가 일정하지 않다. 프레임 순서에 의존하는
+                VIDEO 모드 추적이나 빈 화면 판별(presence_gate)을 쓰면 1로 제한한다.
+        """
         super().__init__(parent)
         self._video_path = video_path
-        self._sample_interval = sample_interval
+        self._sample_interval = max(1, sample_interval)
+        self._sample_seconds = sample_seconds
+        self._inference_threads = max(1, inference_threads)
+        self._model_type = model_type
+        self._cache_dir = cache_dir
+        self._threshold = threshold
+        self._inference_size = inference_size
+        self._tracking = tracking
+        self._num_poses = num_poses
+        self._roi_tracking = roi_tracking
+        self._presence_gate = presence_gate
+        self._min_visibility = min_visibility  # 평균 가시성 하한 (0이면 사용 안 함)
+        self._detection_sensitivity = detection_sensitivity  # RULA/REBA 감지 민감도
+        self._index_dir = index_dir
+        self._keyframe_index = None
+        self._fps = _DEFAULT_FPS
         self._resume_state = resume_state
         self._resume_frame = resume_frame
         self._resume_skipped = resume_skipped
@@ -37,6 +100,31 @@ class AnalysisWorker(QThread):
         self._stopped = False
         self._logger = get_logger('analysis_worker')
 
+    @staticmethod
+    def interval_from_seconds(seconds: float, fps: float) -> int:
+        """초 단위 샘플링 간격을 프레임 간격으로 변환 (최소 1)"""
+        if seconds <= 0 or fps <= 0:
+            return 1
+        return max(1, int(round(seconds * fps)))
+
+    @staticmethod
+    def running_mode_for(sample_interval: int, fps: float, tracking: bool = True) -> str:
+        """샘플 간격에 맞는 PoseDetector 실행 모드
+
+        샘플 프레임 간격이 추적 초기화 기준보다 길면 매번 추적이 초기화되므로 IMAGE 모드를 쓴다.
+        """
+        if not tracking:
+            return 'image'
+        fps = fps if fps > 0 else _DEFAULT_FPS
+        gap_ms = sample_interval * 1000.0 / fps
+        return 'video' if gap_ms <= TRACKING_RESET_GAP_MS else 'image'
+
+    @staticmethod
+    def frame_timestamp_ms(frame_index: int, fps: float) -> int:
+        """프레임 번호 → VIDEO 모드 타임스탬프 (ms)"""
+        fps = fps if fps > 0 else _DEFAULT_FPS
+        return int(round(frame_index * 1000.0 / fps))
+
     def stop(self):
         self._stopped = True
 
@@ -44,70 +132,159 @@ class AnalysisWorker(QThread):
         start_time = time.time()
 
         cap = CvVideoCapture(self._video_path)
-        detector = PoseDetector()
+        detectors = []
         angle_calc = AngleCalculator()
         rula_calc = RULACalculator()
         reba_calc = REBACalculator()
-        analyzer = MovementAnalyzer(sample_interval=self._sample_interval)
+        rula_calc.detection_sensitivity = self._detection_sensitivity
+        reba_calc.detection_sensitivity = self._detection_sensitivity
+        threads = []
+        cache = None
 
         try:
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self._fps = cap.get(cv2.CAP_PROP_FPS)
+
+            # 초 단위 샘플링이면 동영상 fps 기준으로 프레임 간격 결정
+            if self._sample_seconds > 0:
+                self._sample_interval = self.interval_from_seconds(self._sample_seconds, self._fps)
+
+            # MediaPipe landmarker는 스레드 간 공유 불가 → 추론 스레드마다 하나씩
+            # (VIDEO 모드는 탐색/재개 시 타임스탬프 간격으로 추적이 자동 초기화됨)
+            running_mode = self.running_mode_for(self._sample_interval, self._fps, self._tracking)
+            cache = self._open_cache(total_frames, running_mode)
+            # 추적/빈 화면 판별은 연속된 프레임을 순서대로 봐야 하므로 추론 스레드 하나로 처리
+            if self._inference_threads > 1 and (running_mode == 'video' or self._presence_gate):
+                self._logger.info("VIDEO 모드 추적/빈 화면 판별 사용 중 - 추론 스레드 1개로 제한")
+                self._inference_threads = 1
+            for _ in range(self._inference_threads):
+                detectors.append(PoseDetector(model_type=self._model_type,
+                                              inference_size=self._inference_size,
+                                              running_mode=running_mode,
+                                              num_poses=self._num_poses,
+                                              roi_tracking=self._roi_tracking))
+
+            # 빈 화면 판별기는 추론 스레드가 하나일 때만 사용됨 (위 제한 참고)
+            gates = [PresenceGate() if self._presence_gate else None for _ in detectors]
+
+            analyzer = MovementAnalyzer(threshold=self._threshold,
+                                        sample_interval=self._sample_interval)
             skipped_frames = self._resume_skipped
+            gated_frames = 0
             frame_index = self._resume_frame
 
             # 재개 상태 복원
             if self._resume_state:
                 analyzer.load_state(self._resume_state)
+                gated_frames = self._resume_state.get('gated_frames', 0)
                 self._logger.info(f"분석 재개: 프레임 {frame_index}/{total_frames}부터")
 
+            # 탐색이 필요하면(재개 또는 긴 샘플 간격) 재생기가 만들어 둔 키프레임 색인으로 정확히 이동
+            if frame_index > 0 or self._sample_interval >= self.SEEK_MIN_INTERVAL:
+                self._keyframe_index = self._open_index()
+
             # 프레임 위치 이동 (재개 시)
             if frame_index > 0:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                position = seek_frame(cap, frame_index, self._keyframe_index)
+                if position != frame_index:
+                    self._logger.warning(f"재개 위치 {frame_index}까지 이동하지 못함 ({position})")
 
-            while not self._stopped:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            frame_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            result_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            decoder_state = {'frame_index': frame_index}
 
-                # 샘플링: sample_interval에 따라 스킵
-                if frame_index % self._sample_interval != 0:
-                    frame_index += 1
-                    continue
+            # 단계별 누적 시간 - 스레드마다 자기 칸만 갱신 (잠금 불필요)
+            stage_times = {
+                'decode': [0.0],
+                'inference': [0.0] * len(detectors),
+                'scoring': [0.0],
+            }
+            throttle = TelemetryThrottle(total_frames, start_frame=frame_index)
+            sampled_frames = skipped_frames
+            if self._resume_state:
+                sampled_frames += self._resume_state.get('analyzed_frames', 0)
+
+            threads.append(threading.Thread(
+                target=self._decode_stage,
+                args=(cap, frame_queue, frame_index, total_frames, decoder_state, cache,
+                      stage_times['decode']),
+                name='analysis-decoder', daemon=True,
+            ))
+            for i, detector in enumerate(detectors):
+                threads.append(threading.Thread(
+                    target=self._inference_stage,
+                    args=(detector, frame_queue, result_queue, cache,
+                          stage_times['inference'], i, gates[i]),
+                    name=f'analysis-inference-{i}', daemon=True,
+                ))
+            for thread in threads:
+                thread.start()
 
-                # 포즈 감지
-                pose_result = detector.detect(frame)
-                if not pose_result.pose_detected:
-                    skipped_frames += 1
-                    frame_index += 1
-                    self.progress_updated.emit(frame_index, total_frames)
-                    self.skipped_updated.emit(skipped_frames)
+            # 집계 단계: 추론 스레드가 여러 개여도 디코딩 순서대로 처리
+            pending = {}
+            next_seq = 0
+            ended = 0
+            while ended < len(detectors):
+                item = self._queue_get(result_queue)
+                if item is None:
+                    break
+                if item is _END:
+                    ended += 1
                     continue
+                if isinstance(item, _StageError):
+                    raise item.error
 
-                # 각도 계산
-                angles = angle_calc.calculate_all_angles(pose_result.landmarks)
+                seq, index, pose_result, gated = item
+                pending[seq] = (index, pose_result, gated)
+                while next_seq in pending:
+                    index, pose_result, gated = pending.pop(next_seq)
+                    next_seq += 1
+                    frame_index = index + 1
+                    sampled_frames += 1
+                    gated_frames += gated
 
-                # RULA/REBA 평가
-                landmarks_for_calc = pose_result.landmarks
-                rula_result = rula_calc.calculate(angles, landmarks_for_calc)
-                reba_result = reba_calc.calculate(angles, landmarks_for_calc)
+                    if pose_result.pose_detected and (
+                            self._min_visibility <= 0
+                            or pose_result.mean_visibility() >= self._min_visibility):
+                        scoring_start = time.perf_counter()
 
-                # 분석 엔진에 누적
-                analyzer.update(angles, rula_result, reba_result)
+                        # 각도 계산
+                        angles = angle_calc.calculate_all_angles(pose_result.landmarks)
 
-                frame_index += 1
-                self.progress_updated.emit(frame_index, total_frames)
+                        # RULA/REBA 평가
+                        landmarks_for_calc = pose_result.landmarks
+                        rula_result = rula_calc.calculate(angles, landmarks_for_calc)
+                        reba_result = reba_calc.calculate(angles, landmarks_for_calc)
+
+                        # 분석 엔진에 누적
+                        analyzer.update(angles, rula_result, reba_result)
+                        stage_times['scoring'][0] += time.perf_counter() - scoring_start
+                    else:
+                        skipped_frames += 1
+
+                    if throttle.due():
+                        self._report(throttle, frame_index, sampled_frames,
+                                     skipped_frames, stage_times)
+
+            # 정상 종료면 디코더가 멈춘 위치까지 처리 완료
+            # (취소 시에는 집계가 끝난 프레임 다음부터 재개)
+            if not self._stopped:
+                frame_index = decoder_state['frame_index']
+            self._report(throttle, frame_index, sampled_frames, skipped_frames, stage_times)
 
             # 결과 생성 (이전 실행 시간 누적)
             elapsed = time.time() - start_time + self._resume_elapsed
             result = analyzer.get_result()
             result.total_frames = frame_index
             result.skipped_frames = skipped_frames
+            result.gated_frames = gated_frames
             result.duration_seconds = elapsed
             result.sample_interval = self._sample_interval
 
             if self._stopped:
                 # 취소 시 부분 결과 + 분석기 상태 전달
                 analyzer_state = analyzer.get_state()
+                analyzer_state['gated_frames'] = gated_frames
                 self.analysis_cancelled.emit(result, analyzer_state, frame_index, skipped_frames)
                 self._logger.info(f"분석 취소: {frame_index}/{total_frames} 프레임 처리")
             else:
@@ -119,5 +296,221 @@ class AnalysisWorker(QThread):
             self.error_occurred.emit(str(e))
 
         finally:
+            # 파이프라인 스레드가 큐 대기에서 빠져나오도록 중단 후 합류
+            stopped_by_user = self._stopped
+            self._stopped = True
+            for thread in threads:
+                thread.join()
+            self._stopped = stopped_by_user
             cap.release()
-            detector.release()
+            for detector in detectors:
+                detector.release()
+            if cache is not None:
+                cache.close()
+
+    def _report(self, throttle: TelemetryThrottle, frame_index: int, sampled_frames: int,
+                skipped_frames: int, stage_times: dict):
+        """진행률/감지 실패/텔레메트리 시그널 발생"""
+        telemetry = throttle.snapshot(
+            frame_index, sampled_frames, skipped_frames,
+            {name: sum(times) for name, times in stage_times.items()},
+        )
+        self.progress_updated.emit(frame_index, telemetry.total_frames)
+        self.skipped_updated.emit(skipped_frames)
+        self.telemetry_updated.emit(telemetry)
+
+    def _open_cache(self, total_frames: int, running_mode: str):
+        """랜드마크 캐시 열기 (cache_dir 미지정 또는 실패 시 None)
+
+        감지기 옵션(실행 모드/최대 인원/인물 영역 추적)이 다르면 다른 캐시를 쓴다.
+        """
+        if not self._cache_dir or total_frames <= 0:
+            return None
+        try:
+            cache = LandmarkCache.for_video(
+                self._cache_dir, self._video_path, total_frames,
+                model_type=self._model_type, inference_size=self._inference_size,
+                running_mode=running_mode, num_poses=self._num_poses,
+                roi_tracking=self._roi_tracking,
+            )
+            self._logger.info(f"랜드마크 캐시: {cache.cached_count}/{total_frames} 프레임 저장됨")
+            return cache
+        except OSError as e:
+            self._logger.warning(f"랜드마크 캐시를 열 수 없음: {e}")
+            return None
+
+    def _open_index(self):
+        """
+        키프레임 색인 로드 (index_dir 미지정, 아직 없음, 실패 시 None)
+
+        색인은 동영상을 열 때 재생기가 백그라운드에서 한 번 만든다. 분석 시작을 패킷 전체
+        훑기로 늦추지 않도록 여기서는 만들지 않고, 없으면 CAP_PROP_POS_FRAMES 탐색을 쓴다.
+        """
+        if not self._index_dir:
+            return None
+        try:
+            return KeyframeIndex.cached(self._index_dir, self._video_path)
+        except OSError as e:
+            self._logger.warning(f"키프레임 색인을 열 수 없음: {e}")
+            return None
+
+    def _decode_stage(self, cap, frame_queue: queue.Queue, frame_index: int,
+                      total_frames: int, decoder_state: dict, cache=None,
+                      decode_time: list = None):
+        """디코더 스레드: 샘플 프레임만 디코딩하여 (순번, 프레임 번호, 프레임) 전달
+
+        캐시에 결과가 있는 프레임은 디코딩하지 않고 프레임 None으로 전달한다.
+        빈 화면 판별을 끄면 빈 화면 생략으로 기록된 프레임은 다시 디코딩해 추론한다.
+        """
+        seq = 0
+        cap_index = frame_index  # 캡처의 실제 읽기 위치
+        try:
+            while not self._stopped:
+                # 샘플링: 다음 샘플 프레임까지 디코딩 없이 건너뛰기
+                target = frame_index + (-frame_index % self._sample_interval)
+
+                if cache is not None and target >= total_frames:
+                    # 캐시는 전체 프레임 범위를 덮으므로 끝 확인용 디코딩 생략
+                    frame_index = decoder_state['frame_index'] = total_frames
+                    break
+                if cache is not None and cache.has(target, include_gated=self._presence_gate):
+                    frame_index = target
+                    frame = None
+                else:
+                    decode_start = time.perf_counter()
+                    cap_index, ok = self._skip_to(cap, cap_index, target, total_frames)
+                    frame_index = cap_index
+                    decoder_state['frame_index'] = frame_index
+                    if not ok or self._stopped:
+                        break
+
+                    ret, frame = cap.read()
+                    if decode_time is not None:
+                        decode_time[0] += time.perf_counter() - decode_start
+                    if not ret:
+                        break
+                    cap_index += 1
+
+                if not self._queue_put(frame_queue, (seq, frame_index, frame)):
+                    break
+                seq += 1
+                frame_index += 1
+                decoder_state['frame_index'] = frame_index
+        except Exception as e:
+            self._queue_put(frame_queue, _StageError(e))
+        finally:
+            for _ in range(self._inference_threads):
+                self._queue_put(frame_queue, _END)
+
+    def _inference_stage(self, detector, frame_queue: queue.Queue,
+                         result_queue: queue.Queue, cache=None,
+                         inference_times: list = None, slot: int = 0, gate=None):
+        """추론 스레드: 포즈 감지 후 (순번, 프레임 번호, PoseResult, 추론 생략 여부) 전달
+
+        gate(PresenceGate)가 빈 화면으로 판별한 프레임은 추론 없이 포즈 미감지로 처리한다.
+        캐시에는 미감지와 구분해 빈 화면 생략으로 기록한다 (게이트를 끄고 다시 분석하면 추론).
+        """
+        while True:
+            item = self._queue_get(frame_queue)
+            if item is None:
+                return
+            if item is _END or isinstance(item, _StageError):
+                self._queue_put(result_queue, item)
+                if item is _END:
+                    return
+                continue
+
+            seq, index, frame = item
+            gated = False
+            try:
+                if frame is None:
+                    gated = cache.is_gated(index)
+                    pose_result = cache.get(index)
+                elif gate is not None and not gate.should_detect(frame):
+                    gated = True
+                    pose_result = PoseResult(pose_detected=False)
+                    if cache is not None:
+                        cache.put_gated(index)
+                else:
+                    inference_start = time.perf_counter()
+                    if detector.running_mode == 'video':
+                        pose_result = detector.detect(
+                            frame, self.frame_timestamp_ms(index, self._fps)
+                        )
+                    else:
+                        pose_result = detector.detect(frame)
+                    if inference_times is not None:
+                        inference_times[slot] += time.perf_counter() - inference_start
+                    if gate is not None:
+                        gate.record(pose_result.pose_detected)
+                    if cache is not None:
+                        cache.put(index, pose_result)
+            except Exception as e:
+                self._queue_put(result_queue, _StageError(e))
+                return
+            if not self._queue_put(result_queue, (seq, index, pose_result, gated)):
+                return
+
+    def _queue_put(self, q: queue.Queue, item) -> bool:
+        """중단되지 않는 동안 큐에 넣기 (가득 차면 대기 = 역압)"""
+        while not self._stopped:
+            try:
+                q.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _queue_get(self, q: queue.Queue):
+        """중단되지 않는 동안 큐에서 꺼내기 (중단 시 None)"""
+        while not self._stopped:
+            try:
+                return q.get(timeout=_QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return None
+
+    def _skip_to(self, cap, frame_index: int, target: int, total_frames: int):
+        """target 프레임 직전까지 디코딩 없이 이동 (skip_to_frame 참고)"""
+        return skip_to_frame(cap, frame_index, target, total_frames,
+                             is_stopped=lambda: self._stopped,
+                             seek_min_interval=self.SEEK_MIN_INTERVAL,
+                             index=self._keyframe_index)
+
+
+def skip_to_frame(cap, frame_index: int, target: int, total_frames: int,
+                  is_stopped=None, seek_min_interval: int = AnalysisWorker.SEEK_MIN_INTERVAL,
+                  index: KeyframeIndex = None):
+    """target 프레임 직전까지 디코딩 없이 이동
+
+    간격이 짧으면 grab()만 호출하여 디코딩/색변환 비용을 피하고,
+    간격이 길면 키프레임 탐색(seek)으로 한 번에 이동한다.
+
+    Args:
+        cap: VideoCapture (grab/set 지원)
+        frame_index: 다음에 읽을 프레임 번호
+        target: 이동할 프레임 번호
+        total_frames: 프레임 상한 (0 이하면 제한 없음)
+        is_stopped: 중단 여부를 반환하는 콜백
+        index: 키프레임 색인 (있으면 탐색 후 위치를 확인해 정확히 맞춤)
+
+    Returns:
+        (이동 후 frame_index, 계속 진행 가능 여부)
+    """
+    gap = target - frame_index
+    if gap <= 0:
+        return frame_index, True
+
+    if gap >= seek_min_interval:
+        if total_frames > 0 and target >= total_frames:
+            return total_frames, False
+        position = seek_frame(cap, target, index)
+        return position, position == target
+
+    while frame_index < target:
+        if is_stopped is not None and is_stopped():
+            return frame_index, False
+        if not cap.grab():
+            return frame_index, False
+        frame_index += 1
+    return frame_index, True
@@ -3,6 +3,8 @@ import math
 import numpy as np
 from typing import Tuple, Dict, List, Union
 
+from src.core.landmarks import LandmarkArray
+
 # MediaPipe Pose 랜드마크 인덱스
 LANDMARKS = {
     'nose': 0,
@@ -57,6 +59,26 @@ ANGLE_DEFINITIONS = {
     'right_ankle': ('right_knee', 'right_ankle', 'right_foot_index'),
 }
 
+# 수직선 기준 굴곡 각도 이름 (calculate_all_angles에 추가되는 값)
+FLEXION_ANGLE_NAMES = (
+    'trunk_flexion',
+    'neck_flexion',
+    'left_shoulder_flexion',
+    'right_shoulder_flexion',
+    'left_elbow_flexion',
+    'right_elbow_flexion',
+    'left_wrist_flexion',
+    'right_wrist_flexion',
+    'left_knee_flexion',
+    'right_knee_flexion',
+)
+
+# 배치 계산 결과의 열 순서
+ALL_ANGLE_NAMES = tuple(ANGLE_DEFINITIONS) + FLEXION_ANGLE_NAMES
+
+# 목 굴곡 정면 카메라 보정값 (°)
+NECK_OFFSET = 5.0
+
 
 class AngleCalculator:
     """인체 관절 각도 계산 클래스"""
@@ -114,6 +136,10 @@ class AngleCalculator:
         Returns:
             각도 딕셔너리 {'joint_name': angle_value}
         """
+        # 배열 기반 랜드마크는 배치 경로로 한 번에 계산
+        if isinstance(landmarks, LandmarkArray) and len(landmarks) == len(LANDMARKS):
+            return self.angles_to_dicts(self.calculate_angles_batch(landmarks.array[None]))[0]
+
         angles = {}
 
         for angle_name, (p1_name, p2_name, p3_name) in ANGLE_DEFINITIONS.items():
@@ -185,7 +211,6 @@ class AngleCalculator:
         # --- 목 굴곡 (귀 중심점 2D, 부호 포함) ---
         # nose 대신 귀 중심점 사용 (두개골 중심에 가까워 편향 감소)
         # 양수 = 굴곡 (앞으로 숙임), 음수 = 신전 (뒤로 젖힘)
-        NECK_OFFSET = 5.0  # 정면 카메라 보정값 (°)
         nose = self._get_point(landmarks, 'nose')
         ear_center_2d = ((l_ear[0] + r_ear[0]) / 2, (l_ear[1] + r_ear[1]) / 2)
         sc_2d = (shoulder_center[0], shoulder_center[1])
@@ -277,3 +302,84 @@ class AngleCalculator:
         if dy == 0:
             return 90.0
         return math.degrees(math.atan(abs(dx) / abs(dy)))
+
+    # --- 배치 계산 (여러 프레임을 배열 연산으로 한 번에) ---
+
+    def calculate_angles_batch(self, landmarks: np.ndarray) -> np.ndarray:
+        """
+        여러 프레임의 모든 관절/굴곡 각도를 배열 연산으로 계산
+
+        calculate_all_angles와 같은 값을 낸다.
+
+        Args:
+            landmarks: (N, 33, 3) 또는 (N, 33, 4) 배열 - x, y, z[, visibility]
+
+        Returns:
+            (N, len(ALL_ANGLE_NAMES)) float64 배열 (열 순서 = ALL_ANGLE_NAMES)
+        """
+        points = np.asarray(landmarks, dtype=np.float64)[:, :, :3]
+        out = np.empty((points.shape[0], len(ALL_ANGLE_NAMES)), dtype=np.float64)
+
+        def p(name: str, dims: int = 3) -> np.ndarray:
+            return points[:, LANDMARKS[name], :dims]
+
+        # 관절 각도 (3D)
+        for col, (p1, p2, p3) in enumerate(ANGLE_DEFINITIONS.values()):
+            out[:, col] = self._angle_batch(p(p1), p(p2), p(p3))
+
+        col = len(ANGLE_DEFINITIONS)
+        shoulder_center = (p('left_shoulder') + p('right_shoulder')) / 2
+        hip_center = (p('left_hip') + p('right_hip')) / 2
+
+        # 몸통 굴곡 (수직선 기준)
+        dx = hip_center[:, 0] - shoulder_center[:, 0]
+        dy = hip_center[:, 1] - shoulder_center[:, 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trunk = np.degrees(np.arctan(np.abs(dx) / np.abs(dy)))
+        out[:, col] = np.where(dy == 0, 90.0, trunk)
+
+        # 목 굴곡 (귀 중심점 2D, 부호 포함)
+        ear_center = (p('left_ear', 2) + p('right_ear', 2)) / 2
+        sc = shoulder_center[:, :2]
+        hc = hip_center[:, :2]
+        neck_value = 180 - self._angle_batch(ear_center, sc, hc) - NECK_OFFSET
+        trunk_up = sc - hc
+        neck_dir = ear_center - sc
+        face_fwd = p('nose', 2) - ear_center
+        cross_neck = trunk_up[:, 0] * neck_dir[:, 1] - trunk_up[:, 1] * neck_dir[:, 0]
+        cross_face = trunk_up[:, 0] * face_fwd[:, 1] - trunk_up[:, 1] * face_fwd[:, 0]
+        is_extension = (np.abs(cross_face) > 1e-10) & (cross_neck * cross_face < 0)
+        out[:, col + 1] = np.where(is_extension, -np.abs(neck_value), np.maximum(neck_value, 0))
+
+        # 2D 굴곡 각도 (z축 노이즈로 인한 과대측정 방지)
+        for offset, side in enumerate(('left', 'right')):
+            s2 = p(f'{side}_shoulder', 2)
+            e2 = p(f'{side}_elbow', 2)
+            w2 = p(f'{side}_wrist', 2)
+            h2 = p(f'{side}_hip', 2)
+            k2 = p(f'{side}_knee', 2)
+            a2 = p(f'{side}_ankle', 2)
+            wrist_max = np.maximum(self._angle_batch(e2, w2, p(f'{side}_index', 2)),
+                                   self._angle_batch(e2, w2, p(f'{side}_pinky', 2)))
+
+            out[:, col + 2 + offset] = self._angle_batch(e2, s2, h2)
+            out[:, col + 4 + offset] = np.maximum(180 - self._angle_batch(s2, e2, w2), 0)
+            out[:, col + 6 + offset] = np.maximum(180 - wrist_max, 0)
+            out[:, col + 8 + offset] = np.maximum(180 - self._angle_batch(h2, k2, a2), 0)
+
+        return out
+
+    @staticmethod
+    def _angle_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        """calculate_angle의 배치 버전 ((N, D) 배열 세 개 → (N,) 각도)"""
+        ba = a - b
+        bc = c - b
+        dot = np.einsum('ij,ij->i', ba, bc)
+        norms = np.sqrt(np.einsum('ij,ij->i', ba, ba)) * np.sqrt(np.einsum('ij,ij->i', bc, bc))
+        cosine = np.clip(dot / (norms + 1e-10), -1.0, 1.0)
+        return np.degrees(np.arccos(cosine))
+
+    @staticmethod
+    def angles_to_dicts(angles: np.ndarray) -> List[Dict[str, float]]:
+        """calculate_angles_batch 결과를 프레임별 각도 딕셔너리로 변환"""
+        return [dict(zip(ALL_ANGLE_NAMES, row)) for row in angles.tolist()]
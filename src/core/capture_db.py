@@ -0,0 +1,204 @@
+"""
+SQLite 캡처 저장소
+
+장시간 평가로 캡처가 수천 개 이상 쌓이면 captures.json을 통째로 쓰고 읽는 비용이 커진다.
+캡처 레코드를 SQLite 테이블(레코드당 한 행)에 저장한다.
+
+- WAL 저널 + synchronous=NORMAL, 저장은 트랜잭션 하나로 묶어 executemany로 기록
+- 모델과 짝지어진 뒤에는 바뀐/삭제된 행만 다시 쓴다 (CaptureDataModel.take_changes)
+- 로드는 (timestamp, id) 인덱스를 따라 페이지 단위로 읽는다
+"""
+
+import sqlite3
+from dataclasses import fields
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .capture_model import (
+    CaptureDataModel,
+    CaptureRecord,
+    IMAGE_PATH_FIELDS,
+    absolute_image_path,
+    relative_image_path,
+)
+from .logger import get_logger
+
+SCHEMA_VERSION = 1
+
+# 로드/저장 한 번에 처리하는 행 수
+DEFAULT_PAGE_SIZE = 1000
+
+_FIELDS = [f.name for f in fields(CaptureRecord)]
+_SQL_TYPES = {bool: 'INTEGER', int: 'INTEGER', float: 'REAL', str: 'TEXT'}
+
+
+class CaptureDatabase:
+    """캡처 레코드 SQLite 파일
+
+    Args:
+        path: 데이터베이스 파일 경로 (없으면 생성)
+    """
+
+    def __init__(self, path: Path):
+        self._logger = get_logger('capture_db')
+        self._path = Path(path)
+        # 백그라운드 저장 스레드에서도 쓰므로 스레드 검사 해제 (한 번에 한 스레드만 사용)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+        # 증분 저장용: 짝지어진 모델(lineage)과 레코드 고유 번호 → 행 id
+        self._lineage: Optional[object] = None
+        self._row_ids: Dict[int, int] = {}
+        self._next_id = 1
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _create_schema(self) -> None:
+        """테이블/인덱스 생성 (예전 파일에 없는 필드는 열 추가)"""
+        with self._conn:
+            columns = ', '.join(f'{f.name} {_SQL_TYPES.get(f.type, "TEXT")}'
+                                for f in fields(CaptureRecord))
+            self._conn.execute(f'CREATE TABLE IF NOT EXISTS captures (id INTEGER PRIMARY KEY, {columns})')
+            existing = {row[1] for row in self._conn.execute('PRAGMA table_info(captures)')}
+            for f in fields(CaptureRecord):
+                if f.name not in existing:
+                    self._conn.execute(
+                        f'ALTER TABLE captures ADD COLUMN {f.name} {_SQL_TYPES.get(f.type, "TEXT")}')
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_captures_timestamp ON captures (timestamp, id)')
+            self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self) -> None:
+        """연결 종료 (WAL 내용은 본 파일에 반영)"""
+        if self._conn is not None:
+            self.checkpoint()
+            self._conn.close()
+            self._conn = None
+            self._lineage = None
+
+    def unpair(self) -> None:
+        """모델과의 짝 해제 (다음 sync는 전체 기록, 저장 취소/실패 시)"""
+        self._lineage = None
+
+    def checkpoint(self) -> None:
+        """WAL 내용을 본 파일에 반영하고 WAL을 비움 (파일 복사 전에 호출)"""
+        self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def count(self) -> int:
+        """저장된 레코드 수"""
+        return self._conn.execute('SELECT COUNT(*) FROM captures').fetchone()[0]
+
+    # === 저장 ===
+
+    def sync(self, model: CaptureDataModel, base_path: Path) -> int:
+        """
+        모델 내용을 데이터베이스에 반영
+
+        이 데이터베이스에서 로드했거나 이전에 저장한 모델(또는 그 snapshot)이면 바뀐 행만 쓰고,
+        다른 모델이면(JSON 프로젝트 마이그레이션 등) 테이블 전체를 다시 쓴다.
+
+        Args:
+            model: 저장할 캡처 모델
+            base_path: 이미지 경로의 기준 디렉토리 (상대 경로로 저장)
+
+        Returns:
+            기록/삭제한 행 수
+        """
+        paired = self._lineage is not None and self._lineage is model.lineage
+        changed, removed, reset = model.take_changes()
+
+        try:
+            with self._conn:
+                if not paired or reset:
+                    written = self._write_all(model, base_path)
+                else:
+                    written = self._write_changes(model, base_path, changed, removed)
+        except Exception:
+            # 롤백된 변경 기록은 되살릴 수 없으므로 다음 저장은 전체 기록
+            self._lineage = None
+            raise
+
+        self._lineage = model.lineage
+        self._logger.debug(f"캡처 DB 저장: {written}행 ({'증분' if paired and not reset else '전체'})")
+        return written
+
+    def _write_all(self, model: CaptureDataModel, base_path: Path) -> int:
+        self._conn.execute('DELETE FROM captures')
+        self._row_ids = {}
+        self._next_id = 1
+        record_ids = (model.record_id(index) for index in range(len(model)))
+        return self._insert_rows(self._rows(model, base_path, record_ids))
+
+    def _write_changes(self, model, base_path, changed, removed) -> int:
+        deleted = [(self._row_ids.pop(record_id),) for record_id in removed
+                   if record_id in self._row_ids]
+        self._conn.executemany('DELETE FROM captures WHERE id = ?', deleted)
+        return len(deleted) + self._insert_rows(self._rows(model, base_path, sorted(changed)))
+
+    def _rows(self, model, base_path, record_ids) -> Iterator[Tuple[Any, ...]]:
+        """레코드 고유 번호 → INSERT 행 (id, 필드...)"""
+        for record_id in record_ids:
+            row_id = self._row_ids.get(record_id)
+            if row_id is None:
+                row_id = self._row_ids[record_id] = self._next_id
+                self._next_id += 1
+            data = model.get_record_by_id(record_id).to_dict()
+            for key in IMAGE_PATH_FIELDS:
+                data[key] = relative_image_path(data.get(key), base_path)
+            yield (row_id, *(data[name] for name in _FIELDS))
+
+    def _insert_rows(self, rows: Iterator[Tuple[Any, ...]]) -> int:
+        sql = (f'INSERT OR REPLACE INTO captures (id, {", ".join(_FIELDS)}) '
+               f'VALUES ({", ".join("?" * (len(_FIELDS) + 1))})')
+        count = 0
+        while True:
+            batch = list(islice(rows, DEFAULT_PAGE_SIZE))
+            if not batch:
+                return count
+            self._conn.executemany(sql, batch)
+            count += len(batch)
+
+    # === 로드 ===
+
+    def iter_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+        """(행 id, 필드 딕셔너리) 목록을 타임스탬프 순으로 page_size개씩 반환"""
+        columns = ', '.join(_FIELDS)
+        cursor = self._conn.execute(
+            f'SELECT id, {columns} FROM captures ORDER BY timestamp, id LIMIT ?', (page_size,))
+        while True:
+            page = [(row[0], dict(zip(_FIELDS, row[1:]))) for row in cursor.fetchall()]
+            if not page:
+                return
+            yield page
+            last_id, last = page[-1]
+            cursor = self._conn.execute(
+                f'SELECT id, {columns} FROM captures WHERE (timestamp, id) > (?, ?) '
+                f'ORDER BY timestamp, id LIMIT ?', (last['timestamp'], last_id, page_size))
+
+    def load(self, base_path: Path, page_size: int = DEFAULT_PAGE_SIZE) -> CaptureDataModel:
+        """
+        모델로 로드 (이후 sync는 바뀐 행만 기록)
+
+        Args:
+            base_path: 이미지 경로의 기준 디렉토리 (절대 경로로 복원)
+            page_size: 한 번에 읽을 행 수
+        """
+        model = CaptureDataModel()
+        self._row_ids = {}
+        max_id = 0
+        for page in self.iter_pages(page_size):
+            for row_id, data in page:
+                for key in IMAGE_PATH_FIELDS:
+                    data[key] = absolute_image_path(data.get(key), base_path)
+                index = model.add_record(CaptureRecord.from_dict(data))
+                self._row_ids[model.record_id(index)] = row_id
+                max_id = max(max_id, row_id)
+        self._next_id = max_id + 1
+        model.take_changes()
+        self._lineage = model.lineage
+        return model
@@ -2,16 +2,18 @@
 캡처 데이터 모델
 
 스프레드시트 캡처 기능을 위한 데이터 모델 정의.
-CaptureRecord: 단일 캡처 레코드 (40개 필드)
-CaptureDataModel: 레코드 컬렉션 관리
+CaptureRecord: 단일 캡처 레코드 (85개 필드)
+CaptureDataModel: 레코드 컬렉션 관리 (필드별 NumPy 열 저장소, 레코드는 조회 시 뷰로 생성,
+                  시간/위험 수준/점수 인덱스 조회)
 """
 
 from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Sequence, Iterable, Iterator, Tuple, Union, Set
 from pathlib import Path
 import json
-import bisect
+
+import numpy as np
 
 from .score_calculator import (
     get_rula_table_a_score,
@@ -31,12 +33,62 @@ from .score_calculator import (
     # SI functions
     calculate_si_score,
     get_si_risk_level,
+    # 일괄 재계산용 배열 버전
+    get_rula_table_a_score_batch,
+    get_rula_table_b_score_batch,
+    get_rula_table_c_score_batch,
+    get_rula_risk_level_batch,
+    get_reba_table_a_score_batch,
+    get_reba_table_b_score_batch,
+    get_reba_table_c_score_batch,
+    get_reba_risk_level_batch,
+    get_owas_action_category_batch,
+    get_owas_risk_level_batch,
+    calculate_nle_rwl_batch,
+    calculate_nle_li_batch,
+    get_nle_risk_level_batch,
+    calculate_si_score_batch,
+    get_si_risk_level_batch,
 )
+from .capture_store import ColumnStore
 from .logger import get_logger
 
 _logger = get_logger('capture_model')
 
+# 평가별 계산 결과 필드 (입력 필드가 바뀌면 다시 계산)
+DERIVED_FIELDS = {
+    'rula': ('rula_score_a', 'rula_score_b', 'rula_score', 'rula_risk'),
+    'reba': ('reba_score_a', 'reba_score_b', 'reba_score', 'reba_risk'),
+    'owas': ('owas_code', 'owas_ac', 'owas_risk'),
+    'nle': ('nle_rwl', 'nle_li', 'nle_risk'),
+    'si': ('si_score', 'si_risk'),
+}
+
+# 일괄 수정할 수 없는 필드 (정렬 기준/캡처 정보)
+_KEY_FIELDS = ('timestamp', 'frame_number', 'capture_time')
+
+# 프로젝트 저장 시 상대 경로로 바꾸는 이미지 경로 필드
+IMAGE_PATH_FIELDS = ('video_frame_path', 'skeleton_image_path')
+
+# 조회 인덱스를 유지하는 필드 (점수는 범위, 위험 수준은 일치 조회)
+INDEXED_SCORE_FIELDS = ('rula_score', 'reba_score', 'owas_ac', 'nle_li', 'si_score')
+INDEXED_RISK_FIELDS = ('rula_risk', 'reba_risk', 'owas_risk', 'nle_risk', 'si_risk')
+
 
+def _with_slots(cls):
+    """dataclass에 필드 이름으로 __slots__를 선언한 클래스를 다시 만든다
+
+    dataclass(slots=True)와 같은 결과 (Python 3.10 이상 전용이라 직접 구현).
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
 @dataclass
 class CaptureRecord:
     """
@@ -501,67 +553,405 @@ class CaptureRecord:
         return record
 
 
+class StaleRecordError(LookupError):
+    """삭제된 레코드의 뷰에 접근 (슬롯이 비었거나 다른 레코드가 재사용 중)"""
+
+
+class CaptureRecordView(CaptureRecord):
+    """CaptureDataModel 저장소 한 행에 대한 CaptureRecord 호환 뷰
+
+    필드를 읽고 쓰면 저장소 열에 바로 반영된다. 만들 때의 슬롯 세대를 기억해 두고,
+    레코드가 삭제된(또는 슬롯이 다른 레코드에 재사용된) 뒤 접근하면 StaleRecordError를 낸다.
+    """
+
+    __slots__ = ('_store', '_slot', '_generation')
+
+    def __init__(self, store: ColumnStore, slot: int):
+        self._store = store
+        self._slot = slot
+        self._generation = store.generation(slot)
+
+    @property
+    def is_valid(self) -> bool:
+        """가리키는 레코드가 아직 저장소에 있는지"""
+        return self._generation != 0 and self._store.generation(self._slot) == self._generation
+
+    def _checked_slot(self) -> int:
+        if not self.is_valid:
+            raise StaleRecordError(f"삭제된 레코드입니다 (슬롯 {self._slot})")
+        return self._slot
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        d = self._store.row(self._checked_slot())
+        if isinstance(d['capture_time'], datetime):
+            d['capture_time'] = d['capture_time'].isoformat()
+        return d
+
+    def detach(self) -> CaptureRecord:
+        """저장소와 분리된 CaptureRecord 복사본"""
+        return CaptureRecord(**self._store.row(self._checked_slot()))
+
+    def __eq__(self, other):
+        if isinstance(other, CaptureRecord):
+            return _record_values(self) == _record_values(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+def _column_property(name: str) -> property:
+    def fget(self):
+        return self._store.get(self._checked_slot(), name)
+
+    def fset(self, value):
+        self._store.set(self._checked_slot(), name, value)
+
+    return property(fget, fset)
+
+
+for _field in fields(CaptureRecord):
+    setattr(CaptureRecordView, _field.name, _column_property(_field.name))
+del _field
+
+
+def relative_image_path(path: Optional[str], base_path: Path) -> Optional[str]:
+    """이미지 경로를 base_path 기준 상대 경로로 변환 (base_path 밖이면 원본 유지)"""
+    if not path:
+        return path
+    try:
+        path_obj = Path(path)
+        if path_obj.is_absolute():
+            # 절대 경로인 경우 base_path 기준 상대 경로로 변환
+            return str(path_obj.relative_to(base_path))
+        # 상대 경로인 경우 base_path로 시작하면 제거
+        path_str = str(path_obj)
+        base_path_str = str(base_path)
+        if path_str.startswith(base_path_str + '/') or path_str.startswith(base_path_str + '\\'):
+            return path_str[len(base_path_str) + 1:]
+    except ValueError:
+        # base_path 밖의 경로인 경우 원본 유지
+        pass
+    return path
+
+
+def absolute_image_path(path: Optional[str], base_path: Path) -> Optional[str]:
+    """상대 이미지 경로를 base_path 기준 절대 경로로 변환"""
+    if path and not Path(path).is_absolute():
+        return str(base_path / path)
+    return path
+
+
+def _record_values(record: CaptureRecord) -> Dict[str, Any]:
+    """레코드의 필드명 → 값 (뷰는 저장소에서 한 번에 읽음)"""
+    if isinstance(record, CaptureRecordView):
+        return record._store.row(record._checked_slot())
+    return {f.name: getattr(record, f.name) for f in fields(CaptureRecord)}
+
+
+def _recalculate_columns(col: Callable[[str], np.ndarray], groups) -> Dict[str, np.ndarray]:
+    """계산 결과 필드를 평가별로 배열 연산으로 다시 계산
+
+    CaptureRecord.recalculate_*와 같은 값을 낸다.
+
+    Args:
+        col: 필드명 → 대상 레코드 순서의 값 배열
+        groups: 다시 계산할 평가 ('rula', 'reba', 'owas', 'nle', 'si')
+
+    Returns:
+        필드명 → 대상 레코드 순서의 값 배열
+    """
+    out: Dict[str, np.ndarray] = {}
+
+    if 'rula' in groups:
+        posture_a = get_rula_table_a_score_batch(
+            col('rula_upper_arm'), col('rula_lower_arm'), col('rula_wrist'), col('rula_wrist_twist'))
+        posture_b = get_rula_table_b_score_batch(col('rula_neck'), col('rula_trunk'), col('rula_leg'))
+        out['rula_score_a'] = posture_a + col('rula_muscle_use_a') + col('rula_force_load_a')
+        out['rula_score_b'] = posture_b + col('rula_muscle_use_b') + col('rula_force_load_b')
+        out['rula_score'] = get_rula_table_c_score_batch(out['rula_score_a'], out['rula_score_b'])
+        out['rula_risk'] = get_rula_risk_level_batch(out['rula_score'])
+
+    if 'reba' in groups:
+        posture_a = get_reba_table_a_score_batch(col('reba_neck'), col('reba_trunk'), col('reba_leg'))
+        posture_b = get_reba_table_b_score_batch(
+            col('reba_upper_arm'), col('reba_lower_arm'), col('reba_wrist'))
+        out['reba_score_a'] = posture_a + col('reba_load_force')
+        out['reba_score_b'] = posture_b + col('reba_coupling')
+        score_c = get_reba_table_c_score_batch(out['reba_score_a'], out['reba_score_b'])
+        out['reba_score'] = score_c + col('reba_activity')
+        out['reba_risk'] = get_reba_risk_level_batch(out['reba_score'])
+
+    if 'owas' in groups:
+        back, arms, legs, load = col('owas_back'), col('owas_arms'), col('owas_legs'), col('owas_load')
+        code = back.astype(str)
+        for part in (arms, legs, load):
+            code = np.char.add(code, part.astype(str))
+        out['owas_code'] = code
+        out['owas_ac'] = get_owas_action_category_batch(back, arms, legs)
+        out['owas_risk'] = get_owas_risk_level_batch(out['owas_ac'])
+
+    if 'nle' in groups:
+        out['nle_rwl'] = calculate_nle_rwl_batch(
+            col('nle_h'), col('nle_v'), col('nle_d'), col('nle_a'),
+            frequency=col('nle_f'), duration_hours=1.0, coupling=col('nle_c'))
+        out['nle_li'] = calculate_nle_li_batch(col('nle_load'), out['nle_rwl'])
+        out['nle_risk'] = get_nle_risk_level_batch(out['nle_li'])
+
+    if 'si' in groups:
+        out['si_score'] = calculate_si_score_batch(
+            col('si_ie'), col('si_de'), col('si_em'), col('si_hwp'), col('si_sw'), col('si_dd'))
+        out['si_risk'] = get_si_risk_level_batch(out['si_score'])
+
+    return out
+
+
 class CaptureDataModel:
     """캡처 데이터 모델 (레코드 컬렉션 관리)"""
 
     def __init__(self):
-        self._records: List[CaptureRecord] = []
+        self._store = ColumnStore({f.name: f.type for f in fields(CaptureRecord)}, sort_key='timestamp')
+        for name in INDEXED_SCORE_FIELDS + INDEXED_RISK_FIELDS:
+            self._store.add_index(name)
+        self._change_listeners: List[Callable[[List[int]], None]] = []
+        self._lineage = object()
+
+    @property
+    def lineage(self) -> object:
+        """같은 레코드 집합을 가리키는 식별자 (원본과 snapshot()이 공유, 영속 저장소 짝 확인용)"""
+        return self._lineage
+
+    def snapshot(self, take_changes: bool = True) -> 'CaptureDataModel':
+        """
+        저장용 복사본 (열 배열 복사라 수만 건도 수 ms)
+
+        take_changes=True면 변경 기록이 복사본으로 넘어가므로, 복사본을 저장한 뒤 원본의 이후
+        변경만 다음 저장에 남는다. 저장이 실패하면 영속 저장소가 짝을 풀어 다음 저장을 전체 기록으로
+        처리한다. 복구용 저장처럼 영속 저장소에 반영하지 않을 복사본은 take_changes=False로 만든다.
+        """
+        copy = CaptureDataModel.__new__(CaptureDataModel)
+        copy._store = self._store.copy()
+        copy._change_listeners = []
+        copy._lineage = self._lineage
+        if take_changes:
+            self._store.take_changes()
+        else:
+            copy._store.take_changes()
+        return copy
+
+    def add_change_listener(self, callback: Callable[[List[int]], None]) -> None:
+        """일괄 변경 알림 등록 (callback(변경된 인덱스 리스트))"""
+        self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback: Callable[[List[int]], None]) -> None:
+        """일괄 변경 알림 해제"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def bulk_update(
+        self,
+        patch: Dict[str, Any],
+        indices: Optional[Sequence[int]] = None,
+    ) -> List[int]:
+        """
+        여러 레코드의 입력 필드를 한 번에 바꾸고 계산 결과를 일괄 재계산
+
+        바뀐 필드가 속한 평가(RULA/REBA/OWAS/NLE/SI)만 배열 연산으로 다시 계산하고,
+        변경 알림은 레코드 수와 관계없이 한 번만 보낸다. patch가 비어 있으면
+        모든 평가를 다시 계산한다 (recalculate_all 일괄 버전).
+
+        Args:
+            patch: 필드명 → 값 (모든 레코드에 같은 값) 또는 indices 순서의 값 목록
+            indices: 대상 레코드 인덱스 (None이면 전체)
+
+        Returns:
+            변경된 레코드 인덱스 (indices 순서)
+
+        Raises:
+            ValueError: 없는 필드, 계산 결과/키 필드, 값 목록 길이 불일치, 중복 인덱스
+            IndexError: 범위를 벗어난 인덱스
+        """
+        if indices is None:
+            rows = list(range(len(self._store)))
+        else:
+            rows = [int(i) for i in indices]
+            if len(set(rows)) != len(rows):
+                raise ValueError("중복된 레코드 인덱스가 있습니다")
+            for i in rows:
+                if not 0 <= i < len(self._store):
+                    raise IndexError(f"레코드 인덱스 범위를 벗어났습니다: {i}")
+
+        derived = {name for names in DERIVED_FIELDS.values() for name in names}
+        record_fields = {f.name for f in fields(CaptureRecord)}
+        columns = {}
+        for name, values in patch.items():
+            if name not in record_fields:
+                raise ValueError(f"알 수 없는 필드: {name}")
+            if name in derived or name in _KEY_FIELDS:
+                raise ValueError(f"일괄 수정할 수 없는 필드: {name}")
+            if isinstance(values, (str, bytes)) or np.ndim(values) == 0:
+                values = [values] * len(rows)
+            elif len(values) != len(rows):
+                raise ValueError(f"{name} 값 개수({len(values)})가 레코드 수({len(rows)})와 다릅니다")
+            columns[name] = values
+
+        if not rows:
+            return rows
+
+        slots = self._store.slots(rows)
+        for name, values in columns.items():
+            self._store.set_column(name, slots, values)
+
+        groups = {name.split('_', 1)[0] for name in columns} if columns else set(DERIVED_FIELDS)
+        derived_columns = _recalculate_columns(lambda name: self._store.column(name, slots), groups)
+        for name, values in derived_columns.items():
+            self._store.set_column(name, slots, values)
+
+        for callback in list(self._change_listeners):
+            callback(rows)
+        return rows
+
+    def recalculate_all(self, indices: Optional[Sequence[int]] = None) -> List[int]:
+        """모든 평가 일괄 재계산 (CaptureRecord.recalculate_all 배열 버전)"""
+        return self.bulk_update({}, indices)
 
     def add_record(self, record: CaptureRecord) -> int:
         """
         레코드 추가 (타임스탬프 기준 정렬 유지)
 
+        레코드 값은 저장소 열에 복사된다. 이후 변경은 get_record로 받은 뷰를 통해 한다.
+
         Returns:
             삽입된 인덱스
         """
-        # bisect를 사용하여 정렬된 위치에 삽입
-        timestamps = [r.timestamp for r in self._records]
-        index = bisect.bisect_left(timestamps, record.timestamp)
-        self._records.insert(index, record)
-        return index
+        return self._store.insert(_record_values(record))
+
+    def _view(self, index: int) -> CaptureRecordView:
+        return CaptureRecordView(self._store, self._store.slot_at(index))
 
     def get_record(self, index: int) -> Optional[CaptureRecord]:
-        """인덱스로 레코드 조회"""
-        if 0 <= index < len(self._records):
-            return self._records[index]
+        """인덱스로 레코드 조회 (저장소에 바로 반영되는 뷰, 삭제 후 접근하면 StaleRecordError)"""
+        if 0 <= index < len(self._store):
+            return self._view(index)
         return None
 
     def update_record(self, index: int, record: CaptureRecord) -> bool:
         """레코드 업데이트"""
-        if 0 <= index < len(self._records):
-            self._records[index] = record
+        if 0 <= index < len(self._store):
+            slot = self._store.slot_at(index)
+            if not (isinstance(record, CaptureRecordView) and record._store is self._store
+                    and record._slot == slot and record.is_valid):
+                self._store.assign(slot, _record_values(record))
             return True
         return False
 
     def delete_record(self, index: int) -> bool:
         """레코드 삭제"""
-        if 0 <= index < len(self._records):
-            del self._records[index]
+        if 0 <= index < len(self._store):
+            self._store.delete(index)
             return True
         return False
 
+    def record_id(self, index: int) -> int:
+        """레코드 고유 번호 (레코드가 삭제될 때까지 인덱스가 바뀌어도 유지, 삭제 후 재사용될 수 있음)"""
+        return self._store.slot_at(index)
+
+    def get_record_by_id(self, record_id: int) -> CaptureRecord:
+        """고유 번호로 레코드 뷰 조회"""
+        return CaptureRecordView(self._store, record_id)
+
+    def take_changes(self) -> Tuple[Set[int], Set[int], bool]:
+        """
+        마지막 호출 이후 추가/수정/삭제된 레코드 고유 번호 (영속 저장소의 증분 저장용)
+
+        Returns:
+            (추가/수정된 번호, 삭제된 번호, clear 여부). 삭제 후 재사용된 번호는 양쪽에 모두 있다.
+        """
+        return self._store.take_changes()
+
     def get_all_records(self) -> List[CaptureRecord]:
-        """모든 레코드 반환"""
-        return self._records.copy()
+        """모든 레코드 반환 (뷰 목록)"""
+        return [self._view(index) for index in range(len(self._store))]
+
+    def iter_records(self, indices: Optional[Iterable[int]] = None) -> Iterator[CaptureRecord]:
+        """레코드 뷰를 하나씩 반환 (None이면 전체, 목록을 미리 만들지 않음)"""
+        if indices is None:
+            indices = range(len(self._store))
+        for index in indices:
+            yield self._view(int(index))
+
+    def select(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        risk_levels: Optional[Dict[str, Union[str, Iterable[str]]]] = None,
+        scores: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    ) -> np.ndarray:
+        """
+        조건에 맞는 레코드 인덱스 (타임스탬프 순)
+
+        타임스탬프/점수/위험 수준 인덱스를 이진 탐색하므로 조건마다 O(log n + k).
+        조건끼리는 AND로 결합한다.
+
+        Args:
+            start, end: 타임스탬프 범위 (초, 양 끝 포함, None이면 제한 없음)
+            risk_levels: 위험 수준 필드 → 값 또는 값 목록 (예: {'rula_risk': ['high', 'very_high']})
+            scores: 점수 필드 → (최소, 최대) (양 끝 포함, None이면 제한 없음)
+
+        Returns:
+            레코드 인덱스 배열 (int64, 오름차순)
+
+        Raises:
+            ValueError: 인덱스가 없는 필드
+        """
+        first, stop = self._store.key_range(start, end)
+        candidates = []
+        for name, levels in (risk_levels or {}).items():
+            if name not in INDEXED_RISK_FIELDS:
+                raise ValueError(f"위험 수준으로 조회할 수 없는 필드: {name}")
+            if isinstance(levels, str):
+                levels = [levels]
+            candidates.append(self._store.index_equal(name, levels))
+        for name, (low, high) in (scores or {}).items():
+            if name not in INDEXED_SCORE_FIELDS:
+                raise ValueError(f"점수로 조회할 수 없는 필드: {name}")
+            candidates.append(self._store.index_between(name, low, high))
+
+        if not candidates:
+            return np.arange(first, stop, dtype=np.int64)
+
+        slots = candidates[0]
+        for other in candidates[1:]:
+            slots = np.intersect1d(slots, other, assume_unique=True)
+        positions = np.sort(self._store.positions(slots))
+        return positions[(positions >= first) & (positions < stop)]
+
+    def query(self, **criteria) -> Iterator[CaptureRecord]:
+        """조건에 맞는 레코드 뷰를 타임스탬프 순으로 하나씩 반환 (조건은 select와 같음)"""
+        return self.iter_records(self.select(**criteria))
 
     def clear(self) -> None:
         """모든 레코드 삭제"""
-        self._records.clear()
+        self._store.clear()
 
     def __len__(self) -> int:
-        return len(self._records)
+        return len(self._store)
+
+    def memory_usage(self) -> int:
+        """저장소 열 배열의 바이트 수"""
+        return self._store.nbytes()
 
     def to_json(self, indent: int = 2) -> str:
         """JSON 문자열로 직렬화"""
         return json.dumps(
-            [record.to_dict() for record in self._records],
+            self.to_dict_list(),
             ensure_ascii=False,
             indent=indent,
         )
 
     def to_dict_list(self) -> List[Dict[str, Any]]:
         """딕셔너리 리스트 반환 (Excel용)"""
-        return [record.to_dict() for record in self._records]
+        return [record.to_dict() for record in self.iter_records()]
 
     def to_project_dict(self, base_path: Path) -> Dict[str, Any]:
         """
@@ -576,28 +966,13 @@ class CaptureDataModel:
             {'records': [...]} 형태의 딕셔너리
         """
         records = []
-        base_path_str = str(base_path)
 
-        for record in self._records:
+        for record in self.iter_records():
             data = record.to_dict()
 
             # 이미지 경로를 상대 경로로 변환
-            for key in ('video_frame_path', 'skeleton_image_path'):
-                path = data.get(key)
-                if path:
-                    try:
-                        path_obj = Path(path)
-                        if path_obj.is_absolute():
-                            # 절대 경로인 경우 base_path 기준 상대 경로로 변환
-                            data[key] = str(path_obj.relative_to(base_path))
-                        else:
-                            # 상대 경로인 경우 base_path로 시작하면 제거
-                            path_str = str(path_obj)
-                            if path_str.startswith(base_path_str + '/') or path_str.startswith(base_path_str + '\\'):
-                                data[key] = path_str[len(base_path_str) + 1:]
-                    except ValueError:
-                        # base_path 밖의 경로인 경우 원본 유지
-                        pass
+            for key in IMAGE_PATH_FIELDS:
+                data[key] = relative_image_path(data.get(key), base_path)
 
             records.append(data)
 
@@ -627,13 +1002,9 @@ class CaptureDataModel:
 
         for idx, record_data in enumerate(records_data):
             # 이미지 경로를 절대 경로로 변환
-            for key in ('video_frame_path', 'skeleton_image_path'):
-                path = record_data.get(key)
-                if path:
-                    rel_path = Path(path)
-                    if not rel_path.is_absolute():
-                        abs_path = str(base_path / rel_path)
-                        record_data[key] = abs_path
+            for key in IMAGE_PATH_FIELDS:
+                if record_data.get(key):
+                    record_data[key] = absolute_image_path(record_data[key], base_path)
 
             record = CaptureRecord.from_dict(record_data)
             model.add_record(record)
@@ -0,0 +1,426 @@
+"""캡처 레코드 열 저장소 (struct-of-arrays)
+
+자동 캡처 세션은 레코드가 수만 개까지 늘어난다. 레코드마다 85개 필드를 가진 객체를 두면
+메모리가 커지고, 정렬 삽입마다 타임스탬프 목록을 다시 만들어야 한다.
+필드마다 NumPy 열 하나에 값을 모으고(정수/실수는 고정 크기 배열, 위험 수준 같은 반복 문자열은
+정수 코드 + 문자열 사전), 정렬 키(타임스탬프) 인덱스를 따로 유지한다.
+
+레코드는 슬롯(열의 행 번호)에 저장되고, 정렬 위치 → 슬롯 배열로 순서를 관리한다.
+삭제된 슬롯은 다음 삽입에 재사용한다. 슬롯마다 세대 번호(삽입 때마다 새 값, 삭제 시 0)를 두어
+슬롯을 가리키는 뷰가 삭제/재사용 뒤의 다른 레코드를 읽지 않게 한다 (generation). 조회가 잦은 열에는 보조 인덱스(SortedIndex)를 두어
+범위/일치 조회를 이진 탐색으로 처리한다. 바뀐/삭제된 슬롯은 변경 기록에 모아
+영속 저장소가 바뀐 행만 다시 쓸 수 있게 한다 (take_changes).
+
+삽입 비용: 자리는 이진 탐색(O(log n))으로 찾지만, 정렬 인덱스(슬롯/키 int64·float64 두 배열)와
+보조 인덱스는 그 뒤 구간을 한 칸 미는 memmove라 최악 O(n)이다. 열 데이터는 옮기지 않는다.
+자동 캡처는 시각 순으로 뒤에 붙이므로 이동이 없고, 중간 삽입(수동 캡처/가져오기)도
+10만 건에서 약 0.16ms라 충분하다. 블록 분할 구조로 바꾸면 삽입은 줄지만 정렬 위치 기반 조회
+(key_range, slots, positions)가 모두 느려지므로 연속 배열을 유지한다.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# 열 초기 용량 (가득 차면 두 배로 늘림)
+INITIAL_CAPACITY = 64
+
+_INT, _FLOAT, _STR, _OBJECT = 'int', 'float', 'str', 'object'
+
+
+class _StringPool:
+    """반복 문자열 사전 (문자열 ↔ 정수 코드)"""
+
+    __slots__ = ('values', '_codes')
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def code(self, value) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.array(self.values, dtype=object)[codes]
+
+
+class SortedIndex:
+    """(값, 슬롯) 오름차순 보조 인덱스
+
+    범위 조회는 O(log n + k), 추가/삭제는 이진 탐색 후 배열 한 구간 이동 (memmove, 최악 O(n)).
+    같은 값 안에서는 슬롯 순으로 정렬해 특정 (값, 슬롯) 항목도 이진 탐색으로 찾는다.
+    """
+
+    def __init__(self, dtype, capacity: int = INITIAL_CAPACITY):
+        self._values = np.empty(max(1, capacity), dtype=dtype)
+        self._slots = np.empty(max(1, capacity), dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def nbytes(self) -> int:
+        return self._values.nbytes + self._slots.nbytes
+
+    def _locate(self, value, slot: int) -> int:
+        values = self._values[:self._size]
+        lo = int(np.searchsorted(values, value, side='left'))
+        hi = int(np.searchsorted(values, value, side='right'))
+        return lo + int(np.searchsorted(self._slots[lo:hi], slot))
+
+    def add(self, value, slot: int) -> None:
+        n = self._size
+        if n >= len(self._values):
+            self._values = np.concatenate([self._values, np.empty_like(self._values)])
+            self._slots = np.concatenate([self._slots, np.empty_like(self._slots)])
+        i = int(np.searchsorted(self._values[:n], value, side='right'))
+        if i and self._values[i - 1] == value and self._slots[i - 1] > slot:
+            i = self._locate(value, slot)  # 재사용 슬롯: 같은 값 구간 안에서 자리 찾기
+        self._values[i + 1:n + 1] = self._values[i:n]
+        self._slots[i + 1:n + 1] = self._slots[i:n]
+        self._values[i] = value
+        self._slots[i] = slot
+        self._size = n + 1
+
+    def remove(self, value, slot: int) -> None:
+        n = self._size
+        i = self._locate(value, slot)
+        if i >= n or self._slots[i] != slot:
+            raise KeyError(f"인덱스에 없는 항목: ({value}, {slot})")
+        self._values[i:n - 1] = self._values[i + 1:n]
+        self._slots[i:n - 1] = self._slots[i + 1:n]
+        self._size = n - 1
+
+    def copy(self) -> 'SortedIndex':
+        index = SortedIndex.__new__(SortedIndex)
+        index._values = self._values.copy()
+        index._slots = self._slots.copy()
+        index._size = self._size
+        return index
+
+    def rebuild(self, values: np.ndarray, slots: np.ndarray) -> None:
+        """전체 재구성 (대량 변경 시)"""
+        order = np.lexsort((slots, values))
+        size = len(slots)
+        capacity = max(len(self._values), size)
+        self._values = np.empty(capacity, dtype=self._values.dtype)
+        self._slots = np.empty(capacity, dtype=np.int64)
+        self._values[:size] = values[order]
+        self._slots[:size] = slots[order]
+        self._size = size
+
+    def between(self, low=None, high=None) -> np.ndarray:
+        """low ≤ 값 ≤ high 인 슬롯 (None이면 제한 없음, 값 순)"""
+        values = self._values[:self._size]
+        lo = 0 if low is None else int(np.searchsorted(values, low, side='left'))
+        hi = self._size if high is None else int(np.searchsorted(values, high, side='right'))
+        return self._slots[lo:max(lo, hi)].copy()
+
+
+class ColumnStore:
+    """필드별 NumPy 열에 레코드를 저장하고 정렬 키 순서를 유지하는 저장소
+
+    Args:
+        field_types: 필드명 → 타입 (int/float는 숫자 열, str은 코드 열, 그 외는 object 열)
+        sort_key: 정렬 기준 필드 (실수로 비교)
+    """
+
+    def __init__(self, field_types: Dict[str, Any], sort_key: str,
+                 capacity: int = INITIAL_CAPACITY):
+        self._kinds = {name: self._kind_of(tp) for name, tp in field_types.items()}
+        self._sort_key = sort_key
+        self._initial_capacity = max(1, capacity)
+        self._indexed: tuple = ()
+        self._next_generation = 1  # clear 후에도 이어서 증가 (이전 세대와 겹치지 않게)
+        self.clear()
+
+    @staticmethod
+    def _kind_of(tp) -> str:
+        if tp is bool or tp is int:
+            return _INT
+        if tp is float:
+            return _FLOAT
+        if tp is str:
+            return _STR
+        return _OBJECT
+
+    def clear(self) -> None:
+        """모든 레코드 삭제 (열 용량도 초기화)"""
+        self._capacity = self._initial_capacity
+        self._size = 0
+        self._slot_count = 0
+        self._free_slots: List[int] = []
+        self._pools = {name: _StringPool() for name, kind in self._kinds.items() if kind == _STR}
+        self._columns = {name: self._empty_column(kind, self._capacity)
+                         for name, kind in self._kinds.items()}
+        self._order = np.empty(self._capacity, dtype=np.int64)   # 정렬 위치 → 슬롯
+        self._keys = np.empty(self._capacity, dtype=np.float64)  # 정렬 위치 → 정렬 키
+        self._generations = np.zeros(self._capacity, dtype=np.int64)  # 슬롯 → 세대 (0 = 빈 슬롯)
+        self._positions: Optional[np.ndarray] = None             # 슬롯 → 정렬 위치 (조회 시 생성)
+        self._indexes: Dict[str, SortedIndex] = {
+            name: SortedIndex(self._columns[name].dtype, self._capacity)
+            for name in self._indexed
+        }
+        # 변경 기록 (take_changes로 가져가면 비움)
+        self._changed: Set[int] = set()
+        self._removed: Set[int] = set()
+        self._reset = True
+
+    def add_index(self, name: str) -> None:
+        """열에 보조 인덱스 추가 (숫자 열은 범위, 문자열 열은 일치 조회)"""
+        if self._kinds[name] == _OBJECT:
+            raise ValueError(f"인덱스를 만들 수 없는 열: {name}")
+        self._indexed += (name,)
+        index = SortedIndex(self._columns[name].dtype, self._capacity)
+        slots = self._order[:self._size]
+        index.rebuild(self._columns[name][slots], slots)
+        self._indexes[name] = index
+
+    def copy(self) -> 'ColumnStore':
+        """독립된 복사본 (열 배열 memcpy, 슬롯 번호와 변경 기록도 그대로)"""
+        store = ColumnStore.__new__(ColumnStore)
+        store.__dict__.update(self.__dict__)
+        store._columns = {name: column.copy() for name, column in self._columns.items()}
+        store._pools = {}
+        for name, pool in self._pools.items():
+            copied = _StringPool()
+            copied.values = list(pool.values)
+            copied._codes = dict(pool._codes)
+            store._pools[name] = copied
+        store._indexes = {name: index.copy() for name, index in self._indexes.items()}
+        store._order = self._order.copy()
+        store._keys = self._keys.copy()
+        store._generations = self._generations.copy()
+        store._positions = None
+        store._free_slots = list(self._free_slots)
+        store._changed = set(self._changed)
+        store._removed = set(self._removed)
+        return store
+
+    @staticmethod
+    def _empty_column(kind: str, capacity: int) -> np.ndarray:
+        if kind == _INT:
+            return np.zeros(capacity, dtype=np.int64)
+        if kind == _FLOAT:
+            return np.zeros(capacity, dtype=np.float64)
+        if kind == _STR:
+            return np.zeros(capacity, dtype=np.int32)
+        return np.full(capacity, None, dtype=object)
+
+    def _grow(self) -> None:
+        """열 용량 두 배로 확장"""
+        capacity = self._capacity * 2
+        for name, column in self._columns.items():
+            grown = self._empty_column(self._kinds[name], capacity)
+            grown[:self._capacity] = column
+            self._columns[name] = grown
+        for attr in ('_order', '_keys', '_generations'):
+            old = getattr(self, attr)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self._capacity] = old
+            setattr(self, attr, grown)
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._kinds)
+
+    def nbytes(self) -> int:
+        """열 배열이 차지하는 바이트 수 (object 열은 포인터만)"""
+        return (sum(column.nbytes for column in self._columns.values())
+                + self._order.nbytes + self._keys.nbytes
+                + sum(aux.nbytes() for aux in self._indexes.values()))
+
+    # --- 레코드 단위 ---
+
+    def insert(self, values: Dict[str, Any]) -> int:
+        """레코드 삽입 (정렬 키 기준 bisect_left 위치)
+
+        위치 탐색은 O(log n), 정렬 인덱스 이동은 삽입 위치 뒤 구간 memmove (끝에 추가하면 0).
+
+        Returns:
+            삽입된 정렬 위치
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self._slot_count >= self._capacity:
+                self._grow()
+            slot = self._slot_count
+            self._slot_count += 1
+        self._generations[slot] = self._next_generation
+        self._next_generation += 1
+        for name, value in values.items():
+            self._write(slot, name, value)
+        for name, aux in self._indexes.items():
+            aux.add(self._columns[name][slot], slot)
+        self._changed.add(slot)
+
+        key = float(values[self._sort_key])
+        n = self._size
+        index = int(np.searchsorted(self._keys[:n], key, side='left'))
+        if index < n:
+            # 정렬 인덱스만 한 칸 밀기 (열 데이터는 옮기지 않음, 뒤에 추가하면 이동 없음)
+            self._order[index + 1:n + 1] = self._order[index:n]
+            self._keys[index + 1:n + 1] = self._keys[index:n]
+        self._order[index] = slot
+        self._keys[index] = key
+        self._size = n + 1
+        self._positions = None
+        return index
+
+    def delete(self, index: int) -> None:
+        """정렬 위치의 레코드 삭제 (슬롯은 재사용 목록으로)"""
+        n = self._size
+        slot = int(self._order[index])
+        self._order[index:n - 1] = self._order[index + 1:n]
+        self._keys[index:n - 1] = self._keys[index + 1:n]
+        self._size = n - 1
+        self._positions = None
+        for name, aux in self._indexes.items():
+            aux.remove(self._columns[name][slot], slot)
+        for name, kind in self._kinds.items():
+            if kind == _OBJECT:
+                self._columns[name][slot] = None  # 경로 문자열 등 참조 해제
+        self._generations[slot] = 0
+        self._free_slots.append(slot)
+        self._changed.discard(slot)
+        self._removed.add(slot)
+
+    def generation(self, slot: int) -> int:
+        """슬롯의 세대 번호 (삽입할 때마다 바뀌고 빈 슬롯은 0)"""
+        if 0 <= slot < self._capacity:
+            return int(self._generations[slot])
+        return 0
+
+    def slot_at(self, index: int) -> int:
+        """정렬 위치 → 슬롯"""
+        return int(self._order[index])
+
+    def slots(self, indices: Optional[Iterable[int]] = None) -> np.ndarray:
+        """정렬 위치 목록 → 슬롯 배열 (None이면 전체, 정렬 순서)"""
+        if indices is None:
+            return self._order[:self._size].copy()
+        return self._order[np.asarray(list(indices), dtype=np.int64)]
+
+    def get(self, slot: int, name: str) -> Any:
+        """한 필드 값 (파이썬 값)"""
+        kind = self._kinds[name]
+        value = self._columns[name][slot]
+        if kind == _STR:
+            return self._pools[name].values[value]
+        if kind == _OBJECT:
+            return value
+        return value.item()
+
+    def set(self, slot: int, name: str, value: Any) -> None:
+        """한 필드 값 변경 (정렬 키를 바꾸면 정렬 인덱스의 키도 갱신, 위치는 유지)"""
+        aux = self._indexes.get(name)
+        if aux is not None:
+            aux.remove(self._columns[name][slot], slot)
+        self._write(slot, name, value)
+        if aux is not None:
+            aux.add(self._columns[name][slot], slot)
+        self._changed.add(slot)
+        if name == self._sort_key:
+            index = np.flatnonzero(self._order[:self._size] == slot)
+            if index.size:
+                self._keys[index[0]] = float(value)
+
+    def row(self, slot: int) -> Dict[str, Any]:
+        """슬롯의 모든 필드 값"""
+        return {name: self.get(slot, name) for name in self._kinds}
+
+    def assign(self, slot: int, values: Dict[str, Any]) -> None:
+        """슬롯의 필드 값 일괄 변경"""
+        for name, value in values.items():
+            self.set(slot, name, value)
+
+    def _write(self, slot: int, name: str, value: Any) -> None:
+        if self._kinds[name] == _STR:
+            value = self._pools[name].code(value)
+        self._columns[name][slot] = value
+
+    # --- 열 단위 ---
+
+    def column(self, name: str, slots: np.ndarray) -> np.ndarray:
+        """슬롯들의 열 값 (문자열 열은 object 배열로 복원)"""
+        values = self._columns[name][slots]
+        if self._kinds[name] == _STR:
+            return self._pools[name].decode(values)
+        return values
+
+    def set_column(self, name: str, slots: np.ndarray, values) -> None:
+        """슬롯들의 열 값 일괄 변경 (보조 인덱스는 변경량에 따라 항목 갱신 또는 재구성)"""
+        if self._kinds[name] == _STR:
+            pool = self._pools[name]
+            values = np.array([pool.code(value) for value in values], dtype=np.int32)
+        aux = self._indexes.get(name)
+        column = self._columns[name]
+        if aux is not None and len(slots) * 8 < self._size:
+            values = np.broadcast_to(np.asarray(values, dtype=column.dtype), len(slots))
+            for slot, value in zip(np.asarray(slots).tolist(), values):
+                aux.remove(column[slot], slot)
+                column[slot] = value
+                aux.add(value, slot)
+        else:
+            column[slots] = values
+            if aux is not None:
+                live = self._order[:self._size]
+                aux.rebuild(column[live], live)
+        self._changed.update(np.asarray(slots).tolist())
+        if name == self._sort_key:
+            self._keys[self.positions(slots)] = np.asarray(values, dtype=np.float64)
+
+    # --- 변경 기록 ---
+
+    def take_changes(self) -> Tuple[Set[int], Set[int], bool]:
+        """마지막 호출 이후의 변경 기록을 가져오고 비움
+
+        Returns:
+            (추가/수정된 슬롯, 삭제된 슬롯, clear 여부).
+            삭제 후 재사용된 슬롯은 양쪽에 모두 들어 있다 (삭제를 먼저 반영할 것).
+        """
+        changes = (self._changed, self._removed, self._reset)
+        self._changed, self._removed, self._reset = set(), set(), False
+        return changes
+
+    # --- 조회 ---
+
+    def positions(self, slots: np.ndarray) -> np.ndarray:
+        """슬롯 → 정렬 위치 (역방향 표는 삽입/삭제 후 처음 조회할 때 한 번 만든다)"""
+        if self._positions is None:
+            positions = np.full(self._slot_count, -1, dtype=np.int64)
+            positions[self._order[:self._size]] = np.arange(self._size)
+            self._positions = positions
+        return self._positions[slots]
+
+    def key_range(self, low=None, high=None) -> tuple:
+        """low ≤ 정렬 키 ≤ high 인 정렬 위치 구간 [start, stop)"""
+        keys = self._keys[:self._size]
+        start = 0 if low is None else int(np.searchsorted(keys, low, side='left'))
+        stop = self._size if high is None else int(np.searchsorted(keys, high, side='right'))
+        return start, max(start, stop)
+
+    def index_between(self, name: str, low=None, high=None) -> np.ndarray:
+        """보조 인덱스 범위 조회 → 슬롯 배열"""
+        return self._indexes[name].between(low, high)
+
+    def index_equal(self, name: str, values: Iterable[Any]) -> np.ndarray:
+        """보조 인덱스 일치 조회 (값 목록 중 하나와 같음) → 슬롯 배열"""
+        index = self._indexes[name]
+        if self._kinds[name] == _STR:
+            codes = self._pools[name]._codes
+            values = [codes[value] for value in values if value in codes]
+        parts = [index.between(value, value) for value in values]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def is_indexed(self, name: str) -> bool:
+        return name in self._indexes
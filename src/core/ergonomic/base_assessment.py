@@ -2,7 +2,13 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, List, Optional
+
+import numpy as np
+
+from ..angle_calculator import ALL_ANGLE_NAMES
+from ..landmarks import LandmarkArray
 
 
 # 감지 임계값 기본값
@@ -118,6 +124,10 @@ class BaseAssessment(ABC):
         if not landmarks or index >= len(landmarks):
             return (0.0, 0.0, 0.0)
 
+        if isinstance(landmarks, LandmarkArray):
+            x, y, z = landmarks.array[index, :3].tolist()
+            return (x, y, z)
+
         lm = landmarks[index]
         if isinstance(lm, dict):
             return (lm.get('x', 0), lm.get('y', 0), lm.get('z', 0))
@@ -144,3 +154,81 @@ class BaseAssessment(ABC):
 
         angle = math.degrees(math.atan(abs(dx) / abs(dy)))
         return angle
+
+    # --- 배치 계산 (여러 프레임을 배열 연산으로 한 번에) ---
+    # 서브클래스의 calculate_batch가 사용한다. 랜드마크 인덱스는 서브클래스 상수를 따른다.
+
+    @staticmethod
+    def _batch_size(angles, landmarks) -> int:
+        """배치 프레임 수"""
+        if landmarks is not None:
+            return len(landmarks)
+        if isinstance(angles, np.ndarray):
+            return angles.shape[0]
+        for column in angles.values():
+            return len(column)
+        return 0
+
+    @staticmethod
+    def _batch_angle(angles, name: str, default: float, n: int) -> np.ndarray:
+        """배치 각도 열 조회 (없으면 default로 채움 - calculate의 angles.get과 같은 동작)
+
+        angles는 (N, len(ALL_ANGLE_NAMES)) 배열 또는 각도명 → (N,) 배열 딕셔너리
+        """
+        if isinstance(angles, np.ndarray):
+            if name not in ALL_ANGLE_NAMES:
+                return np.full(n, float(default))
+            return angles[:, ALL_ANGLE_NAMES.index(name)].astype(np.float64, copy=False)
+        column = angles.get(name)
+        if column is None:
+            return np.full(n, float(default))
+        return np.asarray(column, dtype=np.float64)
+
+    @staticmethod
+    def _batch_points(landmarks) -> Optional[np.ndarray]:
+        """(N, 33, 3) float64 좌표 배열 (랜드마크가 없으면 None)"""
+        if landmarks is None:
+            return None
+        return np.asarray(landmarks, dtype=np.float64)[:, :, :3]
+
+    def _batch_trunk_flexion(self, points: np.ndarray) -> np.ndarray:
+        """어깨 중심-골반 중심 선의 수직선 기준 각도 (_calculate_angle_from_vertical 배치 버전)"""
+        shoulder_center = (points[:, self.LEFT_SHOULDER, :2] + points[:, self.RIGHT_SHOULDER, :2]) / 2
+        hip_center = (points[:, self.LEFT_HIP, :2] + points[:, self.RIGHT_HIP, :2]) / 2
+        dx = hip_center[:, 0] - shoulder_center[:, 0]
+        dy = hip_center[:, 1] - shoulder_center[:, 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            angle = np.degrees(np.arctan(np.abs(dx) / np.abs(dy)))
+        return np.where(dy == 0, 90.0, angle)
+
+    def _batch_neck_twisted(self, points: Optional[np.ndarray], n: int) -> np.ndarray:
+        """목 회전 여부 (귀 중심점과 어깨 중심의 x좌표 차이, 0/1)"""
+        if points is None:
+            return np.zeros(n, dtype=np.int64)
+        ear_center_x = (points[:, 7, 0] + points[:, 8, 0]) / 2
+        shoulder_center_x = (points[:, self.LEFT_SHOULDER, 0] + points[:, self.RIGHT_SHOULDER, 0]) / 2
+        twisted = np.abs(ear_center_x - shoulder_center_x) > self._get_threshold('neck_twisted')
+        return twisted.astype(np.int64)
+
+    def _batch_trunk_side_bending(self, points: Optional[np.ndarray], n: int) -> np.ndarray:
+        """몸통 측굴 여부 (좌우 어깨 y좌표 차이, 0/1)"""
+        if points is None:
+            return np.zeros(n, dtype=np.int64)
+        tilt = np.abs(points[:, self.LEFT_SHOULDER, 1] - points[:, self.RIGHT_SHOULDER, 1])
+        return (tilt > self._get_threshold('trunk_side_bending')).astype(np.int64)
+
+    def _batch_upper_arm_abducted(self, points: Optional[np.ndarray], n: int) -> np.ndarray:
+        """상박 외전 여부 (팔꿈치가 어깨보다 바깥쪽, 0/1)"""
+        if points is None:
+            return np.zeros(n, dtype=np.int64)
+        abducted = (points[:, self.LEFT_ELBOW, 0]
+                    < points[:, self.LEFT_SHOULDER, 0] - self._get_threshold('upper_arm_abducted'))
+        return abducted.astype(np.int64)
+
+    @staticmethod
+    def batch_rows(batch: Dict[str, np.ndarray]) -> Iterator[SimpleNamespace]:
+        """calculate_batch 결과를 프레임별 속성 접근 객체로 순회 (MovementAnalyzer.update 등 기존 API용)"""
+        columns = {name: values.tolist() for name, values in batch.items()}
+        n = len(next(iter(columns.values()), ()))
+        for i in range(n):
+            yield SimpleNamespace(**{name: values[i] for name, values in columns.items()})
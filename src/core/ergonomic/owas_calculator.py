@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 import math
 
+import numpy as np
+
 from .base_assessment import BaseAssessment, AssessmentResult, DEFAULT_DETECTION_THRESHOLDS
 
 
@@ -57,6 +59,14 @@ class OWASCalculator(BaseAssessment):
         (4, 3, 1): 3, (4, 3, 2): 3, (4, 3, 3): 4, (4, 3, 4): 4, (4, 3, 5): 4, (4, 3, 6): 4, (4, 3, 7): 4,
     }
 
+    # 배치 계산용 배열 테이블 [back-1][arms-1][legs-1] → AC
+    ACTION_CATEGORY_ARRAY = np.ones((4, 3, 7), dtype=np.int64)
+    for (_back, _arms, _legs), _ac in ACTION_CATEGORY_TABLE.items():
+        ACTION_CATEGORY_ARRAY[_back - 1, _arms - 1, _legs - 1] = _ac
+    del _back, _arms, _legs, _ac
+
+    RISK_ORDER = ('normal', 'slight', 'harmful', 'very_harmful')
+
     RISK_LEVELS = {
         'normal': '개선 필요 없음',
         'slight': '부분적 개선',
@@ -124,6 +134,76 @@ class OWASCalculator(BaseAssessment):
             posture_code=posture_code,
         )
 
+    def calculate_batch(self, angles, landmarks=None, load_code: int = 1,
+                        is_sitting: bool = False) -> Dict[str, np.ndarray]:
+        """여러 프레임의 OWAS 코드를 배열 연산으로 한 번에 계산
+
+        프레임마다 calculate를 호출한 것과 같은 코드를 낸다 (detection_sensitivity 반영).
+
+        Args:
+            angles: (N, len(ALL_ANGLE_NAMES)) 각도 배열 또는 각도명 → (N,) 배열 딕셔너리
+            landmarks: (N, 33, 3 이상) 랜드마크 배열 (None이면 랜드마크 없이 계산)
+            load_code: 하중 코드 (1: 10kg 미만, 2: 10-20kg, 3: 20kg 초과)
+            is_sitting: 앉음 상태 (수동 선택)
+
+        Returns:
+            OWASResult 코드 필드명(final_score, risk_level 포함) → (N,) 배열 딕셔너리
+        """
+        n = self._batch_size(angles, landmarks)
+        points = self._batch_points(landmarks)
+        s = self.detection_sensitivity
+
+        # 등 / 팔 (랜드마크가 없으면 1)
+        if points is None:
+            back_code = np.ones(n, dtype=np.int64)
+            arms_code = np.ones(n, dtype=np.int64)
+        else:
+            is_bent = self._batch_trunk_flexion(points) > self._get_threshold('owas_back_bent')
+            twisted_thresh = self._get_threshold('owas_back_twisted')
+            y = points[:, :, 1]
+            is_twisted = ((np.abs(y[:, self.LEFT_SHOULDER] - y[:, self.RIGHT_SHOULDER]) > twisted_thresh)
+                          | (np.abs(y[:, self.LEFT_HIP] - y[:, self.RIGHT_HIP]) > twisted_thresh))
+            back_code = np.select([is_bent & is_twisted, is_twisted, is_bent], [4, 3, 2], default=1)
+
+            arm_margin = 0.02 * s
+            left_raised = ((y[:, self.LEFT_WRIST] < y[:, self.LEFT_SHOULDER] - arm_margin)
+                           | (y[:, self.LEFT_ELBOW] < y[:, self.LEFT_SHOULDER] - arm_margin))
+            right_raised = ((y[:, self.RIGHT_WRIST] < y[:, self.RIGHT_SHOULDER] - arm_margin)
+                            | (y[:, self.RIGHT_ELBOW] < y[:, self.RIGHT_SHOULDER] - arm_margin))
+            arms_code = 1 + left_raised.astype(np.int64) + right_raised.astype(np.int64)
+
+        # 다리
+        if is_sitting:
+            legs_code = np.ones(n, dtype=np.int64)
+        else:
+            left_knee_angle = self._batch_angle(angles, 'left_knee', 180, n)
+            right_knee_angle = self._batch_angle(angles, 'right_knee', 180, n)
+            knee_bent_thresh = DEFAULT_DETECTION_THRESHOLDS['owas_knee_bent'] / s if s > 0 else 150
+            kneeling_thresh = DEFAULT_DETECTION_THRESHOLDS['owas_kneeling'] / s if s > 0 else 90
+            left_knee_bent = left_knee_angle < knee_bent_thresh
+            right_knee_bent = right_knee_angle < knee_bent_thresh
+            kneeling = (left_knee_angle < kneeling_thresh) & (right_knee_angle < kneeling_thresh)
+            legs_code = np.select(
+                [left_knee_bent & right_knee_bent & kneeling, left_knee_bent & right_knee_bent,
+                 left_knee_bent | right_knee_bent],
+                [6, 4, 5], default=2)
+
+        load_code = max(1, min(3, load_code))
+        action_category = self.ACTION_CATEGORY_ARRAY[back_code - 1, arms_code - 1, legs_code - 1]
+        posture_code = (back_code * 1000 + arms_code * 100 + legs_code * 10 + load_code).astype(str)
+        risk_level = np.array(self.RISK_ORDER)[np.clip(action_category - 1, 0, 3)]
+
+        return {
+            'final_score': action_category,
+            'risk_level': risk_level,
+            'back_code': back_code,
+            'arms_code': arms_code,
+            'legs_code': legs_code,
+            'load_code': np.full(n, load_code, dtype=np.int64),
+            'action_category': action_category,
+            'posture_code': posture_code,
+        }
+
     def _calculate_back_code(self, angles: Dict[str, float], landmarks: List[Dict]) -> int:
         """
         등 코드 계산 (1-4)
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 import math
 
+import numpy as np
+
 from .base_assessment import BaseAssessment, AssessmentResult
 
 
@@ -107,6 +109,15 @@ class REBACalculator(BaseAssessment):
         [12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12],  # A=12
     ]
 
+    # 배치 계산용 배열 테이블
+    TABLE_A_ARRAY = np.array(TABLE_A)
+    TABLE_B_ARRAY = np.array(TABLE_B)
+    TABLE_C_ARRAY = np.array(TABLE_C)
+
+    # 위험 수준 경계 (점수 ≤ 경계값 → 해당 수준, 마지막은 초과)
+    RISK_BOUNDS = (1, 3, 7, 10)
+    RISK_ORDER = ('negligible', 'low', 'medium', 'high', 'very_high')
+
     RISK_LEVELS = {
         'negligible': '개선 필요 없음',
         'low': '부분적 개선',
@@ -195,6 +206,109 @@ class REBACalculator(BaseAssessment):
             wrist_twisted=wrist_details['twisted'],
         )
 
+    def calculate_batch(self, angles, landmarks=None) -> Dict[str, np.ndarray]:
+        """여러 프레임의 REBA 점수를 배열 연산으로 한 번에 계산
+
+        프레임마다 calculate를 호출한 것과 같은 점수를 낸다 (detection_sensitivity 반영).
+
+        Args:
+            angles: (N, len(ALL_ANGLE_NAMES)) 각도 배열 또는 각도명 → (N,) 배열 딕셔너리
+            landmarks: (N, 33, 3 이상) 랜드마크 배열 (None이면 랜드마크 없이 계산)
+
+        Returns:
+            REBAResult 점수 필드명(final_score, risk_level 포함) → (N,) 배열 딕셔너리
+        """
+        n = self._batch_size(angles, landmarks)
+        points = self._batch_points(landmarks)
+        zeros = np.zeros(n, dtype=np.int64)
+
+        # 목
+        flexion = self._batch_angle(angles, 'neck_flexion', 0, n)
+        neck_base = np.where((0 <= flexion) & (flexion <= self._get_threshold('neck_flexion_high')), 1, 2)
+        neck_twist_side = self._batch_neck_twisted(points, n)
+        neck = np.minimum(neck_base + neck_twist_side, 3)
+
+        # 몸통 (랜드마크가 없으면 1점)
+        if points is None:
+            trunk_base = np.ones(n, dtype=np.int64)
+        else:
+            flexion = self._batch_trunk_flexion(points)
+            trunk_base = np.select(
+                [flexion <= self._get_threshold('trunk_flexion_1'),
+                 flexion <= self._get_threshold('trunk_flexion_2'),
+                 flexion <= self._get_threshold('trunk_flexion_3')],
+                [1, 2, 3], default=4)
+        trunk_twist_side = self._batch_trunk_side_bending(points, n)
+        trunk = np.minimum(trunk_base + trunk_twist_side, 5)
+
+        # 다리
+        knee_flexion = np.maximum(self._batch_angle(angles, 'left_knee_flexion', 0, n),
+                                  self._batch_angle(angles, 'right_knee_flexion', 0, n))
+        lk_mid = self._get_threshold('leg_knee_mid')
+        lk_high = self._get_threshold('leg_knee_high')
+        leg_base = np.ones(n, dtype=np.int64)
+        leg_knee_30_60 = ((knee_flexion > lk_mid) & (knee_flexion <= lk_high)).astype(np.int64)
+        leg_knee_over_60 = np.where(knee_flexion > lk_high, 2, 0)
+        leg = np.minimum(leg_base + leg_knee_30_60 + leg_knee_over_60, 4)
+
+        # 상완
+        flexion = self._batch_angle(angles, 'left_shoulder', 90, n)
+        t1 = self._get_threshold('upper_arm_flexion_1')
+        t2 = self._get_threshold('upper_arm_flexion_2')
+        t3 = self._get_threshold('upper_arm_flexion_3')
+        upper_arm_base = np.select(
+            [(-t1 <= flexion) & (flexion <= t1), (flexion > t1) & (flexion <= t2),
+             (flexion > t2) & (flexion <= t3), flexion > t3],
+            [1, 2, 3, 4], default=2)
+        upper_arm_abducted = self._batch_upper_arm_abducted(points, n)
+        upper_arm = np.minimum(upper_arm_base + upper_arm_abducted, 6)
+
+        # 전완
+        flexion = self._batch_angle(angles, 'left_elbow_flexion', 90, n)
+        in_range = ((self._get_threshold('elbow_flexion_low') <= flexion)
+                    & (flexion <= self._get_threshold('elbow_flexion_high')))
+        lower_arm = np.where(in_range, 1, 2)
+
+        # 손목
+        flexion = self._batch_angle(angles, 'left_wrist_flexion', 0, n)
+        wrist_base = np.where(flexion <= self._get_threshold('wrist_flexion_2'), 1, 2)
+        wrist = np.minimum(wrist_base, 3)
+
+        # Table A/B/C
+        group_a_score = self.TABLE_A_ARRAY[
+            np.clip(neck - 1, 0, 2), np.clip(trunk - 1, 0, 4), np.clip(leg - 1, 0, 3)]
+        group_b_score = self.TABLE_B_ARRAY[
+            np.clip(upper_arm - 1, 0, 5), np.clip(lower_arm - 1, 0, 1), np.clip(wrist - 1, 0, 2)]
+        final_score = self.TABLE_C_ARRAY[
+            np.clip(group_a_score - 1, 0, 11), np.clip(group_b_score - 1, 0, 11)]
+        risk_level = np.array(self.RISK_ORDER)[np.searchsorted(self.RISK_BOUNDS, final_score)]
+
+        return {
+            'final_score': final_score,
+            'risk_level': risk_level,
+            'group_a_score': group_a_score,
+            'group_b_score': group_b_score,
+            'neck_score': neck,
+            'trunk_score': trunk,
+            'leg_score': leg,
+            'upper_arm_score': upper_arm,
+            'lower_arm_score': lower_arm,
+            'wrist_score': wrist,
+            'neck_base': neck_base,
+            'neck_twist_side': neck_twist_side,
+            'trunk_base': trunk_base,
+            'trunk_twist_side': trunk_twist_side,
+            'leg_base': leg_base,
+            'leg_knee_30_60': leg_knee_30_60,
+            'leg_knee_over_60': leg_knee_over_60,
+            'upper_arm_base': upper_arm_base,
+            'upper_arm_shoulder_raised': zeros,
+            'upper_arm_abducted': upper_arm_abducted,
+            'upper_arm_supported': zeros,
+            'wrist_base': wrist_base,
+            'wrist_twisted': zeros,
+        }
+
     def _calculate_neck_score(self, angles: Dict[str, float], landmarks: List[Dict]) -> Dict[str, int]:
         """목 점수 계산 (세부 점수 포함)"""
         # 목 굴곡 (좌/우 몸통 기준 평균, 0°=직립)
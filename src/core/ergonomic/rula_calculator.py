@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any
 import math
 
+import numpy as np
+
 from .base_assessment import BaseAssessment, AssessmentResult
 
 
@@ -123,6 +125,15 @@ class RULACalculator(BaseAssessment):
         [5, 5, 6, 7, 7, 7, 7],  # A=8
     ]
 
+    # 배치 계산용 배열 테이블
+    TABLE_A_ARRAY = np.array(TABLE_A)
+    TABLE_B_ARRAY = np.array(TABLE_B)
+    TABLE_C_ARRAY = np.array(TABLE_C)
+
+    # 위험 수준 경계 (점수 ≤ 경계값 → 해당 수준, 마지막은 초과)
+    RISK_BOUNDS = (2, 4, 6)
+    RISK_ORDER = ('acceptable', 'investigate', 'change_soon', 'change_now')
+
     RISK_LEVELS = {
         'acceptable': '개선 필요 없음',
         'investigate': '부분적 개선',
@@ -211,6 +222,116 @@ class RULACalculator(BaseAssessment):
             trunk_side_bending=trunk_details['side_bending'],
         )
 
+    def calculate_batch(self, angles, landmarks=None) -> Dict[str, np.ndarray]:
+        """여러 프레임의 RULA 점수를 배열 연산으로 한 번에 계산
+
+        프레임마다 calculate를 호출한 것과 같은 점수를 낸다 (detection_sensitivity 반영).
+
+        Args:
+            angles: (N, len(ALL_ANGLE_NAMES)) 각도 배열 또는 각도명 → (N,) 배열 딕셔너리
+            landmarks: (N, 33, 3 이상) 랜드마크 배열 (None이면 랜드마크 없이 계산)
+
+        Returns:
+            RULAResult 점수 필드명(final_score, risk_level 포함) → (N,) 배열 딕셔너리
+        """
+        n = self._batch_size(angles, landmarks)
+        points = self._batch_points(landmarks)
+        zeros = np.zeros(n, dtype=np.int64)
+
+        # 상박
+        flexion = self._batch_angle(angles, 'left_shoulder', 90, n)
+        t1 = self._get_threshold('upper_arm_flexion_1')
+        t2 = self._get_threshold('upper_arm_flexion_2')
+        t3 = self._get_threshold('upper_arm_flexion_3')
+        upper_arm_base = np.select(
+            [(-t1 <= flexion) & (flexion <= t1), (flexion > t1) & (flexion <= t2),
+             (flexion > t2) & (flexion <= t3), flexion > t3, flexion < -t1],
+            [1, 2, 3, 4, 2], default=1)
+        upper_arm_abducted = self._batch_upper_arm_abducted(points, n)
+        upper_arm = np.minimum(upper_arm_base + upper_arm_abducted, 6)
+
+        # 하박
+        flexion = self._batch_angle(angles, 'left_elbow_flexion', 90, n)
+        in_range = ((self._get_threshold('elbow_flexion_low') <= flexion)
+                    & (flexion <= self._get_threshold('elbow_flexion_high')))
+        lower_arm_base = np.where(in_range, 1, 2)
+        lower_arm = np.minimum(lower_arm_base, 3)
+
+        # 손목
+        flexion = self._batch_angle(angles, 'left_wrist_flexion', 0, n)
+        wrist_base = np.select(
+            [flexion <= self._get_threshold('wrist_flexion_1'),
+             flexion <= self._get_threshold('wrist_flexion_2')],
+            [1, 2], default=3)
+        wrist = np.minimum(wrist_base, 4)
+        wrist_twist = np.ones(n, dtype=np.int64)
+
+        # 목
+        flexion = self._batch_angle(angles, 'neck_flexion', 0, n)
+        neck_base = np.select(
+            [flexion < 0, flexion <= self._get_threshold('neck_flexion_mid'),
+             flexion <= self._get_threshold('neck_flexion_high')],
+            [4, 1, 2], default=3)
+        neck_twisted = self._batch_neck_twisted(points, n)
+        neck = np.minimum(neck_base + neck_twisted, 6)
+
+        # 몸통 (랜드마크가 없으면 1점)
+        if points is None:
+            trunk_base = np.ones(n, dtype=np.int64)
+        else:
+            flexion = self._batch_trunk_flexion(points)
+            trunk_base = np.select(
+                [flexion <= self._get_threshold('trunk_flexion_1'),
+                 flexion <= self._get_threshold('trunk_flexion_2'),
+                 flexion <= self._get_threshold('trunk_flexion_3')],
+                [1, 2, 3], default=4)
+        trunk_side_bending = self._batch_trunk_side_bending(points, n)
+        trunk = np.minimum(trunk_base + trunk_side_bending, 6)
+
+        # 다리
+        leg_thresh = self._get_threshold('leg_flexion')
+        legs_straight = ((self._batch_angle(angles, 'left_knee_flexion', 0, n) <= leg_thresh)
+                         & (self._batch_angle(angles, 'right_knee_flexion', 0, n) <= leg_thresh))
+        leg = np.where(legs_straight, 1, 2)
+
+        # Table A/B/C
+        arm_wrist_score = self.TABLE_A_ARRAY[
+            np.clip(upper_arm - 1, 0, 5), np.clip(lower_arm - 1, 0, 2),
+            np.clip(wrist - 1, 0, 3), np.clip(wrist_twist - 1, 0, 1)]
+        neck_trunk_score = self.TABLE_B_ARRAY[
+            np.clip(neck - 1, 0, 5), np.clip(trunk - 1, 0, 5), np.clip(leg - 1, 0, 1)]
+        final_score = self.TABLE_C_ARRAY[
+            np.clip(arm_wrist_score - 1, 0, 7), np.clip(neck_trunk_score - 1, 0, 6)]
+        risk_level = np.array(self.RISK_ORDER)[np.searchsorted(self.RISK_BOUNDS, final_score)]
+
+        return {
+            'final_score': final_score,
+            'risk_level': risk_level,
+            'arm_wrist_score': arm_wrist_score,
+            'neck_trunk_score': neck_trunk_score,
+            'upper_arm_score': upper_arm,
+            'lower_arm_score': lower_arm,
+            'wrist_score': wrist,
+            'wrist_twist_score': wrist_twist,
+            'neck_score': neck,
+            'trunk_score': trunk,
+            'leg_score': leg,
+            'upper_arm_base': upper_arm_base,
+            'upper_arm_shoulder_raised': zeros,
+            'upper_arm_abducted': upper_arm_abducted,
+            'upper_arm_supported': zeros,
+            'lower_arm_base': lower_arm_base,
+            'lower_arm_working_across': zeros,
+            'wrist_base': wrist_base,
+            'wrist_bent_midline': zeros,
+            'neck_base': neck_base,
+            'neck_twisted': neck_twisted,
+            'neck_side_bending': zeros,
+            'trunk_base': trunk_base,
+            'trunk_twisted': zeros,
+            'trunk_side_bending': trunk_side_bending,
+        }
+
     def _calculate_upper_arm_score(self, angles: Dict[str, float], landmarks: List[Dict]) -> Dict[str, int]:
         """상완 점수 계산 (세부 점수 포함)"""
         # 어깨 각도(팔꿈치-어깨-엉덩이) 자체가 팔 거상각에 대응
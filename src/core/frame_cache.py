@@ -0,0 +1,251 @@
+"""디코딩된 프레임 캐시
+
+한 프레임 뒤로 가거나 한 지점 주변을 오가며 탐색하면, OpenCV는 매번 직전 키프레임부터
+다시 디코딩한다. 재생 위치 주변에서 디코딩한 프레임을 바이트 한도가 있는 LRU 캐시에 두고,
+일시정지/탐색 후에는 백그라운드 스레드가 재생 위치 뒤쪽 구간을 미리 채워서
+한 프레임씩 뒤로 가기와 짧은 탐색은 메모리에서 바로 꺼낸다.
+
+- FrameCache: 프레임 번호 → 프레임 (읽기 전용), 바이트 한도를 넘으면 가장 오래 안 쓴 것부터 버림
+- FrameBackfiller: 자체 VideoCapture로 [위치 - window, 위치) 구간의 빠진 프레임을 순서대로 디코딩
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from src.core.logger import get_logger
+
+# 기본 캐시 한도 (1080p BGR 프레임 약 40장, 4K 약 10장)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 재생 위치 뒤로 미리 채울 기본 프레임 수
+DEFAULT_BACKFILL_FRAMES = 30
+
+
+def _seek_position(cap, frame: int) -> int:
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+    return frame
+
+
+class FrameCache:
+    """바이트 한도가 있는 프레임 LRU 캐시 (스레드 안전)
+
+    저장한 프레임은 읽기 전용으로 바꾼다. 꺼낸 프레임을 고쳐 쓰려면 복사해야 한다.
+
+    Args:
+        max_bytes: 캐시가 보관할 프레임 바이트 합계 한도
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._max_bytes = max(0, int(max_bytes))
+        self._frames: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 프레임 바이트 합계"""
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, index: int) -> bool:
+        with self._lock:
+            return index in self._frames
+
+    def get(self, index: int) -> Optional[np.ndarray]:
+        """프레임 조회 (있으면 가장 최근 사용으로 표시)"""
+        with self._lock:
+            frame = self._frames.get(index)
+            if frame is None:
+                self._misses += 1
+                return None
+            self._frames.move_to_end(index)
+            self._hits += 1
+            return frame
+
+    def put(self, index: int, frame: np.ndarray) -> bool:
+        """
+        프레임 저장 (한도를 넘으면 오래 안 쓴 프레임부터 버림)
+
+        Returns:
+            저장 여부 (프레임 하나가 한도보다 크면 저장하지 않음)
+        """
+        if frame.nbytes > self._max_bytes:
+            return False
+        frame.setflags(write=False)
+        with self._lock:
+            old = self._frames.pop(index, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._frames[index] = frame
+            self._nbytes += frame.nbytes
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+        return True
+
+    def missing(self, start: int, stop: int) -> int:
+        """[start, stop) 구간에서 캐시에 없는 프레임 수"""
+        with self._lock:
+            return sum(1 for index in range(start, stop) if index not in self._frames)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+
+class FrameBackfiller:
+    """재생 위치 뒤쪽 프레임을 미리 디코딩해 캐시를 채우는 백그라운드 스레드
+
+    요청 칸은 하나뿐이라 디코딩 중에 새 위치가 들어오면 최신 위치만 남는다.
+    디코딩 중인 프레임이 새 위치의 구간을 벗어나면 그 자리에서 멈추고 새 위치부터 채운다.
+    스레드와 VideoCapture는 첫 요청 때 만든다.
+
+    Args:
+        open_capture: VideoCapture를 여는 함수 (스레드 안에서 호출)
+        cache: 채울 프레임 캐시
+        window: 위치 뒤로 채울 프레임 수
+        seek: (캡처, 프레임 번호) → 실제 다음 읽기 위치 (기본: CAP_PROP_POS_FRAMES 탐색)
+    """
+
+    def __init__(self, open_capture: Callable[[], object], cache: FrameCache,
+                 window: int = DEFAULT_BACKFILL_FRAMES,
+                 seek: Optional[Callable[[object, int], int]] = None):
+        self._logger = get_logger('frame_cache')
+        self._open_capture = open_capture
+        self._cache = cache
+        self._window = max(0, int(window))
+        self._seek = seek or _seek_position
+        self._condition = threading.Condition()
+        self._pending: Optional[int] = None
+        self._latest: Optional[int] = None
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._decoded = 0
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def decoded_frames(self) -> int:
+        """지금까지 미리 디코딩해 캐시에 넣은 프레임 수"""
+        return self._decoded
+
+    def request(self, position: int):
+        """position 바로 앞 window개 프레임 채우기 요청"""
+        if self._window == 0:
+            return
+        with self._condition:
+            if self._stopping:
+                return
+            self._pending = self._latest = position
+            self._condition.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='frame-backfill', daemon=True)
+                self._thread.start()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 요청이 없고 디코딩도 끝날 때까지 대기 (테스트용)"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and self._latest is None, timeout)
+
+    def stop(self):
+        """스레드 종료 (디코딩 중인 프레임이 끝날 때까지 대기)"""
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _next(self) -> Optional[int]:
+        with self._condition:
+            while self._pending is None and not self._stopping:
+                self._condition.wait()
+            if self._stopping:
+                return None
+            position, self._pending = self._pending, None
+            return position
+
+    def _superseded(self, index: int) -> bool:
+        """더 새로운 요청이 있고 index가 그 구간 밖이면 True"""
+        with self._condition:
+            if self._stopping:
+                return True
+            latest = self._latest
+        return latest is None or not (latest - self._window <= index < latest + self._window)
+
+    def _run(self):
+        cap = None
+        try:
+            while True:
+                position = self._next()
+                if position is None:
+                    return
+                start = max(0, position - self._window)
+                # 바로 앞 프레임이 있고 빠진 프레임이 절반 미만이면 다음 요청까지 미룸
+                # (한 프레임씩 뒤로 갈 때마다 키프레임부터 다시 디코딩하지 않도록)
+                missing = self._cache.missing(start, position)
+                if missing and ((position - 1) not in self._cache or missing * 2 >= self._window):
+                    if cap is None:
+                        cap = self._open_capture()
+                    self._fill(cap, start, position)
+                with self._condition:
+                    if self._pending is None:
+                        self._latest = None
+                        self._condition.notify_all()
+        except Exception as e:
+            self._logger.error(f"프레임 미리 디코딩 오류: {e}")
+            with self._condition:
+                self._pending = self._latest = None
+                self._condition.notify_all()
+        finally:
+            if cap is not None:
+                cap.release()
+
+    def _fill(self, cap, start: int, stop: int):
+        """[start, stop) 구간의 빠진 프레임을 순서대로 디코딩 (이미 있는 프레임은 grab으로 넘김)"""
+        first = start
+        while first < stop and first in self._cache:
+            first += 1
+        if first >= stop:
+            return
+        if self._seek(cap, first) != first:
+            return
+        for index in range(first, stop):
+            if self._superseded(index):
+                return
+            if index in self._cache:
+                if not cap.grab():
+                    return
+                continue
+            ret, frame = cap.read()
+            if not ret:
+                return
+            self._cache.put(index, frame)
+            self._decoded += 1
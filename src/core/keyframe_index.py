@@ -0,0 +1,279 @@
+"""키프레임 색인 사이드카
+
+OpenCV의 CAP_PROP_POS_FRAMES 탐색은 프레임 번호를 fps로 시각으로 바꿔 찾아가므로
+긴 H.264 파일에서는 느리고, 가변 fps나 시작 시각이 0이 아닌 파일에서는 몇 프레임씩 빗나간다.
+동영상마다 한 번 패킷만 훑어(디코딩 없음) 키프레임 위치와 프레임별 시각을 기록해 두고,
+탐색은 목표 직전 키프레임으로 간 뒤 도착한 위치를 시각으로 확인하고 남은 프레임을 grab()으로 넘긴다.
+
+사이드카 파일: <index_dir>/<동영상 내용 지문>.keyframes.npz
+    timestamps : float64 (frames,) - 표시 순서 프레임 시각 (ms)
+    keyframes  : int64 (keys,)     - 키프레임 프레임 번호 (오름차순, 0 포함)
+
+색인을 만들 수 없는 동영상(시각이 겹치거나 패킷을 읽을 수 없음)은 빈 표시 파일
+<동영상 내용 지문>.keyframes.none을 남겨, 다음에 열 때 파일 전체를 다시 훑지 않는다.
+"""
+import os
+import threading
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from src.core.landmark_cache import video_fingerprint
+from src.core.logger import get_logger
+from src.utils.cv_unicode import VideoCapture as CvVideoCapture
+
+INDEX_VERSION = 1
+
+# 탐색이 목표를 지나쳤을 때 더 앞 키프레임으로 다시 시도하는 횟수
+_SEEK_RETRIES = 3
+
+_logger = get_logger('keyframe_index')
+
+
+def index_path(index_dir: str, fingerprint: str) -> str:
+    """사이드카 파일 경로"""
+    return os.path.join(index_dir, f'{fingerprint}.keyframes.npz')
+
+
+def unindexable_path(index_dir: str, fingerprint: str) -> str:
+    """색인을 만들 수 없는 동영상 표시 파일 경로"""
+    return os.path.join(index_dir, f'{fingerprint}.keyframes.none')
+
+
+class KeyframeIndex:
+    """동영상 키프레임 위치와 프레임별 시각
+
+    Args:
+        timestamps_ms: 표시 순서 프레임 시각 (ms, 오름차순)
+        keyframes: 키프레임 프레임 번호
+    """
+
+    def __init__(self, timestamps_ms, keyframes):
+        self._timestamps = np.asarray(timestamps_ms, dtype=np.float64)
+        keyframes = np.asarray(keyframes, dtype=np.int64)
+        if len(self._timestamps):
+            # 첫 프레임은 파일 처음이라 항상 탐색 기준이 될 수 있음
+            keyframes = keyframes[(keyframes >= 0) & (keyframes < len(self._timestamps))]
+            keyframes = np.union1d(keyframes, [0])
+        self._keyframes = keyframes
+        intervals = np.diff(self._timestamps)
+        # 같은 프레임으로 볼 시각 오차 (프레임 간격의 절반)
+        self._tolerance = float(np.median(intervals)) / 2 if len(intervals) else 0.5
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def keyframes(self) -> np.ndarray:
+        return self._keyframes
+
+    @property
+    def timestamps_ms(self) -> np.ndarray:
+        return self._timestamps
+
+    def keyframe_before(self, frame: int) -> int:
+        """frame 이하인 가장 가까운 키프레임 번호"""
+        position = int(np.searchsorted(self._keyframes, frame, side='right')) - 1
+        return int(self._keyframes[max(0, position)])
+
+    def timestamp_ms(self, frame: int) -> Optional[float]:
+        """프레임 시각 (ms, 범위 밖이면 None)"""
+        if 0 <= frame < len(self._timestamps):
+            return float(self._timestamps[frame])
+        return None
+
+    def frame_at_ms(self, ms: float) -> Optional[int]:
+        """시각에 해당하는 프레임 번호 (프레임 간격 절반 안에 맞는 프레임이 없으면 None)"""
+        if not len(self._timestamps):
+            return None
+        position = int(np.searchsorted(self._timestamps, ms))
+        candidates = [i for i in (position - 1, position) if 0 <= i < len(self._timestamps)]
+        nearest = min(candidates, key=lambda i: abs(self._timestamps[i] - ms))
+        if abs(self._timestamps[nearest] - ms) <= self._tolerance:
+            return nearest
+        return None
+
+    # === 저장/로드 ===
+
+    def save(self, path: str):
+        """사이드카 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, version=np.array(INDEX_VERSION),
+                     timestamps=self._timestamps, keyframes=self._keyframes)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['KeyframeIndex']:
+        """사이드카 파일 로드 (없거나 형식이 다르면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != INDEX_VERSION:
+                    return None
+                return cls(data['timestamps'], data['keyframes'])
+        except (OSError, ValueError, KeyError) as e:
+            _logger.warning(f"키프레임 색인 읽기 실패: {e}")
+            return None
+
+    @classmethod
+    def build(cls, video_path: str,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> Optional['KeyframeIndex']:
+        """
+        패킷만 훑어 색인 생성 (디코딩 없음)
+
+        Returns:
+            색인, 백엔드가 패킷 읽기를 지원하지 않거나 시각이 없거나 취소되면 None
+        """
+        cap = CvVideoCapture(video_path)
+        try:
+            # 패킷(압축 데이터) 그대로 읽기: 키프레임 여부와 시각만 필요
+            if not cap.isOpened() or not cap.set(cv2.CAP_PROP_FORMAT, -1):
+                return None
+            timestamps = []
+            is_key = []
+            while cap.grab():
+                if is_cancelled is not None and is_cancelled():
+                    return None
+                timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+                is_key.append(bool(cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME)))
+        finally:
+            cap.release()
+
+        if not timestamps:
+            return None
+        # 패킷은 디코딩 순서라 B 프레임이 있으면 시각 순서와 다름 → 시각으로 정렬해 표시 순서로
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        if len(timestamps) > 1 and np.any(np.diff(timestamps) <= 0):
+            _logger.info(f"프레임 시각이 겹쳐 키프레임 색인을 만들 수 없음: {video_path}")
+            return None
+        keyframes = np.flatnonzero(np.asarray(is_key)[order])
+        return cls(timestamps, keyframes)
+
+    @classmethod
+    def cached(cls, index_dir: str, video_path: str) -> Optional['KeyframeIndex']:
+        """이미 만들어 둔 사이드카 색인만 로드 (없으면 만들지 않고 None)"""
+        return cls.load(index_path(index_dir, video_fingerprint(video_path)))
+
+    @classmethod
+    def for_video(cls, index_dir: str, video_path: str,
+                  is_cancelled: Optional[Callable[[], bool]] = None) -> Optional['KeyframeIndex']:
+        """동영상의 사이드카 색인 로드 (없으면 만들어 저장, 만들 수 없는 동영상이면 표시 파일을 남김)"""
+        fingerprint = video_fingerprint(video_path)
+        path = index_path(index_dir, fingerprint)
+        index = cls.load(path)
+        if index is not None:
+            return index
+        marker = unindexable_path(index_dir, fingerprint)
+        if os.path.exists(marker):
+            return None
+        index = cls.build(video_path, is_cancelled)
+        if index is None:
+            if is_cancelled is None or not is_cancelled():
+                try:
+                    os.makedirs(index_dir, exist_ok=True)
+                    open(marker, 'wb').close()
+                except OSError as e:
+                    _logger.warning(f"키프레임 색인 표시 파일 저장 실패: {e}")
+            return None
+        try:
+            index.save(path)
+        except OSError as e:
+            _logger.warning(f"키프레임 색인 저장 실패: {e}")
+        _logger.info(f"키프레임 색인 생성: {index.frame_count} 프레임, "
+                     f"키프레임 {len(index.keyframes)}개")
+        return index
+
+
+def seek_frame(cap, target: int, index: Optional[KeyframeIndex] = None) -> int:
+    """
+    캡처의 다음 읽기 위치를 target 프레임으로 이동
+
+    색인이 있으면 target 직전 키프레임으로 탐색한 뒤, 도착한 위치를 마지막으로 디코딩된
+    프레임 시각으로 확인하고 남은 프레임은 grab()으로 넘긴다. 지나쳤으면 더 앞 키프레임에서 다시 한다.
+    색인이 없거나 target이 색인 범위 밖이면 OpenCV 탐색만 한다.
+
+    Args:
+        cap: VideoCapture (set/get/grab 지원)
+        target: 다음에 읽을 프레임 번호
+        index: 키프레임 색인
+
+    Returns:
+        이동 후 다음 읽기 위치 (파일 끝에 닿으면 target보다 작을 수 있음)
+    """
+    if index is None or not 0 <= target < index.frame_count:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+        return target
+
+    key = index.keyframe_before(target)
+    for _ in range(_SEEK_RETRIES):
+        position = _seek_to_keyframe(cap, key, index)
+        if position <= target:
+            break
+        # 탐색이 목표를 지나침: 한 키프레임 앞에서 다시
+        key = index.keyframe_before(key - 1) if key > 0 else 0
+    else:
+        position = _seek_to_keyframe(cap, 0, index)
+
+    while position < target and cap.grab():
+        position += 1
+    return position
+
+
+def _seek_to_keyframe(cap, key: int, index: KeyframeIndex) -> int:
+    """key로 탐색하고 실제 다음 읽기 위치 반환 (확인할 수 없으면 key로 간주)"""
+    cap.set(cv2.CAP_PROP_POS_FRAMES, key)
+    if key == 0:
+        return 0
+    # OpenCV 탐색은 목표 직전 프레임까지 디코딩하고 멈추므로 그 프레임 시각으로 위치를 확인
+    decoded = index.frame_at_ms(cap.get(cv2.CAP_PROP_POS_MSEC))
+    return key if decoded is None else decoded + 1
+
+
+class KeyframeIndexer:
+    """동영상 로드 후 백그라운드에서 색인을 로드하거나 만드는 스레드
+
+    Args:
+        index_dir: 사이드카 디렉토리
+        video_path: 동영상 경로
+        on_ready: 색인이 준비되면 색인 스레드에서 호출
+    """
+
+    def __init__(self, index_dir: str, video_path: str,
+                 on_ready: Callable[[KeyframeIndex], None]):
+        self._index_dir = index_dir
+        self._video_path = video_path
+        self._on_ready = on_ready
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='keyframe-index', daemon=True)
+
+    def start(self) -> 'KeyframeIndexer':
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """색인 중단 후 스레드 종료 대기"""
+        self._cancel_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """끝날 때까지 대기 (테스트용), 끝났으면 True"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        try:
+            index = KeyframeIndex.for_video(self._index_dir, self._video_path,
+                                            self._cancel_event.is_set)
+        except Exception as e:
+            _logger.warning(f"키프레임 색인 실패: {e}")
+            return
+        if index is not None and not self._cancel_event.is_set():
+            self._on_ready(index)
@@ -0,0 +1,279 @@
+"""프레임별 랜드마크 디스크 캐시
+
+한 번 감지한 프레임의 랜드마크를 메모리 맵 파일에 저장해 두고,
+같은 동영상을 다시 분석하거나 재생/탐색할 때 MediaPipe 추론 없이 재사용한다.
+
+캐시 키 = 동영상 내용 지문 + 포즈 모델 타입 + 추론 해상도 + 회전/반전 변환
+        + 감지기 옵션 (실행 모드, 최대 인원, 인물 영역 추적 - 모두 랜드마크 결과를 바꿈).
+    <key>.landmarks.npy : float32 (frames, 33, 4)  - x, y, z, visibility (하한 적용 전 값)
+    <key>.world.npy     : float32 (frames, 33, 4)  - 월드 랜드마크 (미터, 없으면 0)
+    <key>.valid.npy     : uint8 (frames,)          - 프레임별 상태 (미처리/감지/미감지/빈 화면 생략)
+변환은 같은 영상이 되는 조합끼리 같은 키가 되도록 정규화한다 (좌우+상하 반전 = 180° 회전).
+일괄 분석은 변환 없이 원본을 디코딩하고, 실시간 감지는 화면 변환과 실시간 추론 해상도를 쓰므로
+변환이 있거나 두 추론 해상도 설정이 다르면 실시간 캐시와 분석 캐시는 서로 다른 파일이다.
+상태는 프레임당 1바이트로 기록하므로 여러 스레드/프로세스가 서로 다른 프레임을
+동시에 기록해도 안전하다.
+"""
+import hashlib
+import os
+from typing import Optional
+
+import numpy as np
+
+from src.core.pose_detector import PoseResult, MIN_LANDMARK_VISIBILITY
+from src.core.landmarks import LandmarkArray, LANDMARK_FIELDS
+from src.core.logger import get_logger
+
+NUM_LANDMARKS = 33
+
+# 프레임 상태
+FRAME_UNKNOWN = 0     # 아직 처리 안 됨
+FRAME_DETECTED = 1    # 포즈 감지됨 (랜드마크 유효)
+FRAME_NO_POSE = 2     # 처리했지만 포즈 없음
+FRAME_GATED = 3       # 빈 화면 판별로 추론 생략 (빈 화면 판별을 켠 분석에서만 처리된 프레임으로 봄)
+
+# 지문 계산 시 읽는 파일 앞/뒤 바이트 수
+_FINGERPRINT_CHUNK = 1024 * 1024
+
+_logger = get_logger('landmark_cache')
+
+
+def video_fingerprint(video_path: str) -> str:
+    """동영상 내용 지문 (파일 크기 + 앞/뒤 1MB의 SHA-1)
+
+    경로나 수정 시각이 아닌 내용 기준이므로 파일을 옮기거나 복사해도 같은 캐시를 쓴다.
+    """
+    size = os.path.getsize(video_path)
+    digest = hashlib.sha1(str(size).encode())
+    with open(video_path, 'rb') as f:
+        digest.update(f.read(_FINGERPRINT_CHUNK))
+        if size > _FINGERPRINT_CHUNK:
+            f.seek(max(_FINGERPRINT_CHUNK, size - _FINGERPRINT_CHUNK))
+            digest.update(f.read(_FINGERPRINT_CHUNK))
+    return digest.hexdigest()
+
+
+def normalize_transforms(transforms: Optional[dict] = None) -> tuple:
+    """회전/반전 변환을 (회전 각도, 좌우 반전, 상하 반전) 정규형으로
+
+    좌우+상하 반전은 180° 회전과 같으므로 회전으로 바꿔 같은 영상이 하나의 키만 갖게 한다.
+    """
+    transforms = transforms or {}
+    rotation = int(transforms.get('rotation_angle', 0)) % 360
+    flip_h = bool(transforms.get('flip_horizontal', False))
+    flip_v = bool(transforms.get('flip_vertical', False))
+    if flip_h and flip_v:
+        rotation = (rotation + 180) % 360
+        flip_h = flip_v = False
+    return rotation, flip_h, flip_v
+
+
+def cache_key(fingerprint: str, model_type: str, transforms: Optional[dict] = None,
+              inference_size: int = 0, running_mode: str = 'image', num_poses: int = 5,
+              roi_tracking: bool = False) -> str:
+    """캐시 파일 이름 (지문 + 모델 + 추론 해상도 + 변환 + 감지기 옵션)
+
+    감지기 옵션 기본값은 PoseDetector 기본값과 같다.
+    """
+    rotation, flip_h, flip_v = normalize_transforms(transforms)
+    parts = [
+        fingerprint,
+        model_type,
+        str(int(inference_size)),
+        str(rotation),
+        '1' if flip_h else '0',
+        '1' if flip_v else '0',
+        running_mode,
+        str(int(num_poses)),
+        '1' if roi_tracking else '0',
+    ]
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+
+class LandmarkCache:
+    """메모리 맵 기반 프레임별 랜드마크 저장소"""
+
+    def __init__(self, path: str, frame_count: int):
+        """
+        LandmarkCache 열기 (없거나 프레임 수가 다르면 새로 생성)
+
+        Args:
+            path: 캐시 파일 경로 (확장자 제외)
+            frame_count: 동영상 총 프레임 수
+        """
+        self._path = path
+        self._frame_count = max(0, int(frame_count))
+        self._landmarks = None
+        self._world = None
+        self._valid = None
+        self._open()
+
+    @classmethod
+    def for_video(cls, cache_dir: str, video_path: str, frame_count: int,
+                  model_type: str = 'lite', transforms: Optional[dict] = None,
+                  inference_size: int = 0, running_mode: str = 'image', num_poses: int = 5,
+                  roi_tracking: bool = False) -> 'LandmarkCache':
+        """동영상/모델/추론 해상도/변환/감지기 옵션에 해당하는 캐시 열기"""
+        os.makedirs(cache_dir, exist_ok=True)
+        key = cache_key(video_fingerprint(video_path), model_type, transforms, inference_size,
+                        running_mode, num_poses, roi_tracking)
+        return cls(os.path.join(cache_dir, key), frame_count)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def cached_count(self) -> int:
+        """추론 완료(감지/미감지)된 프레임 수 (빈 화면 생략 프레임 제외)"""
+        if self._valid is None:
+            return 0
+        return int(np.count_nonzero((self._valid == FRAME_DETECTED)
+                                    | (self._valid == FRAME_NO_POSE)))
+
+    @property
+    def landmarks(self) -> Optional[np.ndarray]:
+        """(frames, 33, 4) float32 랜드마크 배열 (메모리 맵)"""
+        return self._landmarks
+
+    @property
+    def states(self) -> Optional[np.ndarray]:
+        """(frames,) uint8 프레임 상태 배열 (메모리 맵)"""
+        return self._valid
+
+    def covers(self, sample_interval: int = 1, include_gated: bool = True) -> bool:
+        """샘플링 간격의 모든 분석 프레임이 캐시에 있는지
+
+        include_gated가 False(빈 화면 판별 끔)이면 빈 화면 생략 프레임은 미처리로 본다.
+        """
+        if self._valid is None:
+            return False
+        sampled = self._valid[::max(1, sample_interval)]
+        processed = sampled != FRAME_UNKNOWN
+        if not include_gated:
+            processed &= sampled != FRAME_GATED
+        return bool(np.all(processed))
+
+    def _open(self):
+        landmarks_path = self._path + '.landmarks.npy'
+        valid_path = self._path + '.valid.npy'
+        shape = (self._frame_count, NUM_LANDMARKS, len(LANDMARK_FIELDS))
+
+        if os.path.exists(landmarks_path) and os.path.exists(valid_path):
+            try:
+                landmarks = np.load(landmarks_path, mmap_mode='r+')
+                valid = np.load(valid_path, mmap_mode='r+')
+                if landmarks.shape == shape and valid.shape == (self._frame_count,):
+                    self._landmarks = landmarks
+                    self._valid = valid
+                    self._world = self._open_world(shape)
+                    return
+                _logger.info(f"랜드마크 캐시 크기 불일치, 새로 생성: {self._path}")
+            except (OSError, ValueError) as e:
+                _logger.warning(f"랜드마크 캐시 열기 실패, 새로 생성: {e}")
+
+        if self._frame_count == 0:
+            return
+
+        self._landmarks = np.lib.format.open_memmap(
+            landmarks_path, mode='w+', dtype=np.float32, shape=shape
+        )
+        self._world = np.lib.format.open_memmap(
+            self._path + '.world.npy', mode='w+', dtype=np.float32, shape=shape
+        )
+        self._valid = np.lib.format.open_memmap(
+            valid_path, mode='w+', dtype=np.uint8, shape=(self._frame_count,)
+        )
+
+    def _open_world(self, shape: tuple) -> np.ndarray:
+        """월드 랜드마크 파일 열기 (이전 형식 캐시에는 없으므로 빈 배열로 생성)"""
+        world_path = self._path + '.world.npy'
+        if os.path.exists(world_path):
+            try:
+                world = np.load(world_path, mmap_mode='r+')
+                if world.shape == shape:
+                    return world
+            except (OSError, ValueError) as e:
+                _logger.warning(f"월드 랜드마크 캐시 열기 실패, 새로 생성: {e}")
+        return np.lib.format.open_memmap(world_path, mode='w+', dtype=np.float32, shape=shape)
+
+    def _in_range(self, frame_index: int) -> bool:
+        return self._valid is not None and 0 <= frame_index < self._frame_count
+
+    def has(self, frame_index: int, include_gated: bool = True) -> bool:
+        """해당 프레임 결과가 캐시에 있는지 (include_gated가 False면 빈 화면 생략 프레임 제외)"""
+        if not self._in_range(frame_index):
+            return False
+        state = self._valid[frame_index]
+        return state != FRAME_UNKNOWN and (include_gated or state != FRAME_GATED)
+
+    def is_gated(self, frame_index: int) -> bool:
+        """빈 화면 판별로 추론을 생략한 프레임인지"""
+        return self._in_range(frame_index) and self._valid[frame_index] == FRAME_GATED
+
+    def get(self, frame_index: int) -> Optional[PoseResult]:
+        """캐시된 감지 결과 (없으면 None)
+
+        저장된 가시성은 raw_visibility로, landmarks에는 감지 직후와 같이 하한을 적용해 돌려준다.
+        월드 랜드마크가 기록되지 않은 프레임(모두 0)은 world_landmarks가 None이다.
+        """
+        if not self.has(frame_index):
+            return None
+        if self._valid[frame_index] in (FRAME_NO_POSE, FRAME_GATED):
+            return PoseResult(pose_detected=False, landmarks=None)
+
+        data = np.array(self._landmarks[frame_index])
+        raw_visibility = data[:, 3].copy()
+        np.maximum(data[:, 3], MIN_LANDMARK_VISIBILITY, out=data[:, 3])
+        world = np.array(self._world[frame_index])
+        world_landmarks = LandmarkArray(world) if world.any() else None
+        return PoseResult(pose_detected=True, landmarks=LandmarkArray(data),
+                          world_landmarks=world_landmarks, raw_visibility=raw_visibility)
+
+    def put(self, frame_index: int, pose_result: PoseResult):
+        """감지 결과 기록 (랜드마크 먼저, 상태는 마지막에 기록)"""
+        if not self._in_range(frame_index):
+            return
+        landmarks = pose_result.landmarks
+        if pose_result.pose_detected and landmarks:
+            self._landmarks[frame_index] = self._as_rows(landmarks)
+            raw_visibility = pose_result.raw_visibility
+            if isinstance(raw_visibility, np.ndarray):
+                self._landmarks[frame_index, :, 3] = raw_visibility[:NUM_LANDMARKS]
+            world = pose_result.world_landmarks
+            has_world = world is not None and len(world) >= NUM_LANDMARKS
+            self._world[frame_index] = self._as_rows(world) if has_world else 0.0
+            self._valid[frame_index] = FRAME_DETECTED
+        else:
+            self._valid[frame_index] = FRAME_NO_POSE
+
+    def put_gated(self, frame_index: int):
+        """빈 화면 판별로 추론을 생략했음을 기록 (이미 추론한 결과는 덮어쓰지 않음)"""
+        if self._in_range(frame_index) and self._valid[frame_index] == FRAME_UNKNOWN:
+            self._valid[frame_index] = FRAME_GATED
+
+    @staticmethod
+    def _as_rows(landmarks):
+        """LandmarkArray 또는 딕셔너리 목록 → (33, 4) 값"""
+        if isinstance(landmarks, LandmarkArray):
+            return landmarks.array[:NUM_LANDMARKS]
+        return [[lm.get(field, 0.0) for field in LANDMARK_FIELDS]
+                for lm in landmarks[:NUM_LANDMARKS]]
+
+    def flush(self):
+        """변경 내용을 디스크에 반영"""
+        if self._landmarks is not None:
+            self._landmarks.flush()
+            self._world.flush()
+            self._valid.flush()
+
+    def close(self):
+        """캐시 닫기"""
+        self.flush()
+        self._landmarks = None
+        self._world = None
+        self._valid = None
@@ -0,0 +1,118 @@
+"""배열 기반 포즈 랜드마크
+
+PoseDetector는 프레임마다 랜드마크 33개를 만들고, 이 값은 각도 계산/평가/스켈레톤 표시로 흘러간다.
+점마다 dict를 만들면 프레임당 수십 개의 객체가 생기고 deepcopy도 느리므로
+(33, 4) float32 배열 하나에 x, y, z, visibility를 담는다.
+
+기존 코드와의 호환을 위해 `landmarks[i]['x']`, `landmarks[i].get('z', 0)`, `lm['x'] = v`,
+`lm.x` 같은 dict/속성 접근을 그대로 지원한다 (배열 행을 직접 읽고 쓰는 뷰).
+"""
+from collections.abc import MutableMapping
+from typing import Iterable, List
+
+import numpy as np
+
+LANDMARK_FIELDS = ('x', 'y', 'z', 'visibility')
+_FIELD_INDEX = {name: i for i, name in enumerate(LANDMARK_FIELDS)}
+
+
+class Landmark(MutableMapping):
+    """LandmarkArray 한 행에 대한 dict 호환 뷰 (값을 바꾸면 원본 배열에 반영)"""
+
+    __slots__ = ('_row',)
+
+    def __init__(self, row: np.ndarray):
+        self._row = row
+
+    def __getitem__(self, key: str) -> float:
+        return float(self._row[_FIELD_INDEX[key]])
+
+    def __setitem__(self, key: str, value: float):
+        self._row[_FIELD_INDEX[key]] = value
+
+    def __delitem__(self, key: str):
+        raise TypeError("랜드마크 필드는 삭제할 수 없습니다")
+
+    def __iter__(self):
+        return iter(LANDMARK_FIELDS)
+
+    def __len__(self) -> int:
+        return len(LANDMARK_FIELDS)
+
+    def __getattr__(self, name: str) -> float:
+        index = _FIELD_INDEX.get(name)
+        if index is None:
+            raise AttributeError(name)
+        return float(self._row[index])
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class LandmarkArray:
+    """(N, 4) float32 배열 기반 랜드마크 목록 (x, y, z, visibility)"""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: np.ndarray):
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim != 2 or data.shape[1] != len(LANDMARK_FIELDS):
+            raise ValueError(f"랜드마크 배열 크기가 잘못되었습니다: {data.shape}")
+        self._data = data
+
+    @classmethod
+    def from_dicts(cls, landmarks: Iterable[dict]) -> 'LandmarkArray':
+        """dict 리스트(기존 형식)에서 생성 (빠진 필드는 0, visibility는 1)"""
+        rows = [(lm.get('x', 0.0), lm.get('y', 0.0), lm.get('z', 0.0), lm.get('visibility', 1.0))
+                for lm in landmarks]
+        return cls(np.array(rows, dtype=np.float32).reshape(-1, len(LANDMARK_FIELDS)))
+
+    @classmethod
+    def from_mediapipe(cls, landmarks, min_visibility: float = 0.0) -> 'LandmarkArray':
+        """MediaPipe NormalizedLandmark/Landmark 목록에서 생성"""
+        data = np.array(
+            [(lm.x, lm.y, lm.z, getattr(lm, 'visibility', 1.0)) for lm in landmarks],
+            dtype=np.float32,
+        ).reshape(-1, len(LANDMARK_FIELDS))
+        if min_visibility > 0:
+            np.maximum(data[:, 3], min_visibility, out=data[:, 3])
+        return cls(data)
+
+    @property
+    def array(self) -> np.ndarray:
+        """(N, 4) float32 배열 (복사본 아님)"""
+        return self._data
+
+    def copy(self) -> 'LandmarkArray':
+        return LandmarkArray(self._data.copy())
+
+    def to_dicts(self) -> List[dict]:
+        """dict 리스트로 변환 (직렬화/기존 API용)"""
+        return [dict(zip(LANDMARK_FIELDS, row)) for row in self._data.tolist()]
+
+    def __copy__(self) -> 'LandmarkArray':
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> 'LandmarkArray':
+        return self.copy()
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LandmarkArray(self._data[index])
+        return Landmark(self._data[index])
+
+    def __iter__(self):
+        for row in self._data:
+            yield Landmark(row)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LandmarkArray):
+            return np.array_equal(self._data, other._data)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LandmarkArray({len(self)} points)"
+
@@ -0,0 +1,143 @@
+"""실시간 포즈 감지 워커 스레드
+
+재생 중 표시되는 프레임의 MediaPipe 추론과 각도 계산을 GUI 스레드 밖에서 처리한다.
+요청 칸은 하나뿐이라 추론이 밀리면 대기 중인 프레임을 최신 프레임으로 덮어쓴다 (최신 프레임 우선).
+결과에는 요청한 프레임 정보(순번, 프레임 번호, 원본 이미지)가 함께 담겨 있어
+받는 쪽에서 오래된 결과를 버리고, 표시 중인 결과와 같은 프레임으로 캡처할 수 있다.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.pose_detector import PoseResult
+from src.core.angle_calculator import AngleCalculator
+from src.core.logger import get_logger
+
+
+@dataclass
+class LiveFrame:
+    """감지 요청 프레임"""
+    seq: int                      # 요청 순번 (클수록 최신)
+    frame: np.ndarray             # 표시 중인 프레임 (변환 적용 후)
+    frame_number: int             # 표시 프레임 번호
+    timestamp: float              # 표시 위치 (초)
+    frame_index: Optional[int] = None   # 동영상 프레임 번호 (랜드마크 캐시 키)
+    timestamp_ms: Optional[int] = None  # 재생 중 프레임 시각 (연속 추적용)
+    generation: int = 0           # 요청 시점의 소스 세대 (동영상/변환이 바뀌면 증가)
+
+
+@dataclass
+class LiveDetection:
+    """감지 결과 (요청 프레임 포함)"""
+    frame: LiveFrame
+    result: PoseResult
+    angles: Optional[Dict[str, Any]] = None  # 포즈가 감지됐을 때만
+
+
+class LiveDetectionWorker(QThread):
+    """표시 프레임을 최신 우선으로 감지하는 워커 스레드
+
+    PoseDetector는 생성 후 이 스레드만 사용한다
+    (추적 초기화, 추론 해상도 변경, 감지기 교체도 reset_tracking/set_inference_size/set_detector로 요청).
+
+    Args:
+        detector: 사용할 PoseDetector
+    """
+
+    detection_ready = pyqtSignal(object)  # LiveDetection
+
+    def __init__(self, detector, parent=None):
+        super().__init__(parent)
+        self._logger = get_logger('live_detection')
+        self._detector = detector
+        self._angle_calculator = AngleCalculator()
+        self._condition = threading.Condition()
+        self._pending: Optional[LiveFrame] = None
+        self._reset_requested = False
+        self._inference_size: Optional[int] = None  # 다음 감지 전에 적용할 추론 해상도
+        self._next_detector = None  # 다음 감지 전에 교체할 PoseDetector
+        self._stopping = False
+        self._dropped_frames = 0
+
+    @property
+    def detector(self):
+        """워커가 사용 중인 PoseDetector (교체 요청이 아직 적용되지 않았으면 이전 감지기)"""
+        return self._detector
+
+    @property
+    def dropped_frames(self) -> int:
+        """처리하기 전에 더 새로운 프레임으로 대체된 요청 수"""
+        return self._dropped_frames
+
+    def submit(self, frame: LiveFrame):
+        """감지 요청 (아직 처리하지 않은 이전 요청은 버림)"""
+        with self._condition:
+            if self._pending is not None:
+                self._dropped_frames += 1
+            self._pending = frame
+            self._condition.notify()
+
+    def reset_tracking(self):
+        """다음 감지 전에 추적 상태 초기화 (동영상/변환 변경 시)"""
+        with self._condition:
+            self._reset_requested = True
+
+    def set_inference_size(self, size: int):
+        """다음 감지 전에 추론 해상도 변경 (긴 변 픽셀, 0 = 원본)"""
+        with self._condition:
+            self._inference_size = size
+
+    def set_detector(self, detector):
+        """다음 감지 전에 감지기 교체 (이전 감지기는 워커 스레드에서 해제, 감지기 옵션 변경 시)"""
+        with self._condition:
+            if self._next_detector is not None:
+                # 적용되지 않은 교체 요청의 감지기는 워커가 쓴 적이 없으므로 바로 해제
+                self._next_detector.release()
+            self._next_detector = detector
+            self._inference_size = None  # 새 감지기는 요청 시점의 추론 해상도로 생성됨
+
+    def stop(self):
+        """대기 중인 요청을 버리고 스레드 종료 (처리 중인 프레임은 끝날 때까지 대기)"""
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            self._condition.notify()
+        self.wait()
+
+    def _next(self) -> Optional[LiveFrame]:
+        with self._condition:
+            while self._pending is None and not self._stopping:
+                self._condition.wait()
+            if self._stopping:
+                return None
+            frame, self._pending = self._pending, None
+            if self._next_detector is not None:
+                self._detector.release()
+                self._detector, self._next_detector = self._next_detector, None
+                self._reset_requested = False  # 새 감지기는 추적 상태가 없음
+            if self._reset_requested:
+                self._reset_requested = False
+                self._detector.reset_tracking()
+            if self._inference_size is not None:
+                self._detector.inference_size = self._inference_size
+                self._inference_size = None
+            return frame
+
+    def run(self):
+        while True:
+            frame = self._next()
+            if frame is None:
+                return
+            try:
+                result = self._detector.detect(frame.frame, frame.timestamp_ms)
+            except Exception as e:
+                self._logger.error(f"실시간 감지 오류 (프레임 {frame.frame_number}): {e}")
+                result = PoseResult(pose_detected=False, landmarks=None)
+
+            angles = None
+            if result.pose_detected and result.landmarks:
+                angles = self._angle_calculator.calculate_all_angles(result.landmarks)
+            self.detection_ready.emit(LiveDetection(frame=frame, result=result, angles=angles))
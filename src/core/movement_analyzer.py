@@ -87,6 +87,13 @@ class MovementAnalysisResult:
     skipped_frames: int = 0
     sample_interval: int = 1
     duration_seconds: float = 0.0
+    gated_frames: int = 0             # 빈 화면으로 판별되어 추론 없이 건너뛴 프레임 (skipped_frames에 포함)
+
+    @property
+    def gate_hit_rate(self) -> float:
+        """샘플 프레임 중 빈 화면 판별로 추론을 생략한 비율"""
+        attempted = self.analyzed_frames + self.skipped_frames
+        return self.gated_frames / attempted if attempted > 0 else 0.0
 
     def get_sorted_by_movement(self) -> List[BodyPartStats]:
         return sorted(self.body_parts.values(), key=lambda s: s.movement_count, reverse=True)
@@ -102,6 +109,7 @@ class MovementAnalysisResult:
             'skipped_frames': self.skipped_frames,
             'sample_interval': self.sample_interval,
             'duration_seconds': self.duration_seconds,
+            'gated_frames': self.gated_frames,
         }
 
     @classmethod
@@ -117,6 +125,7 @@ class MovementAnalysisResult:
             skipped_frames=d['skipped_frames'],
             sample_interval=d['sample_interval'],
             duration_seconds=d.get('duration_seconds', 0.0),
+            gated_frames=d.get('gated_frames', 0),
         )
 
 
@@ -127,6 +136,7 @@ class MovementAnalyzer:
         self._threshold = threshold
         self._sample_interval = sample_interval
         self._prev_angles: Optional[Dict[str, float]] = None
+        self._first_angles: Optional[Dict[str, float]] = None  # 병합 시 경계 움직임 판정용
         self._total_frames = 0
         self._analyzed_frames = 0
         self._skipped_frames = 0
@@ -156,6 +166,7 @@ class MovementAnalyzer:
         """내부 상태 직렬화 (재개용)"""
         return {
             'prev_angles': dict(self._prev_angles) if self._prev_angles else None,
+            'first_angles': dict(self._first_angles) if self._first_angles else None,
             'total_frames': self._total_frames,
             'analyzed_frames': self._analyzed_frames,
             'skipped_frames': self._skipped_frames,
@@ -171,6 +182,7 @@ class MovementAnalyzer:
     def load_state(self, state: dict):
         """직렬화된 상태 복원 (재개용)"""
         self._prev_angles = state['prev_angles']
+        self._first_angles = state.get('first_angles')
         self._total_frames = state['total_frames']
         self._analyzed_frames = state['analyzed_frames']
         self._skipped_frames = state['skipped_frames']
@@ -182,8 +194,50 @@ class MovementAnalyzer:
         self._min_angles = dict(state['min_angles'])
         self._risk_score_sums = dict(state['risk_score_sums'])
 
+    def merge(self, state: dict):
+        """뒤따르는 구간(샤드)의 상태를 현재 상태에 병합
+
+        state는 이 분석기가 처리한 구간 바로 다음 구간을 분석한 get_state() 결과여야 한다.
+        구간 경계의 움직임은 현재 구간의 마지막 분석 각도(prev_angles)와
+        다음 구간의 첫 분석 각도(first_angles)를 비교하여 카운트한다.
+
+        Args:
+            state: 다음 구간 분석기의 get_state() 결과
+        """
+        other_first = state.get('first_angles')
+        if self._prev_angles is not None and other_first is not None:
+            for name in ANGLE_DEFINITIONS:
+                delta = abs(other_first.get(name, 0.0) - self._prev_angles.get(name, 0.0))
+                if delta > self._threshold:
+                    self._movement_counts[name] += 1
+
+        for name in ANGLE_DEFINITIONS:
+            other_count = state['angle_counts'].get(name, 0)
+            if other_count > 0:
+                if self._angle_counts[name] == 0:
+                    self._max_angles[name] = state['max_angles'][name]
+                    self._min_angles[name] = state['min_angles'][name]
+                else:
+                    self._max_angles[name] = max(self._max_angles[name], state['max_angles'][name])
+                    self._min_angles[name] = min(self._min_angles[name], state['min_angles'][name])
+            self._angle_counts[name] += other_count
+            self._angle_sums[name] += state['angle_sums'].get(name, 0.0)
+            self._movement_counts[name] += state['movement_counts'].get(name, 0)
+            self._high_risk_frames[name] += state['high_risk_frames'].get(name, 0)
+            self._risk_score_sums[name] += state['risk_score_sums'].get(name, 0.0)
+
+        self._total_frames += state['total_frames']
+        self._analyzed_frames += state['analyzed_frames']
+        self._skipped_frames += state['skipped_frames']
+
+        if self._first_angles is None and other_first is not None:
+            self._first_angles = dict(other_first)
+        if state['prev_angles'] is not None:
+            self._prev_angles = dict(state['prev_angles'])
+
     def reset(self):
         self._prev_angles = None
+        self._first_angles = None
         self._total_frames = 0
         self._analyzed_frames = 0
         self._skipped_frames = 0
@@ -239,6 +293,8 @@ class MovementAnalyzer:
 
         # 이전 각도 저장 (분석된 프레임만)
         self._prev_angles = dict(angles)
+        if self._first_angles is None:
+            self._first_angles = self._prev_angles
 
     def _update_high_risk_from_rula(self, rula_result):
         for score_attr, joint_names in RULA_JOINT_MAPPING.items():
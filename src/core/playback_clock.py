@@ -0,0 +1,113 @@
+"""재생 시계
+
+타이머 틱마다 한 프레임씩 디코딩하면 처리가 느릴 때 재생 시간이 늘어난다.
+재생 시작 시각(단조 시계)과 시작 프레임을 기준으로 지금 보여야 할 프레임을 계산하고,
+뒤처진 만큼은 디코딩 없이 건너뛰게(grab) 해서 벽시계 시간에 맞춘다.
+"""
+import time
+from typing import Callable, Optional
+
+# 지원 재생 배속
+PLAYBACK_RATES = (0.25, 0.5, 1.0, 1.5, 2.0, 4.0)
+MIN_PLAYBACK_RATE = 0.25
+MAX_PLAYBACK_RATE = 4.0
+
+# fps를 알 수 없을 때 기본값
+_DEFAULT_FPS = 30.0
+
+
+class PlaybackClock:
+    """단조 시계 기반 재생 위치 계산기
+
+    Args:
+        fps: 동영상 fps
+        rate: 재생 배속 (0.25 ~ 4.0)
+        clock: 초 단위 단조 시계 (테스트용 주입)
+    """
+
+    def __init__(self, fps: float = _DEFAULT_FPS, rate: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._fps = fps if fps and fps > 0 else _DEFAULT_FPS
+        self._rate = self._clamp_rate(rate)
+        self._anchor_time: Optional[float] = None
+        self._anchor_frame = 0
+        self._dropped_frames = 0
+
+    @staticmethod
+    def _clamp_rate(rate: float) -> float:
+        return min(MAX_PLAYBACK_RATE, max(MIN_PLAYBACK_RATE, float(rate)))
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: float):
+        self._reanchor()
+        self._fps = fps if fps and fps > 0 else _DEFAULT_FPS
+
+    @property
+    def rate(self) -> float:
+        """재생 배속"""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float):
+        # 지금 위치를 기준으로 다시 시작해야 배속 변경 시 위치가 튀지 않음
+        self._reanchor()
+        self._rate = self._clamp_rate(rate)
+
+    @property
+    def is_running(self) -> bool:
+        return self._anchor_time is not None
+
+    @property
+    def dropped_frames(self) -> int:
+        """시작 후 시간을 맞추려고 건너뛴 프레임 수"""
+        return self._dropped_frames
+
+    @property
+    def interval_ms(self) -> int:
+        """타이머 틱 간격 (표시 프레임 간격, 최소 1ms)"""
+        return max(1, int(1000 / (self._fps * self._rate)))
+
+    def start(self, frame: int):
+        """frame부터 지금 시각 기준으로 재생 시작 (탐색 후 다시 맞출 때도 호출)"""
+        self._anchor_time = self._clock()
+        self._anchor_frame = frame
+
+    def stop(self):
+        self._anchor_time = None
+
+    def reset_dropped(self):
+        self._dropped_frames = 0
+
+    def _reanchor(self):
+        if self._anchor_time is not None:
+            self.start(self.frame_due())
+
+    def frame_due(self) -> int:
+        """지금 화면에 있어야 할 프레임 번호"""
+        if self._anchor_time is None:
+            return self._anchor_frame
+        elapsed = self._clock() - self._anchor_time
+        # 부동소수 오차로 프레임 경계 바로 앞에서 한 프레임 늦어지지 않도록 작은 여유를 둠
+        return self._anchor_frame + int(elapsed * self._fps * self._rate + 1e-6)
+
+    def frames_to_skip(self, position: int) -> Optional[int]:
+        """
+        다음에 디코딩할 위치에서 지금 프레임까지 건너뛸 프레임 수
+
+        Args:
+            position: 다음에 디코딩할 프레임 번호
+
+        Returns:
+            건너뛸 프레임 수 (0이면 바로 디코딩), 아직 다음 프레임 시각 전이면 None
+        """
+        due = self.frame_due()
+        if position > due:
+            return None
+        skip = due - position
+        self._dropped_frames += skip
+        return skip
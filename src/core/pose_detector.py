@@ -1,20 +1,70 @@
 """인체 포즈 감지 모듈"""
 import cv2
 import numpy as np
-from dataclasses import dataclass
 from typing import Optional, List
 import mediapipe as mp
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 import os
 
+from src.core.landmarks import LandmarkArray
+from src.core.roi_tracker import PersonRoiTracker
+
+# VIDEO 모드에서 타임스탬프 간격이 이보다 크면(탐색/샘플 건너뜀) 추적 초기화
+TRACKING_RESET_GAP_MS = 1000
+
+
+# 감지된 랜드마크 visibility 하한
+MIN_LANDMARK_VISIBILITY = 0.5
+
 
-@dataclass
 class PoseResult:
-    """포즈 감지 결과"""
-    pose_detected: bool
-    landmarks: Optional[List] = None
-    world_landmarks: Optional[List] = None
+    """포즈 감지 결과
+
+    landmarks는 LandmarkArray (기존 dict 리스트도 허용), visibility는 MIN_LANDMARK_VISIBILITY 하한 적용 후 값.
+    raw_visibility는 하한 적용 전 MediaPipe 가시성 (33,) - 감지 민감도 판정과 캐시 저장에 쓴다.
+    world_landmarks는 MediaPipe 원본을 받아 두었다가 처음 접근할 때 LandmarkArray로 변환한다.
+    """
+
+    __slots__ = ('pose_detected', 'landmarks', '_world_landmarks', 'raw_visibility')
+
+    def __init__(self, pose_detected: bool, landmarks=None, world_landmarks=None,
+                 raw_visibility: Optional[np.ndarray] = None):
+        self.pose_detected = pose_detected
+        self.landmarks = landmarks
+        self._world_landmarks = world_landmarks
+        self.raw_visibility = raw_visibility
+
+    @property
+    def world_landmarks(self):
+        """월드 좌표 랜드마크 (LandmarkArray, MediaPipe 결과는 처음 접근할 때 변환)"""
+        world = self._world_landmarks
+        if world is not None and not isinstance(world, LandmarkArray):
+            world = list(world)
+            if world and isinstance(world[0], dict):
+                world = LandmarkArray.from_dicts(world)
+            else:
+                world = LandmarkArray.from_mediapipe(world, MIN_LANDMARK_VISIBILITY)
+            self._world_landmarks = world
+        return world
+
+    @world_landmarks.setter
+    def world_landmarks(self, value):
+        self._world_landmarks = value
+
+    def mean_visibility(self) -> float:
+        """하한 적용 전 평균 가시성 (raw_visibility가 없으면 landmarks 값)"""
+        if self.raw_visibility is not None:
+            return float(np.mean(self.raw_visibility))
+        landmarks = self.landmarks
+        if isinstance(landmarks, LandmarkArray):
+            return float(landmarks.array[:, 3].mean())
+        if not landmarks:
+            return 0.0
+        return float(np.mean([lm.get('visibility', 1.0) for lm in landmarks]))
+
+    def __repr__(self) -> str:
+        return f"PoseResult(pose_detected={self.pose_detected}, landmarks={self.landmarks!r})"
 
 
 class PoseDetector:
@@ -38,11 +88,23 @@ class PoseDetector:
     # 구버전 모델 파일명 (fallback용)
     LEGACY_MODEL_FILENAME = "pose_landmarker.task"
 
+    # 추론 해상도 선택지 (긴 변 픽셀, 0 = 원본)
+    INFERENCE_SIZES = (0, 1280, 960, 640, 480)
+
+    # 실행 모드: 'image' = 매 프레임 독립 감지, 'video' = 이전 프레임 기반 추적
+    RUNNING_MODES = ('image', 'video')
+
+    TRACKING_RESET_GAP_MS = TRACKING_RESET_GAP_MS
+
     def __init__(
         self,
         model_type: str = 'lite',
         min_detection_confidence: float = 0.5,
-        min_tracking_confidence: float = 0.5
+        min_tracking_confidence: float = 0.5,
+        inference_size: int = 0,
+        running_mode: str = 'image',
+        num_poses: int = 5,
+        roi_tracking: bool = False
     ):
         """
         PoseDetector 초기화
@@ -51,17 +113,50 @@ class PoseDetector:
             model_type: 모델 타입 ('lite', 'full', 'heavy')
             min_detection_confidence: 최소 감지 신뢰도
             min_tracking_confidence: 최소 추적 신뢰도
+            inference_size: 추론 해상도 (긴 변 픽셀, 0이면 원본 크기)
+            running_mode: 'image' 또는 'video' (video는 타임스탬프를 주면 프레임 간 추적)
+            num_poses: 최대 감지 인원 (가장 가까운 1명을 선택)
+            roi_tracking: 이전 감지 인물 주변만 잘라 감지 (VIDEO 모드 추적 중에는 사용 안 함)
         """
         self._model_type = model_type if model_type in self.MODELS else 'lite'
         self._min_detection_confidence = min_detection_confidence
         self._min_tracking_confidence = min_tracking_confidence
+        self._inference_size = max(0, int(inference_size))
+        self._running_mode = running_mode if running_mode in self.RUNNING_MODES else 'image'
+        self._num_poses = max(1, int(num_poses))
         self._landmarker = None
+        self._image_landmarker = None  # VIDEO 모드에서 타임스탬프 없는 단일 이미지 감지용
+        self._last_timestamp_ms: Optional[int] = None
+        self._roi_tracker = PersonRoiTracker() if roi_tracking else None
+        # 축소/색 변환 결과를 담는 재사용 버퍼 (프레임 크기가 바뀔 때만 새로 할당)
+        self._resize_buffer: Optional[np.ndarray] = None
+        self._rgb_buffer: Optional[np.ndarray] = None
         self._initialize()
 
     @property
     def model_type(self) -> str:
         return self._model_type
 
+    @property
+    def running_mode(self) -> str:
+        return self._running_mode
+
+    @property
+    def num_poses(self) -> int:
+        return self._num_poses
+
+    @property
+    def roi_tracking(self) -> bool:
+        return self._roi_tracker is not None
+
+    @property
+    def inference_size(self) -> int:
+        return self._inference_size
+
+    @inference_size.setter
+    def inference_size(self, size: int):
+        self._inference_size = max(0, int(size))
+
     @classmethod
     def model_dir(cls) -> str:
         return os.path.dirname(__file__)
@@ -93,6 +188,11 @@ class PoseDetector:
 
     def _initialize(self):
         """MediaPipe PoseLandmarker 초기화"""
+        self._landmarker = self._create_landmarker(self._running_mode)
+        self._last_timestamp_ms = None
+
+    def _create_landmarker(self, running_mode: str):
+        """지정 실행 모드의 PoseLandmarker 생성"""
         model_path = self._get_model_path()
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
@@ -100,12 +200,25 @@ class PoseDetector:
         base_options = python.BaseOptions(model_asset_path=model_path)
         options = vision.PoseLandmarkerOptions(
             base_options=base_options,
-            running_mode=vision.RunningMode.IMAGE,
-            num_poses=5,
+            running_mode=(vision.RunningMode.VIDEO if running_mode == 'video'
+                          else vision.RunningMode.IMAGE),
+            num_poses=self._num_poses,
             min_pose_detection_confidence=self._min_detection_confidence,
             min_tracking_confidence=self._min_tracking_confidence
         )
-        self._landmarker = vision.PoseLandmarker.create_from_options(options)
+        return vision.PoseLandmarker.create_from_options(options)
+
+    def reset_tracking(self):
+        """추적 상태 초기화 (VIDEO 모드 landmarker는 다음 detect에서 새로 생성, 인물 영역 해제)
+
+        MediaPipe는 추적 상태 초기화 API가 없으므로 landmarker를 다시 만든다.
+        """
+        if self._running_mode == 'video' and self._landmarker:
+            self._landmarker.close()
+            self._landmarker = None
+        self._last_timestamp_ms = None
+        if self._roi_tracker is not None:
+            self._roi_tracker.reset()
 
     def change_model(self, model_type: str):
         """모델 변경"""
@@ -117,62 +230,115 @@ class PoseDetector:
         self._model_type = model_type
         self._initialize()
 
-    def detect(self, image: np.ndarray) -> PoseResult:
+    def detect(self, image: np.ndarray, timestamp_ms: Optional[int] = None) -> PoseResult:
         """
         이미지에서 인체 포즈 감지
 
         Args:
             image: BGR 형식의 이미지 (OpenCV)
+            timestamp_ms: 동영상 프레임 타임스탬프 (VIDEO 모드에서만 사용).
+                이전 타임스탬프보다 작거나 같으면(뒤로 탐색) 또는 간격이
+                TRACKING_RESET_GAP_MS보다 크면 추적을 초기화한다.
+                None이면 추적 없이 단일 이미지로 감지한다.
 
         Returns:
             PoseResult: 감지 결과
         """
-        if self._landmarker is None:
-            self._initialize()
-
-        # BGR → RGB 변환
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        # VIDEO 모드 추적 중에는 MediaPipe가 내부적으로 인물 영역을 추적하므로 잘라내지 않는다
+        # (입력 영역이 바뀌면 추적 좌표가 어긋남)
+        tracker = self._roi_tracker
+        if self._running_mode == 'video' and timestamp_ms is not None:
+            tracker = None
+
+        box = tracker.crop_box(image.shape) if tracker is not None else None
+        if box is not None:
+            x0, y0, x1, y1 = box
+            result = self._detect_frame(image[y0:y1, x0:x1], timestamp_ms)
+            if result.pose_detected:
+                PersonRoiTracker.remap_landmarks(result.landmarks, box, image.shape)
+                tracker.update(result.landmarks)
+                return result
+            # 영역 안에서 놓치면 전체 프레임으로 다시 감지
+
+        result = self._detect_frame(image, timestamp_ms)
+        if tracker is not None:
+            tracker.update(result.landmarks if result.pose_detected else None)
+        return result
+
+    def _detect_frame(self, image: np.ndarray, timestamp_ms: Optional[int]) -> PoseResult:
+        """이미지 전체를 입력으로 감지 (정규화 좌표는 입력 이미지 기준)"""
+        # 추론 해상도로 먼저 축소한 뒤 작은 이미지에서 BGR → RGB 변환
+        # (랜드마크는 정규화 좌표이고 종횡비를 유지하므로 원본 좌표계로 그대로 사용)
+        rgb_image = self._prepare_input(image)
 
         # MediaPipe Image 생성
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
 
         # 포즈 감지
-        results = self._landmarker.detect(mp_image)
+        if self._running_mode == 'video' and timestamp_ms is not None:
+            results = self._detect_for_video(mp_image, int(timestamp_ms))
+        elif self._running_mode == 'video':
+            if self._image_landmarker is None:
+                self._image_landmarker = self._create_landmarker('image')
+            results = self._image_landmarker.detect(mp_image)
+        else:
+            if self._landmarker is None:
+                self._initialize()
+            results = self._landmarker.detect(mp_image)
 
         if results.pose_landmarks and len(results.pose_landmarks) > 0:
             # 다중 인원 감지 시 가장 큰(가까운) 사람 선택
             best_idx = self._select_closest_pose(results.pose_landmarks)
             pose_landmarks = results.pose_landmarks[best_idx]
 
-            # 랜드마크를 리스트로 변환
-            landmarks = []
-            for lm in pose_landmarks:
-                landmarks.append({
-                    'x': lm.x,
-                    'y': lm.y,
-                    'z': lm.z,
-                    'visibility': max(lm.visibility if hasattr(lm, 'visibility') else 1.0, 0.5)
-                })
+            # 랜드마크를 (33, 4) 배열로 변환 (월드 좌표는 사용할 때 변환)
+            # 하한 적용 전 가시성은 따로 보관 (감지 민감도 재계산용)
+            landmarks = LandmarkArray.from_mediapipe(pose_landmarks)
+            raw_visibility = landmarks.array[:, 3].copy()
+            np.maximum(landmarks.array[:, 3], MIN_LANDMARK_VISIBILITY, out=landmarks.array[:, 3])
 
             world_landmarks = None
             if results.pose_world_landmarks and len(results.pose_world_landmarks) > best_idx:
-                world_landmarks = []
-                for lm in results.pose_world_landmarks[best_idx]:
-                    world_landmarks.append({
-                        'x': lm.x,
-                        'y': lm.y,
-                        'z': lm.z,
-                        'visibility': max(lm.visibility if hasattr(lm, 'visibility') else 1.0, 0.5)
-                    })
+                world_landmarks = results.pose_world_landmarks[best_idx]
 
             return PoseResult(
                 pose_detected=True,
                 landmarks=landmarks,
-                world_landmarks=world_landmarks
+                world_landmarks=world_landmarks,
+                raw_visibility=raw_visibility,
             )
 
         return PoseResult(pose_detected=False, landmarks=None)
 
+    def _detect_for_video(self, mp_image, timestamp_ms: int):
+        """VIDEO 모드 감지 (탐색/큰 간격이면 추적 초기화 후 감지)"""
+        last = self._last_timestamp_ms
+        if last is not None and (timestamp_ms <= last
+                                 or timestamp_ms - last > self.TRACKING_RESET_GAP_MS):
+            self.reset_tracking()
+        if self._landmarker is None:
+            self._initialize()
+        results = self._landmarker.detect_for_video(mp_image, timestamp_ms)
+        self._last_timestamp_ms = timestamp_ms
+        return results
+
+    def _prepare_input(self, image: np.ndarray) -> np.ndarray:
+        """추론 입력 준비: 필요 시 INTER_AREA 축소 후 RGB 변환 (버퍼 재사용)"""
+        h, w = image.shape[:2]
+        longest = max(h, w)
+        if 0 < self._inference_size < longest:
+            scale = self._inference_size / longest
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            if self._resize_buffer is None or self._resize_buffer.shape[:2] != (size[1], size[0]):
+                self._resize_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            cv2.resize(image, size, dst=self._resize_buffer, interpolation=cv2.INTER_AREA)
+            image = self._resize_buffer
+
+        if self._rgb_buffer is None or self._rgb_buffer.shape != image.shape:
+            self._rgb_buffer = np.empty(image.shape, dtype=np.uint8)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        return self._rgb_buffer
+
     @staticmethod
     def _select_closest_pose(pose_landmarks_list) -> int:
         """여러 감지된 포즈 중 가장 큰(카메라에 가까운) 사람의 인덱스 반환"""
@@ -256,9 +422,16 @@ class PoseDetector:
         if self._landmarker:
             self._landmarker.close()
             self._landmarker = None
+        if self._image_landmarker:
+            self._image_landmarker.close()
+            self._image_landmarker = None
+        self._last_timestamp_ms = None
+        if self._roi_tracker is not None:
+            self._roi_tracker.reset()
 
     def __del__(self):
         """소멸자"""
         # GC 시점에서 mediapipe 라이브러리가 이미 언로드된 경우
         # bus error 방지를 위해 landmarker 참조만 제거
         self._landmarker = None
+        self._image_landmarker = None
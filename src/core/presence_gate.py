@@ -0,0 +1,93 @@
+"""인물 존재 사전 판별 - 빈 화면 프레임의 포즈 추론 생략
+
+라인 카메라는 교대 시간의 상당 부분이 사람 없는 화면이다. 사람이 없다고 확인된(포즈 미감지)
+프레임을 작은 회색조 썸네일로 기억해 두고, 이후 프레임이 그 장면에서 거의 바뀌지 않았으면
+추론 없이 감지 실패로 처리한다. 움직임이 생기거나 일정 프레임마다는 반드시 다시 추론하므로
+가만히 서 있는 사람을 놓치지 않는다 (기준 장면이 '사람 없음'으로 확인된 경우에만 생략).
+"""
+from typing import Optional
+
+import numpy as np
+
+# 판별용 썸네일 너비 (픽셀, 높이는 같은 간격으로 추출)
+GATE_THUMBNAIL_WIDTH = 64
+
+# 픽셀 밝기 차이가 이보다 크면 바뀐 픽셀로 간주 (0-255)
+GATE_PIXEL_DELTA = 20
+
+# 바뀐 픽셀 비율이 이보다 크면 움직임이 있다고 판단
+GATE_MOTION_RATIO = 0.002
+
+# 연속으로 생략한 샘플 프레임이 이 수에 이르면 한 번은 추론
+GATE_RECHECK_FRAMES = 30
+
+
+class PresenceGate:
+    """빈 화면 판별기 (추론 스레드마다 하나씩 사용)"""
+
+    def __init__(self, pixel_delta: int = GATE_PIXEL_DELTA,
+                 motion_ratio: float = GATE_MOTION_RATIO,
+                 recheck_frames: int = GATE_RECHECK_FRAMES):
+        self._pixel_delta = pixel_delta
+        self._motion_ratio = motion_ratio
+        self._recheck_frames = recheck_frames
+        self._reference: Optional[np.ndarray] = None  # 사람 없음이 확인된 장면
+        self._current: Optional[np.ndarray] = None
+        self._consecutive = 0
+        self._checked_frames = 0
+        self._gated_frames = 0
+
+    @property
+    def checked_frames(self) -> int:
+        """판별한 프레임 수"""
+        return self._checked_frames
+
+    @property
+    def gated_frames(self) -> int:
+        """추론을 생략한 프레임 수"""
+        return self._gated_frames
+
+    @property
+    def hit_rate(self) -> float:
+        """추론 생략 비율"""
+        if self._checked_frames <= 0:
+            return 0.0
+        return self._gated_frames / self._checked_frames
+
+    def reset(self):
+        """기준 장면 해제 (탐색/변환 변경 시)"""
+        self._reference = None
+        self._current = None
+        self._consecutive = 0
+
+    def should_detect(self, frame: np.ndarray) -> bool:
+        """포즈 추론이 필요한지 (False면 사람 없음으로 처리)"""
+        self._checked_frames += 1
+        self._current = self._thumbnail(frame)
+
+        reference = self._reference
+        if (reference is None or reference.shape != self._current.shape
+                or self._consecutive >= self._recheck_frames):
+            return True
+
+        changed = np.abs(self._current - reference) > self._pixel_delta
+        if np.count_nonzero(changed) > self._motion_ratio * changed.size:
+            return True
+
+        self._consecutive += 1
+        self._gated_frames += 1
+        return False
+
+    def record(self, pose_detected: bool):
+        """추론 결과 기록 - 사람이 없으면 방금 판별한 장면을 기준으로 삼는다"""
+        self._consecutive = 0
+        self._reference = None if pose_detected else self._current
+
+    @staticmethod
+    def _thumbnail(frame: np.ndarray) -> np.ndarray:
+        """일정 간격 픽셀만 뽑은 회색조 썸네일 (int16, 프레임 전체를 읽지 않음)"""
+        step = max(1, frame.shape[1] // GATE_THUMBNAIL_WIDTH)
+        small = frame[::step, ::step].astype(np.int16)
+        if small.ndim == 3:
+            small = small.sum(axis=2) // small.shape[2]
+        return small
@@ -0,0 +1,173 @@
+"""
+프로젝트 이미지 지연 로드
+
+프로젝트를 열 때 images/ 멤버를 모두 꺼내면 캡처 수에 비례해 시간이 걸린다.
+ZIP을 열어 둔 채로 캡처 경로 → 멤버 이름 표만 만들고, 이미지는 처음 쓸 때 꺼내거나
+(resolve) 파일로 꺼내지 않고 바로 읽는다 (read). 프로젝트를 저장할 때 아직 꺼내지 않은 이미지는
+새 ZIP으로 바로 복사하고(copy_to), 원본 파일을 바꿔 쓰면 새 파일로 다시 연다(replace_file).
+모든 ZipFile 접근은 잠금 안에서 하므로 저장 스레드와 GUI 스레드가 함께 써도 된다.
+"""
+
+import os
+import shutil
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from .logger import get_logger
+
+IMAGE_PREFIX = 'images/'
+
+
+def extract_member(zf: zipfile.ZipFile, name: str, target: Path) -> None:
+    """ZIP 멤버를 파일로 꺼내고 수정 시각을 멤버 시각으로 맞춤
+
+    다음 저장에서 같은 이미지로 인식되어(크기/시각 비교) 다시 덧붙여지지 않게 한다.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zf.open(name) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    mtime = time.mktime(zf.getinfo(name).date_time + (0, 0, -1))
+    os.utime(target, (mtime, mtime))
+
+
+class ProjectImageArchive:
+    """프로젝트 ZIP의 캡처 이미지를 필요할 때 꺼내는 캐시
+
+    Args:
+        path: 프로젝트 파일 경로
+        target_dir: 이미지를 꺼낼 캡처 디렉토리 (레코드의 이미지 경로 기준)
+    """
+
+    def __init__(self, path: Path, target_dir: Path):
+        self._logger = get_logger('project_archive')
+        self._path = Path(path)
+        self._target_dir = Path(target_dir)
+        self._lock = threading.Lock()  # ZipFile 읽기는 스레드 안전하지 않음
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._members: Dict[str, str] = {}
+        self._extracted: Set[str] = set()
+        self._open()
+
+    def _open(self) -> None:
+        """ZIP을 열고 꺼낼 경로 → 멤버 이름 표 작성 (잠금 안에서 호출)"""
+        self._zip = zipfile.ZipFile(self._path, 'r')
+        # 덧붙이기 저장으로 같은 이름이 여러 번 있으면 마지막 멤버
+        self._members = {}
+        for name in self._zip.namelist():
+            if name.startswith(IMAGE_PREFIX) and not name.endswith('/'):
+                self._members[str(self._target_dir / name[len(IMAGE_PREFIX):])] = name
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, image_path) -> bool:
+        return str(image_path) in self._members
+
+    def is_extracted(self, image_path) -> bool:
+        return str(image_path) in self._extracted
+
+    def is_pending(self, image_path) -> bool:
+        """ZIP에만 있고 아직 파일로 꺼내지 않은 이미지인지"""
+        key = str(image_path)
+        return key in self._members and key not in self._extracted
+
+    def member_info(self, image_path) -> Optional[zipfile.ZipInfo]:
+        """이미지의 ZIP 멤버 정보 (없으면 None)"""
+        member = self._members.get(str(image_path))
+        with self._lock:
+            if member is None or self._zip is None:
+                return None
+            return self._zip.getinfo(member)
+
+    def resolve(self, image_path: Optional[str]) -> Optional[str]:
+        """
+        이미지 파일 경로 반환 (ZIP에 있으면 이번 세션에서 처음 쓸 때 꺼냄)
+
+        Returns:
+            사용할 수 있는 파일 경로, 없으면 None
+        """
+        if not image_path:
+            return None
+        key = str(image_path)
+        if self.is_pending(key):
+            with self._lock:
+                member = self._members.get(key)
+                if member is not None and key not in self._extracted and self._zip is not None:
+                    extract_member(self._zip, member, Path(key))
+                    self._extracted.add(key)
+        return key if Path(key).exists() else None
+
+    def read(self, image_path: Optional[str]) -> Optional[bytes]:
+        """이미지 바이트 (꺼낸 파일이 있으면 파일에서, 없으면 ZIP에서 바로)"""
+        if not image_path:
+            return None
+        key = str(image_path)
+        if self.is_pending(key):
+            with self._lock:
+                member = self._members.get(key)
+                if member is not None and key not in self._extracted and self._zip is not None:
+                    return self._zip.read(member)
+        path = Path(key)
+        return path.read_bytes() if path.exists() else None
+
+    def copy_to(self, image_path, out_zip: zipfile.ZipFile, arcname: str) -> bool:
+        """
+        꺼내지 않은 이미지를 파일을 거치지 않고 다른 ZIP에 복사 (멤버 시각/압축 방식 유지)
+
+        Returns:
+            복사했으면 True, 이미 꺼냈거나 없는 이미지면 False (파일에서 쓰면 됨)
+        """
+        key = str(image_path)
+        with self._lock:
+            member = self._members.get(key)
+            if member is None or key in self._extracted or self._zip is None:
+                return False
+            src_info = self._zip.getinfo(member)
+            info = zipfile.ZipInfo(arcname, date_time=src_info.date_time)
+            info.compress_type = src_info.compress_type
+            info.external_attr = src_info.external_attr
+            with self._zip.open(member) as src, out_zip.open(info, 'w') as dst:
+                shutil.copyfileobj(src, dst)
+        return True
+
+    def replace_file(self, new_path: Path) -> None:
+        """
+        열어 둔 원본 ZIP을 새로 쓴 파일로 바꾸고 다시 연다 (같은 경로에 전체 다시 쓰기)
+
+        새 파일에는 꺼내지 않은 이미지도 같은 멤버 이름으로 들어 있어야 한다.
+        옮기지 못하면 원본을 다시 열고 예외를 그대로 올린다.
+        """
+        with self._lock:
+            was_open = self._zip is not None
+            if was_open:
+                self._zip.close()
+            try:
+                shutil.move(str(new_path), str(self._path))
+            finally:
+                if was_open:
+                    self._open()
+
+    def extract_all(self) -> int:
+        """아직 꺼내지 않은 이미지를 모두 꺼냄 (ZIP을 다시 쓰기 전에 호출)
+
+        Returns:
+            새로 꺼낸 이미지 수
+        """
+        pending = [key for key in self._members if key not in self._extracted]
+        for key in pending:
+            self.resolve(key)
+        return len(pending)
+
+    def close(self) -> None:
+        """ZIP 닫기 (이후 resolve/read는 이미 꺼낸 파일만 돌려줌)"""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
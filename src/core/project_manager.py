@@ -7,25 +7,45 @@ ZIP 구조:
     project.skpx
     ├── project.json    # 메타데이터 (버전, 생성일 등)
     ├── video.json      # 동영상 정보 (절대 경로)
-    ├── captures.json   # 캡처 데이터
+    ├── captures.json   # 캡처 데이터 (JSON 저장 방식)
+    ├── captures.db     # 캡처 데이터 (SQLite 저장 방식, captures.json 대신)
     ├── ui_state.json   # UI 상태
     └── images/         # 캡처 이미지 파일들
+
+기본 저장 방식은 JSON이고 SQLite는 선택 사항이다. SQLite 저장 방식에서는 작업 파일
+(capture_db_dir/<이름>-<경로 해시>.captures.db, capture_db_dir가 없으면 프로젝트 옆의
+<이름>.captures.db)에 바뀐 행만 기록하고, 그 스냅샷을 ZIP에 넣는다. JSON 프로젝트를 열어
+SQLite 방식으로 저장하면 captures.db로 바뀐다 (이전 버전은 captures.json이 없는 프로젝트를 열 수 없음).
+
+같은 파일에 다시 저장하면 바뀐 멤버와 새 이미지만 ZIP 끝에 덧붙이고(같은 이름은 마지막 멤버가 유효),
+전체 재작성(정리)은 compact() 또는 다른 이름으로 저장할 때만 한다.
 """
 
+import copy
+import hashlib
 import json
+import sqlite3
+import threading
 import zipfile
+import zlib
 import tempfile
 import shutil
+import warnings
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Set
+from typing import Optional, Callable, Dict, Any, List, Set, Iterator, Tuple
 
 from .capture_model import CaptureDataModel, CaptureRecord
+from .capture_db import CaptureDatabase
+from .project_archive import ProjectImageArchive, extract_member
 from .movement_analyzer import MovementAnalysisResult
 from .logger import get_logger
 
+# 이미 압축된 이미지 형식 (ZIP에 무압축으로 저장)
+STORED_IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp')
+
 
 class LoadResult(Enum):
     """프로젝트 로드 결과"""
@@ -46,21 +66,88 @@ class LoadInfo:
     source_path: Optional[str] = None
 
 
+@dataclass
+class ProjectSnapshot:
+    """저장 시점의 프로젝트 상태 복사본 (백그라운드 저장 중 편집과 분리)"""
+    video_path: Optional[str]
+    frame_position: int
+    fps: float
+    capture_model: CaptureDataModel
+    ui_state: Dict[str, Any]
+    capture_dir: Optional[Path]
+    movement_data: Dict[str, Any]
+    source_type: str
+    source_path: Optional[str]
+    transforms: Dict[str, Any]
+    created_at: str
+    generation: int  # 스냅샷 시점의 변경 번호 (저장 중 변경이 있었는지 확인)
+    image_archive: Optional[ProjectImageArchive] = None  # 지연 로드 중이면 아직 꺼내지 않은 이미지의 원본
+
+
 class ProjectLoadError(Exception):
     """프로젝트 로드 오류"""
     pass
 
 
+class ProjectSaveCancelled(Exception):
+    """프로젝트 저장 취소 (기존 파일은 그대로)"""
+    pass
+
+
+class _SaveProgress:
+    """저장 진행 보고/취소 확인 (멤버 하나를 쓸 때마다 호출)"""
+
+    def __init__(self, progress: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None):
+        self._progress = progress
+        self._is_cancelled = is_cancelled
+        self._done = 0
+        self._total = 0
+
+    def start(self, total: int) -> None:
+        self._done = 0
+        self._total = total
+        self.check()
+        if self._progress:
+            self._progress(0, total)
+
+    def check(self) -> None:
+        if self._is_cancelled and self._is_cancelled():
+            raise ProjectSaveCancelled()
+
+    def __call__(self) -> None:
+        self.check()
+        self._done += 1
+        if self._progress:
+            self._progress(self._done, self._total)
+
+
 class ProjectManager:
     """프로젝트 저장/로드 관리자 (ZIP 형식)"""
 
     VERSION = "1.0"
-    REQUIRED_FILES = ['project.json', 'video.json', 'captures.json', 'ui_state.json']
+    REQUIRED_FILES = ['project.json', 'video.json', 'ui_state.json']
+    CAPTURE_FILES = ['captures.db', 'captures.json']  # 둘 중 하나 필요 (db 우선)
+    CAPTURE_STORAGES = ('json', 'sqlite')
 
-    def __init__(self):
+    def __init__(self, capture_storage: str = 'json', capture_db_dir: Optional[Path] = None):
+        """
+        Args:
+            capture_storage: 캡처 저장 방식 ('json' | 'sqlite')
+            capture_db_dir: SQLite 작업 파일 디렉토리 (None이면 프로젝트 파일 옆)
+        """
         self._logger = get_logger('project_manager')
+        self._capture_storage = 'json'
+        self.set_capture_storage(capture_storage)
+        self._capture_db_dir = Path(capture_db_dir) if capture_db_dir else None
+        self._capture_db: Optional[CaptureDatabase] = None
+        self._created_at: Optional[str] = None
+        self._image_archive: Optional[ProjectImageArchive] = None  # 지연 로드 중인 이미지
         self._current_path: Optional[Path] = None
         self._is_dirty: bool = False
+        self._generation: int = 0  # mark_dirty마다 증가
+        self._save_lock = threading.Lock()  # 한 번에 저장 하나
+        self._recovery_path: Optional[Path] = None  # 이 프로젝트로 마지막에 쓴 복구 파일
 
         # 상태 저장용
         self._video_path: Optional[str] = None
@@ -86,6 +173,30 @@ class ProjectManager:
         """현재 프로젝트 경로"""
         return self._current_path
 
+    @property
+    def capture_storage(self) -> str:
+        """캡처 저장 방식 ('json' | 'sqlite')"""
+        return self._capture_storage
+
+    def set_capture_storage(self, capture_storage: str) -> None:
+        """캡처 저장 방식 변경 (다음 저장부터 적용)"""
+        if capture_storage not in self.CAPTURE_STORAGES:
+            raise ValueError(f"알 수 없는 캡처 저장 방식: {capture_storage}")
+        self._capture_storage = capture_storage
+
+    def capture_db_path(self, path: Path) -> Path:
+        """
+        프로젝트의 SQLite 작업 파일 경로
+
+        capture_db_dir가 있으면 그 아래에 프로젝트 경로 해시를 붙여 두므로 읽기 전용 폴더의
+        프로젝트도 열 수 있다. 없으면 프로젝트 파일 옆에 둔다.
+        """
+        path = Path(path)
+        if self._capture_db_dir is None:
+            return path.with_name(f"{path.stem}.captures.db")
+        digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:12]
+        return self._capture_db_dir / f"{path.stem}-{digest}.captures.db"
+
     @property
     def project_name(self) -> Optional[str]:
         """프로젝트 이름 (파일명에서 확장자 제외)"""
@@ -98,6 +209,7 @@ class ProjectManager:
     def mark_dirty(self) -> None:
         """변경사항 있음으로 표시"""
         self._is_dirty = True
+        self._generation += 1
 
     def mark_clean(self) -> None:
         """변경사항 없음으로 표시"""
@@ -146,12 +258,42 @@ class ProjectManager:
 
     # === 저장 ===
 
-    def save(self, path: Optional[Path] = None) -> bool:
+    def snapshot(self, recovery: bool = False) -> ProjectSnapshot:
         """
-        프로젝트를 ZIP 파일로 저장
+        현재 상태의 저장용 복사본 (GUI 스레드에서 호출, 캡처 모델은 열 배열 복사)
+
+        Args:
+            recovery: 복구용 자동 저장이면 True (캡처 모델의 변경 기록을 가져가지 않음)
+        """
+        model = self._capture_model if self._capture_model is not None else CaptureDataModel()
+        movement = self._movement_analysis_result
+        return ProjectSnapshot(
+            video_path=self._video_path,
+            frame_position=self._frame_position,
+            fps=self._fps,
+            capture_model=model.snapshot(take_changes=not recovery),
+            ui_state=copy.deepcopy(self._ui_state),
+            capture_dir=self._capture_dir,
+            movement_data=movement.to_dict() if movement else {},
+            source_type=self._source_type,
+            source_path=self._source_path,
+            transforms=copy.deepcopy(self._transforms),
+            created_at=self._created_at or datetime.now().isoformat(),
+            generation=self._generation,
+            image_archive=self._image_archive,
+        )
+
+    def save(self, path: Optional[Path] = None, compact: bool = False) -> bool:
+        """
+        프로젝트를 ZIP 파일로 저장 (snapshot → write_snapshot → finish_save를 한 번에)
+
+        현재 프로젝트 파일에 다시 저장하면 바뀐 JSON 멤버와 새 이미지만 ZIP 끝에 덧붙인다
+        (같은 이름은 마지막 멤버가 유효). 이전 멤버가 차지하던 공간은 compact=True로
+        저장하거나 다른 이름으로 저장할 때 전체를 다시 써서 정리한다.
 
         Args:
             path: 저장 경로. None이면 current_path 사용.
+            compact: True면 덧붙이지 않고 ZIP 전체를 새로 작성
 
         Returns:
             성공 여부
@@ -161,102 +303,332 @@ class ProjectManager:
         if path is None:
             return False
 
-        path = Path(path)
+        snapshot = self.snapshot()
+        self.write_snapshot(snapshot, path, compact=compact)
+        self.finish_save(snapshot, path)
+        return True
 
-        try:
-            self._logger.info(f"프로젝트 저장 시작: {path}")
+    def compact(self) -> bool:
+        """현재 프로젝트 파일을 새로 작성해 덧붙이기 저장으로 쌓인 이전 멤버 정리"""
+        return self.save(compact=True)
 
-            # 임시 파일에 먼저 저장 (안전한 저장)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.skpx') as tmp:
-                tmp_path = Path(tmp.name)
+    def write_snapshot(
+        self,
+        snapshot: ProjectSnapshot,
+        path: Path,
+        compact: bool = False,
+        recovery: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """
+        스냅샷을 파일에 기록 (백그라운드 스레드에서 호출 가능)
 
-            self._write_zip(tmp_path)
+        현재 경로, 변경 상태 등 매니저 상태는 바꾸지 않는다 (finish_save에서 반영).
+        지연 로드 중이면 아직 꺼내지 않은 이미지는 원본 ZIP에서 새 파일로 바로 복사하고,
+        원본 ZIP 자리에 전체를 다시 쓰면 그 파일로 다시 열어 지연 로드를 유지한다.
+        복구용 저장(recovery=True)은 항상 JSON 방식으로 쓰고 SQLite 작업 파일을 건드리지 않는다.
 
-            # 성공하면 원본 교체
-            shutil.move(str(tmp_path), str(path))
+        Args:
+            snapshot: snapshot()으로 만든 상태
+            path: 저장 경로
+            compact: True면 덧붙이지 않고 ZIP 전체를 새로 작성
+            recovery: 복구용 자동 저장 여부
+            progress: 진행 콜백 (완료 단계 수, 전체 단계 수)
+            is_cancelled: 취소 확인 콜백 (True를 반환하면 ProjectSaveCancelled 발생)
+
+        Returns:
+            덧붙이기 저장이면 True, 전체 작성이면 False
+
+        Raises:
+            ProjectSaveCancelled: 취소됨 (기존 파일은 그대로)
+        """
+        path = Path(path)
+        tick = _SaveProgress(progress, is_cancelled)
+
+        with self._save_lock:
+            try:
+                self._logger.info(f"프로젝트 저장 시작: {path}{' (복구용)' if recovery else ''}")
+
+                # SQLite 방식: 작업 파일에 바뀐 행만 기록
+                db_path = None
+                if self._capture_storage == 'sqlite' and not recovery:
+                    db_path = self._sync_capture_db(snapshot, path)
+                tick.check()
+
+                last_path = self._recovery_path if recovery else self._current_path
+                appended = (not compact and path == last_path
+                            and self._append_zip(snapshot, path, db_path, tick))
+                if not appended:
+                    # 임시 파일에 먼저 저장 (안전한 저장)
+                    with tempfile.NamedTemporaryFile(delete=False, suffix='.skpx') as tmp:
+                        tmp_path = Path(tmp.name)
+
+                    self._write_zip(snapshot, tmp_path, db_path, tick)
+
+                    # 성공하면 원본 교체 (지연 로드 중인 원본이면 닫고 바꾼 뒤 다시 엶)
+                    archive = snapshot.image_archive
+                    if archive is not None and path.resolve() == archive.path.resolve():
+                        archive.replace_file(tmp_path)
+                    else:
+                        shutil.move(str(tmp_path), str(path))
+
+                if recovery:
+                    self._recovery_path = path
+                self._logger.info(f"프로젝트 저장 완료: {path} ({'증분' if appended else '전체'})")
+                return appended
+
+            except ProjectSaveCancelled:
+                self._logger.info(f"프로젝트 저장 취소: {path}")
+                raise
+
+            except Exception as e:
+                self._logger.error(f"프로젝트 저장 실패: {path}, 오류: {e}")
+                raise
+
+            finally:
+                # 임시 파일 정리
+                if 'tmp_path' in locals() and tmp_path.exists():
+                    tmp_path.unlink()
+
+    def finish_save(self, snapshot: ProjectSnapshot, path: Path) -> None:
+        """
+        저장 완료 반영 (GUI 스레드에서 호출)
 
-            self._current_path = path
+        스냅샷 이후에 변경이 있었으면 변경 상태를 유지한다.
+        """
+        self._current_path = Path(path)
+        self._created_at = snapshot.created_at
+        if self._generation == snapshot.generation:
             self.mark_clean()
-            self._logger.info(f"프로젝트 저장 완료: {path}")
+
+    def _sync_capture_db(self, snapshot: ProjectSnapshot, path: Path) -> Path:
+        """SQLite 작업 파일에 캡처 데이터 반영 (다른 프로젝트/JSON에서 온 모델이면 전체 기록)"""
+        db_path = self.capture_db_path(path)
+        if self._capture_db is None or self._capture_db.path != db_path:
+            self._close_capture_db()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._capture_db = CaptureDatabase(db_path)
+        written = self._capture_db.sync(snapshot.capture_model, snapshot.capture_dir or Path('.'))
+        self._capture_db.checkpoint()
+        self._logger.info(f"캡처 DB 저장: {db_path} ({written}행 기록)")
+        return db_path
+
+    def _close_image_archive(self, extract: bool = False) -> None:
+        archive, self._image_archive = self._image_archive, None
+        if archive is not None:
+            if extract:
+                archive.extract_all()
+            archive.close()
+
+    def _close_capture_db(self) -> None:
+        if self._capture_db is not None:
+            self._capture_db.close()
+            self._capture_db = None
+
+    def _json_members(self, snapshot: ProjectSnapshot,
+                      capture_db_path: Optional[Path] = None) -> Dict[str, bytes]:
+        """ZIP에 넣을 JSON 멤버 (이름 → 내용)"""
+        members: Dict[str, bytes] = {}
+
+        # project.json
+        project_data = {
+            'version': self.VERSION,
+            'created_at': snapshot.created_at,
+            'modified_at': datetime.now().isoformat(),
+            'app_version': '1.0.0',
+            'capture_storage': 'sqlite' if capture_db_path else 'json',
+        }
+        members['project.json'] = json.dumps(project_data, indent=2).encode('utf-8')
+
+        # video.json
+        video_data = {
+            'type': snapshot.source_type,
+            'path': snapshot.video_path,
+            'frame_position': snapshot.frame_position,
+            'fps': snapshot.fps,
+        }
+        if snapshot.source_path:
+            video_data['source_path'] = snapshot.source_path
+        if snapshot.transforms:
+            video_data['transforms'] = snapshot.transforms
+        members['video.json'] = json.dumps(video_data, indent=2).encode('utf-8')
+
+        # captures.json (SQLite 방식이면 captures.db를 따로 넣음)
+        if not capture_db_path:
+            base_path = snapshot.capture_dir or Path('.')
+            captures_data = snapshot.capture_model.to_project_dict(base_path)
+            members['captures.json'] = json.dumps(
+                captures_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        # ui_state.json
+        members['ui_state.json'] = json.dumps(snapshot.ui_state, indent=2).encode('utf-8')
+
+        # movement_analysis.json (옵션)
+        members['movement_analysis.json'] = json.dumps(
+            snapshot.movement_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        return members
+
+    def _write_zip(self, snapshot: ProjectSnapshot, path: Path,
+                   capture_db_path: Optional[Path] = None,
+                   tick: Optional['_SaveProgress'] = None) -> None:
+        """ZIP 파일 작성 (capture_db_path가 있으면 captures.json 대신 captures.db)"""
+        tick = tick or _SaveProgress()
+        images = list(self._image_members(snapshot))
+        tick.start(len(images) + 1)
+        archive = snapshot.image_archive
+
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, data in self._json_members(snapshot, capture_db_path).items():
+                zf.writestr(name, data)
+
+            if capture_db_path:
+                zf.write(str(capture_db_path), 'captures.db')
+            tick()
+
+            # 이미지 복사
+            for img_path, archive_path in images:
+                self._write_image(zf, archive, img_path, archive_path)
+                tick()
+
+    def _append_zip(self, snapshot: ProjectSnapshot, path: Path,
+                    capture_db_path: Optional[Path] = None,
+                    tick: Optional['_SaveProgress'] = None) -> bool:
+        """
+        기존 ZIP에 바뀐 멤버만 덧붙이기
+
+        JSON 멤버는 CRC가 같으면, 이미지는 같은 이름에 크기/수정 시각이 같으면 건너뛴다.
+        쓰는 도중 오류가 나거나 취소되면 원래 중앙 디렉토리를 되돌려 기존 파일을 유지한다.
+
+        Returns:
+            덧붙였으면 True, 덧붙일 수 없어 전체 작성이 필요하면 False
+        """
+        tick = tick or _SaveProgress()
+        if not path.exists() or not zipfile.is_zipfile(path):
+            return False
+
+        with zipfile.ZipFile(path, 'r') as zf:
+            existing = {info.filename: info for info in zf.infolist()}  # 같은 이름은 마지막 멤버
+            start_dir = zf.start_dir
+
+        # 저장 방식이 바뀌면 이전 형식의 멤버가 남지 않도록 전체 작성
+        stale_member = 'captures.json' if capture_db_path else 'captures.db'
+        if stale_member in existing:
+            return False
+
+        json_members = {
+            name: data for name, data in self._json_members(snapshot, capture_db_path).items()
+            if not self._same_member(existing.get(name), data)
+        }
+        write_db = bool(capture_db_path) and not self._same_file_crc(existing.get('captures.db'), capture_db_path)
+        archive = snapshot.image_archive
+        images = [
+            (img_path, archive_path) for img_path, archive_path in self._image_members(snapshot)
+            if not self._same_image(existing.get(archive_path), img_path, archive)
+        ]
+        # project.json은 modified_at 때문에 항상 달라지므로 다른 변경이 있을 때만 기록
+        if list(json_members) == ['project.json'] and not write_db and not images:
             return True
+        tick.start(len(images) + 1)
+
+        # 실패 시 되돌릴 원래 중앙 디렉토리
+        with open(path, 'rb') as f:
+            f.seek(start_dir)
+            central_directory = f.read()
 
-        except Exception as e:
-            self._logger.error(f"프로젝트 저장 실패: {path}, 오류: {e}")
-            # 임시 파일 정리
-            if 'tmp_path' in locals() and tmp_path.exists():
-                tmp_path.unlink()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)  # 같은 이름 멤버 경고
+                with zipfile.ZipFile(path, 'a', zipfile.ZIP_DEFLATED) as zf:
+                    for name, data in json_members.items():
+                        zf.writestr(name, data)
+                    if write_db:
+                        zf.write(str(capture_db_path), 'captures.db')
+                    tick()
+                    for img_path, archive_path in images:
+                        self._write_image(zf, archive, img_path, archive_path)
+                        tick()
+        except BaseException:
+            with open(path, 'r+b') as f:
+                f.seek(start_dir)
+                f.write(central_directory)
+                f.truncate()
             raise
 
-    def _write_zip(self, path: Path) -> None:
-        """ZIP 파일 작성"""
-        now = datetime.now().isoformat()
+        self._logger.info(
+            f"프로젝트 덧붙이기 저장: JSON {len(json_members)}개, DB {int(write_db)}개, 이미지 {len(images)}개")
+        return True
 
-        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # project.json
-            project_data = {
-                'version': self.VERSION,
-                'created_at': now,
-                'modified_at': now,
-                'app_version': '1.0.0',
-            }
-            zf.writestr('project.json', json.dumps(project_data, indent=2))
-
-            # video.json
-            video_data = {
-                'type': self._source_type,
-                'path': self._video_path,
-                'frame_position': self._frame_position,
-                'fps': self._fps,
-            }
-            if self._source_path:
-                video_data['source_path'] = self._source_path
-            if self._transforms:
-                video_data['transforms'] = self._transforms
-            zf.writestr('video.json', json.dumps(video_data, indent=2))
-
-            # captures.json
-            if self._capture_model:
-                base_path = self._capture_dir or Path('.')
-                captures_data = self._capture_model.to_project_dict(base_path)
-            else:
-                captures_data = {'records': []}
-            zf.writestr('captures.json', json.dumps(captures_data, indent=2, ensure_ascii=False))
-
-            # ui_state.json
-            zf.writestr('ui_state.json', json.dumps(self._ui_state, indent=2))
-
-            # movement_analysis.json (옵션)
-            if self._movement_analysis_result:
-                movement_data = self._movement_analysis_result.to_dict()
-            else:
-                movement_data = {}
-            zf.writestr('movement_analysis.json', json.dumps(movement_data, indent=2, ensure_ascii=False))
+    @staticmethod
+    def _same_member(info: Optional[zipfile.ZipInfo], data: bytes) -> bool:
+        return info is not None and info.file_size == len(data) and info.CRC == zlib.crc32(data)
 
-            # 이미지 복사
-            if self._capture_model and self._capture_dir:
-                self._copy_images_to_zip(zf)
+    @staticmethod
+    def _same_file_crc(info: Optional[zipfile.ZipInfo], file_path: Path) -> bool:
+        if info is None or info.file_size != file_path.stat().st_size:
+            return False
+        crc = 0
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                crc = zlib.crc32(chunk, crc)
+        return info.CRC == crc
+
+    @staticmethod
+    def _same_image(info: Optional[zipfile.ZipInfo], img_path: Path,
+                    archive: Optional[ProjectImageArchive] = None) -> bool:
+        """캡처 이미지는 한 번 쓰면 바뀌지 않으므로 크기/수정 시각만 비교 (꺼내지 않은 이미지는 CRC)"""
+        if info is None:
+            return False
+        if archive is not None and archive.is_pending(img_path):
+            src_info = archive.member_info(img_path)
+            return (src_info is not None and info.file_size == src_info.file_size
+                    and info.CRC == src_info.CRC)
+        stat_info = zipfile.ZipInfo.from_file(str(img_path))
+        # ZIP 시각은 2초 단위로 저장됨
+        return (info.file_size == stat_info.file_size
+                and info.date_time[:5] == stat_info.date_time[:5]
+                and info.date_time[5] // 2 == stat_info.date_time[5] // 2)
+
+    @staticmethod
+    def _image_compression(img_path: Path) -> int:
+        """PNG/JPEG 등 이미 압축된 이미지는 다시 압축하지 않음"""
+        if img_path.suffix.lower() in STORED_IMAGE_SUFFIXES:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    @classmethod
+    def _write_image(cls, zf: zipfile.ZipFile, archive: Optional[ProjectImageArchive],
+                     img_path: Path, archive_path: str) -> None:
+        """이미지 멤버 기록 (꺼내지 않은 이미지는 원본 ZIP에서 바로 복사)"""
+        if archive is not None and archive.copy_to(img_path, zf, archive_path):
+            return
+        zf.write(str(img_path), archive_path, compress_type=cls._image_compression(img_path))
 
-    def _copy_images_to_zip(self, zf: zipfile.ZipFile) -> None:
-        """캡처 이미지를 ZIP에 복사"""
-        if not self._capture_model:
+    @staticmethod
+    def _image_members(snapshot: ProjectSnapshot) -> Iterator[Tuple[Path, str]]:
+        """ZIP에 넣을 캡처 이미지 (파일 경로, ZIP 내 경로 - 꺼내지 않은 이미지 포함)"""
+        capture_dir = snapshot.capture_dir
+        if not capture_dir:
             return
 
         copied: Set[str] = set()
+        archive = snapshot.image_archive
 
-        for record in self._capture_model.get_all_records():
+        for record in snapshot.capture_model.iter_records():
             for path_attr in ('video_frame_path', 'skeleton_image_path'):
                 path = getattr(record, path_attr)
                 if path and path not in copied:
                     img_path = Path(path)
-                    if img_path.exists():
+                    if img_path.exists() or (archive is not None and archive.is_pending(img_path)):
                         # 상대 경로로 저장
                         try:
-                            rel_path = img_path.relative_to(self._capture_dir)
-                            archive_path = f"images/{rel_path}"
+                            rel_path = img_path.relative_to(capture_dir)
+                            archive_path = f"images/{rel_path.as_posix()}"
                         except ValueError:
                             archive_path = f"images/{img_path.name}"
 
-                        zf.write(str(img_path), archive_path)
+                        yield img_path, archive_path
                         copied.add(path)
 
     # === 로드 ===
@@ -267,6 +639,7 @@ class ProjectManager:
         check_video: bool = True,
         load_video: bool = True,
         capture_dir: Optional[Path] = None,
+        lazy: bool = False,
     ) -> LoadInfo:
         """
         프로젝트 파일 로드
@@ -276,6 +649,8 @@ class ProjectManager:
             check_video: 동영상 파일 존재 여부 확인
             load_video: 동영상 정보 로드 여부 (False면 부분 로드)
             capture_dir: 이미지 추출 디렉토리
+            lazy: True면 이미지를 미리 꺼내지 않고 ZIP을 열어 둔 채 필요할 때 꺼냄
+                  (resolve_image/read_image)
 
         Returns:
             LoadInfo 객체
@@ -300,7 +675,6 @@ class ProjectManager:
                 # 데이터 로드
                 project_data = json.loads(zf.read('project.json'))
                 video_data = json.loads(zf.read('video.json'))
-                captures_data = json.loads(zf.read('captures.json'))
                 ui_state = json.loads(zf.read('ui_state.json'))
 
                 # 움직임 분석 결과 로드 (옵션 - 이전 버전 호환)
@@ -332,13 +706,22 @@ class ProjectManager:
                 self._capture_dir = capture_dir
 
                 # 이미지 추출
-                image_count = self._extract_images(zf, capture_dir)
+                self._close_image_archive()
+                if lazy:
+                    self._image_archive = ProjectImageArchive(path, capture_dir)
+                    image_count = len(self._image_archive)
+                else:
+                    image_count = self._extract_images(zf, capture_dir)
 
                 # CaptureDataModel 복원
-                capture_model = CaptureDataModel.from_project_dict(
-                    captures_data,
-                    base_path=capture_dir,
-                )
+                if 'captures.db' in zf.namelist():
+                    capture_model = self._load_capture_db(zf, path, capture_dir)
+                else:
+                    captures_data = json.loads(zf.read('captures.json'))
+                    capture_model = CaptureDataModel.from_project_dict(
+                        captures_data,
+                        base_path=capture_dir,
+                    )
 
                 # 상태 설정
                 self._video_path = video_path if load_video else None
@@ -351,6 +734,8 @@ class ProjectManager:
                 self._source_path = source_path
                 self._transforms = video_data.get('transforms', {})
                 self._current_path = path
+                self._recovery_path = None
+                self._created_at = project_data.get('created_at')
                 self.mark_clean()
 
                 # 결과 결정
@@ -379,6 +764,47 @@ class ProjectManager:
             raise ProjectLoadError(f"프로젝트 파일을 읽을 수 없습니다: {e}")
         except KeyError as e:
             raise ProjectLoadError(f"프로젝트 파일에 필수 데이터가 없습니다: {e}")
+        except sqlite3.DatabaseError as e:
+            raise ProjectLoadError(f"캡처 데이터베이스를 읽을 수 없습니다: {e}")
+
+    def _load_capture_db(self, zf: zipfile.ZipFile, path: Path, capture_dir: Path) -> CaptureDataModel:
+        """ZIP의 captures.db를 작업 파일로 꺼내 페이지 단위로 로드 (작업 파일이 같으면 다시 꺼내지 않음)"""
+        self._close_capture_db()
+        db_path = self.capture_db_path(path)
+        for stale in (Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+            if stale.exists():
+                stale.unlink()
+        if not (db_path.exists() and self._same_file_crc(zf.getinfo('captures.db'), db_path)):
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open('captures.db') as src, open(db_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        self._capture_db = CaptureDatabase(db_path)
+        return self._capture_db.load(base_path=capture_dir)
+
+    # === 이미지 접근 ===
+
+    def resolve_image(self, image_path: Optional[str]) -> Optional[str]:
+        """
+        캡처 이미지 파일 경로 (지연 로드 중이면 처음 쓸 때 ZIP에서 꺼냄)
+
+        Returns:
+            사용할 수 있는 파일 경로, 없으면 None
+        """
+        archive = self._image_archive  # 한 번만 읽음 (저장/닫기와 겹쳐도 같은 객체 사용)
+        if archive is not None:
+            return archive.resolve(image_path)
+        if image_path and Path(image_path).exists():
+            return image_path
+        return None
+
+    def read_image(self, image_path: Optional[str]) -> Optional[bytes]:
+        """캡처 이미지 바이트 (지연 로드 중이면 파일로 꺼내지 않고 ZIP에서 바로 읽음)"""
+        archive = self._image_archive
+        if archive is not None:
+            return archive.read(image_path)
+        if image_path and Path(image_path).exists():
+            return Path(image_path).read_bytes()
+        return None
 
     def _validate_zip(self, zf: zipfile.ZipFile) -> None:
         """ZIP 파일 유효성 검사"""
@@ -386,27 +812,43 @@ class ProjectManager:
         for required in self.REQUIRED_FILES:
             if required not in names:
                 raise ProjectLoadError(f"필수 파일이 없습니다: {required}")
+        if not any(name in names for name in self.CAPTURE_FILES):
+            raise ProjectLoadError(f"필수 파일이 없습니다: {self.CAPTURE_FILES[-1]}")
 
     def _extract_images(self, zf: zipfile.ZipFile, target_dir: Path) -> int:
         """이미지를 캡처 디렉토리로 추출"""
-        image_files = [n for n in zf.namelist() if n.startswith('images/') and not n.endswith('/')]
+        # 덧붙이기 저장으로 같은 이름이 여러 번 있을 수 있음 (zf.open은 마지막 멤버를 연다)
+        image_files = list(dict.fromkeys(
+            n for n in zf.namelist() if n.startswith('images/') and not n.endswith('/')))
 
         count = 0
         for name in image_files:
             relative_path = name[7:]  # 'images/' 접두사 제거
-            target_path = target_dir / relative_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with zf.open(name) as src, open(target_path, 'wb') as dst:
-                dst.write(src.read())
+            extract_member(zf, name, target_dir / relative_path)
             count += 1
         return count
 
     # === 새 프로젝트 ===
 
+    def detach(self) -> None:
+        """
+        불러온 파일과의 연결 해제 (복구 파일을 연 뒤 등)
+
+        다음 저장은 다른 이름으로 저장이 되고, 내용은 변경됨으로 표시된다.
+        """
+        self._close_capture_db()
+        self._close_image_archive(extract=True)
+        self._current_path = None
+        self._recovery_path = None
+        self.mark_dirty()
+
     def new_project(self) -> None:
         """새 프로젝트 시작 (상태 초기화)"""
+        self._close_capture_db()
+        self._close_image_archive()
+        self._created_at = None
         self._current_path = None
+        self._recovery_path = None
         self._is_dirty = False
         self._video_path = None
         self._frame_position = 0
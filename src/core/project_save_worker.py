@@ -0,0 +1,76 @@
+"""프로젝트 저장 워커 스레드
+
+GUI 스레드에서 ProjectManager.snapshot()으로 상태를 복사한 뒤, ZIP/SQLite 기록은 이 스레드에서 한다.
+저장 중에도 재생/캡처/편집을 계속할 수 있고, 편집 내용은 스냅샷과 분리되어 다음 저장에 반영된다.
+JSON 직렬화는 GIL을 잡지만 ZIP 압축과 파일/SQLite 쓰기는 GIL을 해제하므로 UI 지연은 짧다.
+"""
+import threading
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .project_manager import ProjectManager, ProjectSnapshot, ProjectSaveCancelled
+from .logger import get_logger
+
+# 진행 시그널 최소 간격 (초) - 이미지가 많아도 GUI 이벤트 큐를 채우지 않도록
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+
+class ProjectSaveWorker(QThread):
+    """스냅샷을 프로젝트 파일에 기록하는 워커 스레드"""
+
+    progress_updated = pyqtSignal(int, int)   # (done, total)
+    save_completed = pyqtSignal(object)       # ProjectSnapshot
+    save_cancelled = pyqtSignal()
+    error_occurred = pyqtSignal(str)          # error message
+
+    def __init__(self, manager: ProjectManager, snapshot: ProjectSnapshot, path,
+                 compact: bool = False, recovery: bool = False, parent=None):
+        super().__init__(parent)
+        self._logger = get_logger('project_save_worker')
+        self._manager = manager
+        self._snapshot = snapshot
+        self._path = path
+        self._compact = compact
+        self._recovery = recovery
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    @property
+    def snapshot(self) -> ProjectSnapshot:
+        return self._snapshot
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def is_recovery(self) -> bool:
+        return self._recovery
+
+    def cancel(self):
+        """저장 취소 요청 (다음 멤버를 쓰기 전에 중단, 기존 파일은 그대로)"""
+        self._cancel_event.set()
+
+    def _on_progress(self, done: int, total: int):
+        now = time.monotonic()
+        if done == total or now - self._last_progress >= PROGRESS_INTERVAL_SECONDS:
+            self._last_progress = now
+            self.progress_updated.emit(done, total)
+
+    def run(self):
+        try:
+            self._manager.write_snapshot(
+                self._snapshot, self._path,
+                compact=self._compact,
+                recovery=self._recovery,
+                progress=self._on_progress,
+                is_cancelled=self._cancel_event.is_set,
+            )
+        except ProjectSaveCancelled:
+            self.save_cancelled.emit()
+        except Exception as e:
+            self._logger.error(f"프로젝트 저장 워커 오류: {e}")
+            self.error_occurred.emit(str(e))
+        else:
+            self.save_completed.emit(self._snapshot)
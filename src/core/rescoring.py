@@ -0,0 +1,272 @@
+"""캐시된 랜드마크로 움직임 분석 재계산 (포즈 추론/디코딩 없음)
+
+움직임 판정 임계값, 샘플링 간격, 감지 민감도(RULA/REBA detection_sensitivity), 최소 가시성을 바꿔도
+LandmarkCache에 저장된 프레임별 랜드마크만으로 각도/RULA/REBA/움직임 통계를 다시 계산한다.
+
+샘플링 간격이 추적 초기화 기준(1초)을 넘나들면 분석 실행 모드(VIDEO/IMAGE)가 바뀌어 캐시 키도 달라진다.
+재계산은 분석 모드의 캐시를 먼저 찾고, 없으면 다른 모드의 캐시를 쓴다
+(다른 모드로 감지한 랜드마크라도 재감지 없이 간격만 바꿔 다시 집계할 수 있도록).
+"""
+import os
+import time
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.utils.cv_unicode import VideoCapture as CvVideoCapture
+
+from src.core.angle_calculator import AngleCalculator, ALL_ANGLE_NAMES
+from src.core.ergonomic.rula_calculator import RULACalculator
+from src.core.ergonomic.reba_calculator import REBACalculator
+from src.core.movement_analyzer import MovementAnalyzer, MovementAnalysisResult, DEFAULT_THRESHOLD
+from src.core.landmark_cache import (
+    LandmarkCache, FRAME_DETECTED, FRAME_GATED, cache_key, video_fingerprint,
+)
+from src.core.landmarks import LANDMARK_FIELDS
+from src.core.pose_detector import MIN_LANDMARK_VISIBILITY
+from src.core.analysis_worker import AnalysisWorker
+from src.core.analysis_telemetry import TelemetryThrottle
+from src.core.logger import get_logger
+
+# 진행률 보고 단위 (분석 프레임 수)
+PROGRESS_REPORT_FRAMES = 500
+
+_VISIBILITY = LANDMARK_FIELDS.index('visibility')
+
+_RUNNING_MODES = ('video', 'image')
+
+
+def rescore_running_modes(running_mode: str) -> tuple:
+    """재계산에 쓸 수 있는 캐시의 실행 모드 (분석 모드 우선)"""
+    return (running_mode,) + tuple(mode for mode in _RUNNING_MODES if mode != running_mode)
+
+
+def rescore_from_cache(cache: LandmarkCache, sample_interval: int = 1,
+                       threshold: float = DEFAULT_THRESHOLD, min_visibility: float = 0.0,
+                       detection_sensitivity: float = 1.0,
+                       progress_callback: Callable[[int, int, int, int], None] = None,
+                       is_stopped: Callable[[], bool] = None) -> Optional[MovementAnalysisResult]:
+    """캐시된 랜드마크로 움직임 분석 결과 계산
+
+    Args:
+        cache: 분석할 동영상의 LandmarkCache
+        sample_interval: 샘플링 간격 (프레임)
+        threshold: 움직임 판정 각도 임계값
+        min_visibility: 평균 가시성(하한 적용 전)이 이보다 낮은 프레임은 감지 실패로 처리
+        detection_sensitivity: RULA/REBA 계산기의 감지 민감도 (1.0=기본)
+        progress_callback: (처리 프레임 위치, 전체 프레임, 샘플 프레임 수, 감지 실패 수) 콜백
+        is_stopped: 중단 여부 확인 함수
+
+    Returns:
+        MovementAnalysisResult, 중단 시 None.
+        캐시에 없는 프레임은 감지 실패로, 빈 화면 생략 프레임은 감지 실패 + gated_frames로 센다.
+    """
+    start_time = time.time()
+    interval = max(1, sample_interval)
+    total_frames = cache.frame_count
+    analyzer = MovementAnalyzer(threshold=threshold, sample_interval=interval)
+    angle_calc = AngleCalculator()
+    rula_calc = RULACalculator()
+    reba_calc = REBACalculator()
+    rula_calc.detection_sensitivity = detection_sensitivity
+    reba_calc.detection_sensitivity = detection_sensitivity
+
+    indices = np.arange(0, total_frames, interval)
+    states = np.asarray(cache.states[indices]) if total_frames > 0 else np.zeros(0, np.uint8)
+    landmarks = np.asarray(cache.landmarks[indices]) if total_frames > 0 else None
+
+    # 감지 여부는 배열 연산으로 한 번에 결정
+    detected = states == FRAME_DETECTED
+    gated_frames = int(np.count_nonzero(states == FRAME_GATED))
+    if min_visibility > 0 and len(indices) > 0:
+        detected &= landmarks[:, :, _VISIBILITY].mean(axis=1) >= min_visibility
+
+    # 감지된 프레임의 관절 각도와 RULA/REBA 점수는 배열 연산으로 한 번에 계산
+    # (가시성은 감지 직후와 같게 하한 적용)
+    if np.any(detected):
+        detected_landmarks = landmarks[detected]
+        np.maximum(detected_landmarks[:, :, _VISIBILITY], MIN_LANDMARK_VISIBILITY,
+                   out=detected_landmarks[:, :, _VISIBILITY])
+        angle_table = angle_calc.calculate_angles_batch(detected_landmarks)
+        rula_batch = rula_calc.calculate_batch(angle_table, detected_landmarks)
+        reba_batch = reba_calc.calculate_batch(angle_table, detected_landmarks)
+    else:
+        angle_table = np.zeros((0, len(ALL_ANGLE_NAMES)))
+        rula_batch = reba_batch = {}
+    angle_rows = iter(angle_table.tolist())
+    rula_rows = rula_calc.batch_rows(rula_batch)
+    reba_rows = reba_calc.batch_rows(reba_batch)
+
+    skipped_frames = 0
+    for n, frame_index in enumerate(indices):
+        if is_stopped is not None and is_stopped():
+            return None
+
+        if detected[n]:
+            angles = dict(zip(ALL_ANGLE_NAMES, next(angle_rows)))
+            analyzer.update(angles, next(rula_rows), next(reba_rows))
+        else:
+            skipped_frames += 1
+
+        if progress_callback is not None and (n + 1) % PROGRESS_REPORT_FRAMES == 0:
+            progress_callback(int(frame_index) + 1, total_frames, n + 1, skipped_frames)
+
+    if progress_callback is not None:
+        progress_callback(total_frames, total_frames, len(indices), skipped_frames)
+
+    result = analyzer.get_result()
+    result.total_frames = total_frames
+    result.skipped_frames = skipped_frames
+    result.gated_frames = gated_frames
+    result.sample_interval = interval
+    result.duration_seconds = time.time() - start_time
+    return result
+
+
+def cache_covers(cache_dir: str, video_path: str, total_frames: int,
+                 model_type: str = 'lite', sample_interval: int = 1,
+                 inference_size: int = 0, running_mode: str = 'image',
+                 num_poses: int = 5, roi_tracking: bool = False,
+                 presence_gate: bool = True) -> bool:
+    """동영상의 분석 프레임이 모두 캐시되어 있어 재계산이 가능한지
+
+    감지기 옵션은 분석에 쓸 값과 같아야 한다. 실행 모드는 다른 모드의 캐시도 인정한다
+    (rescore_running_modes). 빈 화면 판별을 끄면 빈 화면 생략 프레임은 캐시에 없는 것으로 본다.
+    """
+    return covering_running_mode(cache_dir, video_path, total_frames, model_type,
+                                 sample_interval, inference_size, running_mode,
+                                 num_poses, roi_tracking, presence_gate) is not None
+
+
+def covering_running_mode(cache_dir: str, video_path: str, total_frames: int,
+                          model_type: str = 'lite', sample_interval: int = 1,
+                          inference_size: int = 0, running_mode: str = 'image',
+                          num_poses: int = 5, roi_tracking: bool = False,
+                          presence_gate: bool = True) -> Optional[str]:
+    """분석 프레임을 모두 담은 캐시의 실행 모드 (분석 모드 우선, 없으면 None)"""
+    if not cache_dir or not video_path or total_frames <= 0:
+        return None
+    try:
+        fingerprint = video_fingerprint(video_path)
+    except OSError:
+        return None
+    for mode in rescore_running_modes(running_mode):
+        # 없는 캐시는 만들지 않고 건너뜀
+        path = os.path.join(cache_dir, cache_key(fingerprint, model_type, None, inference_size,
+                                                 mode, num_poses, roi_tracking))
+        if not os.path.exists(path + '.valid.npy'):
+            continue
+        try:
+            cache = LandmarkCache(path, total_frames)
+        except OSError:
+            continue
+        try:
+            if cache.covers(sample_interval, include_gated=presence_gate):
+                return mode
+        finally:
+            cache.close()
+    return None
+
+
+class RescoreWorker(QThread):
+    """캐시된 랜드마크로 움직임 분석을 다시 계산하는 워커 스레드
+
+    AnalysisWorker와 같은 시그널을 제공한다. 재계산은 빠르게 끝나므로
+    취소 시 재개 상태를 만들지 않으며 analysis_cancelled는 발생하지 않는다.
+    """
+
+    progress_updated = pyqtSignal(int, int)       # (current_frame, total_frames)
+    analysis_completed = pyqtSignal(object)        # MovementAnalysisResult
+    analysis_cancelled = pyqtSignal(object, dict, int, int)  # AnalysisWorker 호환 (미사용)
+    skipped_updated = pyqtSignal(int)              # skipped_frames_count
+    telemetry_updated = pyqtSignal(object)         # AnalysisTelemetry
+    error_occurred = pyqtSignal(str)               # error message
+
+    def __init__(self, video_path: str, cache_dir: str, sample_interval: int = 1,
+                 threshold: float = DEFAULT_THRESHOLD, min_visibility: float = 0.0,
+                 model_type: str = 'lite', sample_seconds: float = 0.0,
+                 inference_size: int = 0, tracking: bool = True, num_poses: int = 5,
+                 roi_tracking: bool = True, detection_sensitivity: float = 1.0,
+                 presence_gate: bool = True, parent=None):
+        super().__init__(parent)
+        self._video_path = video_path
+        self._cache_dir = cache_dir
+        self._sample_interval = max(1, sample_interval)
+        self._sample_seconds = sample_seconds
+        self._threshold = threshold
+        self._min_visibility = min_visibility
+        self._detection_sensitivity = detection_sensitivity
+        self._model_type = model_type
+        self._inference_size = inference_size
+        self._tracking = tracking
+        self._num_poses = num_poses
+        self._roi_tracking = roi_tracking
+        self._presence_gate = presence_gate
+        self._stopped = False
+        self._logger = get_logger('rescoring')
+
+    def stop(self):
+        self._stopped = True
+
+    def run(self):
+        cache = None
+        try:
+            # 프레임 수/fps만 필요하므로 디코딩 없이 속성만 읽음
+            cap = CvVideoCapture(self._video_path)
+            try:
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                fps = cap.get(cv2.CAP_PROP_FPS)
+            finally:
+                cap.release()
+
+            if self._sample_seconds > 0:
+                self._sample_interval = AnalysisWorker.interval_from_seconds(self._sample_seconds, fps)
+
+            # 분석 때와 같은 감지기 옵션의 캐시 (실행 모드는 다른 모드의 캐시도 사용)
+            running_mode = AnalysisWorker.running_mode_for(self._sample_interval, fps, self._tracking)
+            running_mode = covering_running_mode(
+                self._cache_dir, self._video_path, total_frames, self._model_type,
+                self._sample_interval, self._inference_size, running_mode,
+                self._num_poses, self._roi_tracking, self._presence_gate) or running_mode
+            cache = LandmarkCache.for_video(self._cache_dir, self._video_path, total_frames,
+                                            model_type=self._model_type,
+                                            inference_size=self._inference_size,
+                                            running_mode=running_mode,
+                                            num_poses=self._num_poses,
+                                            roi_tracking=self._roi_tracking)
+
+            throttle = TelemetryThrottle(total_frames)
+            scoring_start = time.perf_counter()  # 재계산은 전 구간이 집계 단계
+
+            def on_progress(current, total, sampled, skipped):
+                if current < total and not throttle.due():
+                    return
+                telemetry = throttle.snapshot(current, sampled, skipped,
+                                              {'scoring': time.perf_counter() - scoring_start})
+                self.progress_updated.emit(current, total)
+                self.skipped_updated.emit(skipped)
+                self.telemetry_updated.emit(telemetry)
+
+            result = rescore_from_cache(
+                cache, self._sample_interval, self._threshold, self._min_visibility,
+                self._detection_sensitivity,
+                progress_callback=on_progress, is_stopped=lambda: self._stopped,
+            )
+            if result is None:
+                self._logger.info("재계산 취소")
+                return
+
+            self.analysis_completed.emit(result)
+            self._logger.info(
+                f"재계산 완료: {result.total_frames} 프레임, {result.duration_seconds:.1f}초"
+            )
+
+        except Exception as e:
+            self._logger.error(f"재계산 중 오류 발생: {e}", exc_info=True)
+            self.error_occurred.emit(str(e))
+
+        finally:
+            if cache is not None:
+                cache.close()
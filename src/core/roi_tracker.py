@@ -0,0 +1,105 @@
+"""인물 영역(ROI) 추적 - 이전 프레임 랜드마크 주변만 잘라 추론 입력 축소
+
+넓은 화면에서 작업자가 작게 찍히면 전체 프레임을 넣을 때 사람이 작아져 정확도가 떨어지고
+불필요한 영역까지 축소/색 변환한다. 이전 감지 결과의 바운딩 박스에 여유를 두고 잘라 감지한 뒤
+랜드마크를 전체 프레임 정규화 좌표로 되돌린다. 잘라낸 영역에서 놓치면 전체 프레임으로 다시 감지한다.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.core.landmarks import LandmarkArray
+
+# 바운딩 박스 긴 변 대비 상하좌우 여유 비율 (팔을 뻗거나 이동해도 영역 안에 들도록)
+ROI_PADDING_RATIO = 0.35
+
+# 잘라낸 영역이 프레임의 이 비율 이상이면 자르지 않고 전체 프레임 사용
+ROI_MAX_AREA_RATIO = 0.7
+
+# 너무 작은 영역은 감지가 불안정하므로 최소 크기 (프레임 짧은 변 대비)
+ROI_MIN_SIZE_RATIO = 0.2
+
+# (x0, y0, x1, y1) 픽셀 좌표
+Box = Tuple[int, int, int, int]
+
+
+class PersonRoiTracker:
+    """이전 감지 결과 기반 인물 영역 추적기"""
+
+    def __init__(self, padding_ratio: float = ROI_PADDING_RATIO,
+                 max_area_ratio: float = ROI_MAX_AREA_RATIO):
+        self._padding_ratio = padding_ratio
+        self._max_area_ratio = max_area_ratio
+        self._bounds: Optional[Tuple[float, float, float, float]] = None  # 정규화 좌표
+
+    @property
+    def is_tracking(self) -> bool:
+        return self._bounds is not None
+
+    def reset(self):
+        """추적 해제 (다음 프레임은 전체 프레임 감지)"""
+        self._bounds = None
+
+    def crop_box(self, frame_shape) -> Optional[Box]:
+        """이번 프레임에서 잘라낼 영역 (추적 중이 아니거나 영역이 크면 None)"""
+        if self._bounds is None:
+            return None
+        h, w = frame_shape[:2]
+        x_min, y_min, x_max, y_max = self._bounds
+
+        # 패딩은 픽셀 기준 긴 변으로 계산해 가로로 긴 프레임에서도 상하좌우 여유가 같도록 한다
+        box_w = (x_max - x_min) * w
+        box_h = (y_max - y_min) * h
+        min_size = min(h, w) * ROI_MIN_SIZE_RATIO
+        pad = max(box_w, box_h) * self._padding_ratio
+        pad_x = pad + max(0.0, min_size - box_w) / 2
+        pad_y = pad + max(0.0, min_size - box_h) / 2
+
+        x0 = max(0, int(x_min * w - pad_x))
+        y0 = max(0, int(y_min * h - pad_y))
+        x1 = min(w, int(x_max * w + pad_x + 1))
+        y1 = min(h, int(y_max * h + pad_y + 1))
+        if x1 <= x0 or y1 <= y0:
+            return None
+        if (x1 - x0) * (y1 - y0) >= self._max_area_ratio * w * h:
+            return None
+        return x0, y0, x1, y1
+
+    def update(self, landmarks):
+        """전체 프레임 정규화 좌표 랜드마크로 다음 프레임 영역 갱신 (None이면 추적 해제)"""
+        if not landmarks:
+            self._bounds = None
+            return
+        if isinstance(landmarks, LandmarkArray):
+            xy = landmarks.array[:, :2]
+        else:
+            xy = np.array([(lm['x'], lm['y']) for lm in landmarks], dtype=np.float64)
+        xy = np.clip(xy, 0.0, 1.0)
+        x_min, y_min = xy.min(axis=0).tolist()
+        x_max, y_max = xy.max(axis=0).tolist()
+        self._bounds = (x_min, y_min, x_max, y_max)
+
+    @staticmethod
+    def remap_landmarks(landmarks, box: Box, frame_shape):
+        """잘라낸 영역 기준 정규화 좌표 → 전체 프레임 정규화 좌표 (제자리 변환)
+
+        z는 MediaPipe에서 x와 같은 축척(이미지 너비 기준)이므로 너비 비율로 조정한다.
+        LandmarkArray와 dict 리스트 모두 지원한다.
+        """
+        h, w = frame_shape[:2]
+        x0, y0, x1, y1 = box
+        scale_x = (x1 - x0) / w
+        scale_y = (y1 - y0) / h
+        offset_x = x0 / w
+        offset_y = y0 / h
+        if isinstance(landmarks, LandmarkArray):
+            data = landmarks.array
+            data[:, 0] = offset_x + data[:, 0] * scale_x
+            data[:, 1] = offset_y + data[:, 1] * scale_y
+            data[:, 2] *= scale_x
+            return landmarks
+        for lm in landmarks:
+            lm['x'] = offset_x + lm['x'] * scale_x
+            lm['y'] = offset_y + lm['y'] * scale_y
+            lm['z'] = lm['z'] * scale_x
+        return landmarks
@@ -7,6 +7,8 @@ CaptureRecord에서 사용하기 위한 독립 모듈.
 
 from typing import Dict, Tuple
 
+import numpy as np
+
 # =============================================================================
 # RULA Tables
 # =============================================================================
@@ -655,3 +657,140 @@ def get_si_risk_level(score: float) -> str:
         return 'uncertain'
     else:
         return 'hazardous'
+
+
+# =============================================================================
+# Batch Functions (여러 레코드를 배열 연산으로 한 번에)
+# =============================================================================
+# 위 함수들과 같은 값을 내는 배열 버전. 인자는 스칼라 또는 같은 길이의 배열.
+
+_RULA_TABLE_A_ARRAY = np.array(RULA_TABLE_A)
+_RULA_TABLE_B_ARRAY = np.array(RULA_TABLE_B)
+_RULA_TABLE_C_ARRAY = np.array(RULA_TABLE_C)
+_REBA_TABLE_A_ARRAY = np.array(REBA_TABLE_A)
+_REBA_TABLE_B_ARRAY = np.array(REBA_TABLE_B)
+_REBA_TABLE_C_ARRAY = np.array(REBA_TABLE_C)
+
+_OWAS_AC_ARRAY = np.ones((4, 3, 7), dtype=np.int64)
+for (_back, _arms, _legs), _ac in OWAS_AC_TABLE.items():
+    _OWAS_AC_ARRAY[_back - 1, _arms - 1, _legs - 1] = _ac
+del _back, _arms, _legs, _ac
+
+_NLE_FM_FREQUENCIES = np.array(sorted(NLE_FM_TABLE), dtype=np.float64)
+_NLE_FM_ARRAY = np.array([NLE_FM_TABLE[f] for f in sorted(NLE_FM_TABLE)])  # [freq][duration][v]
+_NLE_CM_ARRAY = np.array([NLE_CM_TABLE[c] for c in (1, 2, 3)])             # [coupling-1][v]
+
+_SI_MULTIPLIER_ARRAYS = {param: np.array(values) for param, values in SI_MULTIPLIERS.items()}
+
+
+def _index(values, upper: int) -> np.ndarray:
+    """1부터 시작하는 점수 → 0부터 시작하는 테이블 인덱스 (범위 제한)"""
+    return np.clip(np.asarray(values, dtype=np.int64) - 1, 0, upper)
+
+
+def get_rula_table_a_score_batch(upper_arm, lower_arm, wrist, wrist_twist) -> np.ndarray:
+    """get_rula_table_a_score 배열 버전"""
+    return _RULA_TABLE_A_ARRAY[_index(upper_arm, 5), _index(lower_arm, 2),
+                               _index(wrist, 3), _index(wrist_twist, 1)]
+
+
+def get_rula_table_b_score_batch(neck, trunk, leg) -> np.ndarray:
+    """get_rula_table_b_score 배열 버전"""
+    return _RULA_TABLE_B_ARRAY[_index(neck, 5), _index(trunk, 5), _index(leg, 1)]
+
+
+def get_rula_table_c_score_batch(score_a, score_b) -> np.ndarray:
+    """get_rula_table_c_score 배열 버전"""
+    return _RULA_TABLE_C_ARRAY[_index(score_a, 7), _index(score_b, 6)]
+
+
+def get_rula_risk_level_batch(score) -> np.ndarray:
+    """get_rula_risk_level 배열 버전"""
+    score = np.asarray(score)
+    return np.select([score <= 2, score <= 4, score <= 6],
+                     ['acceptable', 'investigate', 'change_soon'], default='change_now')
+
+
+def get_reba_table_a_score_batch(neck, trunk, leg) -> np.ndarray:
+    """get_reba_table_a_score 배열 버전"""
+    return _REBA_TABLE_A_ARRAY[_index(neck, 2), _index(trunk, 4), _index(leg, 3)]
+
+
+def get_reba_table_b_score_batch(upper_arm, lower_arm, wrist) -> np.ndarray:
+    """get_reba_table_b_score 배열 버전"""
+    return _REBA_TABLE_B_ARRAY[_index(upper_arm, 5), _index(lower_arm, 1), _index(wrist, 2)]
+
+
+def get_reba_table_c_score_batch(score_a, score_b) -> np.ndarray:
+    """get_reba_table_c_score 배열 버전"""
+    return _REBA_TABLE_C_ARRAY[_index(score_a, 11), _index(score_b, 11)]
+
+
+def get_reba_risk_level_batch(score) -> np.ndarray:
+    """get_reba_risk_level 배열 버전"""
+    score = np.asarray(score)
+    return np.select([score == 1, score <= 3, score <= 7, score <= 10],
+                     ['negligible', 'low', 'medium', 'high'], default='very_high')
+
+
+def get_owas_action_category_batch(back, arms, legs) -> np.ndarray:
+    """get_owas_action_category 배열 버전"""
+    return _OWAS_AC_ARRAY[_index(back, 3), _index(arms, 2), _index(legs, 6)]
+
+
+def get_owas_risk_level_batch(ac) -> np.ndarray:
+    """get_owas_risk_level 배열 버전"""
+    ac = np.asarray(ac)
+    return np.select([ac == 1, ac == 2, ac == 3],
+                     ['normal', 'slight', 'harmful'], default='very_harmful')
+
+
+def calculate_nle_rwl_batch(h, v, d, a, frequency=1.0, duration_hours=1.0, coupling=1) -> np.ndarray:
+    """calculate_nle_rwl 배열 버전"""
+    h, v, d, a, frequency, duration_hours = (
+        np.asarray(x, dtype=np.float64) for x in (h, v, d, a, frequency, duration_hours))
+
+    with np.errstate(divide='ignore'):
+        hm = np.where(h <= 0, 0.0, np.minimum(25.0 / h, 1.0))
+        dm = np.where(d <= 0, 1.0, np.minimum(0.82 + 4.5 / d, 1.0))
+    vm = np.maximum(1.0 - 0.003 * np.abs(v - 75.0), 0.0)
+    am = np.maximum(1.0 - 0.0032 * np.abs(a), 0.0)
+
+    # FM: 가장 가까운 빈도 (같은 거리면 작은 빈도, calculate_nle_fm과 동일)
+    freq_idx = np.argmin(np.abs(_NLE_FM_FREQUENCIES - frequency[..., np.newaxis]), axis=-1)
+    dur_idx = np.select([duration_hours <= 1, duration_hours <= 2], [0, 1], default=2)
+    v_idx = (v >= 75).astype(np.int64)
+    fm = _NLE_FM_ARRAY[freq_idx, dur_idx, v_idx]
+    cm = _NLE_CM_ARRAY[_index(coupling, 2), v_idx]
+
+    return NLE_LC * hm * vm * dm * am * fm * cm
+
+
+def calculate_nle_li_batch(load, rwl) -> np.ndarray:
+    """calculate_nle_li 배열 버전"""
+    load = np.asarray(load, dtype=np.float64)
+    rwl = np.asarray(rwl, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        li = load / rwl
+    return np.where(rwl <= 0, np.where(load <= 0, 0.0, np.inf), li)
+
+
+def get_nle_risk_level_batch(li) -> np.ndarray:
+    """get_nle_risk_level 배열 버전"""
+    li = np.asarray(li)
+    return np.select([li <= 1.0, li <= 3.0], ['safe', 'increased'], default='high')
+
+
+def calculate_si_score_batch(ie=1, de=1, em=1, hwp=1, sw=1, dd=1) -> np.ndarray:
+    """calculate_si_score 배열 버전"""
+    score = None
+    for param, level in (('ie', ie), ('de', de), ('em', em), ('hwp', hwp), ('sw', sw), ('dd', dd)):
+        multiplier = _SI_MULTIPLIER_ARRAYS[param][_index(level, 4)]
+        score = multiplier if score is None else score * multiplier
+    return score
+
+
+def get_si_risk_level_batch(score) -> np.ndarray:
+    """get_si_risk_level 배열 버전"""
+    score = np.asarray(score)
+    return np.select([score < 3, score < 7], ['safe', 'uncertain'], default='hazardous')
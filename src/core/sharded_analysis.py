@@ -0,0 +1,392 @@
+"""멀티프로세스 샤드 분석 - 프레임 구간을 나눠 프로세스별로 병렬 분석 후 병합"""
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import cv2
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.utils.cv_unicode import VideoCapture as CvVideoCapture
+
+from src.core.pose_detector import PoseDetector, PoseResult
+from src.core.angle_calculator import AngleCalculator
+from src.core.ergonomic.rula_calculator import RULACalculator
+from src.core.ergonomic.reba_calculator import REBACalculator
+from src.core.movement_analyzer import MovementAnalyzer, DEFAULT_THRESHOLD
+from src.core.analysis_worker import AnalysisWorker, skip_to_frame
+from src.core.landmark_cache import LandmarkCache
+from src.core.keyframe_index import KeyframeIndex, seek_frame
+from src.core.presence_gate import PresenceGate
+from src.core.analysis_telemetry import TelemetryThrottle
+from src.core.logger import get_logger
+
+# 샤드당 최소 분석(샘플) 프레임 수 - 이보다 짧으면 프로세스 기동 비용이 더 큼
+MIN_SHARD_FRAMES = 300
+
+# 샤드 프로세스가 진행률을 보고하는 프레임 단위
+PROGRESS_REPORT_FRAMES = 30
+
+
+def default_worker_count() -> int:
+    """기본 분석 프로세스 수 (MediaPipe 내부 스레드를 고려해 코어의 절반, 최대 8)"""
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(cpu_count // 2, 8))
+
+
+def split_frame_range(total_frames: int, num_shards: int, sample_interval: int = 1,
+                      min_shard_frames: int = MIN_SHARD_FRAMES) -> List[Tuple[int, int]]:
+    """전체 프레임을 샘플 간격에 정렬된 [start, end) 구간으로 분할
+
+    각 구간의 시작 프레임은 sample_interval의 배수이므로,
+    샤드별 샘플링 결과를 이어 붙이면 단일 순차 분석과 같은 프레임을 분석한다.
+    """
+    if total_frames <= 0:
+        return []
+
+    interval = max(1, sample_interval)
+    sampled = (total_frames + interval - 1) // interval
+    max_shards = max(1, sampled // max(1, min_shard_frames))
+    num_shards = max(1, min(num_shards, max_shards))
+    per_shard = -(-sampled // num_shards) * interval
+
+    ranges = []
+    start = 0
+    while start < total_frames:
+        end = min(total_frames, start + per_shard)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def analyze_shard(video_path: str, start_frame: int, end_frame: int,
+                  sample_interval: int = 1, model_type: str = 'lite',
+                  progress_queue=None, stop_event=None,
+                  cache_path: str = None, cache_frames: int = 0,
+                  threshold: float = DEFAULT_THRESHOLD, inference_size: int = 0,
+                  tracking: bool = True, num_poses: int = 5,
+                  roi_tracking: bool = True, presence_gate: bool = True,
+                  min_visibility: float = 0.0, detection_sensitivity: float = 1.0,
+                  index_dir: str = None) -> dict:
+    """[start_frame, end_frame) 구간 분석 (샤드 프로세스 진입점)
+
+    cache_path가 주어지면 해당 LandmarkCache를 열어 캐시된 프레임은 디코딩/추론 없이 사용한다.
+    index_dir에 키프레임 색인이 있으면 구간 시작과 긴 샘플 간격 이동을 색인으로 정확히 맞춘다
+    (샤드 경계에서 프레임이 겹치거나 빠지지 않도록).
+
+    Returns:
+        {'start_frame', 'end_frame', 'skipped_frames', 'gated_frames', 'state'} 딕셔너리.
+        end_frame은 실제로 처리가 끝난 프레임 위치이며 state는 MovementAnalyzer.get_state() 결과.
+    """
+    cap = CvVideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    running_mode = AnalysisWorker.running_mode_for(sample_interval, fps, tracking)
+    detector = PoseDetector(model_type=model_type, inference_size=inference_size,
+                            running_mode=running_mode, num_poses=num_poses,
+                            roi_tracking=roi_tracking)
+    angle_calc = AngleCalculator()
+    rula_calc = RULACalculator()
+    reba_calc = REBACalculator()
+    rula_calc.detection_sensitivity = detection_sensitivity
+    reba_calc.detection_sensitivity = detection_sensitivity
+    analyzer = MovementAnalyzer(threshold=threshold, sample_interval=sample_interval)
+    cache = LandmarkCache(cache_path, cache_frames) if cache_path else None
+    gate = PresenceGate() if presence_gate else None
+
+    def is_stopped():
+        return stop_event is not None and stop_event.is_set()
+
+    skipped_frames = 0
+    gated_frames = 0
+    sampled_frames = 0
+    frame_index = start_frame
+    cap_index = start_frame  # 캡처의 실제 읽기 위치
+    reported_frames = start_frame
+    reported_sampled = 0
+    reported_skipped = 0
+
+    keyframe_index = None
+    if index_dir and (start_frame > 0 or sample_interval >= AnalysisWorker.SEEK_MIN_INTERVAL):
+        try:
+            keyframe_index = KeyframeIndex.cached(index_dir, video_path)
+        except OSError:
+            keyframe_index = None
+
+    try:
+        if start_frame > 0:
+            cap_index = seek_frame(cap, start_frame, keyframe_index)
+
+        while frame_index < end_frame and not is_stopped():
+            target = min(frame_index + (-frame_index % sample_interval), end_frame)
+            if cache is not None and target >= end_frame:
+                frame_index = end_frame
+                break
+            if cache is not None and cache.has(target, include_gated=presence_gate):
+                frame_index = target
+                pose_result = cache.get(target)
+                gated_frames += cache.is_gated(target)
+            else:
+                cap_index, ok = skip_to_frame(cap, cap_index, target, end_frame,
+                                              is_stopped=is_stopped, index=keyframe_index)
+                frame_index = cap_index
+                if not ok or frame_index >= end_frame:
+                    break
+
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                cap_index += 1
+
+                if gate is not None and not gate.should_detect(frame):
+                    # 추론하지 않은 프레임은 미감지와 구분해 빈 화면 생략으로 기록
+                    pose_result = PoseResult(pose_detected=False)
+                    gated_frames += 1
+                    if cache is not None:
+                        cache.put_gated(frame_index)
+                else:
+                    if running_mode == 'video':
+                        pose_result = detector.detect(
+                            frame, AnalysisWorker.frame_timestamp_ms(frame_index, fps)
+                        )
+                    else:
+                        pose_result = detector.detect(frame)
+                    if gate is not None:
+                        gate.record(pose_result.pose_detected)
+                    if cache is not None:
+                        cache.put(frame_index, pose_result)
+            if pose_result.pose_detected and (
+                    min_visibility <= 0 or pose_result.mean_visibility() >= min_visibility):
+                angles = angle_calc.calculate_all_angles(pose_result.landmarks)
+                rula_result = rula_calc.calculate(angles, pose_result.landmarks)
+                reba_result = reba_calc.calculate(angles, pose_result.landmarks)
+                analyzer.update(angles, rula_result, reba_result)
+            else:
+                skipped_frames += 1
+            sampled_frames += 1
+            frame_index += 1
+
+            # 진행률은 (처리 프레임, 샘플 프레임, 감지 실패) 증가분으로 보고
+            if progress_queue is not None and frame_index - reported_frames >= PROGRESS_REPORT_FRAMES:
+                progress_queue.put((frame_index - reported_frames, sampled_frames - reported_sampled,
+                                    skipped_frames - reported_skipped))
+                reported_frames = frame_index
+                reported_sampled = sampled_frames
+                reported_skipped = skipped_frames
+
+        if progress_queue is not None and frame_index > reported_frames:
+            progress_queue.put((frame_index - reported_frames, sampled_frames - reported_sampled,
+                                skipped_frames - reported_skipped))
+
+        return {
+            'start_frame': start_frame,
+            'end_frame': frame_index,
+            'skipped_frames': skipped_frames,
+            'gated_frames': gated_frames,
+            'state': analyzer.get_state(),
+        }
+
+    finally:
+        cap.release()
+        detector.release()
+        if cache is not None:
+            cache.close()
+
+
+def merge_shard_results(shard_results: List[dict], sample_interval: int = 1,
+                        threshold: float = DEFAULT_THRESHOLD) -> Tuple[MovementAnalyzer, int]:
+    """샤드 결과를 프레임 순서대로 병합
+
+    Returns:
+        (병합된 MovementAnalyzer, 감지 실패 프레임 합계)
+    """
+    analyzer = MovementAnalyzer(threshold=threshold, sample_interval=sample_interval)
+    skipped_frames = 0
+    for shard in sorted(shard_results, key=lambda r: r['start_frame']):
+        analyzer.merge(shard['state'])
+        skipped_frames += shard['skipped_frames']
+    return analyzer, skipped_frames
+
+
+def merge_resumable_prefix(shard_results: List[dict], sample_interval: int = 1,
+                           threshold: float = DEFAULT_THRESHOLD) -> Tuple[MovementAnalyzer, int, int, int]:
+    """취소된 샤드 결과에서 처음부터 끊김 없이 이어지는 구간만 병합 (재개용)
+
+    앞 샤드가 끝난 위치에서 다음 샤드가 시작할 때만 이어 붙인다. 그 뒤 샤드가 분석한 프레임은
+    상태에 넣지 않지만 랜드마크 캐시에는 남아 있어 재개 시 추론 없이 다시 집계된다.
+
+    Returns:
+        (병합된 MovementAnalyzer, 감지 실패 프레임 합계, 재개 프레임 위치, 게이트 생략 프레임 합계)
+    """
+    analyzer = MovementAnalyzer(threshold=threshold, sample_interval=sample_interval)
+    skipped_frames = 0
+    gated_frames = 0
+    frame_index = 0
+    for shard in sorted(shard_results, key=lambda r: r['start_frame']):
+        if shard['start_frame'] != frame_index:
+            break
+        analyzer.merge(shard['state'])
+        skipped_frames += shard['skipped_frames']
+        gated_frames += shard.get('gated_frames', 0)
+        frame_index = shard['end_frame']
+    return analyzer, skipped_frames, frame_index, gated_frames
+
+
+class ShardedAnalysisWorker(QThread):
+    """프레임 구간을 여러 프로세스로 나눠 분석하는 워커 스레드
+
+    AnalysisWorker와 같은 시그널을 제공한다. 취소 시에는 처음부터 끊김 없이 끝난 샤드 구간만
+    병합해 analysis_cancelled로 보내므로, AnalysisWorker로 그 위치부터 이어서 분석할 수 있다.
+    """
+
+    progress_updated = pyqtSignal(int, int)       # (processed_frames, total_frames)
+    analysis_completed = pyqtSignal(object)        # MovementAnalysisResult
+    analysis_cancelled = pyqtSignal(object, dict, int, int)  # (partial_result, analyzer_state, frame_index, skipped_frames)
+    skipped_updated = pyqtSignal(int)              # skipped_frames_count
+    telemetry_updated = pyqtSignal(object)         # AnalysisTelemetry (단계별 시간 없음)
+    error_occurred = pyqtSignal(str)               # error message
+
+    def __init__(self, video_path: str, sample_interval: int = 1,
+                 num_workers: int = 0, model_type: str = 'lite',
+                 sample_seconds: float = 0.0, cache_dir: str = None,
+                 threshold: float = DEFAULT_THRESHOLD, inference_size: int = 0,
+                 tracking: bool = True, num_poses: int = 5, roi_tracking: bool = True,
+                 presence_gate: bool = True, min_visibility: float = 0.0,
+                 detection_sensitivity: float = 1.0, index_dir: str = None, parent=None):
+        super().__init__(parent)
+        self._video_path = video_path
+        self._sample_interval = max(1, sample_interval)
+        self._sample_seconds = sample_seconds
+        self._num_workers = num_workers if num_workers > 0 else default_worker_count()
+        self._model_type = model_type
+        self._cache_dir = cache_dir
+        self._threshold = threshold
+        self._inference_size = inference_size
+        self._tracking = tracking
+        self._num_poses = num_poses
+        self._roi_tracking = roi_tracking
+        self._presence_gate = presence_gate
+        self._min_visibility = min_visibility
+        self._detection_sensitivity = detection_sensitivity
+        self._index_dir = index_dir
+        self._stopped = False
+        self._logger = get_logger('sharded_analysis')
+
+    def stop(self):
+        self._stopped = True
+
+    def run(self):
+        start_time = time.time()
+
+        try:
+            cap = CvVideoCapture(self._video_path)
+            try:
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                fps = cap.get(cv2.CAP_PROP_FPS)
+            finally:
+                cap.release()
+
+            if self._sample_seconds > 0:
+                self._sample_interval = AnalysisWorker.interval_from_seconds(self._sample_seconds, fps)
+
+            # 캐시 파일은 샤드 프로세스 기동 전에 생성해 두고 경로만 넘긴다
+            cache_path = None
+            if self._cache_dir and total_frames > 0:
+                try:
+                    running_mode = AnalysisWorker.running_mode_for(
+                        self._sample_interval, fps, self._tracking)
+                    cache = LandmarkCache.for_video(self._cache_dir, self._video_path,
+                                                    total_frames, model_type=self._model_type,
+                                                    inference_size=self._inference_size,
+                                                    running_mode=running_mode,
+                                                    num_poses=self._num_poses,
+                                                    roi_tracking=self._roi_tracking)
+                    cache_path = cache.path
+                    cache.close()
+                except OSError as e:
+                    self._logger.warning(f"랜드마크 캐시를 열 수 없음: {e}")
+
+            ranges = split_frame_range(total_frames, self._num_workers, self._sample_interval)
+            self._logger.info(f"샤드 분석 시작: {total_frames} 프레임, {len(ranges)}개 샤드")
+
+            # Qt/MediaPipe 스레드가 있는 프로세스는 fork가 안전하지 않으므로 spawn 사용
+            ctx = multiprocessing.get_context('spawn')
+            with ctx.Manager() as manager:
+                progress_queue = manager.Queue()
+                stop_event = manager.Event()
+
+                with ProcessPoolExecutor(max_workers=max(1, len(ranges)), mp_context=ctx) as pool:
+                    futures = [
+                        pool.submit(analyze_shard, self._video_path, start, end,
+                                    self._sample_interval, self._model_type,
+                                    progress_queue, stop_event,
+                                    cache_path, total_frames, self._threshold,
+                                    self._inference_size, self._tracking, self._num_poses,
+                                    self._roi_tracking, self._presence_gate,
+                                    self._min_visibility, self._detection_sensitivity,
+                                    self._index_dir)
+                        for start, end in ranges
+                    ]
+
+                    throttle = TelemetryThrottle(total_frames)
+                    processed = 0
+                    sampled = 0
+                    skipped = 0
+                    while True:
+                        if self._stopped:
+                            stop_event.set()
+                        try:
+                            frames_delta, sampled_delta, skipped_delta = progress_queue.get(timeout=0.1)
+                            processed += frames_delta
+                            sampled += sampled_delta
+                            skipped += skipped_delta
+                        except queue.Empty:
+                            if all(f.done() for f in futures):
+                                break
+                        if throttle.due():
+                            self._report(throttle, processed, sampled, skipped)
+                    self._report(throttle, processed, sampled, skipped)
+
+                    shard_results = [f.result() for f in futures]
+
+            if self._stopped:
+                analyzer, skipped_frames, frame_index, gated_frames = merge_resumable_prefix(
+                    shard_results, self._sample_interval, self._threshold)
+                result = analyzer.get_result()
+                result.total_frames = frame_index
+                result.skipped_frames = skipped_frames
+                result.gated_frames = gated_frames
+                result.duration_seconds = time.time() - start_time
+                result.sample_interval = self._sample_interval
+                analyzer_state = analyzer.get_state()
+                analyzer_state['gated_frames'] = gated_frames
+                self.analysis_cancelled.emit(result, analyzer_state, frame_index, skipped_frames)
+                self._logger.info(f"샤드 분석 취소: {processed}/{total_frames} 프레임 처리, "
+                                  f"{frame_index} 프레임부터 재개 가능")
+                return
+
+            analyzer, skipped_frames = merge_shard_results(shard_results, self._sample_interval,
+                                                           self._threshold)
+            result = analyzer.get_result()
+            result.total_frames = shard_results[-1]['end_frame'] if shard_results else 0
+            result.skipped_frames = skipped_frames
+            result.gated_frames = sum(r.get('gated_frames', 0) for r in shard_results)
+            result.duration_seconds = time.time() - start_time
+            result.sample_interval = self._sample_interval
+
+            self.analysis_completed.emit(result)
+            self._logger.info(
+                f"샤드 분석 완료: {result.total_frames} 프레임, {result.duration_seconds:.1f}초"
+            )
+
+        except Exception as e:
+            self._logger.error(f"샤드 분석 중 오류 발생: {e}", exc_info=True)
+            self.error_occurred.emit(str(e))
+
+    def _report(self, throttle: TelemetryThrottle, processed: int, sampled: int, skipped: int):
+        """진행률/감지 실패/텔레메트리 시그널 발생"""
+        telemetry = throttle.snapshot(processed, sampled, skipped)
+        self.progress_updated.emit(processed, telemetry.total_frames)
+        self.skipped_updated.emit(skipped)
+        self.telemetry_updated.emit(telemetry)
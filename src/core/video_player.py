@@ -3,18 +3,45 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple
 
+from src.core.frame_cache import (
+    DEFAULT_BACKFILL_FRAMES,
+    DEFAULT_MAX_BYTES,
+    FrameBackfiller,
+    FrameCache,
+)
+from src.core.keyframe_index import KeyframeIndex, KeyframeIndexer, seek_frame
 from src.utils.cv_unicode import VideoCapture as CvVideoCapture
 
 
 class VideoPlayer:
     """OpenCV 기반 비디오 플레이어 클래스"""
 
-    def __init__(self):
-        """VideoPlayer 초기화"""
+    # 건너뛸 프레임이 이 값 이상이면 grab() 반복 대신 탐색(seek)
+    # (일반적인 GOP 길이 이상이면 키프레임 탐색이 순차 grab보다 빠름)
+    SEEK_MIN_SKIP = 60
+
+    def __init__(self, cache_bytes: int = DEFAULT_MAX_BYTES,
+                 backfill_frames: int = DEFAULT_BACKFILL_FRAMES,
+                 index_dir: Optional[str] = None):
+        """
+        VideoPlayer 초기화
+
+        Args:
+            cache_bytes: 디코딩된 프레임 캐시 한도 (바이트, 0이면 캐시 안 함)
+            backfill_frames: 일시정지/탐색 후 현재 위치 뒤로 미리 디코딩할 프레임 수 (0이면 끔)
+            index_dir: 키프레임 색인 사이드카 디렉토리 (None이면 OpenCV 탐색만 사용)
+        """
         self._cap: Optional[CvVideoCapture] = None
         self._is_playing: bool = False
         self._current_frame: int = 0
+        self._cap_position: int = 0  # 캡처가 다음에 디코딩할 프레임 (탐색은 읽을 때까지 미룸)
         self._file_path: Optional[str] = None
+        self._frame_cache = FrameCache(cache_bytes)
+        self._backfill_frames = max(0, int(backfill_frames))
+        self._backfiller: Optional[FrameBackfiller] = None
+        self._index_dir = index_dir
+        self._indexer: Optional[KeyframeIndexer] = None
+        self._keyframe_index: Optional[KeyframeIndex] = None
 
     @property
     def is_loaded(self) -> bool:
@@ -73,6 +100,34 @@ class VideoPlayer:
         """로드된 비디오 파일 경로 반환"""
         return self._file_path
 
+    @property
+    def frame_cache(self) -> FrameCache:
+        """디코딩된 프레임 캐시"""
+        return self._frame_cache
+
+    @property
+    def backfiller(self) -> Optional[FrameBackfiller]:
+        """현재 위치 뒤쪽을 미리 디코딩하는 스레드 (로드 전이거나 꺼져 있으면 None)"""
+        return self._backfiller
+
+    @property
+    def index_dir(self) -> Optional[str]:
+        """키프레임 색인 사이드카 디렉토리 (다음 로드부터 적용)"""
+        return self._index_dir
+
+    @index_dir.setter
+    def index_dir(self, index_dir: Optional[str]):
+        self._index_dir = index_dir
+
+    @property
+    def keyframe_index(self) -> Optional[KeyframeIndex]:
+        """로드한 동영상의 키프레임 색인 (백그라운드 색인이 끝나기 전이면 None)"""
+        return self._keyframe_index
+
+    @property
+    def indexer(self) -> Optional[KeyframeIndexer]:
+        return self._indexer
+
     def load(self, file_path: str) -> bool:
         """
         비디오 파일 로드
@@ -101,7 +156,12 @@ class VideoPlayer:
             # 처음으로 되감기
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             self._current_frame = 0
+            self._cap_position = 0
             self._file_path = file_path
+            self._start_backfiller(file_path)
+            if self._index_dir:
+                self._indexer = KeyframeIndexer(
+                    self._index_dir, file_path, self._set_keyframe_index).start()
             return True
 
         except Exception:
@@ -118,11 +178,51 @@ class VideoPlayer:
         if not self.is_loaded:
             return None
 
-        ret, frame = self._cap.read()
-        if ret:
-            self._current_frame += 1
-            return frame
-        return None
+        index = self._current_frame
+        frame = self._frame_cache.get(index)
+        if frame is None:
+            self._move_capture(index)
+            ret, frame = self._cap.read()
+            if not ret:
+                return None
+            self._cap_position = index + 1
+            self._frame_cache.put(index, frame)
+
+        self._current_frame = index + 1
+        if not self._is_playing and self._backfiller is not None:
+            # 멈춘 상태의 탐색/한 프레임 이동: 뒤로 갈 때를 대비해 앞 구간을 미리 디코딩
+            self._backfiller.request(index)
+        return frame
+
+    def _move_capture(self, index: int):
+        """캡처의 다음 디코딩 위치를 index로 (가까운 앞쪽이면 grab, 아니면 키프레임 탐색)"""
+        gap = index - self._cap_position
+        if gap == 0:
+            return
+        if 0 < gap < self.SEEK_MIN_SKIP:
+            while self._cap_position < index and self._cap.grab():
+                self._cap_position += 1
+            if self._cap_position == index:
+                return
+        self._cap_position = seek_frame(self._cap, index, self._keyframe_index)
+
+    def skip_frames(self, count: int) -> int:
+        """
+        프레임을 화면용으로 변환하지 않고 건너뛰기 (재생이 뒤처졌을 때)
+
+        Args:
+            count: 건너뛸 프레임 수
+
+        Returns:
+            실제로 건너뛴 프레임 수 (끝에 닿으면 count보다 적음)
+        """
+        if not self.is_loaded or count <= 0:
+            return 0
+
+        # 위치만 옮기고, 다음 read_frame에서 가까우면 grab, 멀면 탐색
+        skipped = min(count, max(0, self.frame_count - 1 - self._current_frame))
+        self._current_frame += skipped
+        return skipped
 
     def seek(self, frame_number: int) -> bool:
         """
@@ -140,7 +240,7 @@ class VideoPlayer:
         # 범위 제한
         frame_number = max(0, min(frame_number, self.frame_count - 1))
 
-        self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        # 실제 탐색은 read_frame에서 (캐시에 있으면 디코딩 없이 꺼냄)
         self._current_frame = frame_number
         return True
 
@@ -166,6 +266,8 @@ class VideoPlayer:
 
     def pause(self):
         """일시정지"""
+        if self._is_playing and self._backfiller is not None and self._current_frame > 0:
+            self._backfiller.request(self._current_frame - 1)
         self._is_playing = False
 
     def toggle_play(self):
@@ -180,13 +282,38 @@ class VideoPlayer:
         self._is_playing = False
         self.seek(0)
 
+    def _start_backfiller(self, file_path: str):
+        if self._backfill_frames == 0 or self._frame_cache.max_bytes == 0:
+            return
+        # 캐시 한도의 절반만 쓰도록 구간을 줄임 (미리 채운 프레임이 현재 위치 주변을 밀어내지 않게)
+        width, height = self.size
+        frame_bytes = max(1, width * height * 3)
+        window = min(self._backfill_frames, self._frame_cache.max_bytes // (2 * frame_bytes))
+        if window > 0:
+            self._backfiller = FrameBackfiller(
+                lambda: CvVideoCapture(file_path), self._frame_cache, window,
+                seek=lambda cap, frame: seek_frame(cap, frame, self._keyframe_index))
+
+    def _set_keyframe_index(self, index: KeyframeIndex):
+        """색인 스레드에서 호출 (이후 탐색부터 사용)"""
+        self._keyframe_index = index
+
     def release(self):
         """리소스 해제"""
+        if self._indexer is not None:
+            self._indexer.cancel()
+            self._indexer = None
+        self._keyframe_index = None
+        if self._backfiller is not None:
+            self._backfiller.stop()
+            self._backfiller = None
+        self._frame_cache.clear()
         if self._cap:
             self._cap.release()
             self._cap = None
         self._is_playing = False
         self._current_frame = 0
+        self._cap_position = 0
         self._file_path = None
 
     def __del__(self):
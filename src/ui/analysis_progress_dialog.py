@@ -8,7 +8,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 
 from src.core.analysis_worker import AnalysisWorker
-from src.core.movement_analyzer import MovementAnalysisResult
+from src.core.sharded_analysis import ShardedAnalysisWorker
+from src.core.rescoring import RescoreWorker
+from src.core.movement_analyzer import MovementAnalysisResult, DEFAULT_THRESHOLD
+from src.core.analysis_telemetry import AnalysisTelemetry, STAGE_DISPLAY_NAMES
 from src.ui.custom_dialog import CustomDialog
 
 
@@ -18,18 +21,39 @@ class AnalysisProgressDialog(QDialog):
     def __init__(self, video_path: str, sample_interval: int = 1,
                  resume_state: dict = None, resume_frame: int = 0,
                  resume_skipped: int = 0, resume_elapsed: float = 0.0,
-                 parent=None):
+                 sample_seconds: float = 0.0, num_workers: int = 1,
+                 model_type: str = 'lite', cache_dir: str = None,
+                 threshold: float = DEFAULT_THRESHOLD, rescore: bool = False,
+                 inference_size: int = 0, tracking: bool = True, num_poses: int = 5,
+                 roi_tracking: bool = True, presence_gate: bool = True,
+                 index_dir: str = None, min_visibility: float = 0.0,
+                 detection_sensitivity: float = 1.0, parent=None):
         super().__init__(parent)
         self._video_path = video_path
         self._sample_interval = sample_interval
+        self._sample_seconds = sample_seconds
+        self._min_visibility = min_visibility
+        self._detection_sensitivity = detection_sensitivity
+        self._num_workers = num_workers
+        self._model_type = model_type
+        self._cache_dir = cache_dir
+        self._threshold = threshold
+        self._rescore = rescore
+        self._inference_size = inference_size
+        self._tracking = tracking
+        self._num_poses = num_poses
+        self._roi_tracking = roi_tracking
+        self._presence_gate = presence_gate
+        self._index_dir = index_dir
         self._resume_state = resume_state
         self._resume_frame = resume_frame
         self._resume_skipped = resume_skipped
         self._resume_elapsed = resume_elapsed
         self._result: MovementAnalysisResult = None
-        self._worker: AnalysisWorker = None
+        self._worker = None  # AnalysisWorker | ShardedAnalysisWorker | RescoreWorker
         self._start_time = 0.0
         self._skipped_frames = 0
+        self._eta_seconds = None  # 최근 텔레메트리의 예상 남은 시간
         self._finished = False
 
         # 취소 시 부분 상태
@@ -41,7 +65,7 @@ class AnalysisProgressDialog(QDialog):
     def _init_ui(self):
         self.setWindowTitle("동영상 분석")
         self.setModal(True)
-        self.setFixedSize(420, 260)
+        self.setFixedSize(420, 284)
         self.setWindowFlags(
             self.windowFlags()
             & ~Qt.WindowType.WindowCloseButtonHint
@@ -90,6 +114,11 @@ class AnalysisProgressDialog(QDialog):
         self._skip_label.setObjectName("skipLabel")
         layout.addWidget(self._skip_label)
 
+        # 처리 속도 / 단계별 시간
+        self._stage_label = QLabel("")
+        self._stage_label.setObjectName("stageLabel")
+        layout.addWidget(self._stage_label)
+
         layout.addStretch()
 
         # 취소 버튼
@@ -134,6 +163,10 @@ class AnalysisProgressDialog(QDialog):
                 font-size: 12px;
                 color: #888888;
             }
+            QLabel#stageLabel {
+                font-size: 11px;
+                color: #777777;
+            }
             QFrame#separator {
                 background-color: #3a3a3a;
             }
@@ -174,18 +207,67 @@ class AnalysisProgressDialog(QDialog):
         self._start_time = time.time()
         self._skipped_frames = self._resume_skipped
 
-        self._worker = AnalysisWorker(
-            video_path=self._video_path,
-            sample_interval=self._sample_interval,
-            resume_state=self._resume_state,
-            resume_frame=self._resume_frame,
-            resume_skipped=self._resume_skipped,
-            resume_elapsed=self._resume_elapsed,
-        )
-        self._worker.progress_updated.connect(self._on_progress)
+        # 캐시된 랜드마크로 재계산 가능하면 추론 없이 처리
+        if self._rescore and self._cache_dir and not self._resume_state:
+            self._worker = RescoreWorker(
+                video_path=self._video_path,
+                cache_dir=self._cache_dir,
+                sample_interval=self._sample_interval,
+                threshold=self._threshold,
+                min_visibility=self._min_visibility,
+                detection_sensitivity=self._detection_sensitivity,
+                model_type=self._model_type,
+                sample_seconds=self._sample_seconds,
+                inference_size=self._inference_size,
+                tracking=self._tracking,
+                num_poses=self._num_poses,
+                roi_tracking=self._roi_tracking,
+                presence_gate=self._presence_gate,
+            )
+        # 재개는 연속 구간이 필요하므로 항상 단일 워커 사용
+        elif self._num_workers > 1 and not self._resume_state:
+            self._worker = ShardedAnalysisWorker(
+                video_path=self._video_path,
+                sample_interval=self._sample_interval,
+                num_workers=self._num_workers,
+                model_type=self._model_type,
+                sample_seconds=self._sample_seconds,
+                cache_dir=self._cache_dir,
+                threshold=self._threshold,
+                inference_size=self._inference_size,
+                tracking=self._tracking,
+                num_poses=self._num_poses,
+                roi_tracking=self._roi_tracking,
+                presence_gate=self._presence_gate,
+                min_visibility=self._min_visibility,
+                detection_sensitivity=self._detection_sensitivity,
+                index_dir=self._index_dir,
+            )
+        else:
+            self._worker = AnalysisWorker(
+                video_path=self._video_path,
+                sample_interval=self._sample_interval,
+                resume_state=self._resume_state,
+                resume_frame=self._resume_frame,
+                resume_skipped=self._resume_skipped,
+                resume_elapsed=self._resume_elapsed,
+                sample_seconds=self._sample_seconds,
+                model_type=self._model_type,
+                cache_dir=self._cache_dir,
+                threshold=self._threshold,
+                inference_size=self._inference_size,
+                tracking=self._tracking,
+                num_poses=self._num_poses,
+                roi_tracking=self._roi_tracking,
+                presence_gate=self._presence_gate,
+                min_visibility=self._min_visibility,
+                detection_sensitivity=self._detection_sensitivity,
+                index_dir=self._index_dir,
+            )
+        # 진행 표시는 주기적으로 모아 보내는 텔레메트리로만 갱신
+        self._worker.telemetry_updated.connect(self._on_telemetry)
         self._worker.analysis_completed.connect(self._on_completed)
         self._worker.analysis_cancelled.connect(self._on_cancelled)
-        self._worker.skipped_updated.connect(self._on_skipped)
         self._worker.error_occurred.connect(self._on_error)
         self._worker.finished.connect(self._on_worker_finished)
         self._worker.start()
@@ -206,10 +288,19 @@ class AnalysisProgressDialog(QDialog):
             self._progress_bar.setValue(percent)
             self._frame_label.setText(f"{current:,} / {total:,} 프레임")
 
-    def _on_skipped(self, count: int):
-        """감지 실패 수 업데이트"""
-        self._skipped_frames = count
-        self._skip_label.setText(f"감지 실패: {count} 프레임")
+    def _on_telemetry(self, telemetry: AnalysisTelemetry):
+        """텔레메트리 수신 - 진행률, 감지 실패, 속도, 단계별 시간 갱신"""
+        self._on_progress(telemetry.processed_frames, telemetry.total_frames)
+        self._skipped_frames = telemetry.skipped_frames
+        self._skip_label.setText(
+            f"감지 실패: {telemetry.skipped_frames} 프레임 ({telemetry.skipped_ratio:.0%})"
+        )
+        self._eta_seconds = telemetry.eta_seconds
+
+        parts = [f"{telemetry.frames_per_second:.1f} fps"]
+        for stage, seconds in telemetry.stage_seconds.items():
+            parts.append(f"{STAGE_DISPLAY_NAMES.get(stage, stage)} {seconds:.1f}초")
+        self._stage_label.setText("  |  ".join(parts))
 
     def _on_completed(self, result: MovementAnalysisResult):
         """분석 완료"""
@@ -269,7 +360,9 @@ class AnalysisProgressDialog(QDialog):
         elapsed_str = self._format_time(elapsed)
 
         progress = self._progress_bar.value()
-        if progress > 0:
+        if self._eta_seconds is not None:
+            remaining_str = self._format_time(self._eta_seconds)
+        elif progress > 0:
             estimated_total = elapsed / progress * 100
             remaining = max(0, estimated_total - elapsed)
             remaining_str = self._format_time(remaining)
@@ -12,14 +12,16 @@ from PyQt6.QtWidgets import (
     QSpinBox, QStyledItemDelegate, QLabel, QDialog,
     QComboBox, QDialogButtonBox, QFormLayout, QCheckBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
 from PyQt6.QtGui import QColor, QBrush, QAction, QPixmap, QImage, QIcon
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 from pathlib import Path
 import json
 import os
 
+import numpy as np
+
 
 def _get_icon_path(icon_name: str) -> str:
     """아이콘 경로 반환"""
@@ -490,14 +492,18 @@ class CaptureSpreadsheetWidget(QWidget):
 
     # 시그널
     record_updated = pyqtSignal(int)  # 레코드 업데이트 시 행 인덱스 전달
+    records_updated = pyqtSignal(list)  # 일괄 업데이트 시 행 인덱스 리스트 전달 (한 번만)
     export_requested = pyqtSignal(str)  # 내보내기 요청 (파일 경로)
 
     def __init__(self, config: Optional[Config] = None, parent=None):
         super().__init__(parent)
         self._config = config
         self._model = CaptureDataModel()
+        self._model.add_change_listener(self._on_records_changed)
         self._updating = False  # 재계산 중 무한 루프 방지
         self._video_name: Optional[str] = None  # 현재 동영상 파일명
+        self._image_resolver: Optional[Callable[[str], Optional[str]]] = None  # 지연 로드 프로젝트 이미지
+        self._filter_criteria: Optional[Dict[str, Any]] = None  # 활성 행 필터 (None이면 전체 표시)
         self._logger = get_logger('spreadsheet')
 
         self._init_ui()
@@ -544,6 +550,13 @@ class CaptureSpreadsheetWidget(QWidget):
         # 셀 클릭 시그널 (썸네일 클릭 처리)
         self._table.cellClicked.connect(self._on_cell_clicked)
 
+        # 썸네일은 화면에 보이는 행만 불러옴 (스크롤/행 추가 시 갱신)
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.timeout.connect(self._load_visible_thumbnails)
+        self._table.verticalScrollBar().valueChanged.connect(self._schedule_thumbnail_load)
+        self._table.verticalScrollBar().rangeChanged.connect(self._schedule_thumbnail_load)
+
         layout.addWidget(self._table)
 
         # 버튼 영역
@@ -637,6 +650,7 @@ class CaptureSpreadsheetWidget(QWidget):
         # 테이블에 행 추가
         self._table.insertRow(row_idx)
         self._update_row(row_idx)
+        self._apply_filter()
 
         self._updating = False
         return row_idx
@@ -701,27 +715,84 @@ class CaptureSpreadsheetWidget(QWidget):
 
         self._updating = False
 
+    def set_image_resolver(self, resolver: Optional[Callable[[str], Optional[str]]]):
+        """
+        이미지 경로 확인 함수 설정 (지연 로드한 프로젝트는 처음 쓸 때 ZIP에서 꺼냄)
+
+        Args:
+            resolver: 이미지 경로 → 사용할 수 있는 파일 경로 또는 None (None이면 파일 존재만 확인)
+        """
+        self._image_resolver = resolver
+
+    def _resolve_image(self, image_path: Optional[str]) -> Optional[str]:
+        if self._image_resolver is not None:
+            return self._image_resolver(image_path)
+        if image_path and os.path.exists(image_path):
+            return image_path
+        return None
+
     def _set_thumbnail_cell(self, row: int, col: int, image_path: Optional[str]):
-        """썸네일 셀 설정"""
+        """썸네일 셀 설정 (이미지는 행이 화면에 보일 때 불러옴)"""
         label = QLabel()
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         label.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        label.setProperty('image_path', image_path)
 
-        if image_path and os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            pixmap = pixmap.scaled(
-                THUMBNAIL_SIZE, THUMBNAIL_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            label.setPixmap(pixmap)
-            label.setToolTip(f"클릭하여 원본 보기\n{image_path}")
+        if image_path:
+            label.setProperty('thumbnail_pending', True)
+            self._schedule_thumbnail_load()
         else:
-            label.setText("-")
-            label.setStyleSheet("color: #888;")
+            self._set_missing_thumbnail(label)
 
         self._table.setCellWidget(row, col, label)
 
+    @staticmethod
+    def _set_missing_thumbnail(label: QLabel):
+        label.setText("-")
+        label.setStyleSheet("color: #888;")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_thumbnail_load()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_thumbnail_load()
+
+    def _schedule_thumbnail_load(self, *args):
+        """보이는 행 썸네일 로드 예약 (연속 호출은 한 번으로 합침)"""
+        self._thumbnail_timer.start(0)
+
+    def _load_visible_thumbnails(self):
+        """화면에 보이는 행 중 아직 불러오지 않은 썸네일 로드"""
+        row_count = self._table.rowCount()
+        if row_count == 0 or not self._table.isVisible():
+            return  # 숨겨져 있으면 showEvent에서 다시 예약
+        viewport = self._table.viewport()
+        first = self._table.rowAt(0)
+        last = self._table.rowAt(viewport.height() - 1)
+        first = 0 if first < 0 else first
+        last = row_count - 1 if last < 0 else last
+
+        for row in range(first, last + 1):
+            for col in range(self._thumbnail_count):
+                label = self._table.cellWidget(row, col)
+                if label is None or not label.property('thumbnail_pending'):
+                    continue
+                label.setProperty('thumbnail_pending', False)
+                image_path = self._resolve_image(label.property('image_path'))
+                if image_path:
+                    pixmap = QPixmap(image_path)
+                    pixmap = pixmap.scaled(
+                        THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                    label.setPixmap(pixmap)
+                    label.setToolTip(f"클릭하여 원본 보기\n{image_path}")
+                else:
+                    self._set_missing_thumbnail(label)
+
     def _on_cell_clicked(self, row: int, col: int):
         """셀 클릭 시 처리 (썸네일 클릭 시 원본 보기)"""
         if col < self._thumbnail_count:
@@ -730,9 +801,9 @@ class CaptureSpreadsheetWidget(QWidget):
                 return
 
             field = THUMBNAIL_COLUMNS[col][0]
-            image_path = getattr(record, field, None)
+            image_path = self._resolve_image(getattr(record, field, None))
 
-            if image_path and os.path.exists(image_path):
+            if image_path:
                 title = "프레임 이미지" if col == 0 else "스켈레톤 이미지"
                 dialog = ImageViewerDialog(image_path, title, self)
                 dialog.exec()
@@ -793,6 +864,69 @@ class CaptureSpreadsheetWidget(QWidget):
         # 시그널
         self.record_updated.emit(row)
 
+    def bulk_update(self, patch: Dict[str, Any], rows: Optional[List[int]] = None) -> List[int]:
+        """
+        여러 행의 수동 입력을 한 번에 변경 (모델 일괄 재계산 후 화면 한 번 갱신)
+
+        Args:
+            patch: 필드명 → 값 또는 행별 값 목록 (CaptureDataModel.bulk_update 참고)
+            rows: 대상 행 인덱스 (None이면 전체)
+
+        Returns:
+            변경된 행 인덱스
+        """
+        return self._model.bulk_update(patch, rows)
+
+    def _on_records_changed(self, rows: List[int]):
+        """모델 일괄 변경 알림 → 변경된 행만 다시 그림"""
+        self._table.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self._update_row(row)
+        finally:
+            self._table.setUpdatesEnabled(True)
+        self._apply_filter()
+        self.records_updated.emit(rows)
+
+    def filter_rows(self, **criteria) -> int:
+        """
+        조건에 맞는 행만 표시 (모델 인덱스 조회 결과 사용)
+
+        조건은 clear_filter 전까지 유지되어 행 추가/삭제/값 변경 후에도 다시 적용된다.
+
+        Args:
+            **criteria: CaptureDataModel.select 조건 (start, end, risk_levels, scores)
+
+        Returns:
+            표시된 행 수
+        """
+        self._filter_criteria = criteria
+        return self._apply_filter()
+
+    def _apply_filter(self) -> int:
+        """활성 필터를 현재 행에 다시 적용 (필터가 없으면 아무것도 하지 않음)
+
+        Returns:
+            표시된 행 수
+        """
+        if self._filter_criteria is None:
+            return self._table.rowCount()
+        visible = np.zeros(len(self._model), dtype=bool)
+        visible[self._model.select(**self._filter_criteria)] = True
+        self._table.setUpdatesEnabled(False)
+        try:
+            for row, shown in enumerate(visible.tolist()):
+                self._table.setRowHidden(row, not shown)
+        finally:
+            self._table.setUpdatesEnabled(True)
+        return int(visible.sum())
+
+    def clear_filter(self):
+        """행 필터 해제 (모든 행 표시)"""
+        self._filter_criteria = None
+        for row in range(self._table.rowCount()):
+            self._table.setRowHidden(row, False)
+
     def _show_context_menu(self, pos):
         """컨텍스트 메뉴 표시"""
         row = self._table.rowAt(pos.y())
@@ -867,6 +1001,7 @@ class CaptureSpreadsheetWidget(QWidget):
         # 레코드 및 테이블 행 삭제
         self._model.delete_record(row)
         self._table.removeRow(row)
+        self._apply_filter()
 
     def _ask_delete_options(self, row: int, has_images: bool) -> Optional[bool]:
         """
@@ -922,7 +1057,7 @@ class CaptureSpreadsheetWidget(QWidget):
 
         # 이미지 파일 수 확인
         image_count = 0
-        for record in self._model.get_all_records():
+        for record in self._model.iter_records():
             frame_path = getattr(record, 'video_frame_path', None)
             skeleton_path = getattr(record, 'skeleton_image_path', None)
             if frame_path and os.path.exists(frame_path):
@@ -942,7 +1077,7 @@ class CaptureSpreadsheetWidget(QWidget):
 
         # 이미지 삭제 (설정에 따라)
         if auto_delete:
-            for record in self._model.get_all_records():
+            for record in self._model.iter_records():
                 frame_path = getattr(record, 'video_frame_path', None)
                 skeleton_path = getattr(record, 'skeleton_image_path', None)
                 if frame_path and os.path.exists(frame_path):
@@ -1081,14 +1216,14 @@ class CaptureSpreadsheetWidget(QWidget):
                     ws.column_dimensions[get_column_letter(col_idx + img_col_offset)].width = 10
 
             # 데이터 작성
-            for row_idx, record in enumerate(self._model.get_all_records(), start=2):
+            for row_idx, record in enumerate(self._model.iter_records(), start=2):
                 # 이미지 삽입 (포함 옵션 선택 시)
                 if include_images:
                     ws.row_dimensions[row_idx].height = row_height
 
                     for col_idx, (field, header, group) in enumerate(THUMBNAIL_COLUMNS, start=1):
-                        image_path = getattr(record, field, None)
-                        if image_path and os.path.exists(image_path):
+                        image_path = self._resolve_image(getattr(record, field, None))
+                        if image_path:
                             try:
                                 img = XLImage(image_path)
                                 img.width = img_size
@@ -1481,10 +1616,20 @@ class CaptureSpreadsheetWidget(QWidget):
         self._table.setRowCount(0)
 
     def load_from_model(self, model: CaptureDataModel):
-        """CaptureDataModel에서 데이터 로드"""
-        self.clear_all()
-        for record in model.get_all_records():
-            self.add_record(record)
+        """
+        CaptureDataModel 표시 (레코드를 복사하지 않고 이 모델을 그대로 사용)
+
+        프로젝트에서 연 모델을 그대로 쓰므로 다음 저장 때 바뀐 행만 기록할 수 있다.
+        """
+        self._model.remove_change_listener(self._on_records_changed)
+        self._model = model
+        self._model.add_change_listener(self._on_records_changed)
+
+        self._table.setRowCount(0)
+        self._table.setRowCount(len(model))
+        for row in range(len(model)):
+            self._update_row(row)
+        self._apply_filter()
 
     def get_record_count(self) -> int:
         """레코드 수 반환"""
@@ -68,7 +68,7 @@ JOINT_ROM: Dict[Tuple[int, int, int], Tuple[float, float]] = {
 class InteractiveSkeletonWidget(QWidget):
     """인터랙티브 스켈레톤 에디터 위젯 (SkeletonWidget 래핑)"""
 
-    landmarks_changed = pyqtSignal(list)
+    landmarks_changed = pyqtSignal(object)  # LandmarkArray 또는 dict 리스트
     edit_mode_changed = pyqtSignal(bool)
     capture_clicked = pyqtSignal()
 
@@ -5,9 +5,10 @@ from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QSplitter, QVBoxLayout,
     QMenuBar, QMenu, QStatusBar, QFileDialog,
-    QToolBar, QToolButton, QSlider, QLabel, QHBoxLayout
+    QToolBar, QToolButton, QSlider, QLabel, QHBoxLayout,
+    QProgressBar, QPushButton
 )
-from PyQt6.QtCore import Qt, QSettings, QSize
+from PyQt6.QtCore import Qt, QSettings, QSize, QTimer, QThread, QEventLoop, QCoreApplication
 from PyQt6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QPainter
 from typing import Optional, List
 
@@ -20,7 +21,12 @@ from .loading_dialog import LoadingDialog
 from .custom_dialog import CustomDialog
 from ..utils.config import Config
 from ..core.project_manager import ProjectManager, ProjectLoadError, LoadResult
+from ..core.project_save_worker import ProjectSaveWorker
 from ..core.image_slide_player import ImageSlidePlayer
+from ..core.landmark_cache import LandmarkCache
+from ..core.rescoring import cache_covers
+from ..core.analysis_worker import AnalysisWorker
+from ..core.movement_analyzer import DEFAULT_THRESHOLD
 from ..core.logger import get_logger
 from ..license import LicenseManager, LicenseMode
 from ..license.license_dialog import LicenseDialog
@@ -43,14 +49,32 @@ class MainWindow(QMainWindow):
         self._recent_projects: List[str] = []
         self._settings = QSettings("IMAS", "IMAS")
         self._config = Config()
-        self._project_manager = ProjectManager()
+        self._project_manager = ProjectManager(
+            capture_storage=self._config.get("project.capture_storage", "json"),
+            capture_db_dir=self._config.config_dir / "capture_db")
         self._backup_landmarks = None
 
+        # 백그라운드 저장 (한 번에 하나)
+        self._save_worker: Optional[ProjectSaveWorker] = None
+        self._save_result = False
+
+        # 실시간 감지용 랜드마크 캐시 (동영상/모델/변환이 바뀌면 다시 연다)
+        self._landmark_cache: Optional[LandmarkCache] = None
+        self._landmark_cache_key = None
+
+        # 움직임 분석 결과를 계산한 감지 민감도 (슬라이더가 바뀌면 캐시로 재계산)
+        self._analysis_sensitivity = None
+        self._rescore_timer = QTimer(self)
+        self._rescore_timer.setSingleShot(True)
+        self._rescore_timer.setInterval(500)
+        self._rescore_timer.timeout.connect(self._rescore_for_sensitivity)
+
         # 라이센스 매니저
         self._license_manager = LicenseManager.instance()
         self._license_manager.license_changed.connect(self._on_license_changed)
 
         self._init_ui()
+        self.status_widget.spreadsheet_widget.set_image_resolver(self._project_manager.resolve_image)
         self._init_menu()
         self._init_toolbar()
         self._init_shortcuts()
@@ -63,6 +87,12 @@ class MainWindow(QMainWindow):
         # 앱 시작 시 captures 디렉토리 전체 정리 (고아 이미지 삭제)
         self._cleanup_all_captures()
 
+        # 자동 저장 (복구용) - 비정상 종료로 남은 복구 파일이 있으면 창이 뜬 뒤 복원 여부 확인
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.timeout.connect(self._autosave)
+        self._start_autosave_timer()
+        QTimer.singleShot(0, self._offer_recovery)
+
     def _init_ui(self):
         """UI 초기화"""
         self.setWindowTitle(APP_NAME)
@@ -100,6 +130,7 @@ class MainWindow(QMainWindow):
         # 왼쪽: 플레이어 위젯
         self.player_widget = PlayerWidget()
         self.player_widget.setMinimumWidth(400)  # 플레이어 최소 너비
+        self.player_widget.set_keyframe_index_dir(self._keyframe_index_dir())
         self._splitter.addWidget(self.player_widget)
 
         # 오른쪽: 스테이터스 위젯
@@ -121,6 +152,19 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Ready")
 
+        # 저장 진행 표시 (백그라운드 저장 중에만 보임)
+        self._save_progress_bar = QProgressBar()
+        self._save_progress_bar.setMaximumWidth(160)
+        self._save_progress_bar.setMaximumHeight(16)
+        self._save_progress_bar.setTextVisible(False)
+        self._save_progress_bar.hide()
+        self._status_bar.addPermanentWidget(self._save_progress_bar)
+        self._save_cancel_btn = QPushButton("저장 취소")
+        self._save_cancel_btn.setMaximumHeight(20)
+        self._save_cancel_btn.clicked.connect(self._cancel_save)
+        self._save_cancel_btn.hide()
+        self._status_bar.addPermanentWidget(self._save_cancel_btn)
+
         # 시그널 연결
         self.player_widget.frame_changed.connect(self._on_frame_changed)
         self.player_widget.capture_requested.connect(self._on_capture_requested)
@@ -165,15 +209,20 @@ class MainWindow(QMainWindow):
         # 작업 저장
         self._save_project_action = QAction("작업 저장(&S)", self)
         self._save_project_action.setShortcut(QKeySequence.StandardKey.Save)
-        self._save_project_action.triggered.connect(self._save_project)
+        self._save_project_action.triggered.connect(lambda: self._save_project(background=True))
         file_menu.addAction(self._save_project_action)
 
         # 다른 이름으로 저장
         self._save_as_action = QAction("다른 이름으로 저장(&A)...", self)
         self._save_as_action.setShortcut("Ctrl+Shift+S")
-        self._save_as_action.triggered.connect(self._save_project_as)
+        self._save_as_action.triggered.connect(lambda: self._save_project_as(background=True))
         file_menu.addAction(self._save_as_action)
 
+        # 작업 파일 정리 (덧붙이기 저장으로 쌓인 이전 데이터 제거)
+        self._compact_project_action = QAction("작업 파일 정리(&C)", self)
+        self._compact_project_action.triggered.connect(lambda: self._compact_project(background=True))
+        file_menu.addAction(self._compact_project_action)
+
         file_menu.addSeparator()
 
         # 동영상 열기
@@ -434,7 +483,7 @@ class MainWindow(QMainWindow):
         self._save_btn.setFixedHeight(28)
         self._save_btn.setToolTip("작업 저장 (Ctrl+S)")
         self._save_btn.setStyleSheet(self._get_toolbar_button_style('save'))
-        self._save_btn.clicked.connect(self._save_project)
+        self._save_btn.clicked.connect(lambda: self._save_project(background=True))
         self._toolbar.addWidget(self._save_btn)
 
         # 시뮬레이션 토글 버튼
@@ -824,7 +873,10 @@ class MainWindow(QMainWindow):
     def _open_settings(self):
         """설정 다이얼로그 열기"""
         dialog = SettingsDialog(self._config, self)
-        dialog.exec()
+        if dialog.exec():
+            self._project_manager.set_capture_storage(
+                self._config.get("project.capture_storage", "json"))
+            self.status_widget.apply_detection_settings()
 
     def _load_video(self, file_path: str, from_project_load: bool = False):
         """
@@ -871,6 +923,7 @@ class MainWindow(QMainWindow):
                 self._status_bar.showMessage(f"로드됨: {file_path}")
 
                 if not from_project_load:
+                    self._wait_for_save()
                     self._project_manager.new_project()
                     self._update_window_title()
 
@@ -984,10 +1037,10 @@ class MainWindow(QMainWindow):
 
         # 분석 위젯에 동영상 정보 전달
         video_path = self.player_widget.get_video_path()
-        total_frames = self.player_widget._video_player.frame_count
+        total_frames = self.player_widget.get_frame_count()
         if video_path and total_frames > 0:
             self.status_widget.movement_analysis_widget.set_video_info(
-                video_path, total_frames
+                video_path, total_frames, self.player_widget.get_fps()
             )
 
     def _on_source_loaded(self, source_name: str):
@@ -1055,6 +1108,7 @@ class MainWindow(QMainWindow):
                 self._status_bar.showMessage(f"이미지 폴더 로드됨: {folder_path}")
 
                 if not from_project_load:
+                    self._wait_for_save()
                     self._project_manager.new_project()
                     self._update_window_title()
 
@@ -1108,6 +1162,7 @@ class MainWindow(QMainWindow):
                 self._status_bar.showMessage(f"압축 파일 로드됨: {archive_path}")
 
                 if not from_project_load:
+                    self._wait_for_save()
                     self._project_manager.new_project()
                     self._update_window_title()
 
@@ -1215,15 +1270,71 @@ class MainWindow(QMainWindow):
         if frame is not None:
             # 동영상 재생 중이면 편집 모드 강제 해제 (일시정지 상태에서는 유지)
             if (self.status_widget._skeleton_widget.is_edit_mode
-                    and self.player_widget._video_player.is_playing):
+                    and self.player_widget.is_playing):
                 self.status_widget._skeleton_widget.exit_edit_mode()
 
             # 현재 위치 정보 업데이트
             timestamp = self.player_widget.get_current_position()
             self.status_widget.set_current_position(timestamp, frame_number)
 
-            # 스테이터스 위젯에 프레임 전달
-            self.status_widget.process_frame(frame)
+            # 스테이터스 위젯에 프레임 전달 (동영상이면 디코딩된 프레임 번호로 캐시 조회)
+            frame_index = None
+            if self._sync_landmark_cache() is not None:
+                frame_index = self.player_widget.get_current_frame_number() - 1
+            # 재생 중에만 프레임 시각을 넘겨 연속 추적 (탐색/뒤로 이동은 감지기가 자동 초기화)
+            timestamp_ms = None
+            if self.player_widget.is_playing:
+                timestamp_ms = int(round(timestamp * 1000))
+            self.status_widget.process_frame(frame, frame_index, timestamp_ms)
+
+    def _landmark_cache_dir(self) -> str:
+        """랜드마크 캐시 디렉토리"""
+        return str(self._config.config_dir / "landmark_cache")
+
+    def _keyframe_index_dir(self) -> str:
+        """키프레임 색인 사이드카 디렉토리"""
+        return str(self._config.config_dir / "keyframe_index")
+
+    def _sync_landmark_cache(self) -> Optional[LandmarkCache]:
+        """현재 동영상/모델/변환에 맞는 랜드마크 캐시를 열어 스테이터스 위젯에 설정"""
+        video_path = self.player_widget.get_video_path()
+        key = None
+        if video_path:
+            transforms = self.player_widget.get_transforms()
+            detector_options = self.status_widget.pose_detector_options
+            key = (video_path, self.status_widget.pose_model_type,
+                   self.status_widget.pose_inference_size,
+                   tuple(sorted(transforms.items())),
+                   tuple(sorted(detector_options.items())))
+        if key == self._landmark_cache_key:
+            return self._landmark_cache
+
+        self._close_landmark_cache()
+        self._landmark_cache_key = key
+        # 다른 동영상/변환의 추적 상태를 이어 쓰지 않도록 초기화
+        self.status_widget.reset_tracking()
+        if key is not None:
+            try:
+                self._landmark_cache = LandmarkCache.for_video(
+                    self._landmark_cache_dir(), video_path,
+                    self.player_widget.get_frame_count(),
+                    model_type=self.status_widget.pose_model_type,
+                    transforms=transforms,
+                    inference_size=self.status_widget.pose_inference_size,
+                    **detector_options,
+                )
+            except OSError as e:
+                self._logger.warning(f"랜드마크 캐시를 열 수 없음: {e}")
+        self.status_widget.set_landmark_cache(self._landmark_cache)
+        return self._landmark_cache
+
+    def _close_landmark_cache(self):
+        """랜드마크 캐시 닫기"""
+        if self._landmark_cache is not None:
+            self.status_widget.set_landmark_cache(None)
+            self._landmark_cache.close()
+            self._landmark_cache = None
+        self._landmark_cache_key = None
 
     def _on_capture_requested(self, timestamp: float, frame_number: int):
         """캡처 요청 시 호출"""
@@ -1250,6 +1361,10 @@ class MainWindow(QMainWindow):
                 self.player_widget.seek_relative(-5)  # 5초 뒤로
             elif event.key() == Qt.Key.Key_Right:
                 self.player_widget.seek_relative(5)  # 5초 앞으로
+            elif event.key() == Qt.Key.Key_Comma:
+                self.player_widget.step_frame(-1)  # 한 프레임 뒤로
+            elif event.key() == Qt.Key.Key_Period:
+                self.player_widget.step_frame(1)  # 한 프레임 앞으로
             else:
                 super().keyPressEvent(event)
         elif self.player_widget.mode == PlayerWidget.MODE_IMAGE:
@@ -1291,8 +1406,13 @@ class MainWindow(QMainWindow):
             return
 
         self._logger.info("앱 종료 진행")
+        self._autosave_timer.stop()
+        self._wait_for_save()
+        self._remove_recovery_file()
         self._save_settings()
         self.player_widget.release()
+        self.status_widget.release()
+        self._close_landmark_cache()
 
         # 정상 종료 시 captures 전체 정리
         self._cleanup_all_captures()
@@ -1367,9 +1487,10 @@ class MainWindow(QMainWindow):
         if file_path:
             self._load_project(file_path)
 
-    def _load_project(self, file_path: str):
-        """프로젝트 로드"""
+    def _load_project(self, file_path: str, recovery: bool = False):
+        """프로젝트 로드 (recovery=True면 자동 저장 복구 파일 - 최근 목록에 넣지 않고 새 작업으로 취급)"""
         self._logger.info(f"작업 로드 시작: {file_path}")
+        self._wait_for_save()
         try:
             capture_save = self._config.get("directories.capture_save", "captures")
             if not capture_save:
@@ -1379,6 +1500,7 @@ class MainWindow(QMainWindow):
                 Path(file_path),
                 check_video=True,
                 capture_dir=capture_dir,
+                lazy=not recovery,
             )
 
             state = self._project_manager.get_state()
@@ -1440,11 +1562,16 @@ class MainWindow(QMainWindow):
             # 분석 결과 복원
             movement_result = state.get('movement_analysis_result')
             if movement_result:
+                # 저장된 결과는 복원한 민감도로 계산된 것으로 본다
+                self._analysis_sensitivity = self._detection_sensitivity()
                 self.status_widget.movement_analysis_widget.set_result(
                     movement_result, video_missing=info.video_missing
                 )
 
-            self._add_recent_project(file_path)
+            if recovery:
+                self._project_manager.detach()
+            else:
+                self._add_recent_project(file_path)
             self._update_window_title()
             self._status_bar.showMessage(f"작업 로드됨: {file_path}")
             self._logger.info(f"작업 로드 완료: 캡처 {info.capture_count}개, 이미지 {info.image_count}개")
@@ -1478,8 +1605,7 @@ class MainWindow(QMainWindow):
         # 표시값: 0→0.0, 100→1.0 (현재값/최대값)
         display_value = value / 100.0
         self._sensitivity_value_label.setText(f"{display_value:.1f}")
-        # 슬라이더 0→100 을 sensitivity 1.0→10.0 으로 매핑
-        sensitivity = 1.0 + (value / 100.0) * 9.0
+        sensitivity = self._detection_sensitivity()
         # 모든 계산기에 적용
         ergonomic = self.status_widget._ergonomic_widget
         ergonomic._rula_calculator.detection_sensitivity = sensitivity
@@ -1487,15 +1613,55 @@ class MainWindow(QMainWindow):
         ergonomic._owas_calculator.detection_sensitivity = sensitivity
         # 실시간 재계산
         ergonomic.recalculate()
+        # 움직임 분석 결과는 슬라이더 조작이 끝난 뒤 한 번만 재계산
+        self._rescore_timer.start()
+
+    def _detection_sensitivity(self) -> float:
+        """민감도 슬라이더 0→100 을 sensitivity 1.0→10.0 으로 매핑"""
+        return 1.0 + (self._sensitivity_slider.value() / 100.0) * 9.0
+
+    def _rescore_for_sensitivity(self):
+        """감지 민감도가 분석 결과와 다르면 캐시된 랜드마크로 움직임 분석 재계산
+
+        재감지가 필요한 경우(캐시가 분석 프레임을 모두 담지 않음)에는 다시 분석하지 않는다.
+        """
+        movement_widget = self.status_widget.movement_analysis_widget
+        result = movement_widget.get_result()
+        video_path = self.player_widget.get_video_path()
+        if (result is None or not video_path or movement_widget.get_resume_data()
+                or self._analysis_sensitivity == self._detection_sensitivity()):
+            return
+        tracking = self._config.get("detection.tracking", True)
+        if not cache_covers(
+                self._landmark_cache_dir(), video_path, self.player_widget.get_frame_count(),
+                model_type=self._config.get("detection.model_type", "lite"),
+                sample_interval=result.sample_interval,
+                inference_size=self._config.get("detection.batch_inference_size", 0),
+                running_mode=AnalysisWorker.running_mode_for(
+                    result.sample_interval, self.player_widget.get_fps(), tracking),
+                num_poses=self._config.get("detection.num_poses", 5),
+                roi_tracking=self._config.get("detection.roi_tracking", True),
+                presence_gate=self._config.get("analysis.presence_gate", True)):
+            self._status_bar.showMessage("민감도 변경은 동영상을 다시 분석하면 움직임 분석에 반영됩니다.")
+            return
+        self._run_analysis(video_path, result.sample_interval)
 
-    def _save_project(self) -> bool:
+    def _save_project(self, background: bool = False) -> bool:
         """프로젝트 저장"""
         if self._project_manager.current_path is None:
-            return self._save_project_as()
+            return self._save_project_as(background)
 
-        return self._do_save_project(self._project_manager.current_path)
+        return self._do_save_project(self._project_manager.current_path, background=background)
 
-    def _save_project_as(self) -> bool:
+    def _compact_project(self, background: bool = False) -> bool:
+        """현재 작업 파일을 새로 작성해 정리"""
+        if self._project_manager.current_path is None:
+            return self._save_project_as(background)
+
+        return self._do_save_project(self._project_manager.current_path, compact=True,
+                                     background=background)
+
+    def _save_project_as(self, background: bool = False) -> bool:
         """다른 이름으로 저장"""
         default_name = ""
         source_name = self.player_widget.source_name or self._video_name
@@ -1513,52 +1679,218 @@ class MainWindow(QMainWindow):
         if file_path:
             if not file_path.endswith('.skpx'):
                 file_path += '.skpx'
-            return self._do_save_project(Path(file_path))
+            return self._do_save_project(Path(file_path), background=background)
 
         return False
 
-    def _do_save_project(self, path: Path) -> bool:
-        """실제 프로젝트 저장 수행"""
-        self._logger.info(f"작업 저장 시작: {path}")
-        try:
-            capture_save = self._config.get("directories.capture_save", "captures")
-            if not capture_save:
-                capture_save = "captures"
-            capture_dir = Path(capture_save)
+    def _do_save_project(self, path: Path, compact: bool = False, background: bool = False) -> bool:
+        """
+        실제 프로젝트 저장 수행
 
-            # 소스 타입 결정
-            if self.player_widget.mode == 'image' and self.player_widget.image_player.is_loaded:
-                source_type = self.player_widget.image_player.source_type or 'folder'
-            else:
-                source_type = 'video'
-            source_path = self.player_widget.get_source_path()
-
-            self._project_manager.set_state(
-                video_path=self.player_widget.get_video_path(),
-                frame_position=self.player_widget.get_current_frame_number(),
-                fps=self.player_widget.get_fps(),
-                capture_model=self.status_widget.spreadsheet_widget.get_model(),
-                ui_state=self._collect_ui_state(),
-                capture_dir=capture_dir,
-                movement_analysis_result=self.status_widget.movement_analysis_widget.get_result(),
-                source_type=source_type,
-                source_path=source_path,
-                transforms=self.player_widget.get_transforms(),
-            )
+        상태 스냅샷은 GUI 스레드에서 만들고 파일 기록은 ProjectSaveWorker에서 한다.
 
-            if self._project_manager.save(path):
-                self._add_recent_project(str(path))
-                self._update_window_title()
-                self._status_bar.showMessage(f"작업 저장됨: {path}")
-                self._logger.info(f"작업 저장 완료: {path}")
-                CustomDialog.info(self, "작업 저장", f"작업이 저장되었습니다.\n{path}")
-                return True
+        Args:
+            path: 저장 경로
+            compact: True면 ZIP 전체를 새로 작성
+            background: True면 저장을 시작만 하고 바로 반환 (메뉴/툴바 저장),
+                False면 저장이 끝날 때까지 기다림 (종료/다른 데이터 열기 전 저장)
 
+        Returns:
+            background면 저장 시작 여부, 아니면 저장 성공 여부
+        """
+        if self._save_worker is not None:
+            if background and not self._save_worker.is_recovery:
+                self._status_bar.showMessage("이전 저장이 진행 중입니다.")
+                return False
+            self._wait_for_save()
+
+        self._logger.info(f"작업 저장 시작: {path}")
+        try:
+            self._update_project_state()
+            snapshot = self._project_manager.snapshot()
         except Exception as e:
             self._logger.error(f"작업 저장 실패: {path}, 오류: {e}")
             CustomDialog.error(self, "저장 오류", f"작업 저장 실패:\n{e}")
+            return False
 
-        return False
+        self._start_save_worker(snapshot, Path(path), compact=compact)
+        if background:
+            return True
+        return self._wait_for_save()
+
+    def _update_project_state(self):
+        """현재 화면 상태를 프로젝트 매니저에 반영"""
+        capture_save = self._config.get("directories.capture_save", "captures")
+        if not capture_save:
+            capture_save = "captures"
+        capture_dir = Path(capture_save)
+
+        # 소스 타입 결정
+        if self.player_widget.mode == 'image' and self.player_widget.image_player.is_loaded:
+            source_type = self.player_widget.image_player.source_type or 'folder'
+        else:
+            source_type = 'video'
+        source_path = self.player_widget.get_source_path()
+
+        self._project_manager.set_state(
+            video_path=self.player_widget.get_video_path(),
+            frame_position=self.player_widget.get_current_frame_number(),
+            fps=self.player_widget.get_fps(),
+            capture_model=self.status_widget.spreadsheet_widget.get_model(),
+            ui_state=self._collect_ui_state(),
+            capture_dir=capture_dir,
+            movement_analysis_result=self.status_widget.movement_analysis_widget.get_result(),
+            source_type=source_type,
+            source_path=source_path,
+            transforms=self.player_widget.get_transforms(),
+        )
+
+    def _start_save_worker(self, snapshot, path: Path, compact: bool = False, recovery: bool = False):
+        """저장 워커 시작 (재생/캡처를 방해하지 않도록 낮은 우선순위)"""
+        self._save_result = False
+        worker = ProjectSaveWorker(self._project_manager, snapshot, path,
+                                   compact=compact, recovery=recovery, parent=self)
+        worker.progress_updated.connect(self._on_save_progress)
+        worker.save_completed.connect(self._on_save_completed)
+        worker.save_cancelled.connect(self._on_save_cancelled)
+        worker.error_occurred.connect(self._on_save_error)
+        worker.finished.connect(self._on_save_worker_finished)
+        self._save_worker = worker
+
+        if not recovery:
+            self._save_progress_bar.setRange(0, 0)
+            self._save_progress_bar.show()
+            self._save_cancel_btn.setEnabled(True)
+            self._save_cancel_btn.show()
+            self._status_bar.showMessage(f"작업 저장 중: {path}")
+        worker.start(QThread.Priority.LowPriority)
+
+    def _wait_for_save(self) -> bool:
+        """진행 중인 저장이 끝날 때까지 이벤트를 처리하며 대기 (재생/화면 갱신은 계속됨)
+
+        Returns:
+            마지막 저장 성공 여부
+        """
+        worker = self._save_worker
+        if worker is not None:
+            loop = QEventLoop()
+            worker.finished.connect(loop.quit)
+            # finished가 연결 전에 이미 발생했을 수 있으므로 스레드 종료 여부도 주기적으로 확인
+            poll = QTimer()
+            poll.timeout.connect(lambda: worker.isFinished() and loop.quit())
+            poll.start(50)
+            if not worker.isFinished():
+                loop.exec()
+            poll.stop()
+            worker.wait()
+            # 아직 처리되지 않은 완료 슬롯(결과 기록, 워커 정리) 실행
+            QCoreApplication.sendPostedEvents()
+        return self._save_result
+
+    def _cancel_save(self):
+        """진행 중인 저장 취소 (기존 파일은 그대로)"""
+        if self._save_worker is not None:
+            self._save_cancel_btn.setEnabled(False)
+            self._save_worker.cancel()
+
+    def _on_save_progress(self, done: int, total: int):
+        if self._save_worker is not None and not self._save_worker.is_recovery:
+            self._save_progress_bar.setRange(0, max(1, total))
+            self._save_progress_bar.setValue(done)
+
+    def _on_save_completed(self, snapshot):
+        worker = self.sender()
+        path = worker.path
+        if worker.is_recovery:
+            self._logger.info(f"자동 저장 완료: {path}")
+            return
+
+        self._project_manager.finish_save(snapshot, path)
+        self._save_result = True
+        self._remove_recovery_file()
+        self._add_recent_project(str(path))
+        self._update_window_title()
+        self._status_bar.showMessage(f"작업 저장됨: {path}")
+        self._logger.info(f"작업 저장 완료: {path}")
+        CustomDialog.info(self, "작업 저장", f"작업이 저장되었습니다.\n{path}")
+
+    def _on_save_cancelled(self):
+        if not self.sender().is_recovery:
+            self._status_bar.showMessage("작업 저장 취소됨 - 기존 파일은 그대로입니다.")
+
+    def _on_save_error(self, message: str):
+        worker = self.sender()
+        if worker.is_recovery:
+            self._logger.warning(f"자동 저장 실패: {message}")
+            return
+        self._logger.error(f"작업 저장 실패: {worker.path}, 오류: {message}")
+        CustomDialog.error(self, "저장 오류", f"작업 저장 실패:\n{message}")
+
+    def _on_save_worker_finished(self):
+        worker = self.sender()
+        if worker is self._save_worker:
+            self._save_worker = None
+        self._save_progress_bar.hide()
+        self._save_cancel_btn.hide()
+        worker.deleteLater()
+
+    # === 자동 저장 (복구용) ===
+
+    @property
+    def _recovery_path(self) -> Path:
+        """자동 저장 복구 파일 경로"""
+        return self._config.config_dir / "autosave" / "autosave.skpx"
+
+    def _start_autosave_timer(self):
+        """설정(project.autosave_minutes, 0이면 끔)에 따라 자동 저장 타이머 시작"""
+        try:
+            minutes = float(self._config.get("project.autosave_minutes", 5))
+        except (TypeError, ValueError):
+            minutes = 5.0
+        if minutes > 0:
+            self._autosave_timer.start(int(minutes * 60 * 1000))
+        else:
+            self._autosave_timer.stop()
+
+    def _autosave(self):
+        """
+        변경사항이 있으면 복구 파일에 백그라운드로 저장
+
+        작업 파일과 현재 경로는 건드리지 않으며, 다른 저장이 진행 중이면 다음 주기로 넘긴다.
+        """
+        if (self._save_worker is not None or not self._project_manager.is_dirty
+                or not self._license_manager.is_licensed):
+            return
+        try:
+            self._update_project_state()
+            snapshot = self._project_manager.snapshot(recovery=True)
+        except Exception as e:
+            self._logger.warning(f"자동 저장 스냅샷 실패: {e}")
+            return
+
+        self._recovery_path.parent.mkdir(parents=True, exist_ok=True)
+        self._start_save_worker(snapshot, self._recovery_path, recovery=True)
+
+    def _remove_recovery_file(self):
+        """복구 파일 삭제 (정상 저장/종료 후)"""
+        try:
+            self._recovery_path.unlink(missing_ok=True)
+        except OSError as e:
+            self._logger.warning(f"복구 파일 삭제 실패: {e}")
+
+    def _offer_recovery(self):
+        """비정상 종료로 남은 복구 파일이 있으면 복원 여부 확인"""
+        path = self._recovery_path
+        if not path.exists() or not self._license_manager.is_licensed:
+            return
+        if CustomDialog.ask(
+            self, "작업 복구",
+            "이전 실행에서 저장되지 않은 작업이 자동 저장되어 있습니다.\n\n"
+            "복원하시겠습니까?"
+        ):
+            self._load_project(str(path), recovery=True)
+        else:
+            self._remove_recovery_file()
 
     def _collect_ui_state(self) -> dict:
         """현재 UI 상태 수집"""
@@ -1645,8 +1977,8 @@ class MainWindow(QMainWindow):
 
     # === 분석 관련 메서드 ===
 
-    def _on_analysis_requested(self, sample_interval: int):
-        """분석 위젯에서 분석 요청 시"""
+    def _on_analysis_requested(self, sample_interval: int, sample_seconds: float = 0.0):
+        """분석 위젯에서 분석 요청 시 (sample_seconds > 0이면 초 단위 샘플링)"""
         video_path = self.player_widget.get_video_path()
         if not video_path:
             return
@@ -1655,26 +1987,64 @@ class MainWindow(QMainWindow):
         resume_data = self.status_widget.movement_analysis_widget.get_resume_data()
         if resume_data:
             self._run_analysis(
-                video_path, sample_interval,
+                video_path, sample_interval, sample_seconds=sample_seconds,
                 resume_state=resume_data['analyzer_state'],
                 resume_frame=resume_data['frame_index'],
                 resume_skipped=resume_data['skipped_frames'],
                 resume_elapsed=resume_data.get('elapsed_seconds', 0.0),
             )
         else:
-            self._run_analysis(video_path, sample_interval)
+            self._run_analysis(video_path, sample_interval, sample_seconds=sample_seconds)
 
     def _run_analysis(self, video_path: str, sample_interval: int,
                       resume_state: dict = None, resume_frame: int = 0,
-                      resume_skipped: int = 0, resume_elapsed: float = 0.0):
+                      resume_skipped: int = 0, resume_elapsed: float = 0.0,
+                      sample_seconds: float = 0.0):
         """분석 모달 실행"""
+        if sample_seconds > 0:
+            # 워커와 같은 환산으로 캐시 확인용 프레임 간격을 정함
+            sample_interval = AnalysisWorker.interval_from_seconds(
+                sample_seconds, self.player_widget.get_fps())
+        model_type = self._config.get("detection.model_type", "lite")
+        inference_size = self._config.get("detection.batch_inference_size", 0)
+        cache_dir = self._landmark_cache_dir()
+        tracking = self._config.get("detection.tracking", True)
+        num_poses = self._config.get("detection.num_poses", 5)
+        roi_tracking = self._config.get("detection.roi_tracking", True)
+        presence_gate = self._config.get("analysis.presence_gate", True)
+
+        # 모든 분석 프레임의 랜드마크가 같은 감지기 옵션으로 캐시에 있으면 추론 없이 재계산
+        rescore = resume_state is None and cache_covers(
+            cache_dir, video_path, self.player_widget.get_frame_count(),
+            model_type=model_type, sample_interval=sample_interval,
+            inference_size=inference_size,
+            running_mode=AnalysisWorker.running_mode_for(
+                sample_interval, self.player_widget.get_fps(), tracking),
+            num_poses=num_poses, roi_tracking=roi_tracking, presence_gate=presence_gate,
+        )
+
+        dialog_sensitivity = self._detection_sensitivity()
         dialog = AnalysisProgressDialog(
             video_path=video_path,
             sample_interval=sample_interval,
+            sample_seconds=sample_seconds,
             resume_state=resume_state,
             resume_frame=resume_frame,
             resume_skipped=resume_skipped,
             resume_elapsed=resume_elapsed,
+            num_workers=self._config.get("analysis.num_workers", 1),
+            model_type=model_type,
+            cache_dir=cache_dir,
+            threshold=self._config.get("analysis.movement_threshold", DEFAULT_THRESHOLD),
+            rescore=rescore,
+            inference_size=inference_size,
+            tracking=tracking,
+            num_poses=num_poses,
+            roi_tracking=roi_tracking,
+            presence_gate=presence_gate,
+            min_visibility=self._config.get("analysis.min_visibility", 0.0),
+            detection_sensitivity=dialog_sensitivity,
+            index_dir=self._keyframe_index_dir(),
             parent=self,
         )
         dialog.start_analysis()
@@ -1683,6 +2053,7 @@ class MainWindow(QMainWindow):
         if accepted:
             result = dialog.get_result()
             if result:
+                self._analysis_sensitivity = dialog_sensitivity
                 self.status_widget.movement_analysis_widget.set_result(result)
                 self.status_widget.switch_to_analysis_tab()
                 self._status_bar.showMessage(
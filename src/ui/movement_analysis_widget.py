@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor
 
+from src.core.analysis_worker import AnalysisWorker
 from src.core.movement_analyzer import MovementAnalysisResult, BodyPartStats
 from src.ui.bar_item_delegate import BarItemDelegate, get_risk_color
 from src.ui.components.license_overlay import LicenseOverlay
@@ -66,7 +67,7 @@ def _grade_sort_key(grade: str) -> int:
 class MovementAnalysisWidget(QWidget):
     """분석 결과 탭 위젯 (3가지 상태: 미로드 / 분석 전 / 완료)"""
 
-    analysis_requested = pyqtSignal(int)  # sample_interval
+    analysis_requested = pyqtSignal(int, float)  # sample_interval, sample_seconds (0이면 프레임 간격)
 
     # 상태 인덱스
     STATE_NO_VIDEO = 0
@@ -80,6 +81,7 @@ class MovementAnalysisWidget(QWidget):
         super().__init__(parent)
         self._result: MovementAnalysisResult = None
         self._total_frames: int = 0
+        self._fps: float = 0.0
         self._video_path: str = None
         self._resume_data: dict = None  # 재개용 상태 저장
         self._init_ui()
@@ -149,9 +151,13 @@ class MovementAnalysisWidget(QWidget):
         sampling_layout.addWidget(sampling_label)
 
         self._sampling_combo = QComboBox()
-        self._sampling_combo.addItem("전체 프레임", 1)
-        self._sampling_combo.addItem("매 2프레임", 2)
-        self._sampling_combo.addItem("매 3프레임", 3)
+        # 항목 데이터: (프레임 간격, 초 간격), 초 간격이 있으면 동영상 FPS로 프레임 간격을 정함
+        self._sampling_combo.addItem("전체 프레임", (1, 0.0))
+        self._sampling_combo.addItem("매 2프레임", (2, 0.0))
+        self._sampling_combo.addItem("매 3프레임", (3, 0.0))
+        self._sampling_combo.addItem("매 0.5초", (0, 0.5))
+        self._sampling_combo.addItem("매 1초", (0, 1.0))
+        self._sampling_combo.addItem("매 2초", (0, 2.0))
         self._sampling_combo.setCurrentIndex(1)  # 매 2프레임 기본 선택
         self._sampling_combo.setFixedWidth(160)
         self._sampling_combo.currentIndexChanged.connect(self._on_sampling_changed)
@@ -434,12 +440,13 @@ class MovementAnalysisWidget(QWidget):
 
     # === 공개 API ===
 
-    def set_video_info(self, video_path: str, total_frames: int):
-        """동영상 로드 시 호출 - 분석 전 상태로 전환"""
+    def set_video_info(self, video_path: str, total_frames: int, fps: float = 0.0):
+        """동영상 로드 시 호출 - 분석 전 상태로 전환 (fps는 초 단위 샘플링 환산용)"""
         if video_path != self._video_path:
             self._resume_data = None  # 다른 동영상이면 재개 상태 초기화
         self._video_path = video_path
         self._total_frames = total_frames
+        self._fps = fps
         self._result = None
         self._update_expected_frames()
         self._update_resume_ui()
@@ -490,8 +497,16 @@ class MovementAnalysisWidget(QWidget):
         return self._result
 
     def get_sample_interval(self) -> int:
-        """선택된 샘플링 간격 반환"""
-        return self._sampling_combo.currentData()
+        """선택된 샘플링 간격 반환 (초 단위 항목은 동영상 FPS로 환산한 프레임 간격)"""
+        interval, seconds = self._sampling_combo.currentData()
+        if seconds > 0:
+            return AnalysisWorker.interval_from_seconds(seconds, self._fps)
+        return interval
+
+    def _request_analysis(self):
+        """선택된 샘플링으로 분석 요청"""
+        _, seconds = self._sampling_combo.currentData()
+        self.analysis_requested.emit(self.get_sample_interval(), seconds)
 
     # === 내부 메서드 ===
 
@@ -502,14 +517,12 @@ class MovementAnalysisWidget(QWidget):
         if self._total_frames <= 0:
             self._expected_label.setText("예상 분석 대상: - 프레임")
             return
-        interval = self._sampling_combo.currentData()
-        expected = self._total_frames // interval
+        expected = self._total_frames // self.get_sample_interval()
         self._expected_label.setText(f"예상 분석 대상: {expected:,} 프레임")
 
     def _on_start_clicked(self):
-        interval = self._sampling_combo.currentData()
         self._sampling_combo.setEnabled(False)
-        self.analysis_requested.emit(interval)
+        self._request_analysis()
 
     def _on_retry_clicked(self):
         """다시 분석 클릭 - 초기화 후 옵션 선택 화면으로"""
@@ -524,8 +537,7 @@ class MovementAnalysisWidget(QWidget):
         self._resume_data = None
         self._sampling_combo.setEnabled(True)
         self._update_resume_ui()
-        interval = self._sampling_combo.currentData()
-        self.analysis_requested.emit(interval)
+        self._request_analysis()
 
     def _update_resume_ui(self):
         """재개 상태에 따라 버튼 텍스트 업데이트"""
@@ -553,9 +565,10 @@ class MovementAnalysisWidget(QWidget):
 
         # 경고 배너
         warnings = []
-        total_analyzed_attempted = result.analyzed_frames + result.skipped_frames
+        # 빈 화면으로 판별되어 생략한 프레임은 감지 실패율에서 제외
+        total_analyzed_attempted = result.analyzed_frames + result.skipped_frames - result.gated_frames
         if total_analyzed_attempted > 0:
-            fail_rate = result.skipped_frames / total_analyzed_attempted
+            fail_rate = (result.skipped_frames - result.gated_frames) / total_analyzed_attempted
         else:
             fail_rate = 0.0
 
@@ -567,7 +580,8 @@ class MovementAnalysisWidget(QWidget):
 
         if fail_rate > 0.3:
             warnings.append(
-                f"⚠ 감지 실패율이 높습니다: {fail_rate:.1%} ({result.skipped_frames}프레임 실패)\n"
+                f"⚠ 감지 실패율이 높습니다: {fail_rate:.1%} "
+                f"({result.skipped_frames - result.gated_frames}프레임 실패)\n"
                 "화질이 낮거나 사람이 가려진 구간이 많을 수 있습니다."
             )
 
@@ -579,10 +593,12 @@ class MovementAnalysisWidget(QWidget):
 
         # 요약 정보
         success_rate = 1.0 - fail_rate
+        gate_text = f"빈 화면 생략: {result.gate_hit_rate:.1%}  |  " if result.gated_frames else ""
         self._summary_label.setText(
             f"분석 프레임: {result.analyzed_frames:,}  |  "
             f"소요 시간: {result.duration_seconds:.1f}초  |  "
             f"감지 성공률: {success_rate:.1%}  |  "
+            f"{gate_text}"
             f"샘플링: {'전체' if result.sample_interval == 1 else f'매 {result.sample_interval}프레임'}"
         )
 
@@ -2,7 +2,7 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QSlider, QSizePolicy, QFileDialog,
-    QGraphicsOpacityEffect, QStackedWidget, QScrollArea
+    QGraphicsOpacityEffect, QStackedWidget, QScrollArea, QComboBox
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize, QEvent
 from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor, QPen, QBrush, QIcon
@@ -13,6 +13,9 @@ from typing import Optional
 
 from ..core.video_player import VideoPlayer
 from ..core.image_slide_player import ImageSlidePlayer
+from ..core.playback_clock import PlaybackClock, PLAYBACK_RATES
+from ..core.logger import get_logger
+from ..utils.frame_ops import orient, FrameFitter
 
 
 def _get_icon_path(icon_name: str) -> str:
@@ -215,7 +218,13 @@ class PlayerWidget(QWidget):
         self._video_player = VideoPlayer()
         self._image_player = ImageSlidePlayer()
         self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._on_timer)
+        # 재생 시계: 처리가 늦으면 프레임을 건너뛰어 벽시계 시간에 맞춤
+        self._playback_clock = PlaybackClock()
+        self._clock_position = 0  # 마지막 틱 이후 다음에 디코딩할 프레임 (다르면 탐색된 것)
+        self._logger = get_logger('player_widget')
+        self._frame_fitter = FrameFitter()  # 표시용 축소 버퍼 (프레임마다 재사용)
         self._current_video_path = None
         self._current_video_name = None
         self._current_source_name = None
@@ -282,7 +291,7 @@ class PlayerWidget(QWidget):
         menu_layout.addWidget(self._open_archive_btn)
 
         # 안내 메시지
-        self._help_label = QLabel("Space: 재생/정지  |  Enter: 캡처  |  ←/→: 5초 이동")
+        self._help_label = QLabel("Space: 재생/정지  |  Enter: 캡처  |  ←/→: 5초 이동  |  ,/.: 1프레임 이동")
         self._help_label.setStyleSheet("color: #888; font-size: 11px; background: transparent;")
         menu_layout.addWidget(self._help_label)
 
@@ -462,6 +471,19 @@ class PlayerWidget(QWidget):
         self._total_time_label.setStyleSheet("color: #ccc; font-size: 12px; font-weight: bold; background: transparent;")
         control_layout.addWidget(self._total_time_label)
 
+        # 재생 배속
+        self._rate_combo = QComboBox()
+        for rate in PLAYBACK_RATES:
+            self._rate_combo.addItem(f"{rate:g}x", rate)
+        self._rate_combo.setCurrentIndex(PLAYBACK_RATES.index(1.0))
+        self._rate_combo.setFixedSize(62, 28)
+        self._rate_combo.setToolTip("재생 배속")
+        self._rate_combo.setStyleSheet("color: #ccc; font-size: 12px; background: #505050; border-radius: 4px;")
+        self._rate_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._rate_combo.currentIndexChanged.connect(
+            lambda index: self.set_playback_rate(self._rate_combo.itemData(index)))
+        control_layout.addWidget(self._rate_combo)
+
         return control_container
 
     def _create_image_control(self) -> QWidget:
@@ -602,7 +624,7 @@ class PlayerWidget(QWidget):
         if mode == self.MODE_VIDEO:
             self._control_stack.setCurrentIndex(0)
             self._control_stack.setFixedHeight(50)
-            self._help_label.setText("Space: 재생/정지  |  Enter: 캡처  |  ←/→: 5초 이동")
+            self._help_label.setText("Space: 재생/정지  |  Enter: 캡처  |  ←/→: 5초 이동  |  ,/.: 1프레임 이동")
         elif mode == self.MODE_IMAGE:
             self._control_stack.setCurrentIndex(1)
             self._control_stack.setFixedHeight(self._image_control_height)
@@ -630,6 +652,9 @@ class PlayerWidget(QWidget):
             elif self._mode == self.MODE_VIDEO:
                 self.seek_relative(5)
             return
+        elif event.key() in (Qt.Key.Key_Comma, Qt.Key.Key_Period) and self._mode == self.MODE_VIDEO:
+            self.step_frame(-1 if event.key() == Qt.Key.Key_Comma else 1)
+            return
         super().keyPressEvent(event)
 
     # === 드래그 앤 드롭 ===
@@ -698,24 +723,59 @@ class PlayerWidget(QWidget):
         """재생"""
         if self._mode == self.MODE_VIDEO and self._video_player.is_loaded:
             self._video_player.play()
-            fps = self._video_player.fps or 30
-            self._timer.start(int(1000 / fps))
+            self._playback_clock.fps = self._video_player.fps or 30
+            self._playback_clock.reset_dropped()
+            self._playback_clock.start(self._video_player.current_frame)
+            self._clock_position = self._video_player.current_frame
+            self._timer.start(self._playback_clock.interval_ms)
             self._update_play_button_state()
 
     def pause(self):
         """일시정지"""
         self._video_player.pause()
         self._timer.stop()
+        self._stop_playback_clock()
         self._update_play_button_state()
 
     def stop(self):
         """정지"""
         self._video_player.stop()
         self._timer.stop()
+        self._stop_playback_clock()
         self._update_time_display()
         self._slider.setValue(0)
         self._update_play_button_state()
 
+    def _stop_playback_clock(self):
+        """재생 시계 정지 (건너뛴 프레임 수 보고)"""
+        if self._playback_clock.is_running:
+            self._playback_clock.stop()
+            dropped = self._playback_clock.dropped_frames
+            self._rate_combo.setToolTip(f"재생 배속 (최근 재생에서 건너뛴 프레임: {dropped})")
+            if dropped:
+                self._logger.info(f"재생 중 건너뛴 프레임: {dropped} (배속 {self._playback_clock.rate:g}x)")
+
+    @property
+    def playback_rate(self) -> float:
+        """재생 배속"""
+        return self._playback_clock.rate
+
+    @property
+    def dropped_frames(self) -> int:
+        """현재(또는 마지막) 재생에서 시간을 맞추려고 건너뛴 프레임 수"""
+        return self._playback_clock.dropped_frames
+
+    def set_playback_rate(self, rate: float):
+        """재생 배속 설정 (0.25 ~ 4.0, 재생 중이면 현재 위치부터 바로 적용)"""
+        self._playback_clock.rate = rate
+        index = self._rate_combo.findData(self._playback_clock.rate)
+        if index >= 0 and index != self._rate_combo.currentIndex():
+            self._rate_combo.blockSignals(True)
+            self._rate_combo.setCurrentIndex(index)
+            self._rate_combo.blockSignals(False)
+        if self._timer.isActive():
+            self._timer.setInterval(self._playback_clock.interval_ms)
+
     def _update_play_button_state(self):
         """재생/일시정지 버튼 상태 업데이트"""
         if self._video_player.is_playing:
@@ -1046,6 +1106,10 @@ class PlayerWidget(QWidget):
             return self._image_player.is_loaded
         return False
 
+    def set_keyframe_index_dir(self, index_dir: Optional[str]):
+        """키프레임 색인 사이드카 디렉토리 설정 (다음 동영상 로드부터 정확한 탐색에 사용)"""
+        self._video_player.index_dir = index_dir
+
     def seek_relative(self, seconds: float):
         """상대적 시크 (초 단위) - 동영상 모드 전용"""
         if self._mode == self.MODE_VIDEO and self._video_player.is_loaded:
@@ -1055,6 +1119,19 @@ class PlayerWidget(QWidget):
             self._video_player.seek(target_frame)
             self._update_display()
 
+    def step_frame(self, delta: int):
+        """표시 중인 프레임에서 delta 프레임 이동 - 동영상 모드 전용 (재생 중이면 일시정지)
+
+        바로 앞 프레임들은 백그라운드에서 미리 디코딩해 두므로 뒤로 한 프레임씩 가도 다시 디코딩하지 않는다.
+        """
+        if self._mode == self.MODE_VIDEO and self._video_player.is_loaded:
+            if self._video_player.is_playing:
+                self.pause()
+            # read_frame 후 current_frame은 다음 프레임을 가리킴
+            displayed = max(0, self._video_player.current_frame - 1)
+            self._video_player.seek(displayed + delta)
+            self._update_display()
+
     def get_current_position(self) -> float:
         """현재 재생 위치 (초 단위) 반환"""
         if self._mode == self.MODE_VIDEO:
@@ -1069,6 +1146,17 @@ class PlayerWidget(QWidget):
             return self._image_player.current_index if self._image_player.is_loaded else 0
         return 0
 
+    def get_frame_count(self) -> int:
+        """동영상 전체 프레임 수 반환 (동영상이 아니면 0)"""
+        if self._mode == self.MODE_VIDEO:
+            return self._video_player.frame_count if self._video_player.is_loaded else 0
+        return 0
+
+    @property
+    def is_playing(self) -> bool:
+        """동영상 재생 중 여부"""
+        return self._mode == self.MODE_VIDEO and self._video_player.is_playing
+
     def get_video_path(self) -> Optional[str]:
         """현재 로드된 동영상 경로 반환"""
         if self._mode == self.MODE_VIDEO:
@@ -1122,20 +1210,8 @@ class PlayerWidget(QWidget):
     # === 변환 (회전/반전) ===
 
     def _apply_transforms(self, frame: np.ndarray) -> np.ndarray:
-        """프레임에 회전/반전 변환 적용"""
-        if self._rotation_angle == 90:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-        elif self._rotation_angle == 180:
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
-        elif self._rotation_angle == 270:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-        if self._flip_horizontal:
-            frame = cv2.flip(frame, 1)
-        if self._flip_vertical:
-            frame = cv2.flip(frame, 0)
-
-        return frame
+        """프레임에 회전/반전 변환 적용 (조합을 한 번의 연산으로, 변환 없으면 원본 그대로)"""
+        return orient(frame, self._rotation_angle, self._flip_horizontal, self._flip_vertical)
 
     def rotate_90(self):
         """시계방향 90도 회전"""
@@ -1205,8 +1281,23 @@ class PlayerWidget(QWidget):
     # === 내부 메서드 ===
 
     def _on_timer(self):
-        """타이머 콜백 (동영상 모드)"""
+        """타이머 콜백 (동영상 모드) - 재생 시계가 가리키는 프레임을 표시"""
+        position = self._video_player.current_frame
+        if position != self._clock_position:
+            # 재생 중 탐색(슬라이더/건너뛰기)됨: 그 위치부터 시계를 다시 맞춤
+            self._playback_clock.start(position)
+
+        skip = self._playback_clock.frames_to_skip(position)
+        if skip is None:
+            # 아직 다음 프레임 시각 전 (타이머가 일찍 깨어남)
+            self._clock_position = position
+            return
+        if skip:
+            # 뒤처진 프레임은 화면용 변환/표시/감지 없이 건너뜀
+            self._video_player.skip_frames(skip)
+
         frame = self._video_player.read_frame()
+        self._clock_position = self._video_player.current_frame
         if frame is not None:
             frame = self._apply_transforms(frame)
             self._display_frame(frame)
@@ -1221,21 +1312,25 @@ class PlayerWidget(QWidget):
             self._update_play_button_state()
 
     def _display_frame(self, frame: np.ndarray):
-        """프레임 표시"""
-        rgb_frame = frame[:, :, ::-1].copy()
-        h, w, ch = rgb_frame.shape
-
-        bytes_per_line = ch * w
-        q_img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        """프레임 표시
 
+        원본 해상도로 QPixmap을 만들어 Qt에서 줄이는 대신, 표시 크기로 먼저 줄이고(cv2.resize,
+        버퍼 재사용) BGR 그대로 QImage로 감싸 채널 변환 복사를 없앤다.
+        """
+        dpr = self._video_label.devicePixelRatioF()
         label_size = self._video_label.size()
-        scaled_pixmap = QPixmap.fromImage(q_img).scaled(
-            label_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-
-        self._video_label.setPixmap(scaled_pixmap)
+        fitted = self._frame_fitter.fit(
+            frame, int(label_size.width() * dpr), int(label_size.height() * dpr))
+        if fitted is None:
+            return
+        if not fitted.flags['C_CONTIGUOUS']:
+            fitted = np.ascontiguousarray(fitted)
+
+        h, w = fitted.shape[:2]
+        q_img = QImage(fitted.data, w, h, fitted.strides[0], QImage.Format.Format_BGR888)
+        pixmap = QPixmap.fromImage(q_img)  # 여기서 복사되므로 버퍼는 다음 프레임에 재사용 가능
+        pixmap.setDevicePixelRatio(dpr)
+        self._video_label.setPixmap(pixmap)
 
     def _update_time_display(self):
         """시간 표시 업데이트 (동영상 모드)"""
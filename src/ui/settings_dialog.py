@@ -7,12 +7,13 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QCheckBox,
     QFileDialog, QDialogButtonBox, QFormLayout, QComboBox,
-    QProgressBar
+    QProgressBar, QSpinBox, QDoubleSpinBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from typing import TYPE_CHECKING
 
 from ..license import LicenseManager
+from ..core.movement_analyzer import DEFAULT_THRESHOLD
 from .custom_dialog import CustomDialog
 
 if TYPE_CHECKING:
@@ -319,6 +320,24 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(image_group)
 
+        # 프로젝트 저장 설정 그룹
+        project_group = QGroupBox("프로젝트 저장")
+        project_layout = QFormLayout(project_group)
+
+        self._capture_storage_combo = QComboBox()
+        self._capture_storage_combo.addItem("JSON (기본)", "json")
+        self._capture_storage_combo.addItem("SQLite (대용량 캡처)", "sqlite")
+        self._capture_storage_combo.setToolTip(
+            "SQLite 방식은 저장할 때 바뀐 캡처만 기록해 캡처가 많은 프로젝트를 빠르게 저장합니다.\n"
+            "SQLite 방식으로 저장한 프로젝트는 이전 버전에서 열 수 없습니다."
+        )
+        storage_note = QLabel("※ SQLite 작업 파일은 설정 폴더(capture_db)에 보관됩니다")
+        storage_note.setStyleSheet("color: #888; font-size: 11px;")
+        project_layout.addRow("캡처 저장 방식:", self._capture_storage_combo)
+        project_layout.addRow("", storage_note)
+
+        layout.addWidget(project_group)
+
         # 감지 모델 설정 그룹
         model_group = QGroupBox("포즈 감지")
         model_layout = QFormLayout(model_group)
@@ -340,8 +359,89 @@ class SettingsDialog(QDialog):
         model_layout.addRow("감지 모델:", self._model_combo)
         model_layout.addRow("", self._model_note)
 
+        # 추론 해상도 (실시간 / 동영상 분석 별도)
+        self._live_size_combo = self._create_inference_size_combo()
+        self._batch_size_combo = self._create_inference_size_combo()
+        size_note = QLabel("※ 고해상도 영상은 축소 후 감지하면 빨라집니다. 너무 작으면 정확도가 떨어집니다.")
+        size_note.setStyleSheet("color: #888; font-size: 11px;")
+        size_note.setWordWrap(True)
+
+        model_layout.addRow("실시간 추론 해상도:", self._live_size_combo)
+        model_layout.addRow("분석 추론 해상도:", self._batch_size_combo)
+        model_layout.addRow("", size_note)
+
+        # 추적 / 최대 감지 인원
+        self._tracking_checkbox = QCheckBox("연속 프레임 추적 (동영상 재생/분석)")
+        self._tracking_checkbox.setToolTip(
+            "이전 프레임의 포즈를 이용해 다음 프레임을 추적합니다. 빠르고 흔들림이 적습니다."
+        )
+        self._num_poses_spin = QSpinBox()
+        self._num_poses_spin.setRange(1, 10)
+        self._num_poses_spin.setToolTip(
+            "한 프레임에서 찾을 최대 인원 수입니다. 가장 가까운 1명을 평가합니다."
+        )
+
+        self._roi_checkbox = QCheckBox("인물 영역만 잘라 감지")
+        self._roi_checkbox.setToolTip(
+            "이전 프레임에서 찾은 사람 주변만 감지합니다. 넓은 화면에 사람이 작게 보일 때 "
+            "더 빠르고 정확합니다. 놓치면 전체 화면에서 다시 찾습니다."
+        )
+
+        model_layout.addRow("", self._tracking_checkbox)
+        model_layout.addRow("", self._roi_checkbox)
+        model_layout.addRow("최대 감지 인원:", self._num_poses_spin)
+
         layout.addWidget(model_group)
 
+        # 동영상 분석 설정 그룹
+        analysis_group = QGroupBox("동영상 분석")
+        analysis_layout = QFormLayout(analysis_group)
+
+        self._workers_spin = QSpinBox()
+        self._workers_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self._workers_spin.setToolTip(
+            "2 이상이면 동영상을 구간별로 나눠 여러 프로세스에서 동시에 분석합니다."
+        )
+        workers_note = QLabel("※ 병렬 분석을 취소하면 앞에서부터 끝난 구간까지 이어서 분석할 수 있습니다")
+        workers_note.setStyleSheet("color: #888; font-size: 11px;")
+
+        analysis_layout.addRow("분석 프로세스 수:", self._workers_spin)
+        analysis_layout.addRow("", workers_note)
+
+        self._threshold_spin = QDoubleSpinBox()
+        self._threshold_spin.setRange(1.0, 90.0)
+        self._threshold_spin.setSingleStep(1.0)
+        self._threshold_spin.setDecimals(1)
+        self._threshold_spin.setSuffix("°")
+        self._threshold_spin.setToolTip(
+            "이전 분석 프레임 대비 관절 각도 변화가 이 값을 넘으면 움직임 1회로 셉니다."
+        )
+        threshold_note = QLabel("※ 이미 분석한 동영상은 저장된 랜드마크로 빠르게 재계산됩니다")
+        threshold_note.setStyleSheet("color: #888; font-size: 11px;")
+
+        self._min_visibility_spin = QDoubleSpinBox()
+        self._min_visibility_spin.setRange(0.0, 1.0)
+        self._min_visibility_spin.setSingleStep(0.05)
+        self._min_visibility_spin.setDecimals(2)
+        self._min_visibility_spin.setSpecialValueText("사용 안 함")
+        self._min_visibility_spin.setToolTip(
+            "랜드마크 평균 가시성이 이 값보다 낮은 프레임은 감지 실패로 처리합니다.\n"
+            "이미 분석한 동영상은 저장된 랜드마크로 다시 계산합니다."
+        )
+
+        self._presence_gate_checkbox = QCheckBox("사람 없는 장면은 감지 생략")
+        self._presence_gate_checkbox.setToolTip(
+            "사람이 없다고 확인된 화면이 그대로이면 포즈 감지 없이 건너뜁니다.\n"
+            "움직임이 생기면 다시 감지합니다."
+        )
+
+        analysis_layout.addRow("움직임 판정 임계값:", self._threshold_spin)
+        analysis_layout.addRow("", threshold_note)
+        analysis_layout.addRow("최소 가시성:", self._min_visibility_spin)
+        analysis_layout.addRow("", self._presence_gate_checkbox)
+
+        layout.addWidget(analysis_group)
+
         # 버튼
         button_box = QDialogButtonBox()
         ok_btn = button_box.addButton("확인", QDialogButtonBox.ButtonRole.AcceptRole)
@@ -388,12 +488,46 @@ class SettingsDialog(QDialog):
             self._config.get("images.confirm_before_delete", True)
         )
 
+        # 프로젝트 저장 설정
+        self._select_combo_data(self._capture_storage_combo,
+                                self._config.get("project.capture_storage", "json"))
+
         model_type = self._config.get("detection.model_type", "lite")
         idx = self._model_combo.findData(model_type)
         if idx >= 0:
             self._model_combo.setCurrentIndex(idx)
         self._original_model_type = model_type
 
+        self._select_combo_data(self._live_size_combo,
+                                self._config.get("detection.live_inference_size", 0))
+        self._select_combo_data(self._batch_size_combo,
+                                self._config.get("detection.batch_inference_size", 0))
+        self._tracking_checkbox.setChecked(self._config.get("detection.tracking", True))
+        self._num_poses_spin.setValue(self._config.get("detection.num_poses", 5))
+        self._roi_checkbox.setChecked(self._config.get("detection.roi_tracking", True))
+
+        self._workers_spin.setValue(self._config.get("analysis.num_workers", 1))
+        self._threshold_spin.setValue(
+            self._config.get("analysis.movement_threshold", DEFAULT_THRESHOLD)
+        )
+        self._min_visibility_spin.setValue(self._config.get("analysis.min_visibility", 0.0))
+        self._presence_gate_checkbox.setChecked(self._config.get("analysis.presence_gate", True))
+
+    @staticmethod
+    def _create_inference_size_combo() -> QComboBox:
+        """추론 해상도 선택 콤보박스 (데이터: 긴 변 픽셀, 0 = 원본)"""
+        from ..core.pose_detector import PoseDetector
+
+        combo = QComboBox()
+        for size in PoseDetector.INFERENCE_SIZES:
+            combo.addItem("원본 크기" if size == 0 else f"긴 변 {size}px", size)
+        return combo
+
+    @staticmethod
+    def _select_combo_data(combo: QComboBox, value):
+        idx = combo.findData(value)
+        combo.setCurrentIndex(idx if idx >= 0 else 0)
+
     def _save_and_accept(self):
         """설정 저장 후 다이얼로그 닫기"""
         # 디렉토리 설정
@@ -411,6 +545,22 @@ class SettingsDialog(QDialog):
         self._config.set("images.auto_delete_on_row_delete", self._auto_delete_checkbox.isChecked())
         self._config.set("images.confirm_before_delete", self._confirm_delete_checkbox.isChecked())
 
+        # 프로젝트 저장 설정
+        self._config.set("project.capture_storage", self._capture_storage_combo.currentData())
+
+        # 추론 해상도 설정
+        self._config.set("detection.live_inference_size", self._live_size_combo.currentData())
+        self._config.set("detection.batch_inference_size", self._batch_size_combo.currentData())
+        self._config.set("detection.tracking", self._tracking_checkbox.isChecked())
+        self._config.set("detection.num_poses", self._num_poses_spin.value())
+        self._config.set("detection.roi_tracking", self._roi_checkbox.isChecked())
+
+        # 동영상 분석 설정
+        self._config.set("analysis.num_workers", self._workers_spin.value())
+        self._config.set("analysis.movement_threshold", self._threshold_spin.value())
+        self._config.set("analysis.min_visibility", self._min_visibility_spin.value())
+        self._config.set("analysis.presence_gate", self._presence_gate_checkbox.isChecked())
+
         # 감지 모델 설정 (등록 시에만)
         if self._model_combo.isEnabled():
             new_model = self._model_combo.currentData()
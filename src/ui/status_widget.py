@@ -20,6 +20,8 @@ from .settings_dialog import SettingsDialog
 from ..core.pose_detector import PoseDetector
 from ..core.angle_calculator import AngleCalculator
 from ..core.capture_model import CaptureRecord
+from ..core.landmark_cache import LandmarkCache
+from ..core.live_detection import LiveDetectionWorker, LiveDetection, LiveFrame
 from ..utils.image_saver import ImageSaver
 from ..utils.config import Config
 
@@ -36,12 +38,24 @@ class StatusWidget(QWidget):
         super().__init__()
         self._config = config
         self._pose_detector = self._create_pose_detector()
+        self._pose_detector.inference_size = self._live_inference_size()
+        self._pose_inference_size = self._pose_detector.inference_size  # 워커에 요청한 추론 해상도
         self._angle_calculator = AngleCalculator()
         self._image_saver = ImageSaver(config=config)
         self._current_timestamp = 0.0
         self._current_frame_number = 0
         self._current_frame: Optional[np.ndarray] = None  # 현재 프레임 저장
         self._video_name: Optional[str] = None  # 동영상 이름
+        self._landmark_cache: Optional[LandmarkCache] = None  # 현재 동영상 랜드마크 캐시
+
+        # 실시간 감지 워커 (추론/각도 계산은 워커에서, 표시와 평가는 GUI 스레드에서)
+        self._live_worker = LiveDetectionWorker(self._pose_detector, parent=self)
+        self._live_worker.detection_ready.connect(self._on_detection_ready)
+        self._live_worker.start()
+        self._frame_seq = 0            # 감지 요청 순번
+        self._applied_seq = 0          # 표시 중인 결과의 요청 순번
+        self._source_generation = 0    # 동영상/변환/캐시가 바뀌면 증가 (이전 결과 무시)
+        self._result_frame: Optional[LiveFrame] = None  # 표시 중인 결과의 프레임 (캡처용)
 
         # 단축키 표시 접두사 (macOS: ⌘, 기타: Ctrl+)
         self._shortcut_prefix = "⌘" if platform.system() == "Darwin" else "Ctrl+"
@@ -369,24 +383,97 @@ class StatusWidget(QWidget):
         """SI 패널 가시성 반환"""
         return self._si_visible
 
-    def process_frame(self, frame: np.ndarray):
-        """프레임 처리"""
+    @property
+    def pose_model_type(self) -> str:
+        """실시간 감지에 사용 중인 포즈 모델 타입"""
+        return self._pose_detector.model_type
+
+    @property
+    def pose_inference_size(self) -> int:
+        """실시간 감지 추론 해상도 (워커에 요청한 값, 감지기는 워커 스레드만 건드림)"""
+        return self._pose_inference_size
+
+    @property
+    def pose_detector_options(self) -> dict:
+        """실시간 감지기 옵션 (랜드마크 캐시 키에 포함)"""
+        return {
+            'running_mode': self._pose_detector.running_mode,
+            'num_poses': self._pose_detector.num_poses,
+            'roi_tracking': self._pose_detector.roi_tracking,
+        }
+
+    def set_landmark_cache(self, cache: Optional[LandmarkCache]):
+        """실시간 감지에 사용할 랜드마크 캐시 설정 (None이면 사용 안 함)"""
+        self._landmark_cache = cache
+        self._source_generation += 1
+
+    def process_frame(self, frame: np.ndarray, frame_index: Optional[int] = None,
+                      timestamp_ms: Optional[int] = None):
+        """프레임 처리
+
+        캐시에 있으면 바로 표시하고, 없으면 실시간 감지 워커에 요청한다 (결과는 _on_detection_ready).
+
+        Args:
+            frame: 표시 중인 프레임 (변환 적용 후)
+            frame_index: 동영상 프레임 번호 (지정 시 랜드마크 캐시 사용)
+            timestamp_ms: 재생 중인 동영상 프레임 시각 (지정 시 이전 프레임 기반 추적)
+        """
         # 현재 프레임 저장 (캡처용)
         self._current_frame = frame.copy()
+        self._frame_seq += 1
+        live = LiveFrame(
+            seq=self._frame_seq,
+            frame=self._current_frame,
+            frame_number=self._current_frame_number,
+            timestamp=self._current_timestamp,
+            frame_index=frame_index,
+            timestamp_ms=timestamp_ms,
+            generation=self._source_generation,
+        )
 
         # 편집 모드에서는 영상 감지 결과 무시 (편집 값 유지)
         if self._skeleton_widget.is_edit_mode:
+            self._result_frame = live
             return
 
-        # 포즈 감지
-        result = self._pose_detector.detect(frame)
+        # 포즈 감지 (캐시에 있으면 추론 생략)
+        cache = self._landmark_cache if frame_index is not None else None
+        # 실시간 감지는 빈 화면 판별을 쓰지 않으므로 빈 화면 생략 프레임은 다시 감지
+        result = (cache.get(frame_index)
+                  if cache is not None and cache.has(frame_index, include_gated=False) else None)
+        if result is not None:
+            self._apply_detection(LiveDetection(frame=live, result=result))
+        else:
+            self._live_worker.submit(live)
+
+    def _on_detection_ready(self, detection: LiveDetection):
+        """워커 감지 결과 수신 (이전 소스/이미 지난 요청의 결과는 표시하지 않음)"""
+        live = detection.frame
+        if live.generation != self._source_generation:
+            return
+        # VIDEO 모드 감지기도 타임스탬프가 없으면(일시정지/탐색) 단일 이미지로 감지하므로
+        # 실행 모드가 캐시 키(VIDEO)와 다른 결과는 캐시에 남기지 않음
+        tracked = live.timestamp_ms is not None or self._pose_detector.running_mode != 'video'
+        if live.frame_index is not None and self._landmark_cache is not None and tracked:
+            self._landmark_cache.put(live.frame_index, detection.result)
+        if live.seq <= self._applied_seq or self._skeleton_widget.is_edit_mode:
+            return
+        self._apply_detection(detection)
+
+    def _apply_detection(self, detection: LiveDetection):
+        """감지 결과 표시 및 평가"""
+        self._applied_seq = detection.frame.seq
+        self._result_frame = detection.frame
+        result = detection.result
 
         if result.pose_detected and result.landmarks:
             # 스켈레톤 표시
             self._skeleton_widget.set_landmarks(result.landmarks)
 
             # 각도 계산 및 표시
-            angles = self._angle_calculator.calculate_all_angles(result.landmarks)
+            angles = detection.angles
+            if angles is None:
+                angles = self._angle_calculator.calculate_all_angles(result.landmarks)
             self._angle_widget.set_angles(angles)
 
             # 인체공학적 평가 업데이트
@@ -437,18 +524,24 @@ class StatusWidget(QWidget):
         video_frame_path = None
         skeleton_image_path = None
 
+        # 표시 중인 평가 결과를 만든 프레임으로 저장 (감지가 표시보다 늦을 수 있음)
+        live = self._result_frame
+        frame = live.frame if live is not None else self._current_frame
+        timestamp = live.timestamp if live is not None else self._current_timestamp
+        frame_number = live.frame_number if live is not None else self._current_frame_number
+
         source_name = self._video_name or "simulation"
         video_frame_path, skeleton_image_path = self._image_saver.save_capture(
             video_name=source_name,
-            timestamp=self._current_timestamp,
-            frame=self._current_frame,
+            timestamp=timestamp,
+            frame=frame,
             skeleton_pixmap=self._skeleton_widget.grab_as_pixmap(),
         )
 
         # CaptureRecord 생성
         record = CaptureRecord(
-            timestamp=self._current_timestamp,
-            frame_number=self._current_frame_number,
+            timestamp=timestamp,
+            frame_number=frame_number,
             capture_time=datetime.now(),
             # RULA
             rula_upper_arm=rula.upper_arm_score if rula else 0,
@@ -541,8 +634,9 @@ class StatusWidget(QWidget):
         return row_idx
 
     def set_video_name(self, video_name: str):
-        """동영상 이름 설정"""
+        """동영상 이름 설정 (소스가 바뀌었으므로 이전 소스의 결과 프레임은 캡처에 쓰지 않음)"""
         self._video_name = video_name
+        self._result_frame = None
         self._spreadsheet_widget.set_video_name(video_name)
 
     @property
@@ -568,14 +662,53 @@ class StatusWidget(QWidget):
     def _open_settings(self):
         """설정 다이얼로그 열기"""
         dialog = SettingsDialog(self._config, self)
-        dialog.exec()
+        if dialog.exec():
+            self.apply_detection_settings()
+
+    def apply_detection_settings(self):
+        """설정의 실시간 감지 옵션을 다음 감지부터 반영 (감지기는 워커 스레드에서 변경)
+
+        추적/최대 인원/인물 영역 추적이 바뀌면 같은 모델로 감지기를 새로 만들어 교체한다.
+        감지 모델 변경은 다운로드가 필요할 수 있어 재시작 후 적용한다.
+        """
+        size = max(0, int(self._live_inference_size()))
+        options = self._detector_options()
+        if options != self.pose_detector_options:
+            detector = PoseDetector(model_type=self._pose_detector.model_type,
+                                    inference_size=size, **options)
+            self._pose_detector = detector
+            self._pose_inference_size = size
+            self._live_worker.set_detector(detector)
+        elif size != self._pose_inference_size:
+            self._pose_inference_size = size
+            self._live_worker.set_inference_size(size)
+
+    def reset_tracking(self):
+        """실시간 감지 추적 초기화 (동영상/변환 변경 시, 진행 중인 요청의 결과는 표시하지 않음)"""
+        self._source_generation += 1
+        self._result_frame = None
+        self._live_worker.reset_tracking()
+
+    def _live_inference_size(self) -> int:
+        """실시간 감지 추론 해상도 (긴 변 픽셀, 0 = 원본)"""
+        return self._config.get("detection.live_inference_size", 0) if self._config else 0
+
+    def _detector_options(self) -> dict:
+        """설정의 실시간 감지기 옵션 (pose_detector_options와 같은 형식)"""
+        # 재생 중에는 VIDEO 모드로 이전 프레임 기반 추적 (일시정지/탐색 시 단일 이미지 감지)
+        tracking = self._config.get("detection.tracking", True) if self._config else True
+        num_poses = self._config.get("detection.num_poses", 5) if self._config else 5
+        roi_tracking = self._config.get("detection.roi_tracking", True) if self._config else True
+        return {'running_mode': 'video' if tracking else 'image', 'num_poses': num_poses,
+                'roi_tracking': roi_tracking}
 
     def _create_pose_detector(self) -> PoseDetector:
         """PoseDetector 생성 (모델 없으면 다운로드 다이얼로그 표시)"""
         model_type = self._config.get("detection.model_type", "lite") if self._config else "lite"
+        options = self._detector_options()
 
         if PoseDetector.is_model_available(model_type):
-            return PoseDetector(model_type=model_type)
+            return PoseDetector(model_type=model_type, **options)
 
         # 모델이 없으면 다운로드 다이얼로그 표시
         from .settings_dialog import ModelDownloadDialog
@@ -591,14 +724,14 @@ class StatusWidget(QWidget):
         dialog.exec()
 
         if dialog.success:
-            return PoseDetector(model_type=model_type)
+            return PoseDetector(model_type=model_type, **options)
 
         # 다운로드 실패 시 lite fallback 시도
         if model_type != 'lite' and PoseDetector.is_model_available('lite'):
             if self._config:
                 self._config.set("detection.model_type", "lite")
                 self._config.save()
-            return PoseDetector(model_type='lite')
+            return PoseDetector(model_type='lite', **options)
 
         # lite도 없으면 lite 다운로드
         if not PoseDetector.is_model_available('lite'):
@@ -613,8 +746,11 @@ class StatusWidget(QWidget):
         if self._config:
             self._config.set("detection.model_type", "lite")
             self._config.save()
-        return PoseDetector(model_type='lite')
+        return PoseDetector(model_type='lite', **options)
 
     def release(self):
         """리소스 해제"""
+        self._live_worker.stop()
+        # 교체 요청이 적용되기 전에 멈췄으면 워커가 쓰던 이전 감지기도 해제
+        self._live_worker.detector.release()
         self._pose_detector.release()
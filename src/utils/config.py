@@ -15,6 +15,11 @@ class Config:
         self._config: Dict[str, Any] = {}
         self._load()
 
+    @property
+    def config_dir(self) -> Path:
+        """설정 디렉토리 경로"""
+        return self._config_dir
+
     def _get_config_dir(self) -> Path:
         """설정 디렉토리 경로 반환"""
         if os.name == 'nt':  # Windows
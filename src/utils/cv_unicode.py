@@ -100,6 +100,12 @@ class VideoCapture:
     def read(self):
         return self._cap.read()
 
+    def grab(self):
+        return self._cap.grab()
+
+    def retrieve(self):
+        return self._cap.retrieve()
+
     def get(self, prop_id: int):
         return self._cap.get(prop_id)
 
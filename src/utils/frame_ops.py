@@ -0,0 +1,119 @@
+"""
+프레임 표시용 연산
+
+- orient: 회전/반전 조합을 고정 표(ORIENT_OPS)의 OpenCV 연산으로 적용
+  (대부분 1번, 90도+상하 반전과 270도+좌우 반전만 전치 + 180도 회전 2번)
+- FrameFitter: 표시 영역 크기에 맞춰 먼저 줄이고, 결과 버퍼는 프레임마다 재사용
+"""
+
+from typing import Dict, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+# cv2.rotate 코드 대신 cv2.transpose(주대각선 기준 뒤집기)를 뜻하는 표 값
+TRANSPOSE = 'transpose'
+
+# (시계방향 회전, 좌우 반전, 상하 반전) → (cv2.rotate 코드 또는 TRANSPOSE, cv2.flip 코드), None은 생략
+# 좌우+상하 반전은 180도 회전과 같으므로 회전 코드 하나로 합치고,
+# 90도+좌우 반전과 270도+상하 반전은 전치 한 번으로 합친다.
+# 90도+상하 반전과 270도+좌우 반전은 전치 + 180도 회전이라 연산 2번이 남는다.
+ORIENT_OPS: Dict[Tuple[int, bool, bool], Tuple[Optional[Union[int, str]], Optional[int]]] = {
+    (0, False, False): (None, None),
+    (0, True, False): (None, 1),
+    (0, False, True): (None, 0),
+    (0, True, True): (cv2.ROTATE_180, None),
+    (90, False, False): (cv2.ROTATE_90_CLOCKWISE, None),
+    (90, True, False): (TRANSPOSE, None),
+    (90, False, True): (cv2.ROTATE_90_CLOCKWISE, 0),
+    (90, True, True): (cv2.ROTATE_90_COUNTERCLOCKWISE, None),
+    (180, False, False): (cv2.ROTATE_180, None),
+    (180, True, False): (None, 0),
+    (180, False, True): (None, 1),
+    (180, True, True): (None, None),
+    (270, False, False): (cv2.ROTATE_90_COUNTERCLOCKWISE, None),
+    (270, True, False): (cv2.ROTATE_90_COUNTERCLOCKWISE, 1),
+    (270, False, True): (TRANSPOSE, None),
+    (270, True, True): (cv2.ROTATE_90_CLOCKWISE, None),
+}
+
+
+def orient(frame: np.ndarray, rotation: int = 0, flip_h: bool = False,
+           flip_v: bool = False) -> np.ndarray:
+    """
+    회전(시계방향) 후 좌우/상하 반전한 프레임 (ORIENT_OPS 표의 연산을 적용)
+
+    변환이 없으면 원본을 그대로 반환한다 (복사하지 않음).
+
+    Args:
+        frame: 원본 프레임
+        rotation: 시계방향 회전 각도 (0, 90, 180, 270)
+        flip_h: 좌우 반전
+        flip_v: 상하 반전
+    """
+    try:
+        rotate_code, flip_code = ORIENT_OPS[(rotation % 360, bool(flip_h), bool(flip_v))]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 회전 각도: {rotation}") from None
+    if rotate_code == TRANSPOSE:
+        frame = cv2.transpose(frame)
+    elif rotate_code is not None:
+        frame = cv2.rotate(frame, rotate_code)
+    if flip_code is not None:
+        frame = cv2.flip(frame, flip_code)
+    return frame
+
+
+def fit_size(width: int, height: int, max_width: int, max_height: int) -> Tuple[int, int]:
+    """비율을 유지하며 (max_width, max_height) 안에 들어가는 크기 (최소 1픽셀)"""
+    if width <= 0 or height <= 0 or max_width <= 0 or max_height <= 0:
+        return (0, 0)
+    scale = min(max_width / width, max_height / height)
+    return (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+
+
+class FrameFitter:
+    """표시 영역에 맞춘 프레임 축소 (출력 버퍼 재사용)
+
+    2배 이상 줄일 때는 정수 배율 INTER_AREA(OpenCV 빠른 경로)로 먼저 줄이고 나머지를
+    INTER_LINEAR로 맞춘다. 임의 배율 INTER_AREA보다 수 배 빠르고 앨리어싱도 거의 없다.
+    반환하는 배열은 다음 fit() 호출에서 덮어쓰므로, 바로 QImage/QPixmap으로 복사해 쓴다.
+    """
+
+    def __init__(self):
+        self._buffers = {}  # 용도 → 재사용 버퍼
+
+    def _buffer(self, key: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._buffers[key] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def fit(self, frame: np.ndarray, max_width: int, max_height: int) -> Optional[np.ndarray]:
+        """
+        비율을 유지해 (max_width, max_height) 안에 맞춘 프레임
+
+        Returns:
+            맞춘 프레임 (크기가 같으면 원본), 표시 영역이 없으면 None
+        """
+        h, w = frame.shape[:2]
+        target_w, target_h = fit_size(w, h, max_width, max_height)
+        if target_w == 0:
+            return None
+        if (target_w, target_h) == (w, h):
+            return frame
+
+        factor = min(w // target_w, h // target_h)
+        if factor >= 2:
+            # 정수 배율로 나누어떨어지게 가장자리 몇 픽셀은 버림 (뷰라 복사 없음)
+            mid_w, mid_h = w // factor, h // factor
+            source = frame[:mid_h * factor, :mid_w * factor]
+            mid = self._buffer('mid', (mid_h, mid_w) + frame.shape[2:], frame.dtype)
+            cv2.resize(source, (mid_w, mid_h), dst=mid, interpolation=cv2.INTER_AREA)
+            frame = mid
+            if (mid_w, mid_h) == (target_w, target_h):
+                return mid
+
+        out = self._buffer('out', (target_h, target_w) + frame.shape[2:], frame.dtype)
+        cv2.resize(frame, (target_w, target_h), dst=out, interpolation=cv2.INTER_LINEAR)
+        return out
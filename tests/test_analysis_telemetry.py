@@ -0,0 +1,63 @@
+"""분석 텔레메트리 (analysis_telemetry) 단위 테스트"""
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTelemetryThrottle:
+
+    def test_due_after_interval(self):
+        """보고 주기가 지나야 due"""
+        from src.core.analysis_telemetry import TelemetryThrottle
+
+        clock = FakeClock()
+        throttle = TelemetryThrottle(100, interval=0.1, clock=clock)
+        assert not throttle.due()
+        clock.now += 0.05
+        assert not throttle.due()
+        clock.now += 0.06
+        assert throttle.due()
+
+        throttle.snapshot(10)
+        assert not throttle.due()
+
+    def test_fps_and_eta(self):
+        """처리 속도와 남은 시간 계산 (재개 시작 프레임 제외)"""
+        from src.core.analysis_telemetry import TelemetryThrottle
+
+        clock = FakeClock()
+        throttle = TelemetryThrottle(1000, start_frame=200, clock=clock)
+        clock.now += 2.0
+        telemetry = throttle.snapshot(400, sampled_frames=40, skipped_frames=10,
+                                      stage_seconds={'decode': 0.5})
+
+        assert telemetry.frames_per_second == pytest.approx(100.0)
+        assert telemetry.eta_seconds == pytest.approx(6.0)
+        assert telemetry.elapsed_seconds == pytest.approx(2.0)
+        assert telemetry.progress_ratio == pytest.approx(0.4)
+        assert telemetry.skipped_ratio == pytest.approx(0.25)
+        assert telemetry.stage_seconds == {'decode': 0.5}
+
+    def test_no_eta_before_progress(self):
+        """진행 전에는 ETA 없음"""
+        from src.core.analysis_telemetry import TelemetryThrottle
+
+        clock = FakeClock()
+        throttle = TelemetryThrottle(1000, clock=clock)
+        telemetry = throttle.snapshot(0)
+        assert telemetry.eta_seconds is None
+        assert telemetry.frames_per_second == 0.0
+
+    def test_ratios_with_empty_totals(self):
+        """전체/샘플 프레임이 0이면 비율 0"""
+        from src.core.analysis_telemetry import AnalysisTelemetry
+
+        telemetry = AnalysisTelemetry(processed_frames=0, total_frames=0)
+        assert telemetry.progress_ratio == 0.0
+        assert telemetry.skipped_ratio == 0.0
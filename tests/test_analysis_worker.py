@@ -4,12 +4,12 @@ import pytest
 from unittest.mock import MagicMock, patch
 import numpy as np
 
-# cv2, mediapipe를 미리 모킹하여 import 에러 방지
+# mediapipe를 미리 모킹하여 import 에러 방지
+# cv2는 다른 테스트 모듈에 새지 않도록 이 모듈의 테스트 동안만 모킹 (reset_cv2_mock)
 cv2_mock = MagicMock()
 cv2_mock.CAP_PROP_FRAME_COUNT = 7
 cv2_mock.CAP_PROP_FPS = 5
 mediapipe_mock = MagicMock()
-sys.modules.setdefault('cv2', cv2_mock)
 sys.modules.setdefault('mediapipe', mediapipe_mock)
 sys.modules.setdefault('mediapipe.tasks', mediapipe_mock.tasks)
 sys.modules.setdefault('mediapipe.tasks.python', mediapipe_mock.tasks.python)
@@ -20,11 +20,18 @@ class TestAnalysisWorker:
 
     @pytest.fixture(autouse=True)
     def reset_cv2_mock(self):
-        """각 테스트 전에 cv2 모킹 초기화"""
+        """각 테스트 동안 cv2를 초기화한 모킹으로 교체
+
+        src 모듈은 모킹된 cv2로 다시 import하고, 끝나면 sys.modules를 원래대로 되돌린다.
+        """
         cv2_mock.reset_mock()
         cv2_mock.CAP_PROP_FRAME_COUNT = 7
         cv2_mock.CAP_PROP_FPS = 5
-        yield
+        src_modules = [name for name in sys.modules if name == 'src' or name.startswith('src.')]
+        with patch.dict(sys.modules, {'cv2': cv2_mock}):
+            for name in src_modules:
+                del sys.modules[name]
+            yield
 
     def _make_capture(self, num_frames=10, fps=30.0):
         """cv2.VideoCapture 모킹 생성"""
@@ -35,16 +42,32 @@ class TestAnalysisWorker:
             cv2_mock.CAP_PROP_FPS: fps,
         }.get(prop, 0.0)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        # 프레임마다 내용이 달라야 빈 화면 판별기(PresenceGate)가 추론을 생략하지 않음
+        rng = np.random.default_rng(0)
         call_count = [0]
+        position = [0]
 
         def read_side_effect():
             call_count[0] += 1
-            if call_count[0] <= num_frames:
-                return True, frame.copy()
+            if position[0] < num_frames:
+                position[0] += 1
+                return True, rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
             return False, None
 
+        def grab_side_effect():
+            if position[0] < num_frames:
+                position[0] += 1
+                return True
+            return False
+
+        def set_side_effect(prop, value):
+            if prop == cv2_mock.CAP_PROP_POS_FRAMES:
+                position[0] = int(value)
+            return True
+
         cap.read.side_effect = read_side_effect
+        cap.grab.side_effect = grab_side_effect
+        cap.set.side_effect = set_side_effect
         cap._call_count = call_count
         return cap
 
@@ -71,7 +94,7 @@ class TestAnalysisWorker:
         return result
 
     def test_worker_emits_progress(self):
-        """프레임 처리마다 progress_updated 시그널 emit"""
+        """progress_updated 시그널 emit (마지막은 전체 프레임)"""
         from src.core.analysis_worker import AnalysisWorker
 
         cap = self._make_capture(num_frames=10)
@@ -257,3 +280,405 @@ class TestAnalysisWorker:
             # 10프레임 중 매 2프레임: 0,2,4,6,8 = 5프레임
             assert result.analyzed_frames == 5
             assert result.sample_interval == 2
+
+    def test_worker_grabs_skipped_frames(self):
+        """샘플링으로 건너뛰는 프레임은 디코딩(read) 없이 grab()만 호출"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=10)
+        cv2_mock.VideoCapture.return_value = cap
+        pose_success = self._make_pose_result(success=True)
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.return_value = pose_success
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', sample_interval=3)
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            # 0,3,6,9 프레임만 디코딩, 나머지 6프레임은 grab (+ 끝 확인 1회)
+            assert cap.read.call_count == 4
+            assert cap.grab.call_count == 7
+            result = completed_results[0]
+            assert result.analyzed_frames == 4
+            assert result.total_frames == 10
+
+    def test_worker_seeks_for_large_interval(self):
+        """샘플 간격이 크면 grab 반복 대신 탐색으로 이동"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=300)
+        cv2_mock.VideoCapture.return_value = cap
+        pose_success = self._make_pose_result(success=True)
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.return_value = pose_success
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', sample_interval=100)
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            cap.grab.assert_not_called()
+            seek_targets = [c.args[1] for c in cap.set.call_args_list]
+            assert seek_targets == [100, 200]
+            result = completed_results[0]
+            assert result.analyzed_frames == 3
+            assert result.total_frames == 300
+
+    def test_worker_sample_seconds(self):
+        """초 단위 샘플링은 fps 기준 프레임 간격으로 변환"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=30, fps=10.0)
+        cv2_mock.VideoCapture.return_value = cap
+        pose_success = self._make_pose_result(success=True)
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.return_value = pose_success
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', sample_seconds=0.5)
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            result = completed_results[0]
+            # 10fps × 0.5초 = 5프레임 간격: 0,5,10,15,20,25
+            assert result.sample_interval == 5
+            assert result.analyzed_frames == 6
+
+    def test_interval_from_seconds(self):
+        """초 → 프레임 간격 변환"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        assert AnalysisWorker.interval_from_seconds(1.0, 29.97) == 30
+        assert AnalysisWorker.interval_from_seconds(0.01, 30.0) == 1
+        assert AnalysisWorker.interval_from_seconds(0.0, 30.0) == 1
+        assert AnalysisWorker.interval_from_seconds(1.0, 0.0) == 1
+
+    def test_running_mode_for(self):
+        """샘플 프레임 간격이 추적 초기화 기준 이내일 때만 VIDEO 모드"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        assert AnalysisWorker.running_mode_for(1, 30.0) == 'video'
+        assert AnalysisWorker.running_mode_for(30, 30.0) == 'video'
+        assert AnalysisWorker.running_mode_for(31, 30.0) == 'image'
+        assert AnalysisWorker.running_mode_for(1, 30.0, tracking=False) == 'image'
+        assert AnalysisWorker.frame_timestamp_ms(15, 30.0) == 500
+
+    def test_worker_video_mode_timestamps(self):
+        """VIDEO 모드 감지기에 프레임 시각(ms)을 순서대로 전달"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=6, fps=10.0)
+        cv2_mock.VideoCapture.return_value = cap
+        pose_success = self._make_pose_result(success=True)
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.running_mode = 'video'
+            MockDetector.return_value.detect.return_value = pose_success
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', sample_interval=2, num_poses=1)
+            worker.run()
+
+            assert MockDetector.call_args.kwargs['running_mode'] == 'video'
+            assert MockDetector.call_args.kwargs['num_poses'] == 1
+            timestamps = [c.args[1] for c in MockDetector.return_value.detect.call_args_list]
+            assert timestamps == [0, 200, 400]
+
+    def test_worker_presence_gate_skips_static_empty_frames(self):
+        """사람 없음이 확인된 장면이 그대로면 추론 없이 감지 실패로 집계"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=10)
+        empty = np.zeros((48, 64, 3), dtype=np.uint8)
+        cap.read.side_effect = [(True, empty.copy()) for _ in range(10)] + [(False, None)]
+        cv2_mock.VideoCapture.return_value = cap
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector:
+            MockDetector.return_value.detect.return_value = self._make_pose_result(success=False)
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4')
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+        result = completed_results[0]
+        assert MockDetector.return_value.detect.call_count == 1
+        assert result.skipped_frames == 10
+        assert result.gated_frames == 9
+        assert result.gate_hit_rate == pytest.approx(0.9)
+
+    def test_worker_pipeline_preserves_order(self):
+        """추론 스레드가 여러 개여도 집계는 프레임 순서대로"""
+        import random
+        import time
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=20)
+        position = [0]
+
+        def numbered_read():
+            # 프레임 픽셀 값 = 프레임 번호
+            if position[0] < 20:
+                position[0] += 1
+                return True, np.full((4, 4, 3), position[0] - 1, dtype=np.uint8)
+            return False, None
+
+        cap.read.side_effect = numbered_read
+        cv2_mock.VideoCapture.return_value = cap
+
+        def slow_detect(frame):
+            time.sleep(random.uniform(0, 0.005))
+            result = self._make_pose_result(success=True)
+            result.landmarks[0] = dict(result.landmarks[0], frame=int(frame[0, 0, 0]))
+            return result
+
+        scored = []
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.AngleCalculator') as MockAngle, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.side_effect = slow_detect
+            MockAngle.return_value.calculate_all_angles.side_effect = \
+                lambda landmarks: scored.append(landmarks[0]['frame']) or {}
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', inference_threads=3,
+                                    tracking=False, presence_gate=False)
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            assert MockDetector.call_count == 3
+            assert scored == list(range(20))
+            assert completed_results[0].analyzed_frames == 20
+            assert completed_results[0].total_frames == 20
+
+    @pytest.mark.parametrize('tracking,presence_gate', [(True, False), (False, True)])
+    def test_worker_single_inference_thread_for_ordered_stages(self, tracking, presence_gate):
+        """VIDEO 모드 추적이나 빈 화면 판별을 쓰면 추론 스레드는 하나"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=10)
+        cv2_mock.VideoCapture.return_value = cap
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.return_value = self._make_pose_result(success=True)
+            MockDetector.return_value.running_mode = 'video' if tracking else 'image'
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4', inference_threads=3,
+                                    tracking=tracking, presence_gate=presence_gate)
+            completed_results = []
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            assert MockDetector.call_count == 1
+            assert completed_results[0].total_frames == 10
+
+    def test_worker_pipeline_propagates_error(self):
+        """추론 단계 예외는 error_occurred로 전달되고 자원 해제"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=10)
+        cv2_mock.VideoCapture.return_value = cap
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector:
+            MockDetector.return_value.detect.side_effect = RuntimeError("inference failed")
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4')
+            errors = []
+            completed_results = []
+            worker.error_occurred.connect(lambda msg: errors.append(msg))
+            worker.analysis_completed.connect(lambda r: completed_results.append(r))
+            worker.run()
+
+            assert errors == ["inference failed"]
+            assert completed_results == []
+            cap.release.assert_called_once()
+            MockDetector.return_value.release.assert_called_once()
+
+    def test_worker_reuses_landmark_cache(self, tmp_path):
+        """두 번째 분석은 캐시된 랜드마크로 디코딩/추론 없이 완료"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video" * 10)
+        cache_dir = str(tmp_path / "cache")
+
+        pose_success = self._make_pose_result(success=True)
+        pose_fail = self._make_pose_result(success=False)
+        results = []
+
+        for _ in range(2):
+            cap = self._make_capture(num_frames=10)
+            cv2_mock.VideoCapture.return_value = cap
+
+            with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+                 patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+                 patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+                MockDetector.return_value.detect.side_effect = \
+                    [pose_success, pose_fail] * 5
+                MockRula.return_value.calculate.return_value = self._make_assessment_result()
+                MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+                worker = AnalysisWorker(video_path=str(video_file), cache_dir=cache_dir)
+                worker.analysis_completed.connect(lambda r: results.append(r))
+                worker.run()
+                detect_calls = MockDetector.return_value.detect.call_count
+
+        # 두 번째 실행: 디코딩/추론 없음, 결과 동일
+        assert detect_calls == 0
+        assert cap.read.call_count == 0
+        assert results[0].analyzed_frames == results[1].analyzed_frames == 5
+        assert results[0].skipped_frames == results[1].skipped_frames == 5
+        assert results[1].total_frames == 10
+
+    def test_worker_gated_frames_cached_as_gated(self, tmp_path):
+        """게이트로 추론을 생략한 프레임은 빈 화면 생략으로 캐시되어 재계산 가능, 게이트를 끄면 다시 추론"""
+        from src.core.analysis_worker import AnalysisWorker
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.rescoring import cache_covers
+
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video" * 10)
+        cache_dir = str(tmp_path / "cache")
+        empty = np.zeros((48, 64, 3), dtype=np.uint8)
+        pose_fail = self._make_pose_result(success=False)
+        pose_success = self._make_pose_result(success=True)
+
+        detect_calls = []
+        results = []
+        for presence_gate, detected in ((True, pose_fail), (True, pose_fail),
+                                        (False, pose_success)):
+            cap = self._make_capture(num_frames=10)
+            cap.read.side_effect = [(True, empty.copy()) for _ in range(10)] + [(False, None)]
+            cv2_mock.VideoCapture.return_value = cap
+
+            with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+                 patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+                 patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+                MockDetector.return_value.detect.return_value = detected
+                MockRula.return_value.calculate.return_value = self._make_assessment_result()
+                MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+                worker = AnalysisWorker(video_path=str(video_file), cache_dir=cache_dir,
+                                        presence_gate=presence_gate)
+                worker.analysis_completed.connect(lambda r: results.append(r))
+                worker.run()
+                detect_calls.append(MockDetector.return_value.detect.call_count)
+
+            if len(results) == 1:
+                # 실제로 추론한 첫 프레임만 추론 결과, 나머지는 빈 화면 생략으로 기록
+                cache = LandmarkCache.for_video(cache_dir, str(video_file), 10,
+                                                running_mode='video', roi_tracking=True)
+                assert cache.cached_count == 1
+                assert cache.covers()
+                assert not cache.covers(include_gated=False)
+                cache.close()
+                assert cache_covers(cache_dir, str(video_file), 10, running_mode='video',
+                                    roi_tracking=True)
+                assert not cache_covers(cache_dir, str(video_file), 10, running_mode='video',
+                                        roi_tracking=True, presence_gate=False)
+
+        # 두 번째 실행: 캐시만으로 완료 (빈 화면 생략 수 유지)
+        # 세 번째 실행(게이트 끔): 캐시된 첫 프레임 외에는 모두 추론해서 포즈 감지
+        assert detect_calls == [1, 0, 9]
+        assert results[0].gated_frames == results[1].gated_frames == 9
+        assert results[1].skipped_frames == 10
+        assert results[2].analyzed_frames == 9
+        assert results[2].gated_frames == 0
+
+    def test_worker_cache_keyed_by_detector_options(self, tmp_path):
+        """감지기 옵션이 바뀌면 이전 캐시를 쓰지 않고 다시 추론"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video" * 10)
+        cache_dir = str(tmp_path / "cache")
+        pose_success = self._make_pose_result(success=True)
+
+        detect_calls = []
+        for num_poses in (5, 1):
+            cap = self._make_capture(num_frames=10)
+            cv2_mock.VideoCapture.return_value = cap
+
+            with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+                 patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+                 patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+                MockDetector.return_value.detect.return_value = pose_success
+                MockRula.return_value.calculate.return_value = self._make_assessment_result()
+                MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+                worker = AnalysisWorker(video_path=str(video_file), cache_dir=cache_dir,
+                                        num_poses=num_poses)
+                worker.run()
+                detect_calls.append(MockDetector.return_value.detect.call_count)
+
+        assert detect_calls == [10, 10]
+
+    def test_worker_telemetry_throttled(self):
+        """텔레메트리는 주기적으로만 발생하고 마지막에 전체 상태 보고"""
+        from src.core.analysis_worker import AnalysisWorker
+
+        cap = self._make_capture(num_frames=200)
+        cv2_mock.VideoCapture.return_value = cap
+        pose_success = self._make_pose_result(success=True)
+        pose_fail = self._make_pose_result(success=False)
+
+        with patch('src.core.analysis_worker.PoseDetector') as MockDetector, \
+             patch('src.core.analysis_worker.RULACalculator') as MockRula, \
+             patch('src.core.analysis_worker.REBACalculator') as MockReba:
+
+            MockDetector.return_value.detect.side_effect = [pose_success, pose_fail] * 100
+            MockRula.return_value.calculate.return_value = self._make_assessment_result()
+            MockReba.return_value.calculate.return_value = self._make_assessment_result()
+
+            worker = AnalysisWorker(video_path='/tmp/test.mp4')
+            telemetry = []
+            progress_calls = []
+            worker.telemetry_updated.connect(lambda t: telemetry.append(t))
+            worker.progress_updated.connect(lambda cur, total: progress_calls.append(cur))
+            worker.run()
+
+            # 200프레임이 0.1초 안에 끝나므로 종료 보고 1회 (프레임마다 emit하지 않음)
+            assert len(telemetry) < 10
+            assert len(progress_calls) == len(telemetry)
+            last = telemetry[-1]
+            assert last.processed_frames == last.total_frames == 200
+            assert last.sampled_frames == 200
+            assert last.skipped_frames == 100
+            assert last.skipped_ratio == pytest.approx(0.5)
+            assert set(last.stage_seconds) == {'decode', 'inference', 'scoring'}
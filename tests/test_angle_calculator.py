@@ -140,3 +140,45 @@ class TestAngleCalculator:
         for x, y in base_positions:
             landmarks.append({'x': x, 'y': y, 'z': 0, 'visibility': 1.0})
         return landmarks
+
+
+class TestAngleCalculatorBatch:
+    """배치 각도 계산 테스트"""
+
+    def _to_dicts(self, frame):
+        return [dict(zip(('x', 'y', 'z', 'visibility'), row)) for row in frame.tolist()]
+
+    def test_batch_matches_scalar(self):
+        """배치 결과가 프레임별 calculate_all_angles와 일치"""
+        from src.core.angle_calculator import AngleCalculator, ALL_ANGLE_NAMES
+        calculator = AngleCalculator()
+        rng = np.random.default_rng(0)
+        landmarks = rng.random((50, 33, 4)).astype(np.float32)
+
+        batch = calculator.calculate_angles_batch(landmarks)
+
+        assert batch.shape == (50, len(ALL_ANGLE_NAMES))
+        for i in range(len(landmarks)):
+            scalar = calculator.calculate_all_angles(self._to_dicts(landmarks[i]))
+            assert list(scalar) == list(ALL_ANGLE_NAMES)
+            np.testing.assert_allclose(batch[i], [scalar[name] for name in ALL_ANGLE_NAMES],
+                                       atol=1e-9)
+
+    def test_batch_vertical_trunk_and_xyz_input(self):
+        """(N, 33, 3) 입력 허용, 어깨-엉덩이 높이가 같으면 몸통 굴곡 90°"""
+        from src.core.angle_calculator import AngleCalculator, ALL_ANGLE_NAMES
+        calculator = AngleCalculator()
+        landmarks = np.full((1, 33, 3), 0.5)
+        landmarks[0, 11:13, 0] = (0.4, 0.6)    # 어깨
+        landmarks[0, 23:25, 0] = (0.45, 0.55)  # 엉덩이 (같은 높이)
+
+        batch = calculator.calculate_angles_batch(landmarks)
+        assert batch[0, ALL_ANGLE_NAMES.index('trunk_flexion')] == 90.0
+
+    def test_angles_to_dicts(self):
+        """배치 결과 → 프레임별 딕셔너리"""
+        from src.core.angle_calculator import AngleCalculator, ALL_ANGLE_NAMES
+        rows = AngleCalculator.angles_to_dicts(np.arange(2 * len(ALL_ANGLE_NAMES),
+                                                         dtype=float).reshape(2, -1))
+        assert len(rows) == 2
+        assert rows[1][ALL_ANGLE_NAMES[0]] == len(ALL_ANGLE_NAMES)
@@ -0,0 +1,93 @@
+"""RULA/REBA/OWAS 배치 점수 계산 테스트"""
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+
+def _random_frames(n=300, seed=7):
+    """(N, 33, 4) 랜덤 랜드마크 배열 (분기 전체를 덮도록 넓게 분포)"""
+    rng = np.random.default_rng(seed)
+    return rng.random((n, 33, 4)).astype(np.float32)
+
+
+def _per_frame(calculator, angle_table, frames, **kwargs):
+    """프레임마다 calculate를 호출한 결과 (dict 목록)"""
+    from src.core.angle_calculator import AngleCalculator
+    from src.core.landmarks import LandmarkArray
+    results = []
+    for angles, landmarks in zip(AngleCalculator.angles_to_dicts(angle_table), frames):
+        results.append(asdict(calculator.calculate(angles, LandmarkArray(landmarks), **kwargs)))
+    return results
+
+
+def _assert_batch_matches(batch, expected):
+    for name, values in batch.items():
+        assert len(values) == len(expected)
+        assert values.tolist() == [row[name] for row in expected], name
+
+
+class TestBatchScoring:
+
+    @pytest.mark.parametrize('sensitivity', [0.5, 1.0, 1.7])
+    def test_rula_matches_per_frame(self, sensitivity):
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic import RULACalculator
+        frames = _random_frames()
+        angle_table = AngleCalculator().calculate_angles_batch(frames)
+        calculator = RULACalculator()
+        calculator.detection_sensitivity = sensitivity
+
+        batch = calculator.calculate_batch(angle_table, frames)
+        _assert_batch_matches(batch, _per_frame(calculator, angle_table, frames))
+
+    @pytest.mark.parametrize('sensitivity', [0.5, 1.0, 1.7])
+    def test_reba_matches_per_frame(self, sensitivity):
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic import REBACalculator
+        frames = _random_frames()
+        angle_table = AngleCalculator().calculate_angles_batch(frames)
+        calculator = REBACalculator()
+        calculator.detection_sensitivity = sensitivity
+
+        batch = calculator.calculate_batch(angle_table, frames)
+        _assert_batch_matches(batch, _per_frame(calculator, angle_table, frames))
+
+    @pytest.mark.parametrize('sensitivity,is_sitting', [(1.0, False), (0.6, False), (1.0, True)])
+    def test_owas_matches_per_frame(self, sensitivity, is_sitting):
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic import OWASCalculator
+        frames = _random_frames()
+        angle_table = AngleCalculator().calculate_angles_batch(frames)
+        calculator = OWASCalculator()
+        calculator.detection_sensitivity = sensitivity
+
+        batch = calculator.calculate_batch(angle_table, frames, load_code=2, is_sitting=is_sitting)
+        expected = _per_frame(calculator, angle_table, frames, load_code=2, is_sitting=is_sitting)
+        _assert_batch_matches(batch, expected)
+
+    def test_angle_dict_and_missing_landmarks(self):
+        """각도명 → 배열 딕셔너리 입력, 랜드마크 없음은 calculate(angles, [])와 같음"""
+        from src.core.angle_calculator import AngleCalculator, ALL_ANGLE_NAMES
+        from src.core.ergonomic import RULACalculator, REBACalculator
+        angle_table = AngleCalculator().calculate_angles_batch(_random_frames(50))
+        columns = {name: angle_table[:, i] for i, name in enumerate(ALL_ANGLE_NAMES)}
+
+        for calculator in (RULACalculator(), REBACalculator()):
+            batch = calculator.calculate_batch(columns)
+            expected = [asdict(calculator.calculate(angles, []))
+                        for angles in AngleCalculator.angles_to_dicts(angle_table)]
+            _assert_batch_matches(batch, expected)
+
+    def test_batch_rows(self):
+        """batch_rows는 프레임별 속성 접근 객체를 순서대로 반환"""
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic import RULACalculator
+        frames = _random_frames(5)
+        calculator = RULACalculator()
+        batch = calculator.calculate_batch(AngleCalculator().calculate_angles_batch(frames), frames)
+
+        rows = list(calculator.batch_rows(batch))
+        assert len(rows) == 5
+        assert rows[2].neck_score == batch['neck_score'][2]
+        assert rows[4].risk_level == batch['risk_level'][4]
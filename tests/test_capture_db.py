@@ -0,0 +1,80 @@
+"""SQLite 캡처 저장소(CaptureDatabase) 테스트"""
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def _record(timestamp, **kwargs):
+    from src.core.capture_model import CaptureRecord
+    return CaptureRecord(timestamp=timestamp, frame_number=int(timestamp * 30),
+                         capture_time=datetime(2024, 1, 1, 9, 0, 0), **kwargs)
+
+
+def _model(count):
+    from src.core.capture_model import CaptureDataModel
+    model = CaptureDataModel()
+    for i in range(count):
+        model.add_record(_record(float(i), rula_score=i % 7 + 1, owas_code='2131'))
+    return model
+
+
+class TestCaptureDatabase:
+
+    def test_wal_mode_and_index(self, tmp_path):
+        from src.core.capture_db import CaptureDatabase
+        db = CaptureDatabase(tmp_path / "captures.db")
+        conn = sqlite3.connect(str(tmp_path / "captures.db"))
+
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list('captures')")]
+        assert 'idx_captures_timestamp' in indexes
+        conn.close()
+        db.close()
+
+    def test_full_then_incremental_sync(self, tmp_path):
+        from src.core.capture_db import CaptureDatabase
+        db = CaptureDatabase(tmp_path / "captures.db")
+        model = _model(100)
+
+        assert db.sync(model, Path('.')) == 100
+        assert db.sync(model, Path('.')) == 0
+
+        model.get_record(5).rula_muscle_use_a = 1
+        model.bulk_update({'reba_coupling': 2}, indices=[7, 8])
+        assert db.sync(model, Path('.')) == 3
+
+        model.clear()
+        model.add_record(_record(1.0))
+        assert db.sync(model, Path('.')) == 1
+        assert db.count() == 1
+        db.close()
+
+    def test_paged_load_round_trip(self, tmp_path):
+        from src.core.capture_db import CaptureDatabase
+        db = CaptureDatabase(tmp_path / "captures.db")
+        model = _model(25)
+        db.sync(model, Path('.'))
+
+        pages = list(db.iter_pages(page_size=10))
+        assert [len(page) for page in pages] == [10, 10, 5]
+
+        loaded = db.load(Path('.'), page_size=10)
+        assert [r.to_dict() for r in loaded.iter_records()] == [r.to_dict() for r in model.iter_records()]
+        # 로드한 모델은 짝지어져 있으므로 변경이 없으면 기록할 행이 없음
+        assert db.sync(loaded, Path('.')) == 0
+        db.close()
+
+    def test_deleted_slot_reuse(self, tmp_path):
+        """삭제 후 같은 고유 번호를 재사용해도 이전 행을 지우고 새 행을 기록"""
+        from src.core.capture_db import CaptureDatabase
+        db = CaptureDatabase(tmp_path / "captures.db")
+        model = _model(3)
+        db.sync(model, Path('.'))
+
+        model.delete_record(1)
+        model.add_record(_record(9.0, rula_score=7))
+        assert db.sync(model, Path('.')) == 2
+
+        loaded = CaptureDatabase(tmp_path / "captures.db").load(Path('.'))
+        assert [(r.timestamp, r.rula_score) for r in loaded.iter_records()] == [(0.0, 1), (2.0, 3), (9.0, 7)]
+        db.close()
@@ -36,6 +36,18 @@ class TestCaptureRecordCreation:
         from dataclasses import fields
         assert len(fields(record)) == 85
 
+    def test_capture_record_uses_slots(self):
+        """필드는 슬롯에 저장 (인스턴스 __dict__ 없음), 기본값은 그대로"""
+        record = CaptureRecord(
+            timestamp=1.0,
+            frame_number=30,
+            capture_time=datetime.now(),
+        )
+        assert not hasattr(record, '__dict__')
+        assert record.rula_upper_arm == 0
+        with pytest.raises(AttributeError):
+            record.not_a_field = 1
+
     def test_capture_record_default_manual_fields(self):
         """수동 입력 필드 기본값은 0"""
         record = CaptureRecord(
@@ -714,3 +726,114 @@ class TestCaptureDataModelProjectSerialization:
         assert len(restored) == 2
         assert restored.get_record(0).timestamp == 5.0
         assert restored.get_record(1).timestamp == 10.0
+
+
+def _random_records(n: int, seed: int = 0):
+    """입력 필드를 무작위로 채운 레코드 (경계 밖 값 포함)"""
+    import random
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        records.append(CaptureRecord(
+            timestamp=float(i),
+            frame_number=i * 30,
+            capture_time=datetime(2024, 1, 1),
+            rula_upper_arm=rng.randint(0, 7), rula_lower_arm=rng.randint(0, 4),
+            rula_wrist=rng.randint(0, 5), rula_wrist_twist=rng.randint(0, 3),
+            rula_neck=rng.randint(0, 7), rula_trunk=rng.randint(0, 7), rula_leg=rng.randint(0, 3),
+            rula_muscle_use_a=rng.randint(0, 1), rula_force_load_a=rng.randint(0, 3),
+            rula_muscle_use_b=rng.randint(0, 1), rula_force_load_b=rng.randint(0, 3),
+            reba_neck=rng.randint(0, 4), reba_trunk=rng.randint(0, 6), reba_leg=rng.randint(0, 5),
+            reba_upper_arm=rng.randint(0, 7), reba_lower_arm=rng.randint(0, 3),
+            reba_wrist=rng.randint(0, 4), reba_load_force=rng.randint(0, 3),
+            reba_coupling=rng.randint(0, 3), reba_activity=rng.randint(0, 3),
+            owas_back=rng.randint(1, 4), owas_arms=rng.randint(1, 3),
+            owas_legs=rng.randint(1, 7), owas_load=rng.randint(1, 3),
+            nle_h=rng.choice([0.0, 10.0, 25.0, 40.0, 63.5]), nle_v=rng.uniform(0, 180),
+            nle_d=rng.choice([0.0, 10.0, 25.0, 120.0]), nle_a=rng.uniform(0, 135),
+            nle_f=rng.choice([0.1, 0.35, 1.0, 2.5, 9.0, 16.0]), nle_c=rng.randint(1, 3),
+            nle_load=rng.choice([0.0, 5.0, 23.0, 40.0]),
+            si_ie=rng.randint(1, 5), si_de=rng.randint(1, 5), si_em=rng.randint(1, 5),
+            si_hwp=rng.randint(1, 5), si_sw=rng.randint(1, 5), si_dd=rng.randint(1, 5),
+        ))
+    return records
+
+
+class TestCaptureDataModelBulkUpdate:
+    """CaptureDataModel 일괄 재계산 테스트"""
+
+    def test_recalculate_all_matches_per_record(self):
+        """일괄 재계산 결과가 레코드별 recalculate_all과 같음"""
+        import copy
+        records = _random_records(300)
+        expected = copy.deepcopy(records)
+        for record in expected:
+            record.recalculate_all()
+
+        model = CaptureDataModel()
+        for record in records:
+            model.add_record(record)
+        model.recalculate_all()
+
+        for actual, want in zip(model.get_all_records(), expected):
+            assert actual.to_dict() == want.to_dict()
+            assert type(actual.rula_score) is int
+            assert type(actual.nle_rwl) is float
+
+    def test_patch_recalculates_only_affected_group(self):
+        """수동 입력 패치는 해당 평가만 다시 계산"""
+        model = CaptureDataModel()
+        for record in _random_records(5):
+            record.recalculate_all()
+            record.nle_risk = 'stale'
+            model.add_record(record)
+        untouched = model.get_record(1).to_dict()
+
+        rows = model.bulk_update({'rula_force_load_a': 3, 'reba_coupling': [0, 1, 2]}, indices=[4, 0, 2])
+
+        assert rows == [4, 0, 2]
+        for row, coupling in zip(rows, [0, 1, 2]):
+            record = model.get_record(row)
+            assert record.rula_force_load_a == 3
+            assert record.reba_coupling == coupling
+            check = CaptureRecord.from_dict(record.to_dict())
+            check.recalculate_rula()
+            check.recalculate_reba()
+            assert (record.rula_score, record.rula_risk) == (check.rula_score, check.rula_risk)
+            assert (record.reba_score, record.reba_risk) == (check.reba_score, check.reba_risk)
+            assert record.nle_risk == 'stale'
+        assert model.get_record(1).to_dict() == untouched
+
+    def test_single_change_notification(self):
+        """레코드 수와 관계없이 변경 알림은 한 번"""
+        model = CaptureDataModel()
+        for record in _random_records(50):
+            model.add_record(record)
+        calls = []
+        model.add_change_listener(calls.append)
+
+        model.bulk_update({'owas_load': 2})
+        assert calls == [list(range(50))]
+
+        model.remove_change_listener(calls.append)
+        model.bulk_update({'owas_load': 3})
+        assert len(calls) == 1
+        assert model.get_record(7).owas_code.endswith('3')
+
+    def test_invalid_patch(self):
+        model = CaptureDataModel()
+        for record in _random_records(3):
+            model.add_record(record)
+
+        with pytest.raises(ValueError):
+            model.bulk_update({'rula_score': 7})
+        with pytest.raises(ValueError):
+            model.bulk_update({'timestamp': 1.0})
+        with pytest.raises(ValueError):
+            model.bulk_update({'no_such_field': 1})
+        with pytest.raises(ValueError):
+            model.bulk_update({'si_ie': [1, 2]})
+        with pytest.raises(ValueError):
+            model.bulk_update({'si_ie': 2}, indices=[1, 1])
+        with pytest.raises(IndexError):
+            model.bulk_update({'si_ie': 2}, indices=[3])
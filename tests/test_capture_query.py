@@ -0,0 +1,152 @@
+"""CaptureDataModel 인덱스 조회(select/query) 테스트"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+_RISKS = ('acceptable', 'investigate', 'change_soon', 'change_now')
+
+
+def _record(timestamp, **kwargs):
+    from src.core.capture_model import CaptureRecord
+    return CaptureRecord(timestamp=timestamp, frame_number=int(timestamp * 30),
+                         capture_time=datetime(2024, 1, 1), **kwargs)
+
+
+def _model(n=400, seed=11):
+    """타임스탬프/점수/위험 수준이 섞인 모델 (같은 타임스탬프 포함)"""
+    from src.core.capture_model import CaptureDataModel, CaptureRecord
+    rng = np.random.default_rng(seed)
+    model = CaptureDataModel()
+    for i in range(n):
+        model.add_record(CaptureRecord(
+            timestamp=float(rng.integers(0, n // 2)) / 10, frame_number=i,
+            capture_time=datetime(2024, 1, 1),
+            rula_score=int(rng.integers(1, 8)), rula_risk=_RISKS[int(rng.integers(0, 4))],
+            reba_score=int(rng.integers(1, 16)), nle_li=float(rng.random() * 3),
+        ))
+    return model
+
+
+def _scan(model, start=None, end=None, risk_levels=None, scores=None):
+    """전체 순회로 구한 기대 인덱스"""
+    result = []
+    for i, record in enumerate(model.iter_records()):
+        if start is not None and record.timestamp < start:
+            continue
+        if end is not None and record.timestamp > end:
+            continue
+        if any(getattr(record, name) not in ([levels] if isinstance(levels, str) else levels)
+               for name, levels in (risk_levels or {}).items()):
+            continue
+        if any((low is not None and getattr(record, name) < low)
+               or (high is not None and getattr(record, name) > high)
+               for name, (low, high) in (scores or {}).items()):
+            continue
+        result.append(i)
+    return result
+
+
+_CRITERIA = [
+    {},
+    {'start': 5.0, 'end': 12.0},
+    {'end': 3.0},
+    {'risk_levels': {'rula_risk': 'change_now'}},
+    {'risk_levels': {'rula_risk': ['investigate', 'change_soon']}, 'start': 10.0},
+    {'scores': {'rula_score': (5, None)}},
+    {'scores': {'reba_score': (4, 9), 'nle_li': (None, 1.0)}, 'end': 15.0},
+    {'risk_levels': {'rula_risk': 'acceptable'}, 'scores': {'reba_score': (10, 15)}},
+]
+
+
+class TestCaptureQuery:
+
+    @pytest.mark.parametrize('criteria', _CRITERIA)
+    def test_select_matches_scan(self, criteria):
+        model = _model()
+        assert model.select(**criteria).tolist() == _scan(model, **criteria)
+
+    def test_indexes_follow_updates(self):
+        """추가/수정/삭제/일괄 수정 후에도 인덱스 결과가 전체 순회와 같음"""
+        model = _model()
+
+        view = model.get_record(10)
+        view.rula_score = 7
+        view.rula_risk = 'change_now'
+        model.update_record(20, _record(model.get_record(20).timestamp,
+                                        rula_score=1, rula_risk='acceptable'))
+        for index in (300, 150, 0):
+            model.delete_record(index)
+        model.add_record(_record(7.5, rula_score=6, rula_risk='change_soon'))
+        model.bulk_update({'rula_upper_arm': 4, 'rula_trunk': 3}, indices=range(0, 40, 3))
+        model.bulk_update({'reba_load_force': 2})
+
+        for criteria in _CRITERIA:
+            assert model.select(**criteria).tolist() == _scan(model, **criteria), criteria
+
+    def test_query_is_lazy_iterator(self):
+        model = _model(50)
+        result = model.query(scores={'rula_score': (7, 7)})
+
+        assert iter(result) is result
+        records = list(result)
+        assert [r.rula_score for r in records] == [7] * len(records)
+        assert [r.timestamp for r in records] == sorted(r.timestamp for r in records)
+
+    def test_unknown_risk_level_and_empty_model(self):
+        from src.core.capture_model import CaptureDataModel
+        model = _model(50)
+        assert model.select(risk_levels={'rula_risk': 'no_such_level'}).tolist() == []
+        assert CaptureDataModel().select(start=1.0, scores={'rula_score': (1, 7)}).tolist() == []
+
+    def test_non_indexed_field(self):
+        model = _model(10)
+        with pytest.raises(ValueError):
+            model.select(scores={'rula_upper_arm': (1, 2)})
+        with pytest.raises(ValueError):
+            model.select(risk_levels={'rula_score': 'high'})
+
+    def test_clear_keeps_indexes(self):
+        model = _model(20)
+        model.clear()
+        model.add_record(_record(1.0, rula_score=3))
+
+        assert model.select(scores={'rula_score': (3, 3)}).tolist() == [0]
+
+
+class TestSpreadsheetFilter:
+
+    @pytest.fixture
+    def widget(self):
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([])
+        from src.ui.capture_spreadsheet_widget import CaptureSpreadsheetWidget
+        widget = CaptureSpreadsheetWidget()
+        yield widget
+        widget.deleteLater()
+        app.processEvents()
+
+    @staticmethod
+    def _hidden(widget):
+        return [widget._table.isRowHidden(row) for row in range(widget._table.rowCount())]
+
+    def test_filter_reapplied_after_add_and_delete(self, widget, monkeypatch):
+        for timestamp, score in ((1.0, 2), (2.0, 6), (3.0, 3)):
+            widget.add_record(_record(timestamp, rula_score=score))
+        assert widget.filter_rows(scores={'rula_score': (5, 7)}) == 1
+        assert self._hidden(widget) == [True, False, True]
+
+        # 조건에 맞지 않는 새 행은 숨김, 맞는 행은 표시
+        widget.add_record(_record(0.5, rula_score=1))
+        widget.add_record(_record(2.5, rula_score=7))
+        assert self._hidden(widget) == [True, True, False, False, True]
+
+        # 삭제 후에도 필터 유지
+        monkeypatch.setattr(
+            'src.ui.capture_spreadsheet_widget.CustomDialog.ask', lambda *a, **k: True)
+        widget._delete_row(2)
+        assert self._hidden(widget) == [True, True, False, True]
+
+        widget.clear_filter()
+        widget.add_record(_record(4.0, rula_score=1))
+        assert not any(self._hidden(widget))
@@ -0,0 +1,168 @@
+"""캡처 열 저장소(ColumnStore) 및 CaptureDataModel 뷰 테스트"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+
+def _record(timestamp, **kwargs):
+    from src.core.capture_model import CaptureRecord
+    return CaptureRecord(timestamp=timestamp, frame_number=int(timestamp * 30),
+                         capture_time=datetime(2024, 1, 1, 9, 0, 0), **kwargs)
+
+
+class TestColumnStore:
+
+    def _store(self):
+        from src.core.capture_store import ColumnStore
+        return ColumnStore({'timestamp': float, 'score': int, 'risk': str, 'path': object},
+                           sort_key='timestamp', capacity=2)
+
+    def test_sorted_insert_and_growth(self):
+        """정렬 위치에 삽입하고 용량이 부족하면 늘림"""
+        store = self._store()
+        positions = [store.insert({'timestamp': t, 'score': i, 'risk': 'low', 'path': None})
+                     for i, t in enumerate([5.0, 1.0, 9.0, 5.0, 3.0])]
+
+        assert positions == [0, 0, 2, 1, 1]   # bisect_left와 같은 위치
+        assert len(store) == 5
+        keys = [store.get(store.slot_at(i), 'timestamp') for i in range(5)]
+        assert keys == [1.0, 3.0, 5.0, 5.0, 9.0]
+
+    def test_interned_strings_and_python_values(self):
+        store = self._store()
+        for t in range(4):
+            store.insert({'timestamp': float(t), 'score': t, 'risk': 'high' if t % 2 else 'low',
+                          'path': f'/img/{t}.png'})
+
+        slot = store.slot_at(3)
+        assert store.get(slot, 'risk') == 'high'
+        assert type(store.get(slot, 'score')) is int
+        assert store._pools['risk'].values == ['low', 'high']
+        assert store.column('risk', store.slots()).tolist() == ['low', 'high', 'low', 'high']
+
+    def test_delete_reuses_slot(self):
+        store = self._store()
+        for t in (1.0, 2.0, 3.0):
+            store.insert({'timestamp': t, 'score': 0, 'risk': '', 'path': 'x'})
+        freed = store.slot_at(1)
+        store.delete(1)
+
+        assert len(store) == 2
+        assert store.insert({'timestamp': 2.5, 'score': 7, 'risk': '', 'path': None}) == 1
+        assert store.slot_at(1) == freed
+        assert store.row(freed) == {'timestamp': 2.5, 'score': 7, 'risk': '', 'path': None}
+
+    def test_set_column_updates_sort_keys(self):
+        store = self._store()
+        for t in (1.0, 2.0, 3.0):
+            store.insert({'timestamp': t, 'score': 0, 'risk': '', 'path': None})
+        store.set_column('timestamp', store.slots([2]), [10.0])
+
+        assert store.insert({'timestamp': 5.0, 'score': 0, 'risk': '', 'path': None}) == 2
+
+
+class TestCaptureDataModelStore:
+
+    def test_view_writes_through(self):
+        """get_record 뷰에 쓰면 update_record 없이도 모델에 반영"""
+        from src.core.capture_model import CaptureDataModel, CaptureRecord
+        model = CaptureDataModel()
+        model.add_record(_record(1.0))
+        model.add_record(_record(2.0))
+
+        record = model.get_record(1)
+        assert isinstance(record, CaptureRecord)
+        record.rula_muscle_use_a = 1
+        record.recalculate_rula()
+
+        assert model.get_record(1).rula_muscle_use_a == 1
+        assert model.get_record(1).rula_score == record.rula_score
+        assert model.get_record(1).rula_risk == record.rula_risk != ''
+
+    def test_view_equals_detached_record(self):
+        from src.core.capture_model import CaptureDataModel
+        model = CaptureDataModel()
+        original = _record(1.0, rula_risk='investigate', video_frame_path='/a.png')
+        model.add_record(original)
+
+        view = model.get_record(0)
+        assert view == original
+        assert original == view
+        assert view.detach() == original
+        assert view.to_dict() == original.to_dict()
+
+    def test_view_after_delete_raises(self):
+        """삭제된 레코드의 뷰는 슬롯을 재사용한 레코드를 읽거나 쓰지 않음"""
+        from src.core.capture_model import CaptureDataModel, StaleRecordError
+        model = CaptureDataModel()
+        model.add_record(_record(1.0))
+        model.add_record(_record(2.0))
+
+        stale = model.get_record(0)
+        kept = model.get_record(1)
+        model.delete_record(0)
+        model.add_record(_record(3.0))  # 삭제된 슬롯 재사용
+
+        assert not stale.is_valid
+        with pytest.raises(StaleRecordError):
+            _ = stale.timestamp
+        with pytest.raises(StaleRecordError):
+            stale.rula_score = 7
+        assert [r.timestamp for r in model.get_all_records()] == [2.0, 3.0]
+        assert kept.is_valid and kept.timestamp == 2.0
+
+        model.clear()
+        model.add_record(_record(4.0))
+        assert not kept.is_valid
+
+    def test_added_record_is_copied(self):
+        """add_record 이후 원본 객체를 바꿔도 모델은 바뀌지 않음"""
+        from src.core.capture_model import CaptureDataModel
+        model = CaptureDataModel()
+        original = _record(1.0)
+        model.add_record(original)
+        original.rula_score = 7
+
+        assert model.get_record(0).rula_score == 0
+
+    def test_load_from_other_model(self):
+        """다른 모델의 뷰를 추가해도 값이 복사됨"""
+        from src.core.capture_model import CaptureDataModel
+        source = CaptureDataModel()
+        for t in (3.0, 1.0, 2.0):
+            source.add_record(_record(t, owas_code='2131'))
+        target = CaptureDataModel()
+        for record in source.get_all_records():
+            target.add_record(record)
+        source.clear()
+
+        assert [r.timestamp for r in target.get_all_records()] == [1.0, 2.0, 3.0]
+        assert target.get_record(2).owas_code == '2131'
+
+    def test_memory_is_small(self):
+        """레코드당 열 저장 크기가 1KB 미만"""
+        from src.core.capture_model import CaptureDataModel
+        model = CaptureDataModel()
+        for i in range(2000):
+            model.add_record(_record(float(i), rula_risk='acceptable'))
+
+        assert len(model) == 2000
+        assert model.memory_usage() / len(model) < 1024
+
+    def test_record_has_slots(self):
+        from src.core.capture_model import CaptureRecord
+        assert not hasattr(_record(1.0), '__dict__')
+        assert '__slots__' in CaptureRecord.__dict__
+
+    def test_bulk_update_on_columns(self):
+        from src.core.capture_model import CaptureDataModel
+        model = CaptureDataModel()
+        for i in range(10):
+            model.add_record(_record(float(i), rula_upper_arm=3, rula_trunk=2))
+        model.bulk_update({'rula_force_load_a': np.arange(10) % 4})
+
+        expected = model.get_record(9).detach()
+        expected.recalculate_rula()
+        assert model.get_record(9).rula_score == expected.rula_score
+        assert model.get_record(9).rula_force_load_a == 1
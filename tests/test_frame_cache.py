@@ -0,0 +1,196 @@
+"""디코딩된 프레임 캐시 테스트"""
+import threading
+
+import numpy as np
+import pytest
+
+
+def _frame(value, size=10):
+    return np.full((size, size, 3), value, dtype=np.uint8)
+
+
+class _FakeCapture:
+    """프레임 번호를 픽셀 값으로 담은 프레임을 순서대로 내주는 가짜 VideoCapture"""
+
+    def __init__(self, frame_count=100):
+        self.frame_count = frame_count
+        self.position = 0
+        self.reads = []
+        self.seeks = []
+        self.released = False
+
+    def set(self, _prop, value):
+        self.position = int(value)
+        self.seeks.append(self.position)
+        return True
+
+    def grab(self):
+        if self.position >= self.frame_count:
+            return False
+        self.position += 1
+        return True
+
+    def read(self):
+        if self.position >= self.frame_count:
+            return False, None
+        self.reads.append(self.position)
+        frame = _frame(self.position % 256)
+        self.position += 1
+        return True, frame
+
+    def release(self):
+        self.released = True
+
+
+class TestFrameCache:
+
+    def test_get_put(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=10_000)
+        assert cache.get(3) is None
+        cache.put(3, _frame(3))
+        assert cache.get(3)[0, 0, 0] == 3
+        assert 3 in cache and len(cache) == 1
+        assert cache.nbytes == 300
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_frames_become_read_only(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=10_000)
+        frame = _frame(1)
+        cache.put(0, frame)
+        with pytest.raises(ValueError):
+            cache.get(0)[0, 0, 0] = 9
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=900)  # 300바이트 프레임 3장
+        for index in range(3):
+            cache.put(index, _frame(index))
+        cache.get(0)  # 0을 최근 사용으로
+        cache.put(3, _frame(3))
+        assert 1 not in cache
+        assert all(index in cache for index in (0, 2, 3))
+        assert cache.nbytes == 900
+
+    def test_replace_same_index_keeps_byte_count(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=10_000)
+        cache.put(0, _frame(1))
+        cache.put(0, _frame(2))
+        assert len(cache) == 1 and cache.nbytes == 300
+        assert cache.get(0)[0, 0, 0] == 2
+
+    def test_oversized_frame_not_stored(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=100)
+        assert cache.put(0, _frame(0)) is False
+        assert len(cache) == 0
+
+    def test_missing_and_clear(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=10_000)
+        cache.put(2, _frame(2))
+        cache.put(4, _frame(4))
+        assert cache.missing(0, 5) == 3
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+        assert cache.missing(0, 5) == 5
+
+
+class TestFrameBackfiller:
+
+    def _backfiller(self, cache, window=10, frame_count=100):
+        from src.core.frame_cache import FrameBackfiller
+        cap = _FakeCapture(frame_count)
+        return FrameBackfiller(lambda: cap, cache, window), cap
+
+    def test_fills_window_behind_position(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=100_000)
+        backfiller, cap = self._backfiller(cache)
+        try:
+            backfiller.request(50)
+            assert backfiller.wait_idle(5)
+            assert cache.missing(40, 50) == 0
+            assert 50 not in cache
+            # 프레임 번호와 내용이 맞아야 함
+            assert all(cache.get(index)[0, 0, 0] == index for index in range(40, 50))
+            assert cap.seeks == [40]
+            assert backfiller.decoded_frames == 10
+        finally:
+            backfiller.stop()
+        assert cap.released
+
+    def test_skips_cached_frames(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=100_000)
+        for index in (40, 45, 46):
+            cache.put(index, _frame(index))
+        backfiller, cap = self._backfiller(cache)
+        try:
+            backfiller.request(50)
+            assert backfiller.wait_idle(5)
+            assert cache.missing(40, 50) == 0
+            assert 40 not in cap.reads and 45 not in cap.reads
+            assert cap.seeks == [41]
+        finally:
+            backfiller.stop()
+
+    def test_single_steps_back_do_not_refill_every_time(self):
+        """바로 앞 프레임이 있고 빠진 게 절반 미만이면 다시 디코딩하지 않음"""
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=100_000)
+        backfiller, cap = self._backfiller(cache)
+        try:
+            backfiller.request(50)
+            assert backfiller.wait_idle(5)
+            for position in (49, 48, 47):
+                backfiller.request(position)
+                assert backfiller.wait_idle(5)
+            assert cap.seeks == [40]
+
+            # 절반 이상 비면 다시 채움
+            backfiller.request(45)
+            assert backfiller.wait_idle(5)
+            assert cache.missing(35, 45) == 0
+            assert len(cap.seeks) == 2
+        finally:
+            backfiller.stop()
+
+    def test_zero_window_never_starts_thread(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=100_000)
+        backfiller, cap = self._backfiller(cache, window=0)
+        backfiller.request(50)
+        assert backfiller.wait_idle(1)
+        assert cap.reads == []
+        backfiller.stop()
+
+    def test_newer_request_supersedes_running_fill(self):
+        from src.core.frame_cache import FrameCache
+        cache = FrameCache(max_bytes=1_000_000)
+        release = threading.Event()
+        started = threading.Event()
+
+        class _SlowCapture(_FakeCapture):
+            def read(self):
+                started.set()
+                release.wait(5)
+                return super().read()
+
+        from src.core.frame_cache import FrameBackfiller
+        cap = _SlowCapture(1000)
+        backfiller = FrameBackfiller(lambda: cap, cache, window=10)
+        try:
+            backfiller.request(50)
+            assert started.wait(5)
+            backfiller.request(500)  # 먼 곳으로 탐색
+            release.set()
+            assert backfiller.wait_idle(5)
+            assert cache.missing(490, 500) == 0
+            # 이전 구간은 디코딩 중이던 프레임까지만
+            assert cache.missing(40, 50) >= 9
+        finally:
+            release.set()
+            backfiller.stop()
@@ -0,0 +1,91 @@
+"""프레임 표시용 연산 (회전/반전 합성, 표시 크기 축소) 테스트"""
+import cv2
+import numpy as np
+import pytest
+
+
+def _reference(frame, rotation, flip_h, flip_v):
+    """기존 PlayerWidget 변환 (회전 후 반전을 차례로 적용)"""
+    if rotation == 90:
+        frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+    elif rotation == 180:
+        frame = cv2.rotate(frame, cv2.ROTATE_180)
+    elif rotation == 270:
+        frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    if flip_h:
+        frame = cv2.flip(frame, 1)
+    if flip_v:
+        frame = cv2.flip(frame, 0)
+    return frame
+
+
+class TestOrient:
+
+    def test_matches_sequential_transforms(self):
+        from src.utils.frame_ops import orient
+        frame = np.random.default_rng(3).integers(0, 255, (5, 7, 3), dtype=np.uint8)
+        for rotation in (0, 90, 180, 270):
+            for flip_h in (False, True):
+                for flip_v in (False, True):
+                    result = orient(frame, rotation, flip_h, flip_v)
+                    expected = _reference(frame, rotation, flip_h, flip_v)
+                    assert np.array_equal(result, expected), (rotation, flip_h, flip_v)
+                    assert result.flags['C_CONTIGUOUS']
+
+    def test_orient_table_matches_sequential(self):
+        """ORIENT_OPS 표의 16가지 조합이 회전 후 반전을 차례로 적용한 결과와 같음"""
+        from src.utils.frame_ops import ORIENT_OPS, TRANSPOSE
+        frame = np.arange(2 * 3, dtype=np.uint8).reshape(2, 3)
+        assert len(ORIENT_OPS) == 16
+        for (rotation, flip_h, flip_v), (rotate_code, flip_code) in ORIENT_OPS.items():
+            result = frame
+            if rotate_code == TRANSPOSE:
+                result = cv2.transpose(result)
+            elif rotate_code is not None:
+                result = cv2.rotate(result, rotate_code)
+            if flip_code is not None:
+                result = cv2.flip(result, flip_code)
+            expected = _reference(frame, rotation, flip_h, flip_v)
+            assert np.array_equal(result, expected), (rotation, flip_h, flip_v)
+
+    def test_orient_table_op_count(self):
+        """전치 + 180도 회전인 두 조합만 OpenCV 연산 2번"""
+        from src.utils.frame_ops import ORIENT_OPS
+        two_ops = {key for key, ops in ORIENT_OPS.items() if None not in ops}
+        assert two_ops == {(90, False, True), (270, True, False)}
+
+    def test_invalid_rotation(self):
+        from src.utils.frame_ops import orient
+        with pytest.raises(ValueError):
+            orient(np.zeros((2, 3), dtype=np.uint8), 45)
+
+    def test_identity_returns_original(self):
+        from src.utils.frame_ops import orient
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        assert orient(frame) is frame
+
+
+class TestFrameFitter:
+
+    def test_fits_keeping_aspect_and_reuses_buffer(self):
+        from src.utils.frame_ops import FrameFitter
+        fitter = FrameFitter()
+        frame = np.full((2160, 3840, 3), 200, dtype=np.uint8)
+
+        first = fitter.fit(frame, 1200, 700)
+        assert first.shape == (675, 1200, 3)
+        assert int(first.mean()) == 200
+        assert fitter.fit(frame, 1200, 700) is first
+
+    def test_integer_factor_and_upscale(self):
+        from src.utils.frame_ops import FrameFitter
+        fitter = FrameFitter()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        assert fitter.fit(frame, 320, 240).shape == (240, 320, 3)
+        assert fitter.fit(frame, 1280, 2000).shape == (960, 1280, 3)
+        assert fitter.fit(frame, 640, 480) is frame
+
+    def test_empty_area(self):
+        from src.utils.frame_ops import FrameFitter
+        assert FrameFitter().fit(np.zeros((10, 10, 3), dtype=np.uint8), 0, 100) is None
@@ -0,0 +1,205 @@
+"""키프레임 색인 테스트"""
+import numpy as np
+import pytest
+
+
+def _index(frame_count=100, gop=12, fps=30.0):
+    from src.core.keyframe_index import KeyframeIndex
+    timestamps = np.arange(frame_count) * 1000.0 / fps
+    return KeyframeIndex(timestamps, np.arange(0, frame_count, gop))
+
+
+class _FakeCapture:
+    """탐색 위치를 일정하게 빗나가는 가짜 VideoCapture
+
+    OpenCV처럼 탐색 후 목표 직전 프레임까지 디코딩한 상태가 되고,
+    get()은 (속성과 관계없이) 마지막으로 디코딩된 프레임 시각을 돌려준다.
+    """
+
+    def __init__(self, index, seek_error=0, frame_count=100):
+        self.index = index
+        self.seek_error = seek_error
+        self.frame_count = frame_count
+        self.position = 0
+        self.seeks = []
+        self.grabs = 0
+
+    def set(self, _prop, value):
+        self.seeks.append(int(value))
+        self.position = max(0, int(value) + self.seek_error) if value else 0
+        return True
+
+    def get(self, _prop):
+        return self.index.timestamp_ms(self.position - 1) or 0.0
+
+    def grab(self):
+        if self.position >= self.frame_count:
+            return False
+        self.position += 1
+        self.grabs += 1
+        return True
+
+
+class TestKeyframeIndex:
+
+    def test_keyframe_before(self):
+        index = _index()
+        assert index.keyframe_before(0) == 0
+        assert index.keyframe_before(11) == 0
+        assert index.keyframe_before(12) == 12
+        assert index.keyframe_before(50) == 48
+        assert index.keyframe_before(1000) == 96
+
+    def test_first_frame_is_always_keyframe(self):
+        from src.core.keyframe_index import KeyframeIndex
+        index = KeyframeIndex(np.arange(10) * 40.0, [5])
+        assert list(index.keyframes) == [0, 5]
+
+    def test_frame_at_ms(self):
+        index = _index()
+        assert index.frame_at_ms(0.0) == 0
+        assert index.frame_at_ms(1000.0) == 30
+        assert index.frame_at_ms(1005.0) == 30
+        assert index.frame_at_ms(10_000.0) is None
+        assert index.timestamp_ms(30) == pytest.approx(1000.0)
+        assert index.timestamp_ms(100) is None
+
+    def test_save_load_roundtrip(self, tmp_path):
+        from src.core.keyframe_index import KeyframeIndex
+        index = _index()
+        path = str(tmp_path / 'sub' / 'video.keyframes.npz')
+        index.save(path)
+        loaded = KeyframeIndex.load(path)
+        assert loaded.frame_count == 100
+        assert np.array_equal(loaded.keyframes, index.keyframes)
+        assert np.array_equal(loaded.timestamps_ms, index.timestamps_ms)
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        from src.core.keyframe_index import KeyframeIndex
+        assert KeyframeIndex.load(str(tmp_path / 'none.npz')) is None
+        broken = tmp_path / 'broken.keyframes.npz'
+        broken.write_bytes(b'not an npz')
+        assert KeyframeIndex.load(str(broken)) is None
+
+
+class TestSeekFrame:
+
+    def test_seeks_to_keyframe_and_grabs_forward(self):
+        from src.core.keyframe_index import seek_frame
+        index = _index()
+        cap = _FakeCapture(index)
+        assert seek_frame(cap, 50, index) == 50
+        assert cap.seeks == [48]
+        assert cap.grabs == 2
+        assert cap.position == 50
+
+    def test_corrects_seek_that_lands_short(self):
+        from src.core.keyframe_index import seek_frame
+        index = _index()
+        cap = _FakeCapture(index, seek_error=-3)
+        assert seek_frame(cap, 50, index) == 50
+        assert cap.position == 50
+
+    def test_retries_earlier_keyframe_when_seek_overshoots(self):
+        from src.core.keyframe_index import seek_frame
+        index = _index()
+        cap = _FakeCapture(index, seek_error=5)
+        assert seek_frame(cap, 50, index) == 50
+        assert cap.seeks == [48, 36]
+        assert cap.position == 50
+
+    def test_without_index_uses_plain_seek(self):
+        from src.core.keyframe_index import seek_frame
+        cap = _FakeCapture(_index())
+        assert seek_frame(cap, 50) == 50
+        assert cap.seeks == [50] and cap.grabs == 0
+
+    def test_skip_to_frame_uses_index(self):
+        from src.core.analysis_worker import skip_to_frame
+        index = _index()
+        cap = _FakeCapture(index, seek_error=-2)
+        assert skip_to_frame(cap, 0, 70, 100, seek_min_interval=60, index=index) == (70, True)
+        assert cap.position == 70
+
+
+class TestKeyframeIndexVideo:
+
+    @pytest.fixture
+    def sample_video_path(self, tmp_path):
+        import cv2
+        video_path = tmp_path / "test_video.mp4"
+        out = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*'mp4v'), 30, (160, 120))
+        for i in range(90):
+            frame = np.full((120, 160, 3), i * 2, dtype=np.uint8)
+            out.write(frame)
+        out.release()
+        return str(video_path)
+
+    def test_build_and_sidecar(self, sample_video_path, tmp_path, monkeypatch):
+        from src.core.keyframe_index import KeyframeIndex
+        index_dir = str(tmp_path / 'index')
+        index = KeyframeIndex.for_video(index_dir, sample_video_path)
+        assert index is not None
+        assert index.frame_count == 90
+        assert index.keyframes[0] == 0 and len(index.keyframes) > 1
+        assert np.all(np.diff(index.timestamps_ms) > 0)
+
+        # 두 번째부터는 사이드카에서 로드
+        monkeypatch.setattr(KeyframeIndex, 'build', classmethod(lambda cls, *a, **k: None))
+        again = KeyframeIndex.for_video(index_dir, sample_video_path)
+        assert np.array_equal(again.keyframes, index.keyframes)
+
+    def test_unindexable_video_is_not_rescanned(self, sample_video_path, tmp_path, monkeypatch):
+        """색인을 만들 수 없으면 표시 파일을 남기고 다음부터 다시 훑지 않음 (취소는 제외)"""
+        from src.core.keyframe_index import KeyframeIndex
+        index_dir = str(tmp_path / 'index')
+        calls = []
+
+        def build(cls, video_path, is_cancelled=None):
+            calls.append(video_path)
+            return None
+
+        monkeypatch.setattr(KeyframeIndex, 'build', classmethod(build))
+        assert KeyframeIndex.for_video(index_dir, sample_video_path, lambda: True) is None
+        assert KeyframeIndex.for_video(index_dir, sample_video_path) is None
+        assert KeyframeIndex.for_video(index_dir, sample_video_path) is None
+        assert len(calls) == 2
+
+    def test_cached_does_not_build(self, sample_video_path, tmp_path):
+        from src.core.keyframe_index import KeyframeIndex
+        index_dir = str(tmp_path / 'index')
+        assert KeyframeIndex.cached(index_dir, sample_video_path) is None
+        index = KeyframeIndex.for_video(index_dir, sample_video_path)
+        assert KeyframeIndex.cached(index_dir, sample_video_path).frame_count == index.frame_count
+
+    def test_seek_matches_sequential_decode(self, sample_video_path, tmp_path):
+        import cv2
+        from src.core.keyframe_index import KeyframeIndex, seek_frame
+        index = KeyframeIndex.build(sample_video_path)
+
+        cap = cv2.VideoCapture(sample_video_path)
+        expected = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            expected.append(frame)
+
+        for target in (5, 12, 37, 60, 89):
+            assert seek_frame(cap, target, index) == target
+            ret, frame = cap.read()
+            assert ret and np.array_equal(frame, expected[target])
+        cap.release()
+
+    def test_video_player_loads_index_in_background(self, sample_video_path, tmp_path):
+        from src.core.video_player import VideoPlayer
+        player = VideoPlayer(index_dir=str(tmp_path / 'index'))
+        try:
+            assert player.load(sample_video_path)
+            assert player.indexer.join(10)
+            assert player.keyframe_index is not None
+            player.seek(50)
+            assert player.read_frame() is not None
+        finally:
+            player.release()
+        assert player.keyframe_index is None
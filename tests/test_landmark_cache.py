@@ -0,0 +1,176 @@
+"""랜드마크 디스크 캐시 (landmark_cache) 단위 테스트"""
+import sys
+import pytest
+from unittest.mock import MagicMock
+import numpy as np
+
+# mediapipe를 미리 모킹하여 import 에러 방지
+mediapipe_mock = MagicMock()
+sys.modules.setdefault('mediapipe', mediapipe_mock)
+sys.modules.setdefault('mediapipe.tasks', mediapipe_mock.tasks)
+sys.modules.setdefault('mediapipe.tasks.python', mediapipe_mock.tasks.python)
+sys.modules.setdefault('mediapipe.tasks.python.vision', mediapipe_mock.tasks.python.vision)
+
+
+def _landmarks(offset=0.0):
+    return [{'x': 0.01 * i + offset, 'y': 0.5, 'z': -0.1, 'visibility': 0.75} for i in range(33)]
+
+
+class TestLandmarkCache:
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"fake video content" * 100)
+        return str(path)
+
+    def test_put_get_roundtrip(self, tmp_path):
+        """감지 결과 저장 후 같은 값으로 복원"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        cache = LandmarkCache(str(tmp_path / "cache"), 10)
+        cache.put(3, PoseResult(pose_detected=True, landmarks=_landmarks()))
+
+        result = cache.get(3)
+        assert result.pose_detected
+        assert len(result.landmarks) == 33
+        assert result.landmarks[5]['x'] == pytest.approx(0.05)
+        assert result.landmarks[5]['visibility'] == pytest.approx(0.75)
+        assert cache.get(4) is None
+
+    def test_world_landmarks_roundtrip(self, tmp_path):
+        """월드 랜드마크도 저장하고, 없던 프레임은 None으로 복원"""
+        import os
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        path = str(tmp_path / "cache")
+        cache = LandmarkCache(path, 10)
+        world = [{'x': 0.1, 'y': -0.2 + i * 0.01, 'z': 0.05, 'visibility': 0.9} for i in range(33)]
+        cache.put(2, PoseResult(pose_detected=True, landmarks=_landmarks(), world_landmarks=world))
+        cache.put(3, PoseResult(pose_detected=True, landmarks=_landmarks()))
+
+        assert cache.get(2).world_landmarks[4]['y'] == pytest.approx(-0.16)
+        assert cache.get(3).world_landmarks is None
+
+        # 월드 랜드마크 파일이 없는 이전 형식 캐시도 그대로 열림
+        cache.close()
+        os.remove(path + '.world.npy')
+        reopened = LandmarkCache(path, 10)
+        assert reopened.cached_count == 2
+        assert reopened.get(2).world_landmarks is None
+        assert reopened.get(2).landmarks[5]['x'] == pytest.approx(0.05)
+
+    def test_no_pose_is_cached(self, tmp_path):
+        """포즈 미감지도 처리 완료로 기록"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        cache = LandmarkCache(str(tmp_path / "cache"), 10)
+        cache.put(0, PoseResult(pose_detected=False))
+
+        assert cache.has(0)
+        assert cache.get(0).pose_detected is False
+        assert cache.cached_count == 1
+
+    def test_out_of_range_ignored(self, tmp_path):
+        """범위 밖 프레임은 무시"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        cache = LandmarkCache(str(tmp_path / "cache"), 5)
+        cache.put(5, PoseResult(pose_detected=False))
+        assert not cache.has(5)
+        assert not cache.has(-1)
+
+    def test_persists_across_reopen(self, tmp_path, video_file):
+        """다시 열어도 저장된 프레임 유지"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        cache = LandmarkCache.for_video(str(tmp_path / "cache"), video_file, 20, model_type='full')
+        cache.put(7, PoseResult(pose_detected=True, landmarks=_landmarks(0.1)))
+        cache.close()
+
+        reopened = LandmarkCache.for_video(str(tmp_path / "cache"), video_file, 20, model_type='full')
+        assert reopened.cached_count == 1
+        assert reopened.get(7).landmarks[0]['x'] == pytest.approx(0.1)
+
+    def test_key_depends_on_model_and_transforms(self, tmp_path, video_file):
+        """모델이나 변환이 다르면 다른 캐시"""
+        from src.core.landmark_cache import LandmarkCache
+
+        cache_dir = str(tmp_path / "cache")
+        base = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='lite')
+        other_model = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='heavy')
+        rotated = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='lite',
+                                          transforms={'rotation_angle': 90})
+        identity = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='lite',
+                                           transforms={'rotation_angle': 0,
+                                                       'flip_horizontal': False,
+                                                       'flip_vertical': False})
+
+        assert len({base.path, other_model.path, rotated.path}) == 3
+        assert identity.path == base.path
+
+        # 좌우+상하 반전은 180° 회전과 같은 영상
+        both_flips = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='lite',
+                                             transforms={'rotation_angle': 90,
+                                                         'flip_horizontal': True,
+                                                         'flip_vertical': True})
+        rotated_270 = LandmarkCache.for_video(cache_dir, video_file, 10, model_type='lite',
+                                              transforms={'rotation_angle': -90})
+        assert both_flips.path == rotated_270.path
+
+    def test_fingerprint_uses_content(self, tmp_path, video_file):
+        """경로가 달라도 내용이 같으면 같은 지문"""
+        from src.core.landmark_cache import video_fingerprint
+
+        copy = tmp_path / "copy.mp4"
+        copy.write_bytes(open(video_file, 'rb').read())
+        changed = tmp_path / "changed.mp4"
+        changed.write_bytes(b"other content")
+
+        assert video_fingerprint(str(copy)) == video_fingerprint(video_file)
+        assert video_fingerprint(str(changed)) != video_fingerprint(video_file)
+
+    def test_frame_count_mismatch_recreates(self, tmp_path):
+        """프레임 수가 다르면 새로 생성"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        path = str(tmp_path / "cache")
+        cache = LandmarkCache(path, 10)
+        cache.put(1, PoseResult(pose_detected=False))
+        cache.close()
+
+        resized = LandmarkCache(path, 12)
+        assert resized.frame_count == 12
+        assert resized.cached_count == 0
+
+    def test_key_depends_on_inference_size(self, tmp_path, video_file):
+        """추론 해상도가 다르면 다른 캐시"""
+        from src.core.landmark_cache import LandmarkCache
+
+        cache_dir = str(tmp_path / "cache")
+        full = LandmarkCache.for_video(cache_dir, video_file, 10)
+        small = LandmarkCache.for_video(cache_dir, video_file, 10, inference_size=640)
+        assert full.path != small.path
+
+    def test_key_depends_on_detector_options(self, tmp_path, video_file):
+        """실행 모드/최대 인원/인물 영역 추적이 다르면 다른 캐시"""
+        from src.core.landmark_cache import LandmarkCache
+
+        cache_dir = str(tmp_path / "cache")
+        base = LandmarkCache.for_video(cache_dir, video_file, 10)
+        paths = {
+            base.path,
+            LandmarkCache.for_video(cache_dir, video_file, 10, running_mode='video').path,
+            LandmarkCache.for_video(cache_dir, video_file, 10, num_poses=1).path,
+            LandmarkCache.for_video(cache_dir, video_file, 10, roi_tracking=True).path,
+        }
+        assert len(paths) == 4
+        defaults = LandmarkCache.for_video(cache_dir, video_file, 10, running_mode='image',
+                                           num_poses=5, roi_tracking=False)
+        assert defaults.path == base.path
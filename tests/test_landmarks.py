@@ -0,0 +1,110 @@
+"""LandmarkArray 테스트"""
+import copy
+
+import numpy as np
+import pytest
+
+
+def _dicts(n=33):
+    return [{'x': i * 0.01, 'y': 0.5 + i * 0.005, 'z': -0.1, 'visibility': 0.9} for i in range(n)]
+
+
+class TestLandmarkArray:
+
+    def test_dict_compatible_access(self):
+        """기존 dict 접근 방식 그대로 사용"""
+        from src.core.landmarks import LandmarkArray
+        landmarks = LandmarkArray.from_dicts(_dicts())
+
+        assert len(landmarks) == 33
+        assert landmarks[10]['x'] == pytest.approx(0.1)
+        assert landmarks[10].get('z', 0) == pytest.approx(-0.1)
+        assert landmarks[10].get('missing', 1.5) == 1.5
+        assert landmarks[10].y == pytest.approx(0.55)
+        assert dict(landmarks[0]) == pytest.approx({'x': 0.0, 'y': 0.5, 'z': -0.1, 'visibility': 0.9})
+
+    def test_write_through_view(self):
+        """뷰에 쓰면 배열에 반영"""
+        from src.core.landmarks import LandmarkArray
+        landmarks = LandmarkArray.from_dicts(_dicts())
+        landmarks[3]['x'] = 0.75
+        assert landmarks.array[3, 0] == np.float32(0.75)
+
+    def test_deepcopy_is_independent(self):
+        """deepcopy는 배열 복사 한 번"""
+        from src.core.landmarks import LandmarkArray
+        landmarks = LandmarkArray.from_dicts(_dicts())
+        copied = copy.deepcopy(landmarks)
+        copied[0]['x'] = 0.9
+
+        assert isinstance(copied, LandmarkArray)
+        assert landmarks[0]['x'] == 0.0
+
+    def test_from_mediapipe_clamps_visibility(self):
+        """MediaPipe 랜드마크 변환 시 visibility 하한 적용"""
+        from types import SimpleNamespace
+        from src.core.landmarks import LandmarkArray
+        raw = [SimpleNamespace(x=0.1, y=0.2, z=0.3, visibility=0.2)] * 33
+        landmarks = LandmarkArray.from_mediapipe(raw, min_visibility=0.5)
+
+        assert landmarks.array.shape == (33, 4)
+        assert landmarks.array.dtype == np.float32
+        assert landmarks[0]['visibility'] == 0.5
+
+    def test_to_dicts_round_trip(self):
+        from src.core.landmarks import LandmarkArray
+        landmarks = LandmarkArray.from_dicts(_dicts())
+        assert LandmarkArray.from_dicts(landmarks.to_dicts()) == landmarks
+
+    def test_invalid_shape(self):
+        from src.core.landmarks import LandmarkArray
+        with pytest.raises(ValueError):
+            LandmarkArray(np.zeros((33, 3)))
+
+    def test_angles_and_assessment_match_dict_path(self):
+        """각도 계산/평가 결과가 dict 리스트 입력과 같음"""
+        from src.core.landmarks import LandmarkArray
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic import RULACalculator, REBACalculator
+
+        rng = np.random.default_rng(3)
+        array = LandmarkArray(rng.random((33, 4)).astype(np.float32))
+        dicts = array.to_dicts()
+        calculator = AngleCalculator()
+
+        from_array = calculator.calculate_all_angles(array)
+        from_dicts = calculator.calculate_all_angles(dicts)
+        assert from_array == pytest.approx(from_dicts, abs=1e-9)
+
+        for assessment in (RULACalculator(), REBACalculator()):
+            assert (assessment.calculate(from_array, array).final_score
+                    == assessment.calculate(from_dicts, dicts).final_score)
+
+
+class TestPoseResult:
+
+    def test_world_landmarks_converted_lazily(self):
+        """world_landmarks는 처음 접근할 때 변환"""
+        from types import SimpleNamespace
+        from src.core.landmarks import LandmarkArray
+        from src.core.pose_detector import PoseResult
+
+        # MediaPipe pose_world_landmarks[i]는 Landmark 객체의 일반 list
+        raw = [SimpleNamespace(x=0.1, y=0.2, z=0.3, visibility=0.9) for _ in range(33)]
+        result = PoseResult(pose_detected=True, world_landmarks=raw)
+
+        world = result.world_landmarks
+        assert isinstance(world, LandmarkArray)
+        assert world.array.shape == (33, 4)
+        assert world[0]['z'] == pytest.approx(0.3)
+        assert result.world_landmarks is world
+
+    def test_world_landmarks_from_dicts(self):
+        """dict 목록도 LandmarkArray로 변환"""
+        from src.core.landmarks import LandmarkArray
+        from src.core.pose_detector import PoseResult
+
+        raw = [{'x': 0.1, 'y': 0.2, 'z': 0.3, 'visibility': 0.9} for _ in range(33)]
+        world = PoseResult(pose_detected=True, world_landmarks=raw).world_landmarks
+        assert isinstance(world, LandmarkArray)
+        assert world.to_dicts()[0]['y'] == pytest.approx(0.2)
@@ -0,0 +1,161 @@
+"""실시간 감지 워커 (최신 프레임 우선) 테스트"""
+import threading
+
+import numpy as np
+from PyQt6.QtCore import Qt
+
+
+class _BlockingDetector:
+    """첫 프레임에서 gate가 열릴 때까지 멈추는 감지기"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+        self.resets = 0
+        self.inference_size = 0
+        self.sizes = []  # 감지 시점의 추론 해상도와 호출 스레드
+        self.released_on = None  # release를 호출한 스레드
+
+    def detect(self, image, timestamp_ms=None):
+        from src.core.pose_detector import PoseResult
+        self.calls.append(int(image[0, 0, 0]))
+        self.sizes.append((self.inference_size, threading.current_thread()))
+        self.started.set()
+        self.gate.wait(5)
+        return PoseResult(pose_detected=False, landmarks=None)
+
+    def reset_tracking(self):
+        self.resets += 1
+
+    def release(self):
+        self.released_on = threading.current_thread()
+
+
+def _frame(seq):
+    from src.core.live_detection import LiveFrame
+    return LiveFrame(seq=seq, frame=np.full((4, 4, 3), seq, dtype=np.uint8),
+                     frame_number=seq, timestamp=seq / 30)
+
+
+def _run(detector, submit):
+    """워커를 돌려 submit(worker) 후 결과 순번 목록 반환"""
+    from src.core.live_detection import LiveDetectionWorker
+    worker = LiveDetectionWorker(detector)
+    results = []
+    done = threading.Event()
+
+    def on_ready(detection):
+        results.append(detection.frame.seq)
+        if detection.frame.seq == 5:
+            done.set()
+
+    worker.detection_ready.connect(on_ready, Qt.ConnectionType.DirectConnection)
+    worker.start()
+    try:
+        submit(worker)
+        assert done.wait(5)
+    finally:
+        worker.stop()
+    return worker, results
+
+
+class TestLiveDetectionWorker:
+
+    def test_latest_frame_wins(self, qapp):
+        detector = _BlockingDetector()
+
+        def submit(worker):
+            worker.submit(_frame(1))
+            assert detector.started.wait(5)
+            for seq in range(2, 6):  # 1번 처리 중 도착 → 마지막 것만 남음
+                worker.submit(_frame(seq))
+            detector.gate.set()
+
+        worker, results = _run(detector, submit)
+
+        assert results == [1, 5]
+        assert detector.calls == [1, 5]
+        assert worker.dropped_frames == 3
+
+    def test_result_carries_frame(self, qapp):
+        detector = _BlockingDetector()
+        detector.gate.set()
+
+        def submit(worker):
+            worker.reset_tracking()
+            worker.submit(_frame(5))
+
+        worker, results = _run(detector, submit)
+
+        assert results == [5]
+        assert detector.resets == 1
+        assert worker.dropped_frames == 0
+
+    def test_inference_size_applied_on_worker_thread(self, qapp):
+        detector = _BlockingDetector()
+
+        def submit(worker):
+            worker.submit(_frame(1))
+            assert detector.started.wait(5)
+            # 1번 처리 중 요청 → 감지기는 그대로, 다음 프레임부터 반영
+            worker.set_inference_size(256)
+            assert detector.inference_size == 0
+            worker.submit(_frame(5))
+            detector.gate.set()
+
+        worker, results = _run(detector, submit)
+
+        assert results == [1, 5]
+        assert [size for size, _ in detector.sizes] == [0, 256]
+        assert all(thread is not threading.main_thread() for _, thread in detector.sizes)
+
+    def test_detector_replaced_on_worker_thread(self, qapp):
+        old = _BlockingDetector()
+        new = _BlockingDetector()
+        new.gate.set()
+
+        def submit(worker):
+            worker.submit(_frame(1))
+            assert old.started.wait(5)
+            # 1번 처리 중 교체 요청 → 다음 프레임부터 새 감지기 사용
+            worker.set_detector(new)
+            assert worker.detector is old
+            worker.submit(_frame(5))
+            old.gate.set()
+
+        worker, results = _run(old, submit)
+
+        assert results == [1, 5]
+        assert old.calls == [1]
+        assert new.calls == [5]
+        assert worker.detector is new
+        assert old.released_on is not None
+        assert old.released_on is not threading.main_thread()
+
+    def test_result_tagged_with_frame(self, qapp):
+        from src.core.live_detection import LiveDetectionWorker
+        detector = _BlockingDetector()
+        detector.gate.set()
+        worker = LiveDetectionWorker(detector)
+        received = []
+        done = threading.Event()
+        worker.detection_ready.connect(lambda d: (received.append(d), done.set()),
+                                       Qt.ConnectionType.DirectConnection)
+        worker.start()
+        worker.submit(_frame(7))
+        assert done.wait(5)
+        worker.stop()
+
+        detection = received[0]
+        assert detection.frame.frame_number == 7
+        assert int(detection.frame.frame[0, 0, 0]) == 7
+        assert detection.result.pose_detected is False
+        assert detection.angles is None
+
+    def test_stop_without_frames(self, qapp):
+        from src.core.live_detection import LiveDetectionWorker
+        worker = LiveDetectionWorker(_BlockingDetector())
+        worker.start()
+        worker.stop()
+        assert worker.isFinished()
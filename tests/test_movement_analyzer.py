@@ -621,3 +621,82 @@ class TestSerialization:
             assert restored_stats.max_angle == pytest.approx(stats.max_angle)
             assert restored_stats.min_angle == pytest.approx(stats.min_angle)
             assert restored_stats.avg_angle == pytest.approx(stats.avg_angle)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 9. 상태 병합 (샤드 분석)
+# ═══════════════════════════════════════════════════════════════
+
+class TestStateMerge:
+
+    @pytest.fixture
+    def frames(self):
+        """각도/평가 결과 시퀀스 (관절별로 다른 패턴)"""
+        from src.core.angle_calculator import ANGLE_DEFINITIONS
+        from src.core.ergonomic.rula_calculator import RULAResult
+        from src.core.ergonomic.reba_calculator import REBAResult
+
+        sequence = []
+        for i in range(12):
+            angles = {
+                name: 60.0 + ((i * (j + 3)) % 7) * 12.0
+                for j, name in enumerate(ANGLE_DEFINITIONS)
+            }
+            rula = RULAResult(**_BASE_RESULT_DEFAULTS, neck_score=i % 5, upper_arm_score=(i + 2) % 6)
+            reba = REBAResult(**_BASE_RESULT_DEFAULTS, leg_score=i % 5)
+            sequence.append((angles, rula, reba))
+        return sequence
+
+    def _run(self, frames):
+        from src.core.movement_analyzer import MovementAnalyzer
+        analyzer = MovementAnalyzer()
+        for angles, rula, reba in frames:
+            analyzer.update(angles, rula, reba)
+        return analyzer
+
+    def _assert_same_result(self, merged, single):
+        r1 = merged.get_result()
+        r2 = single.get_result()
+        assert r1.total_frames == r2.total_frames
+        assert r1.analyzed_frames == r2.analyzed_frames
+        for name, stats in r2.body_parts.items():
+            other = r1.body_parts[name]
+            assert other.movement_count == stats.movement_count
+            assert other.high_risk_frames == stats.high_risk_frames
+            assert other.total_frames == stats.total_frames
+            assert other.max_angle == pytest.approx(stats.max_angle)
+            assert other.min_angle == pytest.approx(stats.min_angle)
+            assert other.avg_angle == pytest.approx(stats.avg_angle)
+            assert other.cumulative_score == pytest.approx(stats.cumulative_score)
+
+    def test_merge_two_shards_matches_sequential(self, frames):
+        """두 구간 병합 결과가 순차 분석과 동일 (경계 움직임 포함)"""
+        first = self._run(frames[:5])
+        second = self._run(frames[5:])
+        first.merge(second.get_state())
+        self._assert_same_result(first, self._run(frames))
+
+    def test_merge_many_shards(self, frames):
+        """여러 구간을 차례로 병합"""
+        from src.core.movement_analyzer import MovementAnalyzer
+        merged = MovementAnalyzer()
+        for start in range(0, len(frames), 3):
+            merged.merge(self._run(frames[start:start + 3]).get_state())
+        self._assert_same_result(merged, self._run(frames))
+
+    def test_merge_empty_shard(self, frames):
+        """분석 프레임이 없는 구간 병합 시 영향 없음"""
+        from src.core.movement_analyzer import MovementAnalyzer
+        merged = self._run(frames[:6])
+        merged.merge(MovementAnalyzer().get_state())
+        merged.merge(self._run(frames[6:]).get_state())
+        self._assert_same_result(merged, self._run(frames))
+
+    def test_load_state_without_first_angles(self, frames):
+        """first_angles 없는 이전 상태도 복원 가능"""
+        from src.core.movement_analyzer import MovementAnalyzer
+        state = self._run(frames).get_state()
+        del state['first_angles']
+        analyzer = MovementAnalyzer()
+        analyzer.load_state(state)
+        assert analyzer.get_result().analyzed_frames == len(frames)
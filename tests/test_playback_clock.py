@@ -0,0 +1,77 @@
+"""재생 시계 테스트"""
+import pytest
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _clock(fps=30.0, rate=1.0):
+    from src.core.playback_clock import PlaybackClock
+    fake = _FakeClock()
+    return PlaybackClock(fps=fps, rate=rate, clock=fake), fake
+
+
+class TestPlaybackClock:
+
+    def test_on_schedule_decodes_every_frame(self):
+        clock, fake = _clock()
+        clock.start(10)
+        assert clock.frames_to_skip(10) == 0
+
+        fake.now += 1 / 30
+        assert clock.frames_to_skip(11) == 0
+        assert clock.dropped_frames == 0
+
+    def test_early_tick_waits(self):
+        clock, fake = _clock()
+        clock.start(0)
+        fake.now += 0.01
+        assert clock.frames_to_skip(1) is None
+
+    def test_behind_schedule_skips(self):
+        clock, fake = _clock()
+        clock.start(0)
+        fake.now += 0.5  # 15프레임 시각인데 1번 프레임을 디코딩하려 함
+        assert clock.frames_to_skip(1) == 14
+        assert clock.dropped_frames == 14
+
+    @pytest.mark.parametrize('rate', [0.25, 0.5, 1.0, 2.0, 4.0])
+    def test_rate_scales_wall_time(self, rate):
+        clock, fake = _clock(fps=30.0, rate=rate)
+        clock.start(0)
+        fake.now += 60.0
+        assert clock.frame_due() == int(60 * 30 * rate)
+
+    def test_two_hours_at_4x_takes_30_minutes(self):
+        clock, fake = _clock(fps=30.0, rate=4.0)
+        clock.start(0)
+        fake.now += 30 * 60
+        assert clock.frame_due() == 2 * 60 * 60 * 30
+
+    def test_rate_change_keeps_position(self):
+        clock, fake = _clock()
+        clock.start(0)
+        fake.now += 2.0
+        clock.rate = 4.0
+        assert clock.frame_due() == 60
+        fake.now += 1.0
+        assert clock.frame_due() == 60 + 120
+
+    def test_rate_is_clamped(self):
+        clock, _ = _clock(rate=10.0)
+        assert clock.rate == 4.0
+        clock.rate = 0.1
+        assert clock.rate == 0.25
+
+    def test_interval(self):
+        clock, _ = _clock(fps=30.0)
+        assert clock.interval_ms == 33
+        clock.rate = 4.0
+        assert clock.interval_ms == 8
+        clock.fps = 0  # 알 수 없는 fps는 기본값
+        assert clock.fps == 30.0
@@ -71,3 +71,184 @@ class TestPoseDetector:
         large_image = np.zeros((1080, 1920, 3), dtype=np.uint8)
         result = detector.detect(large_image)
         assert result is not None
+
+
+class TestInferenceSize:
+    """추론 해상도 축소 테스트 (모델 없이 입력 준비만 검증)"""
+
+    @pytest.fixture
+    def make_detector(self):
+        from unittest.mock import patch
+        from src.core.pose_detector import PoseDetector
+
+        def make(size):
+            with patch.object(PoseDetector, '_initialize'):
+                return PoseDetector(inference_size=size)
+        return make
+
+    def test_downscale_preserves_aspect(self, make_detector):
+        """긴 변 기준으로 종횡비 유지하며 INTER_AREA 축소"""
+        from unittest.mock import patch
+        detector = make_detector(640)
+        image = np.zeros((2160, 3840, 3), dtype=np.uint8)
+
+        with patch('src.core.pose_detector.cv2') as mock_cv2:
+            detector._prepare_input(image)
+            args, kwargs = mock_cv2.resize.call_args
+            assert args[1] == (640, 360)
+            assert kwargs['interpolation'] == mock_cv2.INTER_AREA
+            assert kwargs['dst'].shape == (360, 640, 3)
+
+    def test_buffers_reused(self, make_detector):
+        """같은 크기 프레임이면 버퍼 재할당 없음"""
+        from unittest.mock import patch
+        detector = make_detector(640)
+        image = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+        with patch('src.core.pose_detector.cv2') as mock_cv2:
+            detector._prepare_input(image)
+            first_resize = mock_cv2.resize.call_args.kwargs['dst']
+            first_rgb = mock_cv2.cvtColor.call_args.kwargs['dst']
+            detector._prepare_input(image)
+            assert mock_cv2.resize.call_args.kwargs['dst'] is first_resize
+            assert mock_cv2.cvtColor.call_args.kwargs['dst'] is first_rgb
+
+    def test_no_resize_when_small_or_disabled(self, make_detector):
+        """원본 크기 설정이거나 이미 작으면 축소 안 함"""
+        from unittest.mock import patch
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        for size in (0, 960):
+            detector = make_detector(size)
+            with patch('src.core.pose_detector.cv2') as mock_cv2:
+                detector._prepare_input(image)
+                mock_cv2.resize.assert_not_called()
+                mock_cv2.cvtColor.assert_called_once()
+
+
+class TestVideoTracking:
+    """VIDEO 모드 추적 초기화 테스트 (landmarker 모킹)"""
+
+    @pytest.fixture
+    def detector(self):
+        from unittest.mock import MagicMock, patch
+        from src.core.pose_detector import PoseDetector
+
+        with patch.object(PoseDetector, '_create_landmarker',
+                          side_effect=lambda mode: MagicMock(name=mode)), \
+             patch.object(PoseDetector, '_prepare_input', side_effect=lambda image: image), \
+             patch('src.core.pose_detector.mp'):
+            detector = PoseDetector(running_mode='video', num_poses=1)
+            detector._landmarker.detect_for_video.return_value.pose_landmarks = []
+            yield detector
+
+    def _detect(self, detector, timestamp_ms):
+        landmarker = detector._landmarker
+        detector.detect(np.zeros((4, 4, 3), dtype=np.uint8), timestamp_ms)
+        if detector._landmarker is not landmarker:
+            detector._landmarker.detect_for_video.return_value.pose_landmarks = []
+        return landmarker
+
+    def test_sequential_frames_keep_tracking(self, detector):
+        """연속 프레임은 같은 landmarker로 추적"""
+        first = self._detect(detector, 0)
+        self._detect(detector, 33)
+        self._detect(detector, 66)
+        assert detector._landmarker is first
+        assert first.detect_for_video.call_count == 3
+
+    def test_seek_backwards_resets(self, detector):
+        """뒤로 탐색하면 landmarker를 새로 생성"""
+        first = self._detect(detector, 1000)
+        self._detect(detector, 500)
+        assert detector._landmarker is not first
+        first.close.assert_called_once()
+
+    def test_large_gap_resets(self, detector):
+        """추적 초기화 기준보다 큰 간격이면 새로 생성"""
+        from src.core.pose_detector import TRACKING_RESET_GAP_MS
+        first = self._detect(detector, 0)
+        self._detect(detector, TRACKING_RESET_GAP_MS + 1)
+        assert detector._landmarker is not first
+
+    def test_no_timestamp_uses_image_landmarker(self, detector):
+        """타임스탬프가 없으면 추적 없이 단일 이미지 감지"""
+        detector.detect(np.zeros((4, 4, 3), dtype=np.uint8))
+        detector._image_landmarker.detect.assert_called_once()
+        detector._landmarker.detect_for_video.assert_not_called()
+
+
+class TestRoiTracking:
+    """인물 영역 잘라 감지 테스트 (전체 이미지 감지 단계 모킹)"""
+
+    @pytest.fixture
+    def detector(self):
+        from unittest.mock import patch
+        from src.core.pose_detector import PoseDetector
+
+        with patch.object(PoseDetector, '_initialize'):
+            yield PoseDetector(roi_tracking=True)
+
+    def _result(self, x, y):
+        from src.core.pose_detector import PoseResult
+        landmarks = [{'x': x, 'y': y + i * 0.005, 'z': 0.0, 'visibility': 0.9} for i in range(33)]
+        return PoseResult(pose_detected=True, landmarks=landmarks)
+
+    def test_second_frame_uses_crop(self, detector):
+        """감지 후 다음 프레임은 인물 주변만 입력하고 좌표를 되돌림"""
+        from unittest.mock import patch
+        image = np.zeros((1000, 2000, 3), dtype=np.uint8)
+        inputs = []
+
+        def fake_detect(frame, timestamp_ms):
+            inputs.append(frame.shape)
+            return self._result(0.5, 0.4)
+
+        with patch.object(detector, '_detect_frame', side_effect=fake_detect):
+            detector.detect(image)
+            result = detector.detect(image)
+
+        assert inputs[0] == image.shape
+        assert inputs[1][0] < 1000 and inputs[1][1] < 2000
+        # 크롭 중앙 → 이전 인물 위치 근처 (전체 프레임 기준)
+        assert 0.45 < result.landmarks[0]['x'] < 0.55
+
+    def test_lost_in_crop_falls_back_to_full_frame(self, detector):
+        """잘라낸 영역에서 놓치면 같은 프레임을 전체로 다시 감지"""
+        from unittest.mock import patch
+        from src.core.pose_detector import PoseResult
+        image = np.zeros((1000, 2000, 3), dtype=np.uint8)
+        outputs = [self._result(0.5, 0.4), PoseResult(pose_detected=False),
+                   self._result(0.1, 0.1)]
+        inputs = []
+
+        def fake_detect(frame, timestamp_ms):
+            inputs.append(frame.shape)
+            return outputs[len(inputs) - 1]
+
+        with patch.object(detector, '_detect_frame', side_effect=fake_detect):
+            detector.detect(image)
+            result = detector.detect(image)
+
+        assert inputs[2] == image.shape
+        assert result.pose_detected
+        assert result.landmarks[0]['x'] == 0.1
+
+    def test_video_tracking_does_not_crop(self):
+        """VIDEO 모드 추적 중에는 전체 프레임 입력"""
+        from unittest.mock import patch
+        from src.core.pose_detector import PoseDetector
+        with patch.object(PoseDetector, '_initialize'):
+            detector = PoseDetector(running_mode='video', roi_tracking=True)
+        image = np.zeros((1000, 2000, 3), dtype=np.uint8)
+        inputs = []
+
+        def fake_detect(frame, timestamp_ms):
+            inputs.append(frame.shape)
+            return self._result(0.5, 0.4)
+
+        with patch.object(detector, '_detect_frame', side_effect=fake_detect):
+            detector.detect(image, 0)
+            detector.detect(image, 33)
+
+        assert inputs == [image.shape, image.shape]
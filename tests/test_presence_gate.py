@@ -0,0 +1,50 @@
+"""PresenceGate 테스트"""
+import numpy as np
+
+
+def _frame(value=0, size=(360, 640)):
+    return np.full((*size, 3), value, dtype=np.uint8)
+
+
+class TestPresenceGate:
+
+    def test_detects_until_empty_scene_confirmed(self):
+        """기준 장면이 없으면 항상 추론"""
+        from src.core.presence_gate import PresenceGate
+        gate = PresenceGate()
+        assert gate.should_detect(_frame())
+        gate.record(pose_detected=True)
+        assert gate.should_detect(_frame())
+
+    def test_skips_unchanged_empty_scene(self):
+        """사람 없음이 확인된 장면이 그대로면 추론 생략"""
+        from src.core.presence_gate import PresenceGate
+        gate = PresenceGate()
+        assert gate.should_detect(_frame())
+        gate.record(pose_detected=False)
+
+        assert not gate.should_detect(_frame())
+        assert not gate.should_detect(_frame())
+        assert gate.gated_frames == 2
+        assert gate.hit_rate == 2 / 3
+
+    def test_motion_triggers_detection(self):
+        """장면 일부가 바뀌면 다시 추론"""
+        from src.core.presence_gate import PresenceGate
+        gate = PresenceGate()
+        gate.should_detect(_frame())
+        gate.record(pose_detected=False)
+
+        moved = _frame()
+        moved[100:200, 300:360] = 200    # 작은 인물이 들어옴
+        assert gate.should_detect(moved)
+
+    def test_periodic_recheck(self):
+        """연속 생략이 일정 수에 이르면 한 번은 추론"""
+        from src.core.presence_gate import PresenceGate
+        gate = PresenceGate(recheck_frames=3)
+        gate.should_detect(_frame())
+        gate.record(pose_detected=False)
+
+        decisions = [gate.should_detect(_frame()) for _ in range(4)]
+        assert decisions == [False, False, False, True]
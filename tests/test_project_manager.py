@@ -461,3 +461,486 @@ class TestProjectManagerImages:
         record = state['capture_model'].get_record(0)
         assert record.video_frame_path is not None
         assert Path(record.video_frame_path).exists()
+
+
+class TestProjectManagerSqlite:
+    """SQLite 캡처 저장 방식 테스트"""
+
+    def _model(self, count=5, img_dir=None):
+        model = CaptureDataModel()
+        for i in range(count):
+            model.add_record(CaptureRecord(
+                timestamp=float(i),
+                frame_number=i * 30,
+                capture_time=datetime(2024, 1, 1, 9, 0, i),
+                rula_score=i % 7 + 1,
+                rula_risk='acceptable',
+                video_frame_path=str(img_dir / f"frame_{i}.png") if img_dir else None,
+            ))
+        return model
+
+    def _save(self, pm, zip_path, model, capture_dir=None):
+        pm.set_state(
+            video_path="/path/to/video.mp4",
+            frame_position=0,
+            fps=30.0,
+            capture_model=model,
+            ui_state={},
+            capture_dir=capture_dir,
+        )
+        assert pm.save(zip_path)
+
+    def test_save_writes_captures_db(self, tmp_path):
+        """captures.json 대신 captures.db 저장, 작업 파일은 프로젝트 옆"""
+        pm = ProjectManager(capture_storage='sqlite')
+        zip_path = tmp_path / "audit.skpx"
+        self._save(pm, zip_path, self._model())
+
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            names = zf.namelist()
+            assert 'captures.db' in names
+            assert 'captures.json' not in names
+            assert json.loads(zf.read('project.json'))['capture_storage'] == 'sqlite'
+        assert pm.capture_db_path(zip_path) == tmp_path / "audit.captures.db"
+        assert (tmp_path / "audit.captures.db").exists()
+
+    def test_capture_db_dir_keeps_project_folder_clean(self, tmp_path):
+        """작업 파일은 capture_db_dir에 두고, 같은 내용이면 열 때 다시 쓰지 않음"""
+        project_dir = tmp_path / "projects"
+        project_dir.mkdir()
+        work_dir = tmp_path / "work"
+        zip_path = project_dir / "audit.skpx"
+        self._save(ProjectManager(capture_storage='sqlite', capture_db_dir=work_dir),
+                   zip_path, self._model(3))
+        assert sorted(p.name for p in project_dir.iterdir()) == ["audit.skpx"]
+
+        pm = ProjectManager(capture_storage='sqlite', capture_db_dir=work_dir)
+        db_path = pm.capture_db_path(zip_path)
+        assert db_path.parent == work_dir
+        mtime = db_path.stat().st_mtime_ns
+        pm.load(zip_path, capture_dir=tmp_path / "captures")
+        assert len(pm.get_state()['capture_model']) == 3
+        assert db_path.stat().st_mtime_ns == mtime
+        assert ProjectManager(capture_db_dir=work_dir).capture_db_path(tmp_path / "audit.skpx") != db_path
+
+    def test_round_trip(self, tmp_path):
+        capture_dir = tmp_path / "captures"
+        model = self._model(img_dir=capture_dir / "video")
+        pm = ProjectManager(capture_storage='sqlite')
+        zip_path = tmp_path / "audit.skpx"
+        self._save(pm, zip_path, model, capture_dir)
+
+        pm2 = ProjectManager()
+        info = pm2.load(zip_path, capture_dir=tmp_path / "extracted")
+        loaded = pm2.get_state()['capture_model']
+
+        assert info.capture_count == 5
+        assert [r.rula_score for r in loaded.iter_records()] == [r.rula_score for r in model.iter_records()]
+        assert loaded.get_record(2).capture_time == datetime(2024, 1, 1, 9, 0, 2)
+        assert loaded.get_record(2).video_frame_path == str(tmp_path / "extracted" / "video" / "frame_2.png")
+
+    def test_incremental_save_writes_changed_rows(self, tmp_path):
+        """로드한 모델을 다시 저장하면 바뀐 행만 기록"""
+        zip_path = tmp_path / "audit.skpx"
+        self._save(ProjectManager(capture_storage='sqlite'), zip_path, self._model(50))
+
+        pm = ProjectManager(capture_storage='sqlite')
+        pm.load(zip_path, capture_dir=tmp_path / "captures")
+        model = pm.get_state()['capture_model']
+        model.get_record(10).rula_force_load_a = 2
+        model.delete_record(20)
+        model.add_record(CaptureRecord(timestamp=7.5, frame_number=225,
+                                       capture_time=datetime(2024, 1, 1), rula_score=3))
+        assert pm._capture_db.sync(model, tmp_path / "captures") == 3
+
+        pm.save(zip_path)
+        pm2 = ProjectManager()
+        pm2.load(zip_path, capture_dir=tmp_path / "captures")
+        loaded = pm2.get_state()['capture_model']
+        assert len(loaded) == 50
+        assert loaded.get_record(8).timestamp == 7.5
+        assert loaded.get_record(11).rula_force_load_a == 2
+        assert all(r.timestamp != 20.0 for r in loaded.iter_records())
+
+    def test_json_project_migrated_on_save(self, tmp_path):
+        """JSON 프로젝트는 그대로 열리고, SQLite 방식으로 저장하면 captures.db로 바뀜"""
+        zip_path = tmp_path / "old.skpx"
+        self._save(ProjectManager(), zip_path, self._model(3))
+
+        pm = ProjectManager(capture_storage='sqlite')
+        pm.load(zip_path, capture_dir=tmp_path / "captures")
+        assert len(pm.get_state()['capture_model']) == 3
+        pm.save(zip_path)
+
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            assert 'captures.db' in zf.namelist()
+            assert 'captures.json' not in zf.namelist()
+        pm2 = ProjectManager()
+        pm2.load(zip_path, capture_dir=tmp_path / "captures")
+        assert [r.timestamp for r in pm2.get_state()['capture_model'].iter_records()] == [0.0, 1.0, 2.0]
+
+    def test_invalid_storage(self):
+        with pytest.raises(ValueError):
+            ProjectManager(capture_storage='xml')
+        with pytest.raises(ValueError):
+            ProjectManager().set_capture_storage('xml')
+
+
+class TestProjectManagerIncrementalSave:
+    """덧붙이기(증분) 저장 테스트"""
+
+    def _setup(self, tmp_path, count=3, storage='json'):
+        img_dir = tmp_path / "captures" / "video"
+        img_dir.mkdir(parents=True)
+        model = CaptureDataModel()
+        for i in range(count):
+            img = img_dir / f"frame_{i}.png"
+            img.write_bytes(b"png" * 1000 + bytes([i]))
+            model.add_record(CaptureRecord(
+                timestamp=float(i), frame_number=i * 30,
+                capture_time=datetime(2024, 1, 1), video_frame_path=str(img),
+            ))
+        pm = ProjectManager(capture_storage=storage)
+        pm.set_state(
+            video_path="/path/to/video.mp4",
+            frame_position=0,
+            fps=30.0,
+            capture_model=model,
+            ui_state={'panels': {'angle': True}},
+            capture_dir=tmp_path / "captures",
+        )
+        return pm, model, img_dir
+
+    def test_images_stored_uncompressed(self, tmp_path):
+        pm, _, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            image_infos = [i for i in zf.infolist() if i.filename.startswith('images/')]
+            assert len(image_infos) == 3
+            assert all(i.compress_type == zipfile.ZIP_STORED for i in image_infos)
+
+    def test_resave_without_changes_keeps_file(self, tmp_path):
+        pm, _, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        before = zip_path.read_bytes()
+
+        pm.save()
+
+        assert zip_path.read_bytes() == before
+
+    def test_resave_appends_only_changes(self, tmp_path):
+        """바뀐 JSON과 새 이미지만 덧붙이고, 로드하면 마지막 내용이 보임"""
+        pm, model, img_dir = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        with zipfile.ZipFile(zip_path) as zf:
+            first_count = len(zf.infolist())
+
+        new_img = img_dir / "frame_9.png"
+        new_img.write_bytes(b"new image")
+        model.add_record(CaptureRecord(timestamp=9.0, frame_number=270,
+                                       capture_time=datetime(2024, 1, 1),
+                                       video_frame_path=str(new_img), rula_score=5))
+        pm.save()
+
+        with zipfile.ZipFile(zip_path) as zf:
+            appended = [i.filename for i in zf.infolist()[first_count:]]
+        assert sorted(appended) == ['captures.json', 'images/video/frame_9.png', 'project.json']
+
+        pm2 = ProjectManager()
+        info = pm2.load(zip_path, capture_dir=tmp_path / "extracted")
+        assert info.capture_count == 4
+        assert info.image_count == 4
+        assert pm2.get_state()['capture_model'].get_record(3).rula_score == 5
+        assert pm2.get_state()['ui_state'] == {'panels': {'angle': True}}
+
+    def test_compact_removes_stale_members(self, tmp_path):
+        pm, model, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        model.delete_record(0)
+        pm.save()
+
+        assert pm.compact()
+
+        with zipfile.ZipFile(zip_path) as zf:
+            names = zf.namelist()
+        assert len(names) == len(set(names))
+        assert 'images/video/frame_0.png' not in names
+
+    def test_storage_switch_rewrites(self, tmp_path):
+        """저장 방식이 바뀌면 이전 형식의 멤버가 남지 않음"""
+        pm, _, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        pm._capture_storage = 'sqlite'
+        pm.save()
+
+        with zipfile.ZipFile(zip_path) as zf:
+            names = zf.namelist()
+        assert 'captures.db' in names
+        assert 'captures.json' not in names
+
+    def test_failed_append_keeps_original(self, tmp_path, monkeypatch):
+        pm, model, img_dir = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        before = zip_path.read_bytes()
+        model.get_record(0).rula_score = 7
+
+        def broken_image_members(snapshot):
+            yield img_dir / "missing.png", "images/video/missing.png"
+        monkeypatch.setattr(pm, '_image_members', broken_image_members)
+        with pytest.raises(OSError):
+            pm.save()
+
+        assert zip_path.read_bytes() == before
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+
+
+class TestProjectManagerLazyLoad:
+    """이미지 지연 로드 테스트"""
+
+    def _save_project(self, tmp_path, count=3):
+        img_dir = tmp_path / "captures" / "video"
+        img_dir.mkdir(parents=True)
+        model = CaptureDataModel()
+        for i in range(count):
+            img = img_dir / f"frame_{i}.png"
+            img.write_bytes(b"image" + bytes([i]))
+            model.add_record(CaptureRecord(
+                timestamp=float(i), frame_number=i * 30,
+                capture_time=datetime(2024, 1, 1), video_frame_path=str(img),
+            ))
+        pm = ProjectManager()
+        pm.set_state(
+            video_path="/path/to/video.mp4",
+            frame_position=0,
+            fps=30.0,
+            capture_model=model,
+            ui_state={},
+            capture_dir=tmp_path / "captures",
+        )
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        return zip_path
+
+    def test_lazy_load_extracts_on_first_access(self, tmp_path):
+        zip_path = self._save_project(tmp_path)
+        extract_dir = tmp_path / "extracted"
+
+        pm = ProjectManager()
+        info = pm.load(zip_path, capture_dir=extract_dir, lazy=True)
+        record = pm.get_state()['capture_model'].get_record(1)
+
+        assert info.image_count == 3
+        assert not Path(record.video_frame_path).exists()
+        assert pm.read_image(record.video_frame_path) == b"image\x01"
+        assert not Path(record.video_frame_path).exists()
+
+        resolved = pm.resolve_image(record.video_frame_path)
+        assert resolved == record.video_frame_path
+        assert Path(resolved).read_bytes() == b"image\x01"
+        assert not (extract_dir / "video" / "frame_0.png").exists()
+        assert pm.resolve_image(str(extract_dir / "video" / "missing.png")) is None
+
+    def test_lazy_resave_keeps_unextracted_images(self, tmp_path):
+        """꺼내지 않은 이미지도 덧붙이기/정리 저장 후 그대로 남음"""
+        zip_path = self._save_project(tmp_path)
+        pm = ProjectManager()
+        pm.load(zip_path, capture_dir=tmp_path / "extracted", lazy=True)
+        model = pm.get_state()['capture_model']
+        pm.resolve_image(model.get_record(0).video_frame_path)
+        model.get_record(0).rula_score = 6
+
+        with zipfile.ZipFile(zip_path) as zf:
+            before = len(zf.infolist())
+        pm.save()
+        with zipfile.ZipFile(zip_path) as zf:
+            appended = [i.filename for i in zf.infolist()[before:]]
+        assert 'images/video/frame_0.png' not in appended
+
+        pm.compact()
+        with zipfile.ZipFile(zip_path) as zf:
+            names = zf.namelist()
+        assert sorted(n for n in names if n.startswith('images/')) == [
+            'images/video/frame_0.png', 'images/video/frame_1.png', 'images/video/frame_2.png']
+        # 전체 다시 쓰기 후에도 지연 로드 유지 (새 파일로 다시 열림)
+        path_1 = model.get_record(1).video_frame_path
+        assert not Path(path_1).exists()
+        assert pm.read_image(path_1) == b"image\x01"
+
+    def test_recovery_write_includes_unextracted_images(self, tmp_path):
+        """복구 파일에 아직 꺼내지 않은 이미지도 원본 ZIP에서 복사됨"""
+        zip_path = self._save_project(tmp_path)
+        pm = ProjectManager()
+        pm.load(zip_path, capture_dir=tmp_path / "extracted", lazy=True)
+        model = pm.get_state()['capture_model']
+        pm.resolve_image(model.get_record(0).video_frame_path)
+
+        recovery_path = tmp_path / "autosave.skpx"
+        pm.write_snapshot(pm.snapshot(recovery=True), recovery_path, recovery=True)
+        with zipfile.ZipFile(recovery_path) as zf:
+            assert zf.read('images/video/frame_2.png') == b"image\x02"
+            assert zf.read('images/video/frame_0.png') == b"image\x00"
+        assert not Path(model.get_record(2).video_frame_path).exists()
+
+        # 같은 복구 파일에 다시 쓰면 꺼내지 않은 이미지는 덧붙이지 않음
+        with zipfile.ZipFile(recovery_path) as zf:
+            before = len(zf.infolist())
+        model.get_record(1).rula_score = 5
+        pm.write_snapshot(pm.snapshot(recovery=True), recovery_path, recovery=True)
+        with zipfile.ZipFile(recovery_path) as zf:
+            appended = [i.filename for i in zf.infolist()[before:]]
+        assert appended and not any(n.startswith('images/') for n in appended)
+
+    def test_close_during_read_is_safe(self, tmp_path):
+        """원본 ZIP을 닫은 뒤에는 꺼낸 파일만 돌려줌 (오류 없음)"""
+        zip_path = self._save_project(tmp_path)
+        pm = ProjectManager()
+        pm.load(zip_path, capture_dir=tmp_path / "extracted", lazy=True)
+        model = pm.get_state()['capture_model']
+        archive = pm._image_archive
+        pm.new_project()
+        assert archive.read(model.get_record(1).video_frame_path) is None
+        assert archive.resolve(model.get_record(1).video_frame_path) is None
+
+
+class TestProjectManagerSnapshotSave:
+    """스냅샷/백그라운드 저장 테스트"""
+
+    def _setup(self, tmp_path, count=3, storage='json'):
+        return TestProjectManagerIncrementalSave()._setup(tmp_path, count, storage)
+
+    def test_snapshot_is_independent(self, tmp_path):
+        pm, model, _ = self._setup(tmp_path)
+        snapshot = pm.snapshot()
+        model.get_record(0).rula_score = 7
+        model.delete_record(1)
+        pm._ui_state['panels']['angle'] = False
+
+        assert len(snapshot.capture_model) == 3
+        assert snapshot.capture_model.get_record(0).rula_score != 7
+        assert snapshot.ui_state == {'panels': {'angle': True}}
+
+    def test_edit_during_save_keeps_dirty(self, tmp_path):
+        pm, model, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.mark_dirty()
+        snapshot = pm.snapshot()
+        pm.mark_dirty()  # 저장 중 편집
+        pm.write_snapshot(snapshot, zip_path)
+        pm.finish_save(snapshot, zip_path)
+
+        assert pm.current_path == zip_path
+        assert pm.is_dirty is True
+
+        pm.save()
+        assert pm.is_dirty is False
+
+    def test_sqlite_stays_incremental(self, tmp_path):
+        pm, model, _ = self._setup(tmp_path, storage='sqlite')
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        written = []
+        sync = pm._capture_db.sync
+        pm._capture_db.sync = lambda *args: written.append(sync(*args)) or written[-1]
+
+        model.get_record(2).rula_score = 5
+        snapshot = pm.snapshot()
+        model.get_record(0).rula_score = 6  # 스냅샷 이후 변경은 다음 저장에 반영
+        pm.write_snapshot(snapshot, zip_path)
+        pm.finish_save(snapshot, zip_path)
+        pm.save()
+        pm.new_project()
+
+        assert written == [1, 1]
+        pm2 = ProjectManager()
+        pm2.load(zip_path, check_video=False, capture_dir=tmp_path / "loaded")
+        scores = [r.rula_score for r in pm2.get_state()['capture_model'].iter_records()]
+        assert scores[0] == 6 and scores[2] == 5
+
+    def test_cancel_keeps_original(self, tmp_path):
+        from core.project_manager import ProjectSaveCancelled
+        pm, model, img_dir = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        before = zip_path.read_bytes()
+
+        for i in range(3, 6):
+            img = img_dir / f"frame_{i}.png"
+            img.write_bytes(b"new" * 1000)
+            model.add_record(CaptureRecord(timestamp=float(i), frame_number=i * 30,
+                                           capture_time=datetime(2024, 1, 1),
+                                           video_frame_path=str(img)))
+        pm.mark_dirty()
+        progress = []
+        with pytest.raises(ProjectSaveCancelled):
+            pm.write_snapshot(pm.snapshot(), zip_path,
+                              progress=lambda done, total: progress.append(done),
+                              is_cancelled=lambda: len(progress) >= 2)
+
+        assert zip_path.read_bytes() == before
+        assert pm.is_dirty is True
+        with pytest.raises(ProjectSaveCancelled):
+            pm.write_snapshot(pm.snapshot(), zip_path, compact=True, is_cancelled=lambda: True)
+        assert zip_path.read_bytes() == before
+
+    def test_recovery_write_leaves_project(self, tmp_path):
+        pm, model, _ = self._setup(tmp_path, storage='sqlite')
+        zip_path = tmp_path / "project.skpx"
+        pm.save(zip_path)
+        model.get_record(1).rula_score = 4
+        pm.mark_dirty()
+
+        recovery_path = tmp_path / "autosave.skpx"
+        pm.write_snapshot(pm.snapshot(recovery=True), recovery_path, recovery=True)
+
+        assert pm.current_path == zip_path
+        assert pm.is_dirty is True
+        with zipfile.ZipFile(recovery_path) as zf:
+            assert 'captures.json' in zf.namelist()
+            assert 'captures.db' not in zf.namelist()
+        # 복구용 저장은 작업 파일 DB의 변경 기록을 가져가지 않음
+        pm.save()
+        pm2 = ProjectManager()
+        pm2.load(zip_path, check_video=False, capture_dir=tmp_path / "loaded")
+        assert pm2.get_state()['capture_model'].get_record(1).rula_score == 4
+
+    def test_detach_after_recovery_load(self, tmp_path):
+        pm, _, _ = self._setup(tmp_path)
+        recovery_path = tmp_path / "autosave.skpx"
+        pm.write_snapshot(pm.snapshot(recovery=True), recovery_path, recovery=True)
+
+        pm2 = ProjectManager()
+        pm2.load(recovery_path, check_video=False, capture_dir=tmp_path / "restored", lazy=True)
+        pm2.detach()
+
+        assert pm2.current_path is None
+        assert pm2.is_dirty is True
+        assert (tmp_path / "restored" / "video" / "frame_0.png").exists()
+
+    def test_save_worker(self, tmp_path):
+        from core.project_save_worker import ProjectSaveWorker
+        pm, _, _ = self._setup(tmp_path)
+        zip_path = tmp_path / "project.skpx"
+        worker = ProjectSaveWorker(pm, pm.snapshot(), zip_path)
+        completed, progress = [], []
+        worker.save_completed.connect(completed.append)
+        worker.progress_updated.connect(lambda done, total: progress.append((done, total)))
+        worker.run()
+
+        assert completed and completed[0] is worker.snapshot
+        assert progress[-1] == (4, 4)  # JSON + 이미지 3개
+        assert zipfile.is_zipfile(zip_path)
+
+        cancelled = []
+        worker = ProjectSaveWorker(pm, pm.snapshot(), tmp_path / "other.skpx")
+        worker.save_cancelled.connect(lambda: cancelled.append(True))
+        worker.cancel()
+        worker.run()
+        assert cancelled and not (tmp_path / "other.skpx").exists()
@@ -0,0 +1,201 @@
+"""캐시 기반 움직임 재계산 (rescoring) 단위 테스트"""
+import sys
+import pytest
+from unittest.mock import MagicMock
+import numpy as np
+
+# mediapipe를 미리 모킹하여 import 에러 방지
+mediapipe_mock = MagicMock()
+sys.modules.setdefault('mediapipe', mediapipe_mock)
+sys.modules.setdefault('mediapipe.tasks', mediapipe_mock.tasks)
+sys.modules.setdefault('mediapipe.tasks.python', mediapipe_mock.tasks.python)
+sys.modules.setdefault('mediapipe.tasks.python.vision', mediapipe_mock.tasks.python.vision)
+
+
+def _random_landmarks(rng, visibility=0.9):
+    return [
+        {'x': float(rng.uniform(0.2, 0.8)), 'y': float(rng.uniform(0.1, 0.9)),
+         'z': float(rng.uniform(-0.2, 0.2)), 'visibility': visibility}
+        for _ in range(33)
+    ]
+
+
+class TestRescoreFromCache:
+
+    @pytest.fixture
+    def filled_cache(self, tmp_path):
+        """20프레임 중 프레임 5만 미감지인 캐시"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        rng = np.random.default_rng(0)
+        cache = LandmarkCache(str(tmp_path / "cache"), 20)
+        poses = []
+        for i in range(20):
+            if i == 5:
+                pose = PoseResult(pose_detected=False)
+            else:
+                pose = PoseResult(pose_detected=True, landmarks=_random_landmarks(rng))
+            cache.put(i, pose)
+            poses.append(cache.get(i))
+        return cache, poses
+
+    def _sequential(self, poses, sample_interval=1, threshold=15.0, sensitivity=1.0):
+        """AnalysisWorker와 같은 순서로 직접 계산한 기준 결과"""
+        from src.core.angle_calculator import AngleCalculator
+        from src.core.ergonomic.rula_calculator import RULACalculator
+        from src.core.ergonomic.reba_calculator import REBACalculator
+        from src.core.movement_analyzer import MovementAnalyzer
+
+        analyzer = MovementAnalyzer(threshold=threshold, sample_interval=sample_interval)
+        angle_calc, rula_calc, reba_calc = AngleCalculator(), RULACalculator(), REBACalculator()
+        rula_calc.detection_sensitivity = reba_calc.detection_sensitivity = sensitivity
+        for pose in poses[::sample_interval]:
+            if not pose.pose_detected:
+                continue
+            angles = angle_calc.calculate_all_angles(pose.landmarks)
+            analyzer.update(angles, rula_calc.calculate(angles, pose.landmarks),
+                            reba_calc.calculate(angles, pose.landmarks))
+        return analyzer.get_result()
+
+    def test_matches_sequential_analysis(self, filled_cache):
+        """재계산 결과가 순차 분석과 동일"""
+        from src.core.rescoring import rescore_from_cache
+
+        cache, poses = filled_cache
+        result = rescore_from_cache(cache)
+        expected = self._sequential(poses)
+
+        assert result.total_frames == 20
+        assert result.analyzed_frames == 19
+        assert result.skipped_frames == 1
+        for name, stats in expected.body_parts.items():
+            assert result.body_parts[name].movement_count == stats.movement_count
+            assert result.body_parts[name].avg_angle == pytest.approx(stats.avg_angle)
+            assert result.body_parts[name].high_risk_frames == stats.high_risk_frames
+
+    def test_threshold_and_interval(self, filled_cache):
+        """임계값/샘플 간격을 바꿔 재계산"""
+        from src.core.rescoring import rescore_from_cache
+
+        cache, poses = filled_cache
+        loose = rescore_from_cache(cache, threshold=1.0)
+        strict = rescore_from_cache(cache, threshold=60.0)
+        loose_total = sum(s.movement_count for s in loose.body_parts.values())
+        strict_total = sum(s.movement_count for s in strict.body_parts.values())
+        assert loose_total > strict_total
+
+        sampled = rescore_from_cache(cache, sample_interval=5)
+        expected = self._sequential(poses, sample_interval=5)
+        assert sampled.sample_interval == 5
+        assert sampled.analyzed_frames == expected.analyzed_frames == 3
+        assert sampled.skipped_frames == 1
+
+    def test_detection_sensitivity(self, filled_cache):
+        """감지 민감도를 바꿔 재계산하면 같은 민감도의 순차 분석과 동일"""
+        from src.core.rescoring import rescore_from_cache
+
+        cache, poses = filled_cache
+        result = rescore_from_cache(cache, detection_sensitivity=5.5)
+        expected = self._sequential(poses, sensitivity=5.5)
+        for name, stats in expected.body_parts.items():
+            assert result.body_parts[name].high_risk_frames == stats.high_risk_frames
+
+    def test_gated_frames(self, tmp_path):
+        """빈 화면 생략 프레임은 감지 실패로 세고 gated_frames에도 포함"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+        from src.core.rescoring import rescore_from_cache
+
+        cache = LandmarkCache(str(tmp_path / "gated"), 6)
+        rng = np.random.default_rng(2)
+        for i in range(3):
+            cache.put(i, PoseResult(pose_detected=True, landmarks=_random_landmarks(rng)))
+        for i in range(3, 6):
+            cache.put_gated(i)
+
+        assert cache.covers()
+        result = rescore_from_cache(cache)
+        assert result.analyzed_frames == 3
+        assert result.skipped_frames == 3
+        assert result.gated_frames == 3
+
+    def test_min_visibility(self, tmp_path):
+        """평균 가시성이 낮은 프레임은 감지 실패로 처리"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+        from src.core.rescoring import rescore_from_cache
+
+        rng = np.random.default_rng(1)
+        cache = LandmarkCache(str(tmp_path / "cache"), 4)
+        for i, visibility in enumerate([0.9, 0.5, 0.9, 0.5]):
+            cache.put(i, PoseResult(pose_detected=True,
+                                    landmarks=_random_landmarks(rng, visibility)))
+
+        result = rescore_from_cache(cache, min_visibility=0.7)
+        assert result.analyzed_frames == 2
+        assert result.skipped_frames == 2
+
+    def test_min_visibility_uses_raw_visibility(self, tmp_path):
+        """하한(0.5) 아래 원래 가시성도 캐시에 남아 민감도 조정에 반영"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.landmarks import LandmarkArray
+        from src.core.pose_detector import PoseResult, MIN_LANDMARK_VISIBILITY
+        from src.core.rescoring import rescore_from_cache
+
+        rng = np.random.default_rng(2)
+        cache = LandmarkCache(str(tmp_path / "cache"), 3)
+        for i, raw in enumerate([0.2, 0.4, 0.9]):
+            landmarks = LandmarkArray.from_dicts(
+                _random_landmarks(rng, max(raw, MIN_LANDMARK_VISIBILITY)))
+            cache.put(i, PoseResult(pose_detected=True, landmarks=landmarks,
+                                    raw_visibility=np.full(33, raw, dtype=np.float32)))
+
+        # 감지 직후와 같이 하한을 적용해 돌려주고 원래 값은 따로 보관
+        restored = cache.get(0)
+        assert restored.landmarks[0]['visibility'] == pytest.approx(MIN_LANDMARK_VISIBILITY)
+        assert restored.mean_visibility() == pytest.approx(0.2)
+
+        assert rescore_from_cache(cache).analyzed_frames == 3
+        assert rescore_from_cache(cache, min_visibility=0.3).analyzed_frames == 2
+        assert rescore_from_cache(cache, min_visibility=0.45).analyzed_frames == 1
+
+    def test_covers_with_other_running_mode(self, tmp_path):
+        """샘플 간격이 바뀌어 실행 모드가 달라도 다른 모드의 캐시로 재계산"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+        from src.core.rescoring import cache_covers, covering_running_mode
+
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"fake video content" * 100)
+        cache_dir = str(tmp_path / "cache")
+        cache = LandmarkCache.for_video(cache_dir, str(video), 10, running_mode='video')
+        for i in range(10):
+            cache.put(i, PoseResult(pose_detected=False))
+        cache.close()
+
+        assert covering_running_mode(cache_dir, str(video), 10, sample_interval=5,
+                                     running_mode='image') == 'video'
+        assert cache_covers(cache_dir, str(video), 10, sample_interval=5, running_mode='image')
+        # 다른 감지기 옵션의 캐시는 만들지 않고 없는 것으로 처리
+        assert not cache_covers(cache_dir, str(video), 10, running_mode='image', num_poses=1)
+        assert len(list((tmp_path / "cache").iterdir())) == 3
+
+    def test_stop_returns_none(self, filled_cache):
+        """중단 시 None"""
+        from src.core.rescoring import rescore_from_cache
+
+        cache, _ = filled_cache
+        assert rescore_from_cache(cache, is_stopped=lambda: True) is None
+
+    def test_covers(self, tmp_path):
+        """샘플 프레임이 모두 캐시되어 있어야 재계산 가능"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.pose_detector import PoseResult
+
+        cache = LandmarkCache(str(tmp_path / "cache"), 10)
+        for i in range(0, 10, 3):
+            cache.put(i, PoseResult(pose_detected=False))
+
+        assert cache.covers(sample_interval=3)
+        assert not cache.covers(sample_interval=1)
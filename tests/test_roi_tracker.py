@@ -0,0 +1,55 @@
+"""PersonRoiTracker 테스트"""
+import pytest
+
+
+def _landmarks(x_min, y_min, x_max, y_max):
+    """바운딩 박스 모서리에 놓인 랜드마크 33개"""
+    corners = [(x_min, y_min), (x_max, y_max), (x_min, y_max), (x_max, y_min)]
+    return [{'x': corners[i % 4][0], 'y': corners[i % 4][1], 'z': -0.1, 'visibility': 0.9}
+            for i in range(33)]
+
+
+class TestPersonRoiTracker:
+
+    def test_no_crop_until_detected(self):
+        """첫 감지 전에는 전체 프레임 사용"""
+        from src.core.roi_tracker import PersonRoiTracker
+        tracker = PersonRoiTracker()
+        assert not tracker.is_tracking
+        assert tracker.crop_box((1080, 1920, 3)) is None
+
+    def test_crop_box_padded_and_clamped(self):
+        """이전 바운딩 박스에 여유를 두고 프레임 안으로 제한"""
+        from src.core.roi_tracker import PersonRoiTracker
+        tracker = PersonRoiTracker(padding_ratio=0.5)
+        tracker.update(_landmarks(0.45, 0.5, 0.55, 0.9))
+
+        x0, y0, x1, y1 = tracker.crop_box((1000, 2000, 3))
+        # 박스 200x400 px, 긴 변 기준 여유 200 px
+        assert (x0, y0) == (700, 300)
+        assert (x1, y1) == (1301, 1000)
+
+    def test_large_subject_uses_full_frame(self):
+        """영역이 프레임 대부분이면 자르지 않음"""
+        from src.core.roi_tracker import PersonRoiTracker
+        tracker = PersonRoiTracker()
+        tracker.update(_landmarks(0.1, 0.1, 0.9, 0.9))
+        assert tracker.crop_box((720, 1280, 3)) is None
+
+    def test_lost_resets(self):
+        """감지 실패 시 추적 해제"""
+        from src.core.roi_tracker import PersonRoiTracker
+        tracker = PersonRoiTracker()
+        tracker.update(_landmarks(0.4, 0.4, 0.5, 0.6))
+        tracker.update(None)
+        assert tracker.crop_box((720, 1280, 3)) is None
+
+    def test_remap_landmarks(self):
+        """잘라낸 영역 좌표 → 전체 프레임 정규화 좌표"""
+        from src.core.roi_tracker import PersonRoiTracker
+        landmarks = [{'x': 0.5, 'y': 0.25, 'z': -0.2, 'visibility': 0.9}]
+        PersonRoiTracker.remap_landmarks(landmarks, (400, 100, 800, 500), (1000, 2000, 3))
+
+        assert landmarks[0]['x'] == pytest.approx((400 + 0.5 * 400) / 2000)
+        assert landmarks[0]['y'] == pytest.approx((100 + 0.25 * 400) / 1000)
+        assert landmarks[0]['z'] == pytest.approx(-0.2 * 400 / 2000)
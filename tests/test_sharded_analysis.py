@@ -0,0 +1,248 @@
+"""샤드 분석 (sharded_analysis) 단위 테스트"""
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+import numpy as np
+
+# mediapipe를 미리 모킹하여 import 에러 방지 (VideoCapture는 테스트마다 patch)
+mediapipe_mock = MagicMock()
+sys.modules.setdefault('mediapipe', mediapipe_mock)
+sys.modules.setdefault('mediapipe.tasks', mediapipe_mock.tasks)
+sys.modules.setdefault('mediapipe.tasks.python', mediapipe_mock.tasks.python)
+sys.modules.setdefault('mediapipe.tasks.python.vision', mediapipe_mock.tasks.python.vision)
+
+
+class TestSplitFrameRange:
+
+    def test_single_shard_for_short_video(self):
+        """짧은 동영상은 샤드 1개"""
+        from src.core.sharded_analysis import split_frame_range
+        assert split_frame_range(100, 8) == [(0, 100)]
+
+    def test_ranges_cover_all_frames(self):
+        """구간이 빈틈 없이 전체 프레임을 덮음"""
+        from src.core.sharded_analysis import split_frame_range
+        ranges = split_frame_range(10000, 4, min_shard_frames=10)
+        assert len(ranges) == 4
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 10000
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+
+    def test_ranges_aligned_to_sample_interval(self):
+        """구간 시작은 샘플 간격의 배수"""
+        from src.core.sharded_analysis import split_frame_range
+        ranges = split_frame_range(1001, 3, sample_interval=7, min_shard_frames=10)
+        assert len(ranges) == 3
+        for start, _ in ranges:
+            assert start % 7 == 0
+
+    def test_empty_video(self):
+        from src.core.sharded_analysis import split_frame_range
+        assert split_frame_range(0, 4) == []
+
+
+class TestAnalyzeShard:
+
+    def _make_capture(self, num_frames=10):
+        """위치 기반 cv2.VideoCapture 모킹"""
+        cap = MagicMock()
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        position = [0]
+
+        def read_side_effect():
+            if position[0] < num_frames:
+                position[0] += 1
+                return True, frame.copy()
+            return False, None
+
+        def grab_side_effect():
+            if position[0] < num_frames:
+                position[0] += 1
+                return True
+            return False
+
+        def set_side_effect(prop, value):
+            # 샤드 분석은 CAP_PROP_POS_FRAMES만 설정
+            position[0] = int(value)
+            return True
+
+        cap.read.side_effect = read_side_effect
+        cap.grab.side_effect = grab_side_effect
+        cap.set.side_effect = set_side_effect
+        cap.get.return_value = 30.0    # CAP_PROP_FPS
+        return cap
+
+    def _make_pose_result(self, angle_seed: float):
+        result = MagicMock()
+        result.pose_detected = True
+        result.landmarks = [
+            {'x': 0.5 + angle_seed * (i % 3) * 0.01, 'y': 0.1 + i * 0.025, 'z': 0.0, 'visibility': 0.9}
+            for i in range(33)
+        ]
+        return result
+
+    def test_shards_merge_to_sequential_result(self):
+        """샤드별 분석 후 병합 결과가 단일 구간 분석과 동일"""
+        from src.core.sharded_analysis import analyze_shard, merge_shard_results
+
+        poses = [self._make_pose_result(float(i % 4)) for i in range(12)]
+        queue = MagicMock()
+
+        def run(start, end):
+            cap = self._make_capture(num_frames=12)
+            with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+                 patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+                MockDetector.return_value.detect.side_effect = poses[start:end:2]
+                return analyze_shard('/tmp/test.mp4', start, end, sample_interval=2,
+                                     progress_queue=queue)
+
+        single = run(0, 12)
+        shards = [run(0, 4), run(4, 8), run(8, 12)]
+
+        merged, skipped = merge_shard_results(shards, sample_interval=2)
+        expected, _ = merge_shard_results([single], sample_interval=2)
+
+        assert skipped == 0
+        assert merged.get_state()['movement_counts'] == expected.get_state()['movement_counts']
+        assert merged.get_result().analyzed_frames == 6
+        assert [s['end_frame'] for s in shards] == [4, 8, 12]
+
+    def test_shard_start_uses_keyframe_index(self, tmp_path):
+        """색인이 있으면 샤드 시작 위치를 seek_frame(색인)으로 맞춤"""
+        from src.core.sharded_analysis import analyze_shard
+
+        cap = self._make_capture(num_frames=12)
+        index = MagicMock()
+        with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+             patch('src.core.sharded_analysis.PoseDetector') as MockDetector, \
+             patch('src.core.sharded_analysis.KeyframeIndex') as MockIndex, \
+             patch('src.core.sharded_analysis.seek_frame', return_value=4) as mock_seek:
+            MockIndex.cached.return_value = index
+            MockDetector.return_value.detect.return_value = self._make_pose_result(0.0)
+            result = analyze_shard('/tmp/test.mp4', 4, 8, sample_interval=2,
+                                   index_dir=str(tmp_path))
+
+        MockIndex.cached.assert_called_once_with(str(tmp_path), '/tmp/test.mp4')
+        mock_seek.assert_called_once_with(cap, 4, index)
+        assert result['end_frame'] == 8
+
+    def test_cancelled_shards_merge_contiguous_prefix(self):
+        """취소 시 처음부터 이어지는 샤드 구간만 병합하고 그 끝에서 재개"""
+        from src.core.sharded_analysis import analyze_shard, merge_resumable_prefix
+
+        poses = [self._make_pose_result(float(i % 4)) for i in range(12)]
+        stop = MagicMock()
+        stop.is_set.return_value = False
+
+        def run(start, end, stop_after=None):
+            cap = self._make_capture(num_frames=12)
+            with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+                 patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+                calls = []
+
+                def detect(*_args):
+                    calls.append(1)
+                    if stop_after is not None and len(calls) >= stop_after:
+                        stop.is_set.return_value = True
+                    return poses[start + 2 * (len(calls) - 1)]
+
+                MockDetector.return_value.detect.side_effect = detect
+                result = analyze_shard('/tmp/test.mp4', start, end, sample_interval=2,
+                                       stop_event=stop)
+            stop.is_set.return_value = False
+            return result
+
+        # 첫 샤드 완료, 둘째 샤드는 1프레임 후 취소, 셋째 샤드 완료
+        shards = [run(0, 4), run(4, 8, stop_after=1), run(8, 12)]
+        assert [s['end_frame'] for s in shards] == [4, 5, 12]
+
+        analyzer, skipped, frame_index, gated = merge_resumable_prefix(shards, sample_interval=2)
+        assert frame_index == 5
+        assert (skipped, gated) == (0, 0)
+        assert analyzer.get_result().analyzed_frames == 3
+
+        # 첫 샤드가 중간에 멈추면 그 위치까지만
+        analyzer, _, frame_index, _ = merge_resumable_prefix(
+            [run(0, 4, stop_after=1), shards[1], shards[2]], sample_interval=2)
+        assert frame_index == 1
+        assert analyzer.get_result().analyzed_frames == 1
+
+    def test_shard_reports_progress(self):
+        """샤드 종료 시 남은 진행률을 큐로 보고"""
+        from src.core.sharded_analysis import analyze_shard
+
+        cap = self._make_capture(num_frames=10)
+        queue = MagicMock()
+        with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+             patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+            fail = MagicMock()
+            fail.pose_detected = False
+            MockDetector.return_value.detect.return_value = fail
+            result = analyze_shard('/tmp/test.mp4', 0, 10, progress_queue=queue)
+
+        reported = [c.args[0] for c in queue.put.call_args_list]
+        assert sum(frames for frames, _, _ in reported) == 10
+        assert sum(sampled for _, sampled, _ in reported) == 10
+        assert sum(skipped for _, _, skipped in reported) == 10
+        assert result['skipped_frames'] == 10
+
+    def test_shard_uses_video_mode_timestamps(self):
+        """연속 샘플 구간은 VIDEO 모드로 프레임 시각을 넘겨 감지"""
+        from src.core.sharded_analysis import analyze_shard
+
+        cap = self._make_capture(num_frames=12)
+        with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+             patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+            MockDetector.return_value.detect.return_value = self._make_pose_result(0.0)
+            analyze_shard('/tmp/test.mp4', 6, 12, sample_interval=3,
+                          progress_queue=MagicMock(), num_poses=2)
+
+        assert MockDetector.call_args.kwargs['running_mode'] == 'video'
+        assert MockDetector.call_args.kwargs['num_poses'] == 2
+        timestamps = [c.args[1] for c in MockDetector.return_value.detect.call_args_list]
+        assert timestamps == [200, 300]
+
+    def test_shard_reuses_landmark_cache(self, tmp_path):
+        """캐시를 채운 뒤 같은 구간은 디코딩/추론 없이 같은 결과"""
+        from src.core.sharded_analysis import analyze_shard
+
+        cache_path = str(tmp_path / "cache")
+        poses = [self._make_pose_result(float(i % 4)) for i in range(10)]
+        results = []
+        for _ in range(2):
+            cap = self._make_capture(num_frames=10)
+            with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+                 patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+                MockDetector.return_value.detect.side_effect = poses
+                results.append(analyze_shard('/tmp/test.mp4', 0, 10,
+                                             cache_path=cache_path, cache_frames=10))
+                detect_calls = MockDetector.return_value.detect.call_count
+
+        assert detect_calls == 0
+        cap.read.assert_not_called()
+        assert results[1]['end_frame'] == 10
+        assert results[1]['state']['movement_counts'] == results[0]['state']['movement_counts']
+
+    def test_shard_does_not_cache_gated_frames(self, tmp_path):
+        """게이트로 추론을 생략한 프레임은 캐시하지 않아 게이트를 끄면 다시 추론"""
+        from src.core.landmark_cache import LandmarkCache
+        from src.core.sharded_analysis import analyze_shard
+
+        cache_path = str(tmp_path / "cache")
+        fail = MagicMock()
+        fail.pose_detected = False
+
+        detect_calls = []
+        for presence_gate, detected in ((True, fail), (False, self._make_pose_result(0.0))):
+            cap = self._make_capture(num_frames=10)
+            with patch('src.core.sharded_analysis.CvVideoCapture', return_value=cap), \
+                 patch('src.core.sharded_analysis.PoseDetector') as MockDetector:
+                MockDetector.return_value.detect.return_value = detected
+                analyze_shard('/tmp/test.mp4', 0, 10, cache_path=cache_path, cache_frames=10,
+                              presence_gate=presence_gate)
+                detect_calls.append(MockDetector.return_value.detect.call_count)
+            if presence_gate:
+                assert LandmarkCache(cache_path, 10).cached_count == 1
+
+        assert detect_calls == [1, 9]
@@ -112,6 +112,20 @@ class TestVideoPlayer:
         player.seek(target_frame)
         assert player.current_frame == target_frame
 
+    def test_skip_frames(self, player, sample_video_path):
+        """디코딩 위치만 옮기는 프레임 건너뛰기"""
+        player.load(sample_video_path)
+        player.read_frame()
+
+        assert player.skip_frames(5) == 5
+        assert player.current_frame == 6
+        assert player.skip_frames(0) == 0
+
+        # 많이 뒤처지면 탐색, 끝을 넘지 않음
+        assert player.skip_frames(500) == 89 - 6
+        assert player.current_frame == 89
+        assert player.read_frame() is not None
+
     def test_seek_to_invalid_position_negative(self, player, sample_video_path):
         """음수 위치로 시크 테스트"""
         player.load(sample_video_path)
@@ -151,3 +165,55 @@ class TestVideoPlayer:
         player.load(sample_video_path)
         player.release()
         assert player.is_loaded == False
+
+    # --- 프레임 캐시 ---
+
+    def test_seek_is_served_from_cache(self, player, sample_video_path):
+        """한 번 디코딩한 프레임은 다시 탐색해도 캡처를 건드리지 않음"""
+        player.load(sample_video_path)
+        player.seek(20)
+        first = player.read_frame()
+        player.read_frame()
+
+        player.seek(20)
+        assert player.read_frame() is first
+        assert player.current_frame == 21
+
+    def test_step_back_uses_backfilled_frames(self, player, sample_video_path):
+        """멈춘 상태에서 탐색하면 바로 앞 프레임들을 미리 디코딩해 둠"""
+        player.load(sample_video_path)
+        player.seek(40)
+        player.read_frame()
+        assert player.backfiller.wait_idle(5)
+
+        window = player.backfiller.window
+        assert player.frame_cache.missing(40 - window, 40) == 0
+
+        # 캐시 내용이 순차 디코딩과 같은 프레임이어야 함
+        cap = cv2.VideoCapture(sample_video_path)
+        for _ in range(39):
+            cap.grab()
+        ret, expected = cap.read()
+        cap.release()
+        assert ret
+
+        hits = player.frame_cache.hits
+        player.seek(39)
+        frame = player.read_frame()
+        assert player.frame_cache.hits == hits + 1
+        assert np.array_equal(frame, expected)
+
+    def test_cache_disabled(self, sample_video_path):
+        """캐시 한도 0이면 캐시/미리 디코딩 없이 동작"""
+        from src.core.video_player import VideoPlayer
+        player = VideoPlayer(cache_bytes=0)
+        try:
+            player.load(sample_video_path)
+            assert player.backfiller is None
+            player.seek(10)
+            assert player.read_frame() is not None
+            player.seek(9)
+            assert player.read_frame() is not None
+            assert len(player.frame_cache) == 0
+        finally:
+            player.release()